@@ -1,6 +1,7 @@
 """NoteDx SDK for Python."""
 
 from .client import NoteDxClient
+from .aio import AsyncNoteDxClient
 
 __version__ = "0.1.8"
-__all__ = ["NoteDxClient"]
\ No newline at end of file
+__all__ = ["NoteDxClient", "AsyncNoteDxClient"]
@@ -77,6 +77,70 @@ class AccountManager:
                 {"auth_type": "firebase"}
             )
 
+    def _build_update_data(
+        self,
+        company_name: Optional[str] = None,
+        contact_email: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        address: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build and validate the request body for an account update.
+
+        Args:
+            company_name: New company or organization name
+            contact_email: New contact email address
+            phone_number: New contact phone number
+            address: New business address
+
+        Returns:
+            Dict with only the fields that were provided
+
+        Raises:
+            InvalidFieldError: If no valid fields provided to update
+        """
+        # Prepare update data
+        update_data = {}
+        allowed_fields = ['company_name', 'contact_email', 'phone_number', 'address']
+        
+        # Log provided fields (without values)
+        self.logger.debug(
+            "Fields provided for update",
+            extra={
+                'fields': {
+                    'company_name': company_name is not None,
+                    'contact_email': contact_email is not None,
+                    'phone_number': phone_number is not None,
+                    'address': address is not None
+                }
+            }
+        )
+        
+        for field, value in {
+            'company_name': company_name,
+            'contact_email': contact_email,
+            'phone_number': phone_number,
+            'address': address
+        }.items():
+            if value is not None:
+                update_data[field] = value
+
+        if not update_data:
+            self.logger.warning(
+                "No valid fields provided for update",
+                extra={'allowed_fields': allowed_fields}
+            )
+            raise InvalidFieldError(
+                "fields",
+                "MISSING_UPDATE_FIELDS",
+                {
+                    "message": "At least one of these fields must be provided: company_name, contact_email, phone_number, address",
+                    "allowed_fields": allowed_fields
+                }
+            )
+
+        return update_data
+
     def get_account(self) -> Dict[str, Any]:
         """
         Get current account information and settings.
@@ -182,45 +246,12 @@ class AccountManager:
         # Verify Firebase auth
         self._check_firebase_auth()
         
-        # Prepare update data
-        update_data = {}
-        allowed_fields = ['company_name', 'contact_email', 'phone_number', 'address']
-        
-        # Log provided fields (without values)
-        self.logger.debug(
-            "Fields provided for update",
-            extra={
-                'fields': {
-                    'company_name': company_name is not None,
-                    'contact_email': contact_email is not None,
-                    'phone_number': phone_number is not None,
-                    'address': address is not None
-                }
-            }
+        update_data = self._build_update_data(
+            company_name=company_name,
+            contact_email=contact_email,
+            phone_number=phone_number,
+            address=address
         )
-        
-        for field, value in {
-            'company_name': company_name,
-            'contact_email': contact_email,
-            'phone_number': phone_number,
-            'address': address
-        }.items():
-            if value is not None:
-                update_data[field] = value
-
-        if not update_data:
-            self.logger.warning(
-                "No valid fields provided for update",
-                extra={'allowed_fields': allowed_fields}
-            )
-            raise InvalidFieldError(
-                "fields",
-                "MISSING_UPDATE_FIELDS",
-                {
-                    "message": "At least one of these fields must be provided: company_name, contact_email, phone_number, address",
-                    "allowed_fields": allowed_fields
-                }
-            )
 
         try:
             response = self._client._request(
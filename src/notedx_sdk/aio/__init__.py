@@ -0,0 +1,5 @@
+"""Asyncio-native NoteDx client (requires the optional `httpx` dependency)."""
+
+from .client import AsyncNoteDxClient
+
+__all__ = ["AsyncNoteDxClient"]
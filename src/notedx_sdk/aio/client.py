@@ -0,0 +1,470 @@
+from typing import Optional, Dict, Any, Coroutine
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from ..client import NoteDxClient
+from ..core.circuit import CircuitBreakers
+from ..core.ratelimit import RateLimiter
+from ..core.retry import RetryPolicy, request_was_sent, select_policy
+from ..helpers import get_env, parse_response, build_headers
+from ..exceptions import (
+    AuthenticationError,
+    NetworkError,
+)
+from .managers import (
+    ASYNC_MANAGERS,
+    AsyncAccountManager,
+    AsyncKeyManager,
+    AsyncWebhookManager,
+    AsyncNoteManager,
+    AsyncUsageManager,
+)
+
+logger = logging.getLogger("notedx_sdk")
+
+
+class AsyncNoteDxClient:
+    """
+    Asyncio-native client for the NoteDx API.
+
+    Mirrors `NoteDxClient`: the `notes`, `usage`, `keys`, `webhooks` and `account`
+    managers expose the same methods, but every API call and file upload is awaitable
+    and runs on a shared `httpx.AsyncClient` connection pool. Thousands of jobs can be
+    in flight on one event loop without a thread per job.
+
+    Requires the optional `httpx` dependency (`pip install notedx-sdk[async]`).
+
+    Parameters:
+        email (str, optional): Email for authentication. If not provided, reads from NOTEDX_EMAIL env var.
+        password (str, optional): Password for authentication. If not provided, reads from NOTEDX_PASSWORD env var.
+        api_key (str, optional): API key for authentication. If not provided, reads from NOTEDX_API_KEY env var.
+        http_client (httpx.AsyncClient, optional): Custom client for advanced configuration.
+        max_connections (int, optional): Maximum concurrent connections of the default client. Defaults to 100.
+        timeout (float, optional): Default request timeout in seconds. Defaults to 60.
+
+    Raises:
+        ImportError: If httpx is not installed
+        AuthenticationError: If no credentials are provided
+
+    Example:
+        ```python
+        import asyncio
+        from notedx_sdk import AsyncNoteDxClient
+
+        async def main():
+            async with AsyncNoteDxClient(api_key="your-api-key") as client:
+                jobs = await asyncio.gather(*[
+                    client.notes.process_audio(
+                        file_path=path,
+                        visit_type="initialEncounter",
+                        recording_type="dictation",
+                        template="primaryCare"
+                    )
+                    for path in ["visit1.mp3", "visit2.mp3"]
+                ])
+
+        asyncio.run(main())
+
+        # Blocking facade for synchronous code
+        client = AsyncNoteDxClient(api_key="your-api-key")
+        status = client.sync.notes.fetch_status("job-id")
+        client.close()
+        ```
+
+    Notes:
+        - Login happens lazily on the first request that needs a Firebase token
+        - Use either the awaitable API or the `sync` facade with a given instance, not both
+    """
+
+    MAX_AUTH_RETRIES = NoteDxClient.MAX_AUTH_RETRIES
+    BASE_URL = NoteDxClient.BASE_URL
+    _defer_rate_limit = NoteDxClient._defer_rate_limit
+
+    def __init__(
+        self,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        api_key: Optional[str] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        max_connections: int = 100,
+        timeout: float = 60,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Initialize the async NoteDx API client.
+
+        Args:
+            email: Email for authentication. If not provided, reads from NOTEDX_EMAIL env var
+            password: Password for authentication. If not provided, reads from NOTEDX_PASSWORD env var
+            api_key: API key for authentication. If not provided, reads from NOTEDX_API_KEY env var
+            http_client: Optional custom httpx.AsyncClient
+            max_connections: Maximum concurrent connections of the default client
+            timeout: Default request timeout in seconds
+            retry_policy: Retry policy of account, key, webhook and usage requests (optional)
+            retry_policies: Retry policies by endpoint prefix, overriding `retry_policy` (optional)
+            circuit_breakers: Circuit breakers guarding each endpoint family (optional)
+            rate_limiter: Client-side rate limits by endpoint class (optional)
+
+        Raises:
+            ImportError: If httpx is not installed
+            AuthenticationError: If credentials are missing
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncNoteDxClient requires httpx. Install it with `pip install notedx-sdk[async]`."
+            )
+
+        self.base_url = self.BASE_URL
+        self._owns_http = http_client is None
+        self.http = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout
+        )
+        self._timeout = timeout
+
+        # Environment fallback
+        self._email = email or get_env("NOTEDX_EMAIL") or None
+        self._password = password or get_env("NOTEDX_PASSWORD") or None
+        self._api_key = api_key or get_env("NOTEDX_API_KEY") or None
+
+        if not any([self._email and self._password, self._api_key]):
+            raise AuthenticationError("No authentication credentials provided. Please provide either an API key or email/password combination.")
+
+        # Firebase auth state
+        self._user_id: Optional[str] = None
+        self._token: Optional[str] = None
+        self._refresh_token: Optional[str] = None
+        self._auth_retry_counts: Dict[str, int] = {}
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_policies: Dict[str, RetryPolicy] = dict(retry_policies or {})
+        self.circuit_breakers = circuit_breakers or CircuitBreakers()
+        self.rate_limiter = rate_limiter
+        self._auth_lock: Optional[asyncio.Lock] = None
+        self._loop_thread: Optional["_EventLoopThread"] = None
+
+        # Initialize managers
+        self.account = AsyncAccountManager(self)
+        self.keys = AsyncKeyManager(self)
+        self.webhooks = AsyncWebhookManager(self)
+        self.notes = AsyncNoteManager(self)
+        self.usage = AsyncUsageManager(self)
+
+    async def __aenter__(self) -> "AsyncNoteDxClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool (if owned by this client)."""
+        if self._owns_http:
+            await self.http.aclose()
+
+    @property
+    def sync(self) -> "_BlockingProxy":
+        """Blocking facade over this client for synchronous callers.
+
+        Every coroutine method of the client and its managers is run to completion
+        on a private event loop thread, e.g. `client.sync.notes.fetch_status(job_id)`.
+        """
+        if self._loop_thread is None:
+            self._loop_thread = _EventLoopThread()
+        return _BlockingProxy(self, self._loop_thread)
+
+    def close(self) -> None:
+        """Close the client when used through the `sync` facade."""
+        if self._loop_thread is not None:
+            self._loop_thread.run(self.aclose())
+            self._loop_thread.stop()
+            self._loop_thread = None
+
+    # --------------------------------------------------
+    # Auth
+    # --------------------------------------------------
+    def set_token(self, token: str, refresh_token: Optional[str] = None) -> None:
+        """Manually set Firebase authentication tokens. See `NoteDxClient.set_token()`."""
+        self._token = token
+        self._refresh_token = refresh_token
+
+    def set_api_key(self, api_key: str) -> None:
+        """Manually set an API key. See `NoteDxClient.set_api_key()`."""
+        self._api_key = api_key
+
+    def _get_auth_lock(self) -> asyncio.Lock:
+        # Created lazily so the lock binds to the running loop
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        return self._auth_lock
+
+    async def _ensure_login(self) -> None:
+        """Log in on first use when email/password are configured and no token is set."""
+        if self._token or not (self._email and self._password):
+            return
+        async with self._get_auth_lock():
+            if not self._token:
+                await self.login()
+
+    async def login(self) -> Dict[str, Any]:
+        """
+        Awaitable version of `NoteDxClient.login()`.
+
+        Raises:
+            AuthenticationError: If credentials are invalid or missing
+            NetworkError: If connection fails or request times out
+        """
+        if not self._email or not self._password:
+            raise AuthenticationError("Missing email/password for login.")
+
+        try:
+            resp = await self.http.post(
+                f"{self.base_url}/auth/login",
+                json={"email": self._email, "password": self._password},
+                timeout=30
+            )
+        except httpx.TimeoutException:
+            raise NetworkError("Login request timed out")
+        except httpx.HTTPError as e:
+            raise NetworkError(f"Connection error during login: {str(e)}")
+
+        data = parse_response(resp)
+        self._user_id = data.get("user_id")
+        if not self._user_id:
+            raise AuthenticationError("Login failed: 'user_id' not found in response.")
+
+        self._token = data.get("id_token")
+        self._refresh_token = data.get("refresh_token")
+        if not self._token or not self._refresh_token:
+            raise AuthenticationError("Missing required tokens in response")
+
+        logger.info("Successfully logged in as: %s", self._email)
+        return data
+
+    async def refresh_token(self) -> Dict[str, Any]:
+        """
+        Awaitable version of `NoteDxClient.refresh_token()`.
+
+        Raises:
+            AuthenticationError: If refresh token is invalid, expired, or missing
+        """
+        if not self._refresh_token:
+            raise AuthenticationError("No refresh token available")
+
+        try:
+            data = await self._request("POST", "auth/refresh", data={
+                "refresh_token": self._refresh_token
+            })
+        except AuthenticationError:
+            logger.warning("Token refresh failed, clearing stored tokens")
+            self._token = None
+            self._refresh_token = None
+            raise
+
+        self._token = data.get("id_token")
+        if not self._token:
+            raise AuthenticationError("Token refresh failed: no id_token in response")
+        if "refresh_token" in data:
+            self._refresh_token = data["refresh_token"]
+        return data
+
+    async def _handle_auth_retry(self, endpoint: str, error_msg: str, error_code: str, response_data: Dict[str, Any]) -> bool:
+        """Awaitable version of `NoteDxClient._handle_auth_retry()`."""
+        self._auth_retry_counts[endpoint] = self._auth_retry_counts.get(endpoint, 0) + 1
+        if self._auth_retry_counts[endpoint] > self.MAX_AUTH_RETRIES:
+            self._auth_retry_counts[endpoint] = 0
+            raise AuthenticationError(
+                f"Authorization failed after {self.MAX_AUTH_RETRIES} retries",
+                error_code,
+                response_data
+            )
+
+        # Concurrent requests hitting an expired token share a single refresh
+        async with self._get_auth_lock():
+            if self._refresh_token:
+                try:
+                    await self.refresh_token()
+                    return True
+                except Exception as e:
+                    logger.debug("Token refresh failed for endpoint %s, falling back to re-login: %s", endpoint, str(e))
+            if self._email and self._password:
+                await self.login()
+                return True
+        return False
+
+    # --------------------------------------------------
+    # Request handling
+    # --------------------------------------------------
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Any = None,
+        params: Dict[str, Any] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Awaitable version of `NoteDxClient._request()`.
+
+        Args:
+            method: HTTP method (GET, POST, etc)
+            endpoint: API endpoint path
+            data: Request body data
+            params: URL parameters
+            timeout: Request timeout in seconds
+
+        Returns:
+            API response data as dictionary
+
+        Raises:
+            Various NoteDxError subclasses based on response
+        """
+        if not endpoint:
+            raise ValueError("Endpoint is required")
+
+        timeout = timeout or self._timeout
+        base_url = get_env("NOTEDX_API_URL", self.base_url)
+        url = f"{base_url}/{endpoint.lstrip('/')}"
+
+        no_auth_endpoints = {"auth/login", "auth/refresh", "auth/create-account"}
+        if endpoint in no_auth_endpoints:
+            headers = {}
+        else:
+            await self._ensure_login()
+            if not self._token and not self._api_key:
+                raise AuthenticationError("No valid authentication token or API key available")
+            headers = build_headers(token=self._token, api_key=self._api_key)
+
+        logger.debug("Making request: %s", {'method': method, 'url': url, 'params': params})
+
+        policy = select_policy(self.retry_policies, endpoint, self.retry_policy)
+        circuit = self.circuit_breakers.get(endpoint)
+        attempt = 0
+        while True:
+            circuit.allow()
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(endpoint, self._api_key or self._email)
+            try:
+                response = await self.http.request(
+                    method,
+                    url,
+                    headers=headers,
+                    json=data,
+                    params=params,
+                    timeout=timeout
+                )
+            except httpx.TransportError as e:
+                circuit.record_failure()
+                attempt += 1
+                delay = policy.next_delay(attempt, method, sent=request_was_sent(e))
+                if delay is not None:
+                    logger.warning(
+                        "Request to %s failed (%s), retrying in %.1f seconds (attempt %d/%d)",
+                        endpoint, type(e).__name__, delay, attempt, policy.max_retries
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                if isinstance(e, httpx.TimeoutException):
+                    logger.error("Request to %s timed out after %s seconds", endpoint, timeout)
+                    raise NetworkError(
+                        f"Request timed out after {timeout} seconds",
+                        "TIMEOUT",
+                        {"url": url, "method": method}
+                    )
+                logger.error("Connection error for %s: %s", endpoint, str(e))
+                raise NetworkError(
+                    f"Connection error: {str(e)}",
+                    "CONNECTION_ERROR",
+                    {"url": url, "method": method}
+                )
+
+            circuit.record_response(response.status_code)
+            if response.status_code == 429:
+                self._defer_rate_limit(endpoint, response.headers)
+            if response.status_code in policy.retry_on_status:
+                attempt += 1
+                delay = policy.next_delay(attempt, method, response.status_code, response.headers)
+                if delay is not None:
+                    logger.warning(
+                        "Request to %s failed with %d, retrying in %.1f seconds (attempt %d/%d)",
+                        endpoint, response.status_code, delay, attempt, policy.max_retries
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+            break
+
+        try:
+            response_data = response.json()
+        except ValueError:
+            response_data = {"message": response.text}
+
+        logger.debug(
+            "Received response: %s",
+            {'status_code': response.status_code, 'data': NoteDxClient._redact_sensitive_data(response_data)}
+        )
+
+        if 200 <= response.status_code < 300:
+            policy.record_success()
+            self._auth_retry_counts[endpoint] = 0
+            return response_data
+
+        if response.status_code == 429:
+            raise NoteDxClient._rate_limit_error(endpoint, response.headers)
+
+        error_msg, error_code, _ = NoteDxClient._parse_error(response_data)
+        if NoteDxClient._is_auth_retryable(endpoint, response.status_code, error_msg):
+            if await self._handle_auth_retry(endpoint, error_msg, error_code, response_data):
+                return await self._request(method, endpoint, data, params, timeout)
+
+        raise NoteDxClient._error_from_response(endpoint, response.status_code, response_data)
+
+
+class _EventLoopThread:
+    """Runs an event loop in a daemon thread for the blocking facade."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="notedx-sdk-event-loop",
+            daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine on the loop thread and block until it completes."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def stop(self) -> None:
+        """Stop the loop and wait for the thread to exit."""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class _BlockingProxy:
+    """Proxy that turns coroutine methods of the client and its managers into blocking calls."""
+
+    def __init__(self, target: Any, loop_thread: _EventLoopThread) -> None:
+        self._target = target
+        self._loop_thread = loop_thread
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if isinstance(attr, ASYNC_MANAGERS):
+            return _BlockingProxy(attr, self._loop_thread)
+        if inspect.iscoroutinefunction(attr):
+            @functools.wraps(attr)
+            def call(*args: Any, **kwargs: Any) -> Any:
+                return self._loop_thread.run(attr(*args, **kwargs))
+            return call
+        return attr
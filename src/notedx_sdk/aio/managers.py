@@ -0,0 +1,916 @@
+from typing import Callable, Dict, Any, Literal, Optional, List, AsyncIterable, AsyncIterator, Union
+import asyncio
+import os
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from ..account.account_manager import AccountManager
+from ..api_keys.key_manager import KeyManager
+from ..webhooks.webhook_manager import WebhookManager
+from ..usage.usage_manager import UsageManager
+from ..core.note_manager import NoteManager, VALID_AUDIO_FORMATS
+from ..core.bandwidth import BandwidthLimiter, upload_limiter
+from ..core.retry import request_was_sent, retry_after, upload_retry_delay
+from ..core.uploads import (
+    AdaptiveBody,
+    AdaptiveChunkSizer,
+    AudioSource,
+    IteratorReader,
+    UploadProgress,
+    rejected_url_error,
+    verify_checksum,
+    open_file_body,
+    open_upload_body
+)
+from ..exceptions import (
+    AuthenticationError,
+    NetworkError,
+    ValidationError,
+    MissingFieldError,
+    InvalidFieldError,
+    BadRequestError,
+    UploadError,
+    UploadUrlRejectedError,
+    NotFoundError,
+    JobNotFoundError,
+    JobError,
+    InternalServerError,
+    NoteDxError,
+    RateLimitError,
+    ServiceUnavailableError
+)
+
+
+class AsyncAccountManager(AccountManager):
+    """Awaitable version of `AccountManager`.
+
+    Example:
+        ```python
+        >>> account_info = await client.account.get_account()
+        ```
+    """
+
+    async def get_account(self) -> Dict[str, Any]:
+        """Awaitable version of `AccountManager.get_account()`."""
+        await self._client._ensure_login()
+        self._check_firebase_auth()
+        try:
+            response = await self._client._request("GET", "user/account/info")
+            self.logger.info(
+                "Successfully retrieved account information",
+                extra={'status': response.get('account_status'), 'company': response.get('company_name')}
+            )
+            return response
+        except Exception as e:
+            self.logger.error("Failed to retrieve account information", extra={'error_type': type(e).__name__})
+            raise
+
+    async def update_account(
+        self,
+        company_name: Optional[str] = None,
+        contact_email: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        address: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Awaitable version of `AccountManager.update_account()`."""
+        await self._client._ensure_login()
+        self._check_firebase_auth()
+        update_data = self._build_update_data(
+            company_name=company_name,
+            contact_email=contact_email,
+            phone_number=phone_number,
+            address=address
+        )
+        try:
+            response = await self._client._request("POST", "user/account/update", data=update_data)
+            self.logger.info(
+                "Successfully updated account information",
+                extra={'updated_fields': list(update_data.keys())}
+            )
+            return response
+        except Exception as e:
+            self.logger.error("Failed to update account information", extra={'error_type': type(e).__name__})
+            raise
+
+    async def cancel_account(self) -> Dict[str, Any]:
+        """Awaitable version of `AccountManager.cancel_account()`."""
+        await self._client._ensure_login()
+        self._check_firebase_auth()
+        response = await self._client._request("POST", "user/cancel-account")
+        self.logger.info("Successfully cancelled account", extra={'user_id': response.get('user_id')})
+        return response
+
+    async def reactivate_account(self) -> Dict[str, Any]:
+        """Awaitable version of `AccountManager.reactivate_account()`."""
+        await self._client._ensure_login()
+        self._check_firebase_auth()
+        response = await self._client._request("POST", "user/reactivate-account")
+        self.logger.info("Successfully reactivated account", extra={'user_id': response.get('user_id')})
+        return response
+
+
+class AsyncKeyManager(KeyManager):
+    """Awaitable version of `KeyManager`.
+
+    Example:
+        ```python
+        >>> keys = await client.keys.list_api_keys()
+        ```
+    """
+
+    async def list_api_keys(self, show_full: bool = False) -> List[Dict[str, Any]]:
+        """Awaitable version of `KeyManager.list_api_keys()`."""
+        params = {'showFull': 'true'} if show_full else None
+        return await self._client._request("GET", "user/list-api-keys", params=params)
+
+    async def create_api_key(
+        self,
+        key_type: Literal['sandbox', 'live'],
+        metadata: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Awaitable version of `KeyManager.create_api_key()`."""
+        data = {
+            'keyType': key_type,
+            'metadata': metadata
+        }
+        return await self._client._request("POST", "user/create-api-key", data=data)
+
+    async def update_metadata(self, api_key: str, metadata: Dict[str, str]) -> Dict[str, Any]:
+        """Awaitable version of `KeyManager.update_metadata()`."""
+        data = {
+            'apiKey': api_key,
+            'metadata': metadata
+        }
+        return await self._client._request("POST", "user/update-api-key-metadata", data=data)
+
+    async def update_status(self, api_key: str, status: Literal['active', 'inactive']) -> Dict[str, Any]:
+        """Awaitable version of `KeyManager.update_status()`."""
+        data = {
+            'apiKey': api_key,
+            'status': status
+        }
+        return await self._client._request("POST", f"user/api-keys/{api_key}/status", data=data)
+
+    async def delete_api_key(self, api_key: str) -> Dict[str, Any]:
+        """Awaitable version of `KeyManager.delete_api_key()`."""
+        data = {'apiKey': api_key}
+        return await self._client._request("POST", "user/delete-api-key", data=data)
+
+
+class AsyncWebhookManager(WebhookManager):
+    """Awaitable version of `WebhookManager`.
+
+    Example:
+        ```python
+        >>> settings = await client.webhooks.get_webhook_settings()
+        ```
+    """
+
+    async def get_webhook_settings(self) -> Dict[str, Any]:
+        """Awaitable version of `WebhookManager.get_webhook_settings()`."""
+        await self._client._ensure_login()
+        self._check_firebase_auth()
+        response = await self._client._request("GET", "user/webhook")
+        self.logger.info(
+            "Successfully retrieved webhook settings",
+            extra={
+                'has_dev_webhook': bool(response.get('webhook_dev')),
+                'has_prod_webhook': bool(response.get('webhook_prod'))
+            }
+        )
+        return response
+
+    async def update_webhook_settings(
+        self,
+        webhook_dev: Optional[str] = None,
+        webhook_prod: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Awaitable version of `WebhookManager.update_webhook_settings()`."""
+        await self._client._ensure_login()
+        self._check_firebase_auth()
+        data = self._build_webhook_data(webhook_dev, webhook_prod)
+        response = await self._client._request("POST", "user/webhook", data=data)
+        self.logger.info(
+            "Successfully updated webhook settings",
+            extra={
+                'updated_dev': webhook_dev is not None,
+                'updated_prod': webhook_prod is not None
+            }
+        )
+        return response
+
+
+class AsyncUsageManager(UsageManager):
+    """Awaitable version of `UsageManager`.
+
+    Example:
+        ```python
+        >>> usage = await client.usage.get(start_month="2024-01", end_month="2024-03")
+        ```
+    """
+
+    async def get(self, start_month: Optional[str] = None, end_month: Optional[str] = None) -> Dict[str, Any]:
+        """Awaitable version of `UsageManager.get()`."""
+        params = self._build_usage_params(start_month, end_month)
+        try:
+            response = await self._client._request("GET", "user/usage", params=params)
+        except ValidationError as e:
+            raise InvalidFieldError(str(e), getattr(e, 'code', None), getattr(e, 'details', {}))
+        self.logger.info(
+            "Successfully retrieved usage statistics",
+            extra={
+                'period': response.get('period', {}),
+                'total_jobs': response.get('totals', {}).get('jobs', 0)
+            }
+        )
+        return response
+
+
+class AsyncNoteManager(NoteManager):
+    """Awaitable version of `NoteManager`.
+
+    Validation, payloads and error mapping are shared with `NoteManager`; only the
+    I/O is different. API calls and the presigned upload go through the client's
+    `httpx.AsyncClient`, so thousands of jobs can be in flight on a single event loop.
+
+    Example:
+        ```python
+        >>> response = await client.notes.process_audio(
+        ...     file_path="visit.mp3",
+        ...     visit_type="initialEncounter",
+        ...     recording_type="dictation",
+        ...     template="primaryCare"
+        ... )
+        >>> status = await client.notes.fetch_status(response["job_id"])
+        ```
+    """
+
+    async def _request(self, method: str, endpoint: str, data: Any = None, params: Dict[str, Any] = None, timeout: Optional[int] = None) -> Dict[str, Any]:
+        """Awaitable version of `NoteManager._request()`."""
+        if not self._client._api_key:
+            raise AuthenticationError("API key is required for note generation operations")
+
+        headers = {
+            'Content-Type': 'application/json',
+            'x-api-key': self._client._api_key
+        }
+
+        url = f"{self._config['api_base_url']}/{endpoint}"
+        timeout = timeout or self._config['request_timeout']
+        policy = self._retry_policy(endpoint)
+        circuit = self._client.circuit_breakers.get(endpoint)
+        attempt = 0
+
+        while True:
+            circuit.allow()
+            if self._client.rate_limiter is not None:
+                await self._client.rate_limiter.acquire_async(endpoint, self._client._api_key)
+            try:
+                self.logger.debug("Making %s request to %s", method, url)
+                response = await self._client.http.request(
+                    method,
+                    url,
+                    json=data if data else None,
+                    params=params,
+                    headers=headers,
+                    timeout=timeout
+                )
+            except httpx.HTTPError as e:
+                attempt += 1
+                delay = None
+                if isinstance(e, httpx.TransportError):
+                    circuit.record_failure()
+                    delay = policy.next_delay(attempt, method, sent=request_was_sent(e))
+                if delay is not None:
+                    self.logger.warning(
+                        "Request to %s failed (%s), retrying in %.1f seconds (attempt %d/%d)",
+                        endpoint, type(e).__name__, delay, attempt, policy.max_retries
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                if isinstance(e, httpx.TimeoutException):
+                    self.logger.error("Request timed out: %s", str(e))
+                    raise NetworkError(f"Request timed out: {str(e)}")
+                if isinstance(e, httpx.TransportError):
+                    self.logger.error("Connection error: %s", str(e))
+                    raise NetworkError(f"Connection error: {str(e)}")
+                self.logger.error("Request failed: %s", str(e))
+                raise NetworkError(f"Request failed: {str(e)}")
+
+            self.logger.debug("Received response: %s", response.status_code)
+            circuit.record_response(response.status_code)
+            if response.status_code == 429:
+                self._client._defer_rate_limit(endpoint, response.headers)
+
+            if response.status_code in policy.retry_on_status:
+                attempt += 1
+                delay = policy.next_delay(attempt, method, response.status_code, response.headers)
+                if delay is not None:
+                    self.logger.warning(
+                        "Request to %s failed with %d, retrying in %.1f seconds (attempt %d/%d)",
+                        endpoint, response.status_code, delay, attempt, policy.max_retries
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+            error = self._error_for_status(response.status_code, response.text)
+            if error is not None:
+                if isinstance(error, RateLimitError):
+                    wait = retry_after(response.headers)
+                    if wait is not None:
+                        error.details['retry_after'] = wait
+                raise error
+            if response.status_code >= 300:
+                raise NetworkError(f"HTTP error: {response.status_code} {response.text}")
+
+            policy.record_success()
+            try:
+                return response.json()
+            except ValueError as e:
+                self.logger.error("Invalid JSON response: %s", str(e))
+                raise BadRequestError("Invalid response format")
+
+    async def _create_job(self, endpoint: str, data: Dict[str, Any], map_field_errors: bool = True) -> Dict[str, Any]:
+        """Awaitable version of `NoteManager._create_job()`."""
+        try:
+            return await self._request("POST", endpoint, data=data)
+        except NoteDxError as e:
+            error = self._job_error(e, map_field_errors)
+            if error is e:
+                raise
+            raise error
+
+    async def _iter_body(self, body: Any) -> AsyncIterator[bytes]:
+        """Yield the chunks of an upload body without blocking on the network.
+
+        Chunks go through the process-wide upload bandwidth limiter, in slices of
+        at most its quantum while a cap is set. Chunks of a synchronous body are
+        read, and fed to its checksum, on the default executor so that file reads
+        and hashing do not block the event loop.
+
+        Args:
+            body: Upload body from `open_upload_body()` or an `_AsyncIteratorReader`
+        """
+        limiter = upload_limiter()
+        if hasattr(body, '__aiter__'):
+            async for chunk in body:
+                async for piece in self._throttle(chunk, limiter):
+                    yield piece
+        else:
+            loop = asyncio.get_running_loop()
+            chunks = iter(body)
+            while True:
+                chunk = await loop.run_in_executor(None, next, chunks, None)
+                if chunk is None:
+                    return
+                async for piece in self._throttle(chunk, limiter):
+                    yield piece
+
+    @staticmethod
+    async def _throttle(
+        chunk: Union[bytes, memoryview],
+        limiter: BandwidthLimiter
+    ) -> AsyncIterator[Union[bytes, memoryview]]:
+        if not limiter.limited:
+            yield chunk
+            return
+        view = memoryview(chunk)
+        for start in range(0, len(view), limiter.quantum):
+            piece = view[start:start + limiter.quantum]
+            await limiter.acquire_async(len(piece))
+            yield piece
+
+    async def _upload_file(
+        self,
+        presigned_url: str,
+        file_path: str,
+        job_id: str,
+        chunk_size: Optional[int] = None,
+        on_progress: Optional[Callable[[UploadProgress], None]] = None
+    ) -> None:
+        """Stream an audio file to its presigned URL in a single PUT.
+
+        Args:
+            presigned_url: Upload URL returned by job creation
+            file_path: Path to the audio file
+            job_id: ID of the job being processed
+            chunk_size: Size of the read chunks in bytes (optional)
+            on_progress: Function called with `UploadProgress` reports (optional)
+
+        Raises:
+            NetworkError: For connection issues
+            UploadError: For upload failures
+        """
+        mime_type = VALID_AUDIO_FORMATS[os.path.splitext(file_path)[1].lower()]
+        loop = asyncio.get_running_loop()
+        file_size = await loop.run_in_executor(None, os.path.getsize, file_path)
+        adaptive = chunk_size is None
+        chunk_size = chunk_size or self._calculate_optimal_chunk_size(file_size)
+        f = await loop.run_in_executor(None, open, file_path, 'rb')
+        try:
+            body = await loop.run_in_executor(
+                None, open_file_body,
+                f, 0, file_size, self._progress_callback(job_id, chunk_size, on_progress), chunk_size
+            )
+            try:
+                await self._upload_body(presigned_url, body, mime_type, job_id, chunk_size if adaptive else None)
+            finally:
+                body.close()
+        finally:
+            f.close()
+
+    async def _upload_body(
+        self,
+        presigned_url: str,
+        body: Any,
+        mime_type: str,
+        job_id: str,
+        max_chunk_size: Optional[int] = None
+    ) -> None:
+        """Awaitable version of `NoteManager._upload_body()`."""
+        headers = {'Content-Type': mime_type}
+        if body.total is not None:
+            headers['Content-Length'] = str(body.total)
+        if self._config['verify_checksum']:
+            body.enable_checksum()
+
+        sizer = None
+        if max_chunk_size is not None and body.rewindable:
+            sizer = AdaptiveChunkSizer(
+                self._throughput,
+                max_chunk_size=max_chunk_size,
+                default_timeout=self._config['request_timeout']
+            )
+            body = AdaptiveBody(body, sizer)
+
+        policy = self._upload_retry_policy()
+        attempt = 0
+        while True:
+            timeout = self._config['request_timeout']
+            if sizer is not None:
+                # httpx applies the write timeout to each chunk of the body
+                timeout = httpx.Timeout(timeout, write=sizer.timeout())
+            try:
+                response = await self._client.http.put(
+                    presigned_url,
+                    content=self._iter_body(body),
+                    headers=headers,
+                    timeout=timeout
+                )
+                rejection = rejected_url_error(response, job_id)
+                if rejection is not None:
+                    raise rejection
+                response.raise_for_status()
+                verify_checksum(response.headers, body.checksum, job_id)
+                policy.record_success()
+                return
+            except Exception as e:
+                attempt += 1
+                delay = None
+                if body.rewindable and not isinstance(e, UploadUrlRejectedError):
+                    delay = upload_retry_delay(policy, attempt, e)
+                if delay is None:
+                    self._handle_upload_error(e, job_id)
+                self.logger.warning(
+                    "Upload failed for job %s, retrying in %.1f seconds (attempt %d/%d)",
+                    job_id, delay, attempt, policy.max_retries + 1
+                )
+                await asyncio.sleep(delay)
+                body.rewind()
+
+    def _handle_upload_error(self, e: Exception, job_id: str) -> None:
+        """Handle httpx upload errors, falling back to `NoteManager._handle_upload_error()`.
+
+        Args:
+            e: The caught exception
+            job_id: ID of the job being processed
+
+        Raises:
+            NetworkError: For connection issues
+            UploadError: For upload failures
+        """
+        if httpx is not None and isinstance(e, httpx.HTTPError):
+            if isinstance(e, httpx.TimeoutException):
+                raise NetworkError(
+                    f"Timeout during file upload: {str(e)}",
+                    details={"job_id": job_id}
+                )
+            if isinstance(e, httpx.TransportError):
+                raise NetworkError(
+                    f"Connection error during file upload: {str(e)}",
+                    details={"job_id": job_id}
+                )
+            error_msg = e.response.text if isinstance(e, httpx.HTTPStatusError) else str(e)
+            raise UploadError(
+                f"Failed to upload file: {error_msg}",
+                job_id=job_id
+            )
+        super()._handle_upload_error(e, job_id)
+
+    async def process_audio(
+        self,
+        file_path: str,
+        visit_type: Optional[Literal['initialEncounter', 'followUp']] = None,
+        recording_type: Optional[Literal['dictation', 'conversation']] = None,
+        patient_consent: Optional[bool] = None,
+        lang: Literal['en', 'fr'] = 'en',
+        output_language: Optional[Literal['en', 'fr']] = None,
+        template: Optional[Literal['primaryCare', 'er', 'psychiatry', 'surgicalSpecialties',
+                                 'medicalSpecialties', 'nursing', 'radiology', 'procedures',
+                                 'letter', 'pharmacy', 'social', 'wfw', 'smartInsert', 'interventionalRadiology']] = None,
+        documentation_style: Optional[Literal['soap', 'problemBased']] = None,
+        custom: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+        custom_metadata: Optional[Dict[str, Any]] = None,
+        webhook_env: Optional[Literal['prod', 'dev']] = None,
+        on_progress: Optional[Callable[[UploadProgress], None]] = None,
+        trim_silence: bool = False,
+        speech_profile: bool = False
+    ) -> Dict[str, Any]:
+        """Awaitable version of `NoteManager.process_audio()`.
+
+        The file is streamed to the presigned URL without blocking the event loop
+        on the network. Validation, preprocessing (`trim_silence`, `speech_profile`),
+        file reads and checksums run on the default executor, so `on_progress` is
+        called from its threads.
+        """
+        self.logger.info("Starting audio processing for file: %s", file_path)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._validate_audio_file, file_path)
+        self._validate_input(
+            visit_type=visit_type,
+            recording_type=recording_type,
+            lang=lang,
+            template=template,
+            patient_consent=patient_consent,
+            output_language=output_language,
+            custom=custom
+        )
+
+        upload_path, preprocessing = await loop.run_in_executor(
+            None, self._preprocess_audio, file_path, trim_silence, speech_profile
+        )
+        try:
+            data = self._build_job_data(
+                lang=lang,
+                template=template,
+                visit_type=visit_type,
+                recording_type=recording_type,
+                patient_consent=patient_consent,
+                output_language=output_language,
+                custom=custom,
+                documentation_style=documentation_style,
+                custom_metadata=custom_metadata,
+                webhook_env=webhook_env,
+                file_extension=os.path.splitext(file_path)[1].lower()
+            )
+            refreshes = 0
+            while True:
+                response = await self._create_job("process-audio", data)
+
+                job_id = response.get('job_id')
+                presigned_url = response.get('presigned_url')
+                if not presigned_url or not job_id:
+                    raise ValidationError(
+                        "Invalid API response: missing presigned_url or job_id",
+                        details={"response": response}
+                    )
+
+                self.logger.info("Uploading file for job %s", job_id)
+                try:
+                    await self._upload_file(presigned_url, upload_path, job_id, chunk_size, on_progress)
+                    break
+                except UploadUrlRejectedError as e:
+                    # Storage will not take the upload on this URL: move it to a new job
+                    if not self._can_refresh_url(e, job_id, refreshes):
+                        raise
+                    refreshes += 1
+            self.logger.info("Successfully uploaded file for job %s", job_id)
+            if preprocessing:
+                response['preprocessing'] = preprocessing.to_dict()
+            return response
+        finally:
+            if upload_path != file_path:
+                os.remove(upload_path)
+
+    async def process_audio_stream(
+        self,
+        source: Union[AudioSource, AsyncIterable[bytes]],
+        format: str,
+        visit_type: Optional[Literal['initialEncounter', 'followUp']] = None,
+        recording_type: Optional[Literal['dictation', 'conversation']] = None,
+        patient_consent: Optional[bool] = None,
+        lang: Literal['en', 'fr'] = 'en',
+        output_language: Optional[Literal['en', 'fr']] = None,
+        template: Optional[Literal['primaryCare', 'er', 'psychiatry', 'surgicalSpecialties',
+                                 'medicalSpecialties', 'nursing', 'radiology', 'procedures',
+                                 'letter', 'pharmacy', 'social', 'wfw', 'smartInsert', 'interventionalRadiology']] = None,
+        documentation_style: Optional[Literal['soap', 'problemBased']] = None,
+        custom: Optional[Dict[str, Any]] = None,
+        custom_metadata: Optional[Dict[str, Any]] = None,
+        webhook_env: Optional[Literal['prod', 'dev']] = None,
+        size: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        on_progress: Optional[Callable[[UploadProgress], None]] = None
+    ) -> Dict[str, Any]:
+        """Awaitable version of `NoteManager.process_audio_stream()`.
+
+        Also accepts async iterators of bytes as `source`.
+        """
+        self.logger.info("Starting audio stream processing (format: %s)", format)
+        file_ext = self._validate_stream_format(format)
+        self._validate_input(
+            visit_type=visit_type,
+            recording_type=recording_type,
+            lang=lang,
+            template=template,
+            patient_consent=patient_consent,
+            output_language=output_language,
+            custom=custom
+        )
+
+        if hasattr(source, '__aiter__'):
+            body = _AsyncIteratorReader(source, size)
+        else:
+            try:
+                body = open_upload_body(source, size)
+            except (TypeError, OSError) as e:
+                raise ValidationError(str(e), field="source")
+        self._validate_stream_size(body.total)
+
+        data = self._build_job_data(
+            lang=lang,
+            template=template,
+            visit_type=visit_type,
+            recording_type=recording_type,
+            patient_consent=patient_consent,
+            output_language=output_language,
+            custom=custom,
+            documentation_style=documentation_style,
+            custom_metadata=custom_metadata,
+            webhook_env=webhook_env,
+            file_extension=file_ext
+        )
+        response = await self._create_job("process-audio", data)
+
+        job_id = response.get('job_id')
+        presigned_url = response.get('presigned_url')
+        if not presigned_url or not job_id:
+            raise ValidationError(
+                "Invalid API response: missing presigned_url or job_id",
+                details={"response": response}
+            )
+
+        adaptive = chunk_size is None
+        chunk_size = chunk_size or self._calculate_optimal_chunk_size(body.total or 0)
+        body.callback = self._progress_callback(job_id, chunk_size, on_progress)
+        self.logger.info("Uploading audio stream for job %s", job_id)
+        await self._upload_body(
+            presigned_url, body, VALID_AUDIO_FORMATS[file_ext], job_id, chunk_size if adaptive else None
+        )
+        self.logger.info("Successfully uploaded audio stream for job %s", job_id)
+        return response
+
+    async def process_text(
+        self,
+        text: str,
+        visit_type: Optional[Literal['initialEncounter', 'followUp']] = None,
+        recording_type: Optional[Literal['dictation', 'conversation']] = None,
+        patient_consent: Optional[bool] = None,
+        lang: Literal['en', 'fr'] = 'en',
+        output_language: Optional[Literal['en', 'fr']] = None,
+        template: Optional[Literal['primaryCare', 'er', 'psychiatry', 'surgicalSpecialties',
+                                 'medicalSpecialties', 'nursing', 'radiology', 'procedures',
+                                 'letter', 'pharmacy', 'social', 'wfw', 'smartInsert', 'interventionalRadiology']] = None,
+        documentation_style: Optional[Literal['soap', 'problemBased']] = None,
+        custom: Optional[Dict[str, Any]] = None,
+        custom_metadata: Optional[Dict[str, Any]] = None,
+        webhook_env: Optional[Literal['prod', 'dev']] = None
+    ) -> Dict[str, Any]:
+        """Awaitable version of `NoteManager.process_text()`."""
+        if not text:
+            raise MissingFieldError("text")
+        text = text.strip()
+        if not text:
+            raise ValidationError(
+                "Text field cannot be empty or whitespace only",
+                field="text"
+            )
+
+        self._validate_input(
+            visit_type=visit_type,
+            recording_type=recording_type,
+            lang=lang,
+            template=template,
+            patient_consent=patient_consent,
+            output_language=output_language,
+            custom=custom
+        )
+
+        data = self._build_job_data(
+            lang=lang,
+            template=template,
+            visit_type=visit_type,
+            recording_type=recording_type,
+            patient_consent=patient_consent,
+            output_language=output_language,
+            custom=custom,
+            documentation_style=documentation_style,
+            custom_metadata=custom_metadata,
+            webhook_env=webhook_env,
+            text=text
+        )
+        response = await self._create_job("process-text", data, map_field_errors=False)
+
+        if not response.get("job_id"):
+            raise BadRequestError("No job_id returned from API")
+        return response
+
+    async def regenerate_note(
+        self,
+        job_id: str,
+        template: Optional[Literal['primaryCare', 'er', 'psychiatry', 'surgicalSpecialties',
+                                 'medicalSpecialties', 'nursing', 'radiology', 'procedures',
+                                 'letter', 'social', 'wfw', 'smartInsert', 'interventionalRadiology']] = None,
+        output_language: Optional[Literal['en', 'fr']] = None,
+        documentation_style: Optional[Literal['soap', 'problemBased']] = None,
+        custom: Optional[Dict[str, Any]] = None,
+        custom_metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Awaitable version of `NoteManager.regenerate_note()`."""
+        self._validate_regenerate_input(job_id, template, output_language, documentation_style)
+
+        try:
+            status = await self.fetch_status(job_id)
+            self._ensure_job_completed(job_id, status)
+        except JobNotFoundError:
+            raise
+        except Exception as e:
+            if isinstance(e, (JobError, InternalServerError)):
+                raise
+            raise JobError(
+                f"Error checking original job status: {str(e)}",
+                job_id=job_id
+            )
+
+        data = {'job_id': job_id}
+        if template:
+            data['template'] = template
+        if output_language:
+            data['output_language'] = output_language
+        if custom:
+            data['custom'] = custom
+        if documentation_style:
+            data['documentation_style'] = documentation_style
+        if custom_metadata:
+            data['custom_metadata'] = custom_metadata
+
+        response = await self._request("POST", "regenerate-note", data=data)
+        if not response.get('job_id'):
+            raise ValidationError(
+                "Invalid API response: missing job_id",
+                details={"response": response}
+            )
+        return response
+
+    async def fetch_status(self, job_id: str) -> Dict[str, Any]:
+        """Awaitable version of `NoteManager.fetch_status()`."""
+        if not job_id:
+            raise MissingFieldError("job_id")
+
+        try:
+            response = await self._request("GET", f"status/{job_id}")
+            if 'status' not in response:
+                raise ValidationError(
+                    "Invalid API response: missing status field",
+                    details={"response": response}
+                )
+            return response
+        except NotFoundError:
+            raise JobNotFoundError(job_id)
+        except Exception as e:
+            if isinstance(e, (JobError, InternalServerError, BadRequestError)):
+                raise
+            raise JobError(
+                f"Error fetching status for job {job_id}: {str(e)}",
+                job_id=job_id
+            )
+
+    async def fetch_note(self, job_id: str) -> Dict[str, Any]:
+        """Awaitable version of `NoteManager.fetch_note()`."""
+        if not job_id:
+            raise MissingFieldError("job_id")
+
+        try:
+            response = await self._request("GET", f"fetch-note/{job_id}")
+        except NotFoundError:
+            raise JobNotFoundError(job_id)
+        except BadRequestError as e:
+            if "not completed" in str(e).lower():
+                raise JobError(
+                    "Note generation not completed",
+                    job_id=job_id,
+                    status="incomplete",
+                    details=e.details
+                )
+            raise
+
+        if 'note' not in response:
+            raise ValidationError(
+                "Invalid API response: missing note content",
+                details={"response": response}
+            )
+        return response
+
+    async def fetch_transcript(self, job_id: str) -> Dict[str, Any]:
+        """Awaitable version of `NoteManager.fetch_transcript()`."""
+        if not job_id:
+            raise MissingFieldError("job_id")
+
+        try:
+            response = await self._request("GET", f"fetch-transcript/{job_id}")
+        except NotFoundError:
+            raise JobNotFoundError(job_id)
+        except BadRequestError as e:
+            if "not transcribed" in str(e).lower():
+                raise JobError(
+                    "Transcription not completed",
+                    job_id=job_id,
+                    status="incomplete",
+                    details=e.details
+                )
+            raise
+
+        if 'transcript' not in response:
+            raise ValidationError(
+                "Invalid API response: missing transcript content",
+                details={"response": response}
+            )
+        return response
+
+    async def fetch_merged_transcript(self, job_ids: List[str]) -> Dict[str, Any]:
+        """Awaitable version of `NoteManager.fetch_merged_transcript()`."""
+        if not job_ids:
+            raise MissingFieldError("job_ids")
+        responses = await asyncio.gather(*(self.fetch_transcript(job_id) for job_id in job_ids))
+        return self._merge_segments(job_ids, list(responses), 'transcript')
+
+    async def fetch_merged_note(self, job_ids: List[str]) -> Dict[str, Any]:
+        """Awaitable version of `NoteManager.fetch_merged_note()`."""
+        if not job_ids:
+            raise MissingFieldError("job_ids")
+        responses = await asyncio.gather(*(self.fetch_note(job_id) for job_id in job_ids))
+        return self._merge_segments(job_ids, list(responses), 'note')
+
+    async def get_system_status(self) -> Dict[str, Any]:
+        """Awaitable version of `NoteManager.get_system_status()`."""
+        try:
+            response = await self._request("GET", "system/status")
+        except (NoteDxError, RateLimitError):
+            raise
+        except Exception as e:
+            raise ServiceUnavailableError(
+                "System status check failed",
+                details={"error": str(e)}
+            )
+
+        missing_fields = [field for field in ('status', 'services', 'latency') if field not in response]
+        if missing_fields:
+            raise ValidationError(
+                "Invalid API response: missing required fields",
+                details={
+                    "missing_fields": missing_fields,
+                    "response": response
+                }
+            )
+        return response
+
+
+class _AsyncIteratorReader(IteratorReader):
+    """`IteratorReader` over an async iterator of byte chunks."""
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._aiter()
+
+    async def _aiter(self) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        async for chunk in self._chunks:
+            if not len(chunk):
+                continue
+            if self.checksum is not None:
+                await loop.run_in_executor(None, self._advance, chunk)
+            else:
+                self._advance(chunk)
+            yield chunk
+
+
+ASYNC_MANAGERS = (
+    AsyncAccountManager,
+    AsyncKeyManager,
+    AsyncWebhookManager,
+    AsyncUsageManager,
+    AsyncNoteManager
+)
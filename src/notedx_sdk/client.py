@@ -1,16 +1,21 @@
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Mapping, Tuple, Union
 import requests
 import logging
+import time
 
 from .account.account_manager import AccountManager
 from .api_keys.key_manager import KeyManager
 from .webhooks.webhook_manager import WebhookManager
 from .core.note_manager import NoteManager
+from .core.circuit import CircuitBreakers
+from .core.ratelimit import RateLimiter
+from .core.retry import RetryPolicy, request_was_sent, retry_after, select_policy
 from .usage.usage_manager import UsageManager
 from .helpers import (
     get_env,
     parse_response,
-    build_headers
+    build_headers,
+    create_session
 )
 from .exceptions import (
     ConflictError,
@@ -54,6 +59,8 @@ class NoteDxClient:
         api_key (str, optional): API key for authentication. If not provided, reads from NOTEDX_API_KEY env var.
         auto_login (bool, optional): If True, automatically logs in when credentials are provided. Defaults to True.
         session (requests.Session, optional): Custom requests.Session for advanced configuration.
+        api_pool_size (int, optional): Maximum pooled keep-alive connections to the API host. Defaults to 10.
+        storage_pool_size (int, optional): Maximum pooled keep-alive connections per storage host. Defaults to 10.
     
     Raises:
         ValidationError: If the base_url is invalid
@@ -90,6 +97,7 @@ class NoteDxClient:
     
     Notes:
         - The session parameter allows for custom SSL, proxy, and timeout configuration
+        - All managers, including note generation and file uploads, share the same session
         - Auto-login can be disabled if you want to handle authentication manually
         - Each account starts with 100 free jobs (live API key)
         - Sandbox API keys have unlimited usage for testing
@@ -177,7 +185,13 @@ class NoteDxClient:
         password: Optional[str] = None,
         api_key: Optional[str] = None,
         auto_login: bool = True,
-        session: Optional[requests.Session] = None
+        session: Optional[requests.Session] = None,
+        api_pool_size: int = 10,
+        storage_pool_size: int = 10,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        rate_limiter: Optional[RateLimiter] = None
     ):
         """
         Initialize the NoteDx API client.
@@ -195,6 +209,17 @@ class NoteDxClient:
             api_key: API key for authentication. If not provided, reads from NOTEDX_API_KEY env var
             auto_login: If True, automatically logs in when credentials are provided
             session: Optional custom requests.Session for advanced configuration
+            api_pool_size: Maximum pooled keep-alive connections to the API host
+            storage_pool_size: Maximum pooled keep-alive connections per storage host (presigned uploads)
+            retry_policy: Retry policy of account, key, webhook and usage requests (optional).
+                Defaults to `RetryPolicy()`: up to 3 jittered retries of connection errors,
+                408, 429, 502, 503 and 504, honouring `Retry-After` and `X-RateLimit-Reset`.
+            retry_policies: Retry policies by endpoint prefix, overriding `retry_policy` (optional)
+            circuit_breakers: Circuit breakers guarding each endpoint family, shared with the
+                managers (optional). Defaults to `CircuitBreakers()`: a family failing 5 times in
+                a row is refused with `ServiceUnavailableError` for 30 seconds.
+            rate_limiter: Client-side rate limits by endpoint class, shared with the managers
+                (optional). Requests over a limit wait for their turn instead of getting a 429.
 
         Raises:
             ValidationError: If the base_url is invalid
@@ -204,10 +229,16 @@ class NoteDxClient:
 
         Note:
             - The session parameter allows for custom SSL, proxy, and timeout configuration
+            - A custom session is used as-is; the pool sizes only apply to the default session
             - Auto-login can be disabled if you want to handle authentication manually
         """
         self.base_url = self.BASE_URL
-        self.session = session or requests.Session()
+        self._owns_session = session is None
+        self.session = session or create_session(
+            self.base_url,
+            api_pool_size=api_pool_size,
+            storage_pool_size=storage_pool_size
+        )
 
         # Environment fallback
         self._email = email or get_env("NOTEDX_EMAIL") or None
@@ -229,6 +260,11 @@ class NoteDxClient:
         # Track auth retry attempts per endpoint
         self._auth_retry_counts: Dict[str, int] = {}
 
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_policies: Dict[str, RetryPolicy] = dict(retry_policies or {})
+        self.circuit_breakers = circuit_breakers or CircuitBreakers()
+        self.rate_limiter = rate_limiter
+
         # Initialize managers
         self.account = AccountManager(self)
         self.keys = KeyManager(self)
@@ -242,6 +278,29 @@ class NoteDxClient:
             logger.debug("Auto-login is enabled and email/password provided. Attempting login.")
             self._maybe_login()
 
+    def close(self) -> None:
+        """Cancel unfinished background uploads and release the client's resources.
+
+        Stops the worker threads of the note manager (see `NoteManager.close()`) and
+        closes the session unless it was passed in. The client can also be used as a
+        context manager, which closes it on exit.
+
+        Example:
+            ```python
+            >>> with NoteDxClient(api_key="your-api-key") as client:
+            ...     client.notes.process_audio("visit.mp3", template="wfw")
+            ```
+        """
+        self.notes.close()
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "NoteDxClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     # --------------------------------------------------
     # Internal Auth & Request Handling
     # --------------------------------------------------
@@ -713,170 +772,265 @@ class NoteDxClient:
                          for k, v in headers.items()}
             logger.debug("Using headers: %s", log_headers)
 
-        try:
-            log_data = {
-                'method': method,
-                'url': url,
-                'params': params
-            }
-            if data:
-                log_data['data'] = self._redact_sensitive_data(data)
-            logger.debug("Making request: %s", log_data)
-
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=data,
-                params=params,
-                timeout=timeout
-            )
-
+        policy = select_policy(self.retry_policies, endpoint, self.retry_policy)
+        circuit = self.circuit_breakers.get(endpoint)
+        attempt = 0
+        while True:
+            circuit.allow()
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint, self._api_key or self._email)
             try:
-                response_data = response.json()
-            except ValueError:
-                response_data = {"message": response.text}
-
-            # Log response details with sensitive data redacted
-            log_response = {
-                'status_code': response.status_code,
-                'data': self._redact_sensitive_data(response_data)
-            }
-            logger.debug("Received response: %s", log_response)
-
-            # If request is successful, update the last successful method
-            if 200 <= response.status_code < 300:
-                self._last_successful_methods[endpoint] = method
-                self._auth_retry_counts[endpoint] = 0
-                
-                # For login endpoint, log success
-                if endpoint == "auth/login":
-                    logger.info("Successfully logged in as: %s", self._email)
-                    
-                return response_data
-
-            # Handle rate limiting
-            if response.status_code == 429:
-                reset_time = response.headers.get('X-RateLimit-Reset')
-                logger.warning(
-                    "Rate limit exceeded for %s. Reset at: %s",
-                    endpoint, reset_time
-                )
-                raise RateLimitError(
-                    "API rate limit exceeded",
-                    reset_time=reset_time,
-                    details={"headers": dict(response.headers)}
+                log_data = {
+                    'method': method,
+                    'url': url,
+                    'params': params
+                }
+                if data:
+                    log_data['data'] = self._redact_sensitive_data(data)
+                logger.debug("Making request: %s", log_data)
+
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    json=data,
+                    params=params,
+                    timeout=timeout
                 )
 
-            # Handle various error responses
-            error_msg = (
-                response_data.get("message") or
-                response_data.get("Message") or
-                response_data.get("error", {}).get("message") or
-                str(response_data) or
-                "Unknown error"
-            )
-            error_code = response_data.get("error", {}).get("code")
-            error_details = response_data.get("details", {})
-            
-            if response.status_code == 401:
-                # Handle Firebase auth errors
-                if "Invalid API Key" in error_msg:
-                    logger.error("Invalid API key used for %s", endpoint)
-                    raise AuthenticationError(error_msg, error_code, error_details)
-                elif "User not found" in error_msg:
-                    logger.error("User not found for %s", endpoint)
-                    raise AuthenticationError(error_msg, "USER_NOT_FOUND", error_details)
-                elif "Invalid credentials" in error_msg:
-                    logger.error("Invalid credentials for %s", endpoint)
-                    raise AuthenticationError(error_msg, "INVALID_CREDENTIALS", error_details)
-                elif "Token expired" in error_msg or "expired" in error_msg.lower():
-                    logger.info("Token expired for %s, attempting refresh", endpoint)
-                    # Try to refresh token and retry request once
-                    if endpoint != "auth/refresh":  # Prevent infinite recursion
-                        if self._handle_auth_retry(endpoint, error_msg, error_code, response_data):
-                            return self._request(method, endpoint, data, params, timeout)
-                    raise AuthenticationError(error_msg, "TOKEN_EXPIRED", error_details)
-                else:
-                    # Try to refresh token first, then fall back to re-login
-                    if endpoint != "auth/refresh" and self._handle_auth_retry(endpoint, error_msg, error_code, response_data):
-                        return self._request(method, endpoint, data, params, timeout)
-                    raise AuthenticationError(error_msg, error_code, error_details)
+                try:
+                    response_data = response.json()
+                except ValueError:
+                    response_data = {"message": response.text}
+
+                # Log response details with sensitive data redacted
+                log_response = {
+                    'status_code': response.status_code,
+                    'data': self._redact_sensitive_data(response_data)
+                }
+                logger.debug("Received response: %s", log_response)
+                circuit.record_response(response.status_code)
+                if response.status_code == 429:
+                    self._defer_rate_limit(endpoint, response.headers)
+
+                # If request is successful, update the last successful method
+                if 200 <= response.status_code < 300:
+                    policy.record_success()
+                    self._last_successful_methods[endpoint] = method
+                    self._auth_retry_counts[endpoint] = 0
+
+                    # For login endpoint, log success
+                    if endpoint == "auth/login":
+                        logger.info("Successfully logged in as: %s", self._email)
+
+                    return response_data
+
+                if response.status_code in policy.retry_on_status:
+                    attempt += 1
+                    delay = policy.next_delay(attempt, method, response.status_code, response.headers)
+                    if delay is not None:
+                        logger.warning(
+                            "Request to %s failed with %d, retrying in %.1f seconds (attempt %d/%d)",
+                            endpoint, response.status_code, delay, attempt, policy.max_retries
+                        )
+                        time.sleep(delay)
+                        continue
 
-            elif response.status_code == 402:
-                logger.error("Payment required for %s: %s", endpoint, error_msg)
-                raise PaymentRequiredError(error_msg, error_code, error_details)
-            
-            elif response.status_code == 403:
-                if "Account Inactive" in error_msg:
-                    logger.error("Inactive account accessing %s", endpoint)
-                    raise InactiveAccountError(error_msg, error_code, error_details)
-                elif "Token revoked" in error_msg or "not authorized" in error_msg.lower():
-                    logger.info("Token revoked or unauthorized for %s, attempting refresh", endpoint)
-                    # Try to refresh token first, then fall back to re-login
+                # Handle rate limiting
+                if response.status_code == 429:
+                    raise self._rate_limit_error(endpoint, response.headers)
+
+                error_msg, error_code, _ = self._parse_error(response_data)
+
+                # Try to refresh token first, then fall back to re-login
+                if self._is_auth_retryable(endpoint, response.status_code, error_msg):
+                    logger.info(
+                        "Authorization failed for %s (%d), attempting token refresh",
+                        endpoint, response.status_code
+                    )
                     if self._handle_auth_retry(endpoint, error_msg, error_code, response_data):
                         return self._request(method, endpoint, data, params, timeout)
-                    raise AuthorizationError(error_msg, error_code, error_details)
-                # For any other 403, try refresh first, then re-login
-                if self._handle_auth_retry(endpoint, error_msg, error_code, response_data):
-                    return self._request(method, endpoint, data, params, timeout)
-                raise AuthorizationError(error_msg, error_code, error_details)
-
-            elif response.status_code == 404:
-                logger.error("Resource not found at %s", endpoint)
-                raise NotFoundError(error_msg, error_code, error_details)
-            
-            elif response.status_code == 400:
-                logger.error("Bad request to %s: %s", endpoint, error_msg)
-                raise BadRequestError(error_msg, error_code, error_details)
-            
-            elif response.status_code == 409:
-                logger.error("Conflict error from %s: %s", endpoint, error_msg)
-                raise ConflictError(error_msg, error_code, error_details)
-            
-            elif response.status_code >= 500:
-                logger.error("Server error from %s: %s", endpoint, error_msg)
-                raise InternalServerError(error_msg, error_code, error_details)
-            
-            else:
-                logger.error(
-                    "Unexpected status code %d from %s: %s",
-                    response.status_code, endpoint, error_msg
+
+                raise self._error_from_response(endpoint, response.status_code, response_data)
+
+            except (requests.Timeout, requests.ConnectionError) as e:
+                circuit.record_failure()
+                attempt += 1
+                delay = policy.next_delay(attempt, method, sent=request_was_sent(e))
+                if delay is not None:
+                    logger.warning(
+                        "Request to %s failed (%s), retrying in %.1f seconds (attempt %d/%d)",
+                        endpoint, type(e).__name__, delay, attempt, policy.max_retries
+                    )
+                    time.sleep(delay)
+                    continue
+                if isinstance(e, requests.Timeout):
+                    logger.error("Request to %s timed out after %d seconds", endpoint, timeout)
+                    raise NetworkError(
+                        f"Request timed out after {timeout} seconds",
+                        "TIMEOUT",
+                        {"url": url, "method": method}
+                    )
+                logger.error("Connection error for %s: %s", endpoint, str(e))
+                raise NetworkError(
+                    f"Connection error: {str(e)}",
+                    "CONNECTION_ERROR",
+                    {"url": url, "method": method}
                 )
-                raise NoteDxError(error_msg, error_code, error_details)
 
-        except requests.Timeout:
-            logger.error("Request to %s timed out after %d seconds", endpoint, timeout)
-            raise NetworkError(
-                f"Request timed out after {timeout} seconds",
-                "TIMEOUT",
-                {"url": url, "method": method}
-            )
-        
-        except requests.ConnectionError as e:
-            logger.error("Connection error for %s: %s", endpoint, str(e))
-            raise NetworkError(
-                f"Connection error: {str(e)}",
-                "CONNECTION_ERROR",
-                {"url": url, "method": method}
-            )
+            except requests.RequestException as e:
+                if isinstance(e, requests.HTTPError) and e.response is not None:
+                    # Handle any missed HTTP errors
+                    status_code = e.response.status_code
+                    if status_code >= 500:
+                        logger.error("Server error from %s: %s", endpoint, str(e))
+                        raise InternalServerError(str(e))
+                    else:
+                        logger.error("HTTP error from %s: %s", endpoint, str(e))
+                        raise BadRequestError(str(e))
+                logger.error("Request to %s failed: %s", endpoint, str(e))
+                raise NetworkError(f"Request failed: {str(e)}")
 
-        except requests.RequestException as e:
-            if isinstance(e, requests.HTTPError) and e.response is not None:
-                # Handle any missed HTTP errors
-                status_code = e.response.status_code
-                if status_code >= 500:
-                    logger.error("Server error from %s: %s", endpoint, str(e))
-                    raise InternalServerError(str(e))
-                else:
-                    logger.error("HTTP error from %s: %s", endpoint, str(e))
-                    raise BadRequestError(str(e))
-            logger.error("Request to %s failed: %s", endpoint, str(e))
-            raise NetworkError(f"Request failed: {str(e)}")
-        
-        except Exception as e:
-            logger.error("Unexpected error in request to %s: %s", endpoint, str(e))
-            raise
+            except Exception as e:
+                logger.error("Unexpected error in request to %s: %s", endpoint, str(e))
+                raise
+
+    @staticmethod
+    def _parse_error(response_data: Dict[str, Any]) -> Tuple[str, Optional[str], Dict[str, Any]]:
+        """Extract the error message, code and details from an API error payload.
+
+        Args:
+            response_data: Decoded error response body
+
+        Returns:
+            Tuple of (message, code, details)
+        """
+        error_msg = (
+            response_data.get("message") or
+            response_data.get("Message") or
+            response_data.get("error", {}).get("message") or
+            str(response_data) or
+            "Unknown error"
+        )
+        error_code = response_data.get("error", {}).get("code")
+        error_details = response_data.get("details", {})
+        return error_msg, error_code, error_details
+
+    @staticmethod
+    def _is_auth_retryable(endpoint: str, status_code: int, error_msg: str) -> bool:
+        """Check whether an auth failure can be fixed by refreshing the token or re-login.
+
+        Args:
+            endpoint: The API endpoint that failed
+            status_code: HTTP status code of the response
+            error_msg: Error message from the response
+
+        Returns:
+            bool: True if a token refresh/re-login should be attempted
+        """
+        if status_code == 401:
+            if any(msg in error_msg for msg in ("Invalid API Key", "User not found", "Invalid credentials")):
+                return False
+            # Prevent infinite recursion on the refresh endpoint itself
+            return endpoint != "auth/refresh"
+        if status_code == 403:
+            return "Account Inactive" not in error_msg
+        return False
+
+    def _defer_rate_limit(self, endpoint: str, headers: Mapping[str, str]) -> None:
+        """Hold the endpoint's rate limit bucket until the reset time of a 429 response."""
+        if self.rate_limiter is None:
+            return
+        wait = retry_after(headers)
+        if wait:
+            self.rate_limiter.defer(endpoint, self._api_key or self._email, wait)
+
+    @staticmethod
+    def _rate_limit_error(endpoint: str, headers: Mapping[str, str]) -> RateLimitError:
+        """Build the RateLimitError for a 429 response.
+
+        Args:
+            endpoint: The API endpoint that was rate limited
+            headers: Response headers
+
+        Returns:
+            RateLimitError: The exception to raise, including the reset time
+        """
+        reset_time = headers.get('X-RateLimit-Reset')
+        logger.warning(
+            "Rate limit exceeded for %s. Reset at: %s",
+            endpoint, reset_time
+        )
+        details: Dict[str, Any] = {"headers": dict(headers)}
+        wait = retry_after(headers)
+        if wait is not None:
+            details["retry_after"] = wait
+        return RateLimitError(
+            "API rate limit exceeded",
+            reset_time=reset_time,
+            details=details
+        )
+
+    @staticmethod
+    def _error_from_response(endpoint: str, status_code: int, response_data: Dict[str, Any]) -> NoteDxError:
+        """Map a failed API response to the matching SDK exception.
+
+        Args:
+            endpoint: The API endpoint that failed
+            status_code: HTTP status code of the response
+            response_data: Decoded response body
+
+        Returns:
+            NoteDxError: The exception to raise for this response
+        """
+        error_msg, error_code, error_details = NoteDxClient._parse_error(response_data)
+
+        if status_code == 401:
+            # Handle Firebase auth errors
+            if "Invalid API Key" in error_msg:
+                logger.error("Invalid API key used for %s", endpoint)
+                return AuthenticationError(error_msg, error_code, error_details)
+            elif "User not found" in error_msg:
+                logger.error("User not found for %s", endpoint)
+                return AuthenticationError(error_msg, "USER_NOT_FOUND", error_details)
+            elif "Invalid credentials" in error_msg:
+                logger.error("Invalid credentials for %s", endpoint)
+                return AuthenticationError(error_msg, "INVALID_CREDENTIALS", error_details)
+            elif "Token expired" in error_msg or "expired" in error_msg.lower():
+                return AuthenticationError(error_msg, "TOKEN_EXPIRED", error_details)
+            return AuthenticationError(error_msg, error_code, error_details)
+
+        elif status_code == 402:
+            logger.error("Payment required for %s: %s", endpoint, error_msg)
+            return PaymentRequiredError(error_msg, error_code, error_details)
+
+        elif status_code == 403:
+            if "Account Inactive" in error_msg:
+                logger.error("Inactive account accessing %s", endpoint)
+                return InactiveAccountError(error_msg, error_code, error_details)
+            return AuthorizationError(error_msg, error_code, error_details)
+
+        elif status_code == 404:
+            logger.error("Resource not found at %s", endpoint)
+            return NotFoundError(error_msg, error_code, error_details)
+
+        elif status_code == 400:
+            logger.error("Bad request to %s: %s", endpoint, error_msg)
+            return BadRequestError(error_msg, error_code, error_details)
+
+        elif status_code == 409:
+            logger.error("Conflict error from %s: %s", endpoint, error_msg)
+            return ConflictError(error_msg, error_code, error_details)
+
+        elif status_code >= 500:
+            logger.error("Server error from %s: %s", endpoint, error_msg)
+            return InternalServerError(error_msg, error_code, error_details)
+
+        logger.error(
+            "Unexpected status code %d from %s: %s",
+            status_code, endpoint, error_msg
+        )
+        return NoteDxError(error_msg, error_code, error_details)
 
     @staticmethod
     def _redact_sensitive_data(data: Any) -> Any:
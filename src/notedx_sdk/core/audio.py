@@ -0,0 +1,601 @@
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+import logging
+import math
+import os
+import time
+import wave
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+logger = logging.getLogger("notedx_sdk")
+
+# Formats whose samples can be read and rewritten without a codec
+PREPROCESS_EXTENSIONS = ('.wav', '.pcm')
+
+# numpy dtypes of the sample widths stored natively (24-bit samples are unpacked to int32)
+_SAMPLE_DTYPES = {1: 'u1', 2: '<i2', 4: '<i4'}
+
+
+class AudioFormat(NamedTuple):
+    """Layout of uncompressed PCM samples."""
+
+    sample_rate: int
+    channels: int
+    sample_width: int  # bytes per sample
+
+    @property
+    def frame_size(self) -> int:
+        return self.channels * self.sample_width
+
+
+# Assumed layout of headerless .pcm files: 16kHz, mono, 16-bit little-endian
+PCM_FORMAT = AudioFormat(16000, 1, 2)
+
+# What speech recognition needs: 16kHz, mono, 16-bit
+SPEECH_FORMAT = AudioFormat(16000, 1, 2)
+
+
+class PreprocessResult:
+    """Outcome of `preprocess_audio()`.
+
+    Attributes:
+        input_bytes: Size of the original file
+        output_bytes: Size of the preprocessed file
+        removed_seconds: Duration of the silence removed
+        cpu_seconds: CPU time spent preprocessing
+    """
+
+    __slots__ = ("input_bytes", "output_bytes", "removed_seconds", "cpu_seconds")
+
+    def __init__(
+        self,
+        input_bytes: int,
+        output_bytes: int,
+        removed_seconds: float = 0.0,
+        cpu_seconds: float = 0.0
+    ) -> None:
+        self.input_bytes = input_bytes
+        self.output_bytes = output_bytes
+        self.removed_seconds = removed_seconds
+        self.cpu_seconds = cpu_seconds
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.input_bytes - self.output_bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "input_bytes": self.input_bytes,
+            "output_bytes": self.output_bytes,
+            "bytes_saved": self.bytes_saved,
+            "removed_seconds": round(self.removed_seconds, 3),
+            "cpu_seconds": round(self.cpu_seconds, 3)
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"PreprocessResult(input_bytes={self.input_bytes}, output_bytes={self.output_bytes}, "
+            f"removed_seconds={self.removed_seconds:.3f}, cpu_seconds={self.cpu_seconds:.3f})"
+        )
+
+
+def numpy_available() -> bool:
+    """Whether the `audio` extra (numpy) is installed."""
+    return np is not None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "Audio preprocessing requires numpy. Install it with `pip install notedx-sdk[audio]`."
+        )
+
+
+def decode_samples(data: bytes, audio_format: AudioFormat) -> "np.ndarray":
+    """Interpret little-endian PCM bytes as a `(frames, channels)` sample array.
+
+    Partial trailing frames are dropped.
+    """
+    width = audio_format.sample_width
+    data = data[:len(data) - len(data) % audio_format.frame_size]
+    if width == 3:
+        raw = np.frombuffer(data, dtype='u1').reshape(-1, 3).astype(np.int32)
+        samples = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        samples = np.where(samples >= 1 << 23, samples - (1 << 24), samples).astype(np.int32)
+    else:
+        samples = np.frombuffer(data, dtype=_SAMPLE_DTYPES[width])
+    return samples.reshape(-1, audio_format.channels)
+
+
+def encode_samples(samples: "np.ndarray", audio_format: AudioFormat) -> bytes:
+    """Inverse of `decode_samples()`."""
+    if audio_format.sample_width == 3:
+        packed = samples.astype('<i4').reshape(-1, 1).view('u1')
+        return packed[:, :3].tobytes()
+    return samples.astype(_SAMPLE_DTYPES[audio_format.sample_width], copy=False).tobytes()
+
+
+def to_float(samples: "np.ndarray", sample_width: int) -> "np.ndarray":
+    """Scale integer samples to float32 in [-1, 1)."""
+    if sample_width == 1:
+        return (samples.astype(np.float32) - 128) / 128
+    return samples.astype(np.float32) / float(1 << (8 * sample_width - 1))
+
+
+def from_float(samples: "np.ndarray", sample_width: int) -> "np.ndarray":
+    """Inverse of `to_float()`, rounding and clipping to the integer range."""
+    scale = float(1 << (8 * sample_width - 1))
+    samples = np.clip(np.rint(samples * scale), -scale, scale - 1)
+    if sample_width == 1:
+        return (samples + 128).astype('u1')
+    return samples.astype(np.int32 if sample_width >= 3 else _SAMPLE_DTYPES[sample_width])
+
+
+class SpeechConverter:
+    """Streaming conversion to a leaner sample format (mono, 16kHz, 16-bit by default).
+
+    Channels are averaged in one vectorized pass. Downsampling applies a
+    windowed-sinc low-pass filter against aliasing, then interpolates the output
+    samples; filter state carries over between blocks, so the result does not
+    depend on block boundaries and memory is bounded by the block size. The
+    format is never upgraded: each property is only reduced, never raised.
+
+    Args:
+        audio_format: Layout of the samples passed to `process()`
+        target: Layout to convert to
+    """
+
+    # Low-pass taps per unit of decimation ratio
+    TAPS_PER_RATIO = 16
+
+    def __init__(self, audio_format: AudioFormat, target: AudioFormat = SPEECH_FORMAT) -> None:
+        _require_numpy()
+        self.input_format = audio_format
+        self.format = AudioFormat(
+            min(audio_format.sample_rate, target.sample_rate),
+            min(audio_format.channels, target.channels),
+            min(audio_format.sample_width, target.sample_width)
+        )
+        self._step = audio_format.sample_rate / self.format.sample_rate
+        self._in_frames = 0
+        self._out_frames = 0
+        self._pos = 0.0
+        self._carry = np.zeros((0, self.format.channels), dtype=np.float32)
+        self._filter = None
+        if self._step > 1:
+            taps = int(self.TAPS_PER_RATIO * self._step) | 1
+            cutoff = 0.45 / self._step  # just under the output Nyquist, in cycles per input sample
+            n = np.arange(taps) - (taps - 1) / 2
+            kernel = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(taps)
+            self._filter = (kernel / kernel.sum()).astype(np.float32)
+            self._delay = (taps - 1) // 2
+            self._skip = self._delay
+            self._history = np.zeros((taps - 1, self.format.channels), dtype=np.float32)
+
+    def process(self, samples: "np.ndarray") -> "np.ndarray":
+        """Convert a block of samples."""
+        self._in_frames += len(samples)
+        audio = to_float(samples, self.input_format.sample_width)
+        if self.format.channels < self.input_format.channels:
+            audio = audio.mean(axis=1, keepdims=True)
+        if self._filter is not None:
+            audio = self._resample(self._lowpass(audio))
+        return from_float(audio, self.format.sample_width)
+
+    def flush(self) -> "np.ndarray":
+        """Return the samples held in the filter once the input is exhausted."""
+        if self._filter is None:
+            return decode_samples(b"", self.format)
+        tail = self._resample(self._lowpass(np.zeros((self._delay, self.format.channels), dtype=np.float32)))
+        expected = int(round(self._in_frames / self._step))
+        return from_float(tail[:max(0, expected - (self._out_frames - len(tail)))], self.format.sample_width)
+
+    def _lowpass(self, audio: "np.ndarray") -> "np.ndarray":
+        padded = np.concatenate((self._history, audio))
+        self._history = padded[len(padded) - len(self._history):]
+        filtered = np.stack(
+            [np.convolve(padded[:, c], self._filter, mode='valid') for c in range(padded.shape[1])],
+            axis=1
+        )
+        # The first outputs of the filter precede the start of the input
+        skip = min(self._skip, len(filtered))
+        self._skip -= skip
+        return filtered[skip:]
+
+    def _resample(self, audio: "np.ndarray") -> "np.ndarray":
+        buffer = np.concatenate((self._carry, audio))
+        count = max(0, math.ceil((len(buffer) - 1 - self._pos) / self._step))
+        if not count:
+            if len(buffer):
+                self._pos -= len(buffer) - 1
+                self._carry = buffer[-1:]
+            return np.zeros((0, self.format.channels), dtype=np.float32)
+        positions = self._pos + self._step * np.arange(count)
+        index = positions.astype(np.int64)
+        fraction = (positions - index)[:, None].astype(np.float32)
+        out = buffer[index] * (1 - fraction) + buffer[index + 1] * fraction
+        # Rebase positions on the last sample, carried over to the next block
+        self._pos = positions[-1] + self._step - (len(buffer) - 1)
+        self._carry = buffer[-1:]
+        self._out_frames += count
+        return out
+
+
+class SilenceTrimmer:
+    """Streaming energy-based silence remover.
+
+    Samples are measured in short windows, with one vectorized RMS computation per
+    block. Silent stretches (RMS below `threshold_db` dBFS) longer than `min_silence`
+    seconds are cut down to `keep_silence` seconds next to speech, so speech keeps
+    its natural onset and decay. Only the ends of the current silent stretch are held in
+    memory, however long it lasts.
+
+    Args:
+        audio_format: Layout of the samples passed to `process()`
+        threshold_db: Level below which a window is silent, in dBFS
+        min_silence: Shortest silence that is trimmed, in seconds
+        keep_silence: Silence kept on each side of a trimmed stretch, in seconds
+        window: Length of the measurement windows, in seconds
+    """
+
+    def __init__(
+        self,
+        audio_format: AudioFormat,
+        threshold_db: float = -40.0,
+        min_silence: float = 1.0,
+        keep_silence: float = 0.25,
+        window: float = 0.02
+    ) -> None:
+        _require_numpy()
+        rate = audio_format.sample_rate
+        self.format = audio_format
+        self.removed_frames = 0
+        self._threshold = 10 ** (threshold_db / 20)
+        self._window = max(1, int(rate * window))
+        self._min_silence = max(1, int(rate * min_silence))
+        self._keep = min(int(rate * keep_silence), self._min_silence // 2)
+        self._empty = decode_samples(b"", audio_format)
+        self._leftover = self._empty
+        # Current silent stretch: every window while short, then only its two ends
+        self._silence: List["np.ndarray"] = []
+        self._silence_frames = 0
+        self._head: Optional["np.ndarray"] = None
+        self._tail: Optional["np.ndarray"] = None
+        self._speech_seen = False
+
+    def process(self, samples: "np.ndarray") -> "np.ndarray":
+        """Feed a block of samples and return the samples to keep so far."""
+        samples = np.concatenate((self._leftover, samples))
+        usable = len(samples) - len(samples) % self._window
+        self._leftover = samples[usable:]
+        if not usable:
+            return self._empty
+
+        windows = to_float(samples[:usable], self.format.sample_width)
+        levels = np.sqrt(np.mean(np.square(windows.reshape(usable // self._window, -1)), axis=1))
+        silent = levels < self._threshold
+
+        # Walk the runs of silent / voiced windows rather than every window
+        edges = np.flatnonzero(np.diff(silent.astype(np.int8))) + 1
+        starts = np.concatenate(([0], edges))
+        ends = np.concatenate((edges, [len(silent)]))
+        kept: List["np.ndarray"] = []
+        for start, end in zip(starts, ends):
+            run = samples[start * self._window:end * self._window]
+            if silent[start]:
+                self._add_silence(run)
+            else:
+                kept.extend(self._end_silence())
+                kept.append(run)
+                self._speech_seen = True
+        return np.concatenate(kept) if kept else self._empty
+
+    def flush(self) -> "np.ndarray":
+        """Return the samples still held back once the input is exhausted."""
+        kept = self._end_silence(final=True) + [self._leftover]
+        self._leftover = self._empty
+        return np.concatenate(kept)
+
+    def _add_silence(self, run: "np.ndarray") -> None:
+        self._silence_frames += len(run)
+        if self._head is None:
+            self._silence.append(run)
+            if self._silence_frames > self._min_silence:
+                silence = np.concatenate(self._silence)
+                self._head = silence[:self._keep].copy()
+                self._tail = silence[len(silence) - self._keep:].copy()
+                self._silence = []
+        else:
+            tail = np.concatenate((self._tail, run))
+            self._tail = tail[len(tail) - self._keep:].copy()
+
+    def _end_silence(self, final: bool = False) -> List["np.ndarray"]:
+        if self._head is None:
+            kept = self._silence
+        else:
+            # Leading silence only needs the end before speech, trailing silence the start after it
+            kept = [part for part, keep in ((self._head, self._speech_seen), (self._tail, not final)) if keep]
+            self.removed_frames += self._silence_frames - sum(len(part) for part in kept)
+        self._silence = []
+        self._silence_frames = 0
+        self._head = self._tail = None
+        return kept
+
+
+def _read_blocks(read: Callable[[int], bytes], audio_format: AudioFormat, block_frames: int) -> Iterator["np.ndarray"]:
+    while True:
+        data = read(block_frames)
+        if not data:
+            return
+        yield decode_samples(data, audio_format)
+
+
+def preprocess_audio(
+    input_path: str,
+    output_path: str,
+    trim_silence: bool = False,
+    speech_format: Optional[AudioFormat] = None,
+    silence_threshold_db: float = -40.0,
+    min_silence: float = 1.0,
+    keep_silence: float = 0.25,
+    pcm_format: AudioFormat = PCM_FORMAT,
+    block_seconds: float = 10.0
+) -> PreprocessResult:
+    """Rewrite a WAV or PCM recording into a smaller file before upload.
+
+    The input is streamed in blocks of `block_seconds` through each enabled
+    stage, so memory stays bounded regardless of the recording length. The
+    output keeps the input's container (WAV or raw PCM).
+
+    Args:
+        input_path: Path to a `.wav` or `.pcm` file
+        output_path: Where to write the processed audio
+        trim_silence: Remove long silences (see `SilenceTrimmer`)
+        speech_format: Convert to this sample layout, e.g. `SPEECH_FORMAT` for mono 16kHz
+            16-bit (see `SpeechConverter`). By default the input layout is kept
+        silence_threshold_db: Level below which audio counts as silence, in dBFS
+        min_silence: Shortest silence that is trimmed, in seconds
+        keep_silence: Silence kept around speech, in seconds
+        pcm_format: Sample layout of headerless `.pcm` files
+        block_seconds: Duration of audio processed at a time
+
+    Returns:
+        PreprocessResult with the input and output sizes
+
+    Raises:
+        ImportError: If numpy is not installed
+        ValueError: If the file is not WAV or PCM
+        wave.Error: If the WAV file is not uncompressed PCM
+        EOFError: If the WAV file is truncated
+
+    Example:
+        ```python
+        >>> result = preprocess_audio("visit.wav", "visit.trimmed.wav", trim_silence=True)
+        >>> result.bytes_saved
+        3145728
+        ```
+    """
+    _require_numpy()
+    started = time.process_time()
+    ext = os.path.splitext(input_path)[1].lower()
+    if ext not in PREPROCESS_EXTENSIONS:
+        raise ValueError(f"Cannot preprocess {ext or 'extensionless'} audio, only WAV and PCM")
+
+    with open(input_path, 'rb') as source, open(output_path, 'wb') as target:
+        if ext == '.wav':
+            reader = wave.open(source, 'rb')
+            audio_format = AudioFormat(reader.getframerate(), reader.getnchannels(), reader.getsampwidth())
+            read: Callable[[int], bytes] = reader.readframes
+        else:
+            reader = None
+            audio_format = pcm_format
+            read = lambda frames: source.read(frames * audio_format.frame_size)
+
+        stages: List[Any] = []
+        output_format = audio_format
+        if speech_format is not None:
+            # Convert first, so the later stages work on fewer samples
+            stages.append(SpeechConverter(output_format, speech_format))
+            output_format = stages[-1].format
+        if trim_silence:
+            stages.append(SilenceTrimmer(output_format, silence_threshold_db, min_silence, keep_silence))
+
+        writer: Optional[wave.Wave_write] = None
+        write: Callable[[bytes], Any] = target.write
+        if reader is not None:
+            writer = wave.open(target, 'wb')
+            writer.setnchannels(output_format.channels)
+            writer.setsampwidth(output_format.sample_width)
+            writer.setframerate(output_format.sample_rate)
+            write = writer.writeframes
+
+        def run(samples: "np.ndarray", final: bool = False) -> "np.ndarray":
+            for stage in stages:
+                samples = stage.process(samples)
+                if final:
+                    samples = np.concatenate((samples, stage.flush()))
+            return samples
+
+        try:
+            block_frames = max(1, int(audio_format.sample_rate * block_seconds))
+            for block in _read_blocks(read, audio_format, block_frames):
+                write(encode_samples(run(block), output_format))
+            write(encode_samples(run(decode_samples(b"", audio_format), final=True), output_format))
+        finally:
+            if writer is not None:
+                writer.close()
+            if reader is not None:
+                reader.close()
+
+    result = PreprocessResult(
+        os.path.getsize(input_path),
+        os.path.getsize(output_path),
+        sum(stage.removed_frames / stage.format.sample_rate for stage in stages if hasattr(stage, 'removed_frames')),
+        time.process_time() - started
+    )
+    logger.debug("Preprocessed %s: %r", input_path, result)
+    return result
+
+
+class AudioSegment(NamedTuple):
+    """A part of a recording written by `split_audio()`."""
+
+    path: str
+    start: float  # seconds from the start of the recording
+    duration: float  # seconds
+
+
+def quietest_point(samples: "np.ndarray", audio_format: AudioFormat, threshold_db: float = -40.0, window: float = 0.02) -> int:
+    """Find where in a block of samples a recording is best cut.
+
+    Args:
+        samples: `(frames, channels)` sample array
+        audio_format: Layout of the samples
+        threshold_db: Level below which a window is silent, in dBFS
+        window: Length of the measurement windows, in seconds
+
+    Returns:
+        Frame index of the middle of the longest silence, or of the quietest
+        window when nothing is below the threshold
+    """
+    _require_numpy()
+    size = max(1, int(audio_format.sample_rate * window))
+    count = len(samples) // size
+    if not count:
+        return len(samples) // 2
+    audio = to_float(samples[:count * size], audio_format.sample_width)
+    levels = np.sqrt(np.mean(np.square(audio.reshape(count, -1)), axis=1))
+    silent = levels < 10 ** (threshold_db / 20)
+    if not silent.any():
+        return int(np.argmin(levels)) * size + size // 2
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], silent.astype(np.int8), [0]))))
+    starts, ends = edges[::2], edges[1::2]
+    longest = int(np.argmax(ends - starts))
+    return int((starts[longest] + ends[longest]) * size // 2)
+
+
+def split_audio(
+    input_path: str,
+    output_dir: str,
+    max_bytes: int,
+    silence_threshold_db: float = -40.0,
+    search_seconds: float = 60.0,
+    pcm_format: AudioFormat = PCM_FORMAT,
+    block_seconds: float = 10.0
+) -> List[AudioSegment]:
+    """Split a WAV or PCM recording into files of at most `max_bytes`, cutting at silences.
+
+    Segments are balanced: a recording a little over the limit is cut near its
+    middle rather than at the limit. Each cut is placed in the longest silence
+    within `search_seconds` around its ideal position (or the quietest moment,
+    if there is no silence), so words are not cut in two. Only the search
+    windows are decoded; the segments are copied as raw frames in blocks of
+    `block_seconds`, keeping memory bounded.
+
+    Args:
+        input_path: Path to a `.wav` or `.pcm` file
+        output_dir: Directory the segments are written to, named `<name>.part<n><ext>`
+        max_bytes: Maximum size of a segment file, headers included
+        silence_threshold_db: Level below which audio counts as silence, in dBFS
+        search_seconds: Span of audio searched for each cut
+        pcm_format: Sample layout of headerless `.pcm` files
+        block_seconds: Duration of audio copied at a time
+
+    Returns:
+        The segments in recording order; a single one when the file already fits
+
+    Raises:
+        ImportError: If numpy is not installed
+        ValueError: If the file is not WAV or PCM, or `max_bytes` is too small to hold audio
+        wave.Error: If the WAV file is not uncompressed PCM
+        EOFError: If the WAV file is truncated
+
+    Example:
+        ```python
+        >>> segments = split_audio("procedure.wav", "/tmp/parts", 500 * 1024 * 1024)
+        >>> [round(segment.duration) for segment in segments]
+        [2731, 2794]
+        ```
+    """
+    _require_numpy()
+    ext = os.path.splitext(input_path)[1].lower()
+    if ext not in PREPROCESS_EXTENSIONS:
+        raise ValueError(f"Cannot split {ext or 'extensionless'} audio, only WAV and PCM")
+    name = os.path.splitext(os.path.basename(input_path))[0]
+
+    with open(input_path, 'rb') as source:
+        reader = wave.open(source, 'rb') if ext == '.wav' else None
+        try:
+            if reader is not None:
+                audio_format = AudioFormat(reader.getframerate(), reader.getnchannels(), reader.getsampwidth())
+                total = reader.getnframes()
+                header_size = 44
+
+                def read_at(frame: int, count: int) -> bytes:
+                    reader.setpos(frame)
+                    return reader.readframes(count)
+            else:
+                audio_format = pcm_format
+                total = os.fstat(source.fileno()).st_size // audio_format.frame_size
+                header_size = 0
+
+                def read_at(frame: int, count: int) -> bytes:
+                    source.seek(frame * audio_format.frame_size)
+                    return source.read(count * audio_format.frame_size)
+
+            limit = (max_bytes - header_size) // audio_format.frame_size
+            search = min(int(audio_format.sample_rate * search_seconds), limit // 4)
+            if search < 1:
+                raise ValueError(f"Segments of {max_bytes} bytes are too small to split {input_path}")
+
+            cuts = [0]
+            while total - cuts[-1] > limit:
+                remaining = total - cuts[-1]
+                target = math.ceil(remaining / math.ceil(remaining / (limit - search)))
+                window_start = cuts[-1] + target - search // 2
+                window = decode_samples(read_at(window_start, search), audio_format)
+                cuts.append(window_start + quietest_point(window, audio_format, silence_threshold_db))
+            cuts.append(total)
+
+            block_frames = max(1, int(audio_format.sample_rate * block_seconds))
+            segments = []
+            for index, (start, end) in enumerate(zip(cuts, cuts[1:]), 1):
+                path = os.path.join(output_dir, f"{name}.part{index}{ext}")
+                _write_frames(path, read_at, start, end, audio_format if reader is not None else None, block_frames)
+                rate = audio_format.sample_rate
+                segments.append(AudioSegment(path, start / rate, (end - start) / rate))
+        finally:
+            if reader is not None:
+                reader.close()
+
+    logger.debug("Split %s into %d segments at %s", input_path, len(segments), cuts[1:-1])
+    return segments
+
+
+def _write_frames(
+    path: str,
+    read_at: Callable[[int, int], bytes],
+    start: int,
+    end: int,
+    wav_format: Optional[AudioFormat],
+    block_frames: int
+) -> None:
+    with open(path, 'wb') as target:
+        writer: Optional[wave.Wave_write] = None
+        write: Callable[[bytes], Any] = target.write
+        if wav_format is not None:
+            writer = wave.open(target, 'wb')
+            writer.setnchannels(wav_format.channels)
+            writer.setsampwidth(wav_format.sample_width)
+            writer.setframerate(wav_format.sample_rate)
+            writer.setnframes(end - start)
+            write = writer.writeframes
+        try:
+            for frame in range(start, end, block_frames):
+                write(read_at(frame, min(block_frames, end - frame)))
+        finally:
+            if writer is not None:
+                writer.close()
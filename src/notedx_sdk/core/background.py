@@ -0,0 +1,158 @@
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+import logging
+import threading
+
+from ..exceptions import UploadCancelledError
+from .uploads import UploadProgress
+
+logger = logging.getLogger("notedx_sdk")
+
+
+class UploadControl:
+    """Pause and cancellation state checked by an upload as it reads its body.
+
+    `check()` is called before each chunk is handed to the transport: it blocks
+    while the upload is paused and raises `UploadCancelledError` once it is
+    cancelled, so both take effect at the next chunk boundary.
+
+    Args:
+        job_id: ID of the job being uploaded
+    """
+
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+        self.cancelled = False
+        self._running = threading.Event()
+        self._running.set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    def pause(self) -> None:
+        self._running.clear()
+
+    def resume(self) -> None:
+        self._running.set()
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        # A paused upload has to wake up to notice
+        self._running.set()
+
+    def check(self) -> None:
+        """Block while paused, raise if cancelled.
+
+        Raises:
+            UploadCancelledError: If the upload was cancelled
+        """
+        if not self._running.is_set():
+            logger.debug("Upload for job %s paused", self.job_id)
+            self._running.wait()
+            logger.debug("Upload for job %s resumed", self.job_id)
+        if self.cancelled:
+            raise UploadCancelledError(self.job_id)
+
+
+class UploadHandle:
+    """Handle on an upload running in the background, returned by `process_audio(background=True)`.
+
+    The job already exists when the handle is returned, so `job_id` can be stored
+    or handed to a webhook consumer right away while the recording uploads.
+
+    Pausing and cancelling take effect at the next chunk of the upload (parts,
+    for multipart uploads). A single-request upload that stays paused for long
+    may be dropped by storage, in which case it restarts from the beginning when
+    resumed. A cancelled upload keeps its checkpoint, so it can be continued
+    later with `resume_upload()`.
+
+    Attributes:
+        job_id: ID of the job the recording is uploaded to. Updated if the upload
+            had to move to a new job because its URL expired while queued.
+        response: Response of the job creation
+
+    Example:
+        ```python
+        >>> handle = note_manager.process_audio("visit.mp3", template="wfw", background=True)
+        >>> handle.job_id
+        'job-123'
+        >>> handle.progress().fraction
+        0.42
+        >>> handle.wait()["job_id"]
+        'job-123'
+        ```
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        response: Dict[str, Any],
+        total_bytes: Optional[int] = None,
+        on_progress: Optional[Callable[[UploadProgress], None]] = None
+    ) -> None:
+        self.job_id = job_id
+        self.response = response
+        self.control = UploadControl(job_id)
+        self._on_progress = on_progress
+        self._progress = UploadProgress(job_id, 0, total_bytes, 0.0, 0.0, None)
+        self._future: "Optional[Future[Dict[str, Any]]]" = None
+
+    def report(self, progress: UploadProgress) -> None:
+        """Record a progress report of the upload and forward it to `on_progress`."""
+        self._progress = progress
+        if self._on_progress is not None:
+            self._on_progress(progress)
+
+    def start(self, future: "Future[Dict[str, Any]]") -> None:
+        self._future = future
+
+    def progress(self) -> UploadProgress:
+        """Latest progress report of the upload (refreshed every `progress_interval` seconds)."""
+        return self._progress
+
+    @property
+    def state(self) -> str:
+        """One of `uploading`, `paused`, `completed`, `cancelled` or `failed`."""
+        if self._future is not None and self._future.done():
+            error = self._future.exception()
+            if error is None:
+                return "completed"
+            return "cancelled" if isinstance(error, UploadCancelledError) else "failed"
+        return "paused" if self.control.paused else "uploading"
+
+    def done(self) -> bool:
+        """Whether the upload finished, successfully or not."""
+        return self._future is not None and self._future.done()
+
+    def pause(self) -> None:
+        """Hold the upload after the chunk being sent."""
+        self.control.pause()
+
+    def resume(self) -> None:
+        """Continue a paused upload."""
+        self.control.resume()
+
+    def cancel(self) -> None:
+        """Stop the upload after the chunk being sent; `wait()` then raises `UploadCancelledError`."""
+        self.control.cancel()
+
+    def wait(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Wait for the upload to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (optional)
+
+        Returns:
+            The `process_audio()` response of the job
+
+        Raises:
+            UploadCancelledError: If the upload was cancelled
+            UploadError: If the upload failed
+            NetworkError: For connection issues
+            concurrent.futures.TimeoutError: If the upload is still running after `timeout` seconds
+        """
+        return self._future.result(timeout)
+
+    def __repr__(self) -> str:
+        return f"UploadHandle(job_id={self.job_id!r}, state={self.state!r})"
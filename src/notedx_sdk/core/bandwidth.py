@@ -0,0 +1,115 @@
+from typing import Optional
+import asyncio
+import threading
+import time
+
+
+class BandwidthLimiter:
+    """Token bucket shared by concurrent uploads to cap their combined throughput.
+
+    Uploads pay for the bytes they send in quanta of `quantum` bytes. Each quantum
+    is scheduled after the ones already granted, so concurrent uploads asking for
+    one quantum at a time are served in turn and share the cap fairly, whatever
+    their chunk sizes. Up to `burst` bytes can go out at once after an idle period.
+
+    The cap can be changed at any time with `set_rate()`; uploads waiting for a
+    quantum keep their schedule, and the bytes granted but not yet paid for are
+    paid at the new rate. Without a rate, nothing is limited and `acquire()` costs
+    one attribute check.
+
+    Args:
+        rate: Bytes per second, or None for no limit
+        burst: Bytes that can be sent at once after an idle period. Defaults to one quantum.
+        quantum: Bytes paid for at a time
+
+    Example:
+        ```python
+        >>> limiter = BandwidthLimiter(rate=2 * 1024 * 1024)  # 2MB/s
+        >>> limiter.acquire(len(chunk))  # blocks until the chunk may be sent
+        >>> limiter.set_rate(None)  # lift the cap
+        ```
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        quantum: int = 64 * 1024
+    ) -> None:
+        if quantum < 1:
+            raise ValueError("quantum must be at least 1 byte")
+        self.quantum = quantum
+        self._lock = threading.Lock()
+        # Time at which every byte granted so far is paid for
+        self._paid_until = 0.0
+        self.rate: Optional[float] = None
+        self.burst = quantum
+        self.set_rate(rate, burst)
+
+    @property
+    def limited(self) -> bool:
+        return self.rate is not None
+
+    def set_rate(self, rate: Optional[float], burst: Optional[int] = None) -> None:
+        """Change the cap.
+
+        Args:
+            rate: Bytes per second, or None for no limit
+            burst: Bytes that can be sent at once after an idle period (optional)
+
+        Raises:
+            ValueError: If `rate` is not positive or `burst` is negative
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive, or None for no limit")
+        if burst is not None and burst < 0:
+            raise ValueError("burst cannot be negative")
+        with self._lock:
+            now = time.monotonic()
+            if rate is None or self.rate is None:
+                # Nothing granted without a cap is owed once one is set
+                self._paid_until = now
+            elif self._paid_until > now:
+                # Bytes granted but not yet paid for are paid at the new rate
+                self._paid_until = now + (self._paid_until - now) * self.rate / rate
+            self.rate = rate
+            if burst is not None:
+                self.burst = burst
+
+    def reserve(self, nbytes: int) -> float:
+        """Schedule `nbytes` (at most one quantum) and return the seconds to wait before sending them."""
+        with self._lock:
+            rate = self.rate
+            if rate is None:
+                return 0.0
+            now = time.monotonic()
+            # Idle time does not accumulate beyond `burst`
+            self._paid_until = max(self._paid_until, now) + nbytes / rate
+            return max(0.0, self._paid_until - now - self.burst / rate)
+
+    def acquire(self, nbytes: int) -> None:
+        """Block until `nbytes` may be sent, one quantum at a time."""
+        while nbytes > 0 and self.rate is not None:
+            size = min(nbytes, self.quantum)
+            delay = self.reserve(size)
+            if delay > 0:
+                time.sleep(delay)
+            nbytes -= size
+
+    async def acquire_async(self, nbytes: int) -> None:
+        """Awaitable version of `acquire()`."""
+        while nbytes > 0 and self.rate is not None:
+            size = min(nbytes, self.quantum)
+            delay = self.reserve(size)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            nbytes -= size
+
+
+# Shared by every upload of the process
+_upload_limiter = BandwidthLimiter()
+
+
+def upload_limiter() -> BandwidthLimiter:
+    """The process-wide limiter applied to every upload."""
+    return _upload_limiter
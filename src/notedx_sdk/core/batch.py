@@ -0,0 +1,174 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+import logging
+import queue
+import threading
+
+logger = logging.getLogger("notedx_sdk")
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+class BatchResult:
+    """Outcome of one item of a batch, yielded by `process_batch()`.
+
+    Attributes:
+        index: Position of the item in the submitted batch
+        item: The item as submitted
+        job_id: ID of the job created for the item, once created
+        response: Response of the job creation
+        status: Last status fetched while waiting for the job
+        note: Response of `fetch_note()`, when notes are fetched
+        error: Exception that stopped the item, or None
+        stage: Name of the last stage the item went through (the failed one, on error)
+    """
+
+    __slots__ = ("index", "item", "job_id", "response", "status", "note", "error", "stage", "context")
+
+    def __init__(self, index: int, item: Any) -> None:
+        self.index = index
+        self.item = item
+        self.job_id: Optional[str] = None
+        self.response: Optional[Dict[str, Any]] = None
+        self.status: Optional[Dict[str, Any]] = None
+        self.note: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+        self.stage: Optional[str] = None
+        # Working state handed from one stage to the next
+        self.context: Dict[str, Any] = {}
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error else "ok"
+        return f"BatchResult(index={self.index}, job_id={self.job_id!r}, stage={self.stage!r}, {outcome})"
+
+
+class Stage(NamedTuple):
+    """A step of a `BatchPipeline`.
+
+    `run` is called with the result being processed and the pipeline's stop
+    event; it records its output on the result and raises to fail the item.
+    Long waits should use the stop event, so a closed pipeline stops promptly.
+    """
+
+    name: str
+    run: Callable[[BatchResult, threading.Event], None]
+    workers: int
+
+
+class _Fed(NamedTuple):
+    count: int
+    error: Optional[BaseException]
+
+
+class BatchPipeline:
+    """Run items through stages, each with its own worker threads.
+
+    Stages are connected by bounded queues, and at most `max_inflight` items are
+    between admission and being yielded, so a slow stage holds back the ones
+    before it instead of piling up work. Items are read lazily from the input,
+    and results are yielded as soon as an item completes or fails, in completion
+    order. An item that fails skips the remaining stages.
+
+    Closing the result iterator early stops admitting items, lets the items in
+    a stage finish it, and skips their remaining stages.
+
+    Args:
+        stages: Stages, in order
+        max_inflight: Maximum number of items admitted and not yet yielded
+
+    Example:
+        ```python
+        >>> pipeline = BatchPipeline([Stage("double", double, workers=4)], max_inflight=8)
+        >>> for result in pipeline.run(range(100)):
+        ...     print(result.index, result.ok)
+        ```
+    """
+
+    def __init__(self, stages: Sequence[Stage], max_inflight: int = 16) -> None:
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        if max_inflight < 1:
+            raise ValueError("max_inflight must be at least 1")
+        self.stages = list(stages)
+        self.max_inflight = max_inflight
+
+    def run(self, items: Iterable[Any]) -> Iterator[BatchResult]:
+        """Process items, yielding a `BatchResult` for each as it completes."""
+        slots = threading.Semaphore(self.max_inflight)
+        stop = threading.Event()
+        queues: List["queue.Queue[Any]"] = [queue.Queue(maxsize=max(1, stage.workers)) for stage in self.stages]
+        results: "queue.Queue[Any]" = queue.Queue()
+
+        def feed() -> None:
+            count = 0
+            error = None
+            try:
+                for item in items:
+                    slots.acquire()
+                    if stop.is_set():
+                        break
+                    queues[0].put(BatchResult(count, item))
+                    count += 1
+            except Exception as e:
+                error = e
+            results.put(_Fed(count, error))
+
+        def work(index: int) -> None:
+            stage = self.stages[index]
+            while True:
+                result = queues[index].get()
+                if result is _DONE:
+                    return
+                if not stop.is_set():
+                    result.stage = stage.name
+                    try:
+                        stage.run(result, stop)
+                    except Exception as e:
+                        result.error = e
+                        logger.debug("Batch item %d failed in %s: %s", result.index, stage.name, str(e))
+                if result.error is None and index + 1 < len(queues) and not stop.is_set():
+                    queues[index + 1].put(result)
+                else:
+                    results.put(result)
+
+        feeder = threading.Thread(target=feed, name="notedx-batch-feed", daemon=True)
+        workers = [
+            threading.Thread(target=work, args=(index,), name=f"notedx-batch-{stage.name}-{n}", daemon=True)
+            for index, stage in enumerate(self.stages)
+            for n in range(max(1, stage.workers))
+        ]
+        for thread in [feeder] + workers:
+            thread.start()
+
+        fed: Optional[_Fed] = None
+        yielded = 0
+        try:
+            while fed is None or yielded < fed.count:
+                result = results.get()
+                if isinstance(result, _Fed):
+                    fed = result
+                    continue
+                yielded += 1
+                slots.release()
+                yield result
+            if fed.error is not None:
+                raise fed.error
+        finally:
+            stop.set()
+            # Unblock the feeder, then let every worker drain its queue and exit
+            for _ in range(self.max_inflight):
+                slots.release()
+            feeder.join()
+            # Stage by stage, so no item is handed to a stage whose workers are gone
+            started = 0
+            for index, stage in enumerate(self.stages):
+                count = max(1, stage.workers)
+                for _ in range(count):
+                    queues[index].put(_DONE)
+                for thread in workers[started:started + count]:
+                    thread.join()
+                started += count
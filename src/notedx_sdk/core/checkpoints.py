@@ -0,0 +1,229 @@
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from ..helpers import get_env
+from .uploads import presigned_url_expiry
+
+logger = logging.getLogger("notedx_sdk")
+
+# Bytes hashed from each end of the file for its fingerprint
+FINGERPRINT_SAMPLE_SIZE = 1024 * 1024
+
+
+def default_checkpoint_dir() -> Optional[str]:
+    """Directory where upload checkpoints are kept, from the NOTEDX_CHECKPOINT_DIR env var.
+
+    Returns:
+        The directory, or None if checkpoints are not enabled
+    """
+    return get_env("NOTEDX_CHECKPOINT_DIR") or None
+
+
+def response_expiry(response: Dict[str, Any]) -> Optional[float]:
+    """When the first upload URL of a job creation response expires, if the URLs say."""
+    multipart = response.get("multipart")
+    urls = multipart.get("part_urls", []) if isinstance(multipart, dict) else []
+    if response.get("presigned_url"):
+        urls = [response["presigned_url"], *urls]
+    expiries = [expiry for expiry in map(presigned_url_expiry, urls) if expiry is not None]
+    return min(expiries) if expiries else None
+
+
+def prune_expired(directory: str) -> int:
+    """Delete the checkpoints of a directory whose upload URLs have expired.
+
+    Args:
+        directory: Checkpoint directory
+
+    Returns:
+        Number of checkpoints deleted
+    """
+    try:
+        names = [name for name in os.listdir(directory) if name.endswith(".json")]
+    except FileNotFoundError:
+        return 0
+    removed = 0
+    now = time.time()
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            with open(path, 'r') as f:
+                expires_at = json.load(f).get("expires_at")
+            if expires_at is not None and expires_at <= now:
+                os.remove(path)
+                removed += 1
+        except (OSError, ValueError, AttributeError):
+            continue
+    if removed:
+        logger.debug("Deleted %d expired upload checkpoints from %s", removed, directory)
+    return removed
+
+
+def file_fingerprint(file_path: str) -> str:
+    """Hash identifying a file's content without reading all of it.
+
+    Covers the file size and the first and last megabyte, which is enough to tell
+    recordings apart while staying cheap for files of hundreds of MB.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    size = os.path.getsize(file_path)
+    digest.update(str(size).encode())
+    with open(file_path, 'rb') as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+        if size > FINGERPRINT_SAMPLE_SIZE:
+            f.seek(max(FINGERPRINT_SAMPLE_SIZE, size - FINGERPRINT_SAMPLE_SIZE))
+            digest.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+    return digest.hexdigest()
+
+
+class UploadCheckpoint:
+    """On-disk record of an upload in progress, keyed by job ID and file hash.
+
+    Stores what is needed to continue an interrupted upload without creating a new
+    job: the upload target (presigned URL or multipart plan), the job creation
+    response and the parts already confirmed by storage. Writes are atomic, so a
+    crash never leaves a half-written checkpoint.
+
+    The presigned URLs in a checkpoint are live upload credentials until they
+    expire: files are created with mode 0600 in a 0700 directory, and deleted
+    once their URLs have expired (`prune_expired()`).
+
+    Args:
+        path: Location of the checkpoint file
+        data: Checkpoint contents
+
+    Example:
+        ```python
+        >>> checkpoint = UploadCheckpoint.create(directory, job_id, file_path, response, multipart=True)
+        >>> checkpoint.mark_part(1, '"etag"')
+        >>> UploadCheckpoint.load(directory, job_id, file_path).completed_parts
+        {1: '"etag"'}
+        ```
+    """
+
+    def __init__(self, path: str, data: Dict[str, Any]) -> None:
+        self.path = path
+        self.data = data
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def path_for(directory: str, job_id: str, file_hash: str) -> str:
+        """Checkpoint file location for a job and file hash."""
+        safe_job_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in job_id)
+        return os.path.join(directory, f"{safe_job_id}-{file_hash[:16]}.json")
+
+    @classmethod
+    def create(
+        cls,
+        directory: str,
+        job_id: str,
+        file_path: str,
+        response: Dict[str, Any],
+        multipart: bool = False
+    ) -> "UploadCheckpoint":
+        """Record the start of an upload.
+
+        Args:
+            directory: Checkpoint directory
+            job_id: ID of the job being uploaded
+            file_path: Path to the file being uploaded
+            response: Job creation response holding the upload target
+            multipart: Whether the upload uses the multipart plan of the response
+
+        Returns:
+            The saved checkpoint
+        """
+        file_hash = file_fingerprint(file_path)
+        checkpoint = cls(cls.path_for(directory, job_id, file_hash), {
+            "job_id": job_id,
+            "file_hash": file_hash,
+            "file_size": os.path.getsize(file_path),
+            "response": response,
+            "expires_at": response_expiry(response),
+            "multipart": multipart,
+            "completed_parts": {}
+        })
+        checkpoint.save()
+        return checkpoint
+
+    @classmethod
+    def load(cls, directory: str, job_id: str, file_path: str) -> Optional["UploadCheckpoint"]:
+        """Load the checkpoint of a job for a file, if one exists.
+
+        Args:
+            directory: Checkpoint directory
+            job_id: ID of the job being uploaded
+            file_path: Path to the file being uploaded
+
+        Returns:
+            The checkpoint, or None if the job has none for this file
+        """
+        path = cls.path_for(directory, job_id, file_fingerprint(file_path))
+        try:
+            with open(path, 'r') as f:
+                return cls(path, json.load(f))
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            logger.warning("Ignoring corrupt upload checkpoint %s", path)
+            return None
+
+    @property
+    def response(self) -> Dict[str, Any]:
+        return self.data["response"]
+
+    @property
+    def expired(self) -> bool:
+        """Whether the upload URLs of the checkpoint have expired."""
+        expires_at = self.data.get("expires_at")
+        return expires_at is not None and expires_at <= time.time()
+
+    @property
+    def multipart(self) -> bool:
+        return bool(self.data.get("multipart"))
+
+    @property
+    def completed_parts(self) -> Dict[int, str]:
+        """ETags of the parts confirmed by storage, by part number."""
+        return {int(number): etag for number, etag in self.data["completed_parts"].items()}
+
+    def mark_part(self, number: int, etag: str) -> None:
+        """Record a part as stored and persist the checkpoint.
+
+        A checkpoint that cannot be written only costs resumability, so write
+        errors are logged rather than failing the upload.
+        """
+        with self._lock:
+            self.data["completed_parts"][str(number)] = etag
+            try:
+                self.save()
+            except OSError as e:
+                logger.warning("Could not update upload checkpoint %s: %s", self.path, str(e))
+
+    def save(self) -> None:
+        """Atomically write the checkpoint to disk."""
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        # Only the owner may read the upload URLs
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.data, f)
+        os.replace(tmp_path, self.path)
+
+    def delete(self) -> None:
+        """Remove the checkpoint once the upload is complete or its URLs are no longer accepted."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
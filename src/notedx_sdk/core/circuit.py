@@ -0,0 +1,279 @@
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+import threading
+import time
+
+from ..exceptions import ServiceUnavailableError
+
+logger = logging.getLogger("notedx_sdk")
+
+# Called with (endpoint family, old state, new state)
+StateChangeHook = Callable[[str, str, str], None]
+
+_Change = Tuple[str, str]
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Leading path segments that group endpoints rather than name one
+_NAMESPACES = frozenset({"user", "auth", "system"})
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Group an endpoint path with the ones served by the same backend route.
+
+    Example:
+        ```python
+        >>> endpoint_family("fetch-note/job-123")
+        'fetch-note'
+        >>> endpoint_family("user/account/info")
+        'user/account'
+        ```
+    """
+    segments = endpoint.strip('/').split('/')
+    if len(segments) > 1 and segments[0] in _NAMESPACES:
+        return '/'.join(segments[:2])
+    return segments[0]
+
+
+class CircuitBreaker:
+    """Stops sending requests to an endpoint family that keeps failing.
+
+    The circuit starts closed. After `failure_threshold` consecutive failures
+    (5xx responses, timeouts, connection errors) it opens, and requests fail
+    right away with `ServiceUnavailableError` (code `CIRCUIT_OPEN`) instead of
+    waiting on a struggling service. After `recovery_timeout` seconds it turns
+    half-open and lets `half_open_calls` trial requests through: if they all
+    succeed the circuit closes, and if one fails it opens again for another
+    `recovery_timeout`.
+
+    Args:
+        name: Endpoint family the circuit guards
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_timeout: Seconds the circuit stays open before a trial request
+        half_open_calls: Trial requests that must succeed to close the circuit
+        on_state_change: Function called with `(name, old_state, new_state)` (optional)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        on_state_change: Optional[StateChangeHook] = None
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_calls < 1:
+            raise ValueError("half_open_calls must be at least 1")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_calls = half_open_calls
+        self.on_state_change = on_state_change
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._state = CLOSED
+        # Trial requests let through / succeeded since the circuit turned half-open
+        self._trials = 0
+        self._trial_successes = 0
+        self._half_opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """`closed`, `open` or `half_open`."""
+        with self._lock:
+            changes = self._refresh()
+            state = self._state
+        self._notify(changes)
+        return state
+
+    def allow(self) -> None:
+        """Check a request may be sent, reserving a trial if the circuit is half-open.
+
+        Raises:
+            ServiceUnavailableError: If the circuit is open, or half-open with its trials under way
+        """
+        with self._lock:
+            changes = self._refresh()
+            if self._state == HALF_OPEN and self._trials < self.half_open_calls:
+                self._trials += 1
+                retry_after = None
+            elif self._state == CLOSED:
+                retry_after = None
+            else:
+                retry_after = max(0.0, self.opened_at + self.recovery_timeout - time.monotonic())
+        self._notify(changes)
+        if retry_after is not None:
+            raise ServiceUnavailableError(
+                f"Circuit open for {self.name} after repeated failures; not sending the request",
+                code='CIRCUIT_OPEN',
+                details={'endpoint_family': self.name, 'retry_after': retry_after}
+            )
+
+    def record_success(self) -> None:
+        """Record a request that got an answer from the service."""
+        with self._lock:
+            changes = []
+            self.failures = 0
+            if self._state == HALF_OPEN:
+                self._trial_successes += 1
+                if self._trial_successes >= self.half_open_calls:
+                    changes.append(self._set(CLOSED))
+        self._notify(changes)
+
+    def record_response(self, status_code: int) -> None:
+        """Record a response: 5xx and 408 count as failures, anything else as a success."""
+        if status_code >= 500 or status_code == 408:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_failure(self) -> None:
+        """Record a request that failed with a 5xx, a timeout or a connection error."""
+        with self._lock:
+            changes = []
+            self.failures += 1
+            if self._state == HALF_OPEN or (self._state == CLOSED and self.failures >= self.failure_threshold):
+                changes.append(self._set(OPEN))
+        self._notify(changes)
+
+    def reset(self) -> None:
+        """Close the circuit."""
+        with self._lock:
+            self.failures = 0
+            changes = [self._set(CLOSED)] if self._state != CLOSED else []
+        self._notify(changes)
+
+    def _refresh(self) -> List[_Change]:
+        now = time.monotonic()
+        if self._state == OPEN and now - self.opened_at >= self.recovery_timeout:
+            return [self._set(HALF_OPEN)]
+        if self._state == HALF_OPEN and now - self._half_opened_at >= self.recovery_timeout:
+            # Trials that never reported back (e.g. interrupted) do not hold the circuit forever
+            self._half_opened_at = now
+            self._trials = self._trial_successes
+        return []
+
+    def _set(self, state: str) -> _Change:
+        old, self._state = self._state, state
+        now = time.monotonic()
+        if state == OPEN:
+            self.opened_at = now
+        elif state == CLOSED:
+            self.opened_at = None
+        self._half_opened_at = now
+        self._trials = 0
+        self._trial_successes = 0
+        return (old, state)
+
+    def _notify(self, changes: List[_Change]) -> None:
+        # Outside the lock, so hooks can inspect the circuit
+        for old, new in changes:
+            if new == OPEN:
+                logger.warning(
+                    "Circuit for %s opened after %d consecutive failures; retrying in %.0f seconds",
+                    self.name, self.failures, self.recovery_timeout
+                )
+            else:
+                logger.info("Circuit for %s is %s", self.name, new.replace('_', '-'))
+            if self.on_state_change is not None:
+                try:
+                    self.on_state_change(self.name, old, new)
+                except Exception as e:
+                    logger.warning("Circuit state change hook failed for %s: %s", self.name, str(e))
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(name={self.name!r}, state={self._state!r}, failures={self.failures})"
+
+
+class _NoCircuit(CircuitBreaker):
+    """Circuit of disabled `CircuitBreakers`: lets everything through."""
+
+    def allow(self) -> None:
+        pass
+
+    def record_success(self) -> None:
+        pass
+
+    def record_failure(self) -> None:
+        pass
+
+
+_NO_CIRCUIT = _NoCircuit("disabled")
+
+
+class CircuitBreakers:
+    """One `CircuitBreaker` per endpoint family, created on first use.
+
+    Args:
+        failure_threshold: Consecutive failures that open a circuit
+        recovery_timeout: Seconds a circuit stays open before a trial request
+        half_open_calls: Trial requests that must succeed to close a circuit
+        enabled: Whether requests are guarded at all
+
+    Example:
+        ```python
+        >>> breakers = CircuitBreakers(failure_threshold=3, recovery_timeout=10)
+        >>> breakers.on_state_change(lambda family, old, new: print(family, old, "->", new))
+        >>> client = NoteDxClient(api_key="...", circuit_breakers=breakers)
+        >>> breakers.states()
+        {'user/account': 'closed'}
+        ```
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        enabled: bool = True
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_calls = half_open_calls
+        self.enabled = enabled
+        self._hooks: List[StateChangeHook] = []
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def on_state_change(self, hook: StateChangeHook) -> None:
+        """Call `hook(family, old_state, new_state)` whenever a circuit changes state."""
+        self._hooks.append(hook)
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """Circuit of the family of `endpoint` (one that never opens if circuits are disabled)."""
+        if not self.enabled:
+            return _NO_CIRCUIT
+        family = endpoint_family(endpoint)
+        with self._lock:
+            breaker = self._breakers.get(family)
+            if breaker is None:
+                breaker = self._breakers[family] = CircuitBreaker(
+                    family,
+                    failure_threshold=self.failure_threshold,
+                    recovery_timeout=self.recovery_timeout,
+                    half_open_calls=self.half_open_calls,
+                    on_state_change=self._dispatch
+                )
+            return breaker
+
+    def states(self) -> Dict[str, str]:
+        """State of every circuit created so far, by endpoint family."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.state for breaker in breakers}
+
+    def reset(self) -> None:
+        """Close every circuit."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+    def _dispatch(self, family: str, old: str, new: str) -> None:
+        for hook in list(self._hooks):
+            hook(family, old, new)
@@ -0,0 +1,175 @@
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from ..helpers import get_env
+from .checkpoints import file_fingerprint
+
+logger = logging.getLogger("notedx_sdk")
+
+# Read size of content hashing; large reads let hashlib release the GIL
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def default_index_path() -> str:
+    """Location of the upload deduplication index.
+
+    Reads the NOTEDX_DEDUP_INDEX env var and falls back to `~/.notedx/uploads.json`.
+    """
+    return get_env("NOTEDX_DEDUP_INDEX") or os.path.join(
+        os.path.expanduser("~"), ".notedx", "uploads.json"
+    )
+
+
+def content_hash(file_path: str) -> str:
+    """SHA-256 of a file's full content, read in one streaming pass.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def params_key(params: Dict[str, Any]) -> str:
+    """Stable key of a set of job parameters, ignoring unset ones."""
+    canonical = json.dumps(
+        {name: value for name, value in params.items() if value is not None},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class UploadIndex:
+    """Local index of uploaded recordings, from content and parameters to job.
+
+    Entries are keyed by the cheap `file_fingerprint()` of the recording and the
+    parameters that shape its transcript (language, visit and recording type, ...).
+    Each entry holds the full content hash, the ID of the job the recording was
+    uploaded to, and the responses of the notes generated from it, keyed by the
+    note parameters (template, output language, ...). A lookup only hashes the
+    whole file when the fingerprint matches an entry.
+
+    The index is a JSON file written atomically. Entries older than `max_age`
+    seconds are ignored and only the `max_entries` most recent are kept.
+
+    Args:
+        path: Location of the index file
+        max_age: Seconds an entry stays valid
+        max_entries: Maximum number of recordings indexed
+
+    Example:
+        ```python
+        >>> index = UploadIndex(default_index_path())
+        >>> entry = index.lookup("visit.wav", {"lang": "en"})
+        >>> entry["job_id"] if entry else None
+        'job-123'
+        ```
+    """
+
+    def __init__(self, path: str, max_age: float = 7 * 24 * 3600, max_entries: int = 1000) -> None:
+        self.path = path
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(file_path: str, source_params: Dict[str, Any]) -> str:
+        """Index key of a recording uploaded with the given transcript parameters."""
+        return params_key({"fingerprint": file_fingerprint(file_path), **source_params})
+
+    def lookup(self, file_path: str, source_params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Find the job a recording was already uploaded to with the same transcript parameters.
+
+        Args:
+            file_path: Path to the recording
+            source_params: Parameters that shape the transcript
+
+        Returns:
+            The index entry (`job_id`, `sha256`, `variants`), or None
+        """
+        key = self.key_for(file_path, source_params)
+        with self._lock:
+            entry = self._load().get(key)
+        if entry is None or time.time() - entry["created"] > self.max_age:
+            return None
+        if content_hash(file_path) != entry["sha256"]:
+            return None
+        return {"key": key, **entry}
+
+    def record(
+        self,
+        file_path: str,
+        source_params: Dict[str, Any],
+        sha256: str,
+        job_id: str,
+        note_params: Dict[str, Any],
+        response: Dict[str, Any]
+    ) -> None:
+        """Record an uploaded recording, or a note generated from one.
+
+        Args:
+            file_path: Path to the recording
+            source_params: Parameters that shape the transcript
+            sha256: Full content hash of the recording
+            job_id: ID of the job the recording was uploaded to
+            note_params: Parameters of the generated note
+            response: Response of the job creating that note
+
+        Write errors are logged rather than raised: the index only saves uploads.
+        """
+        key = self.key_for(file_path, source_params)
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None or entry["sha256"] != sha256 or entry["job_id"] != job_id:
+                entry = {"sha256": sha256, "job_id": job_id, "created": time.time(), "variants": {}}
+            # Presigned upload URLs are credentials, and useless once the upload is done
+            entry["variants"][params_key(note_params)] = {
+                name: value for name, value in response.items() if name not in ("presigned_url", "multipart")
+            }
+            entries.pop(key, None)
+            entries[key] = entry
+            self._save(entries)
+
+    def forget(self, key: str) -> None:
+        """Remove an entry, e.g. once its job no longer exists."""
+        with self._lock:
+            entries = self._load()
+            if entries.pop(key, None) is not None:
+                self._save(entries)
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning("Ignoring corrupt upload index %s", self.path)
+            return {}
+
+    def _save(self, entries: Dict[str, Any]) -> None:
+        now = time.time()
+        fresh = [(key, entry) for key, entry in entries.items() if now - entry["created"] <= self.max_age]
+        # Dicts keep insertion order, and record() re-inserts entries it touches
+        entries = dict(fresh[-self.max_entries:])
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not update upload index %s: %s", self.path, str(e))
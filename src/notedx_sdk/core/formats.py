@@ -0,0 +1,507 @@
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Dict, FrozenSet, Iterator, NamedTuple, Optional, Tuple, Union
+import logging
+import os
+import stat
+import struct
+
+from .audio import PCM_FORMAT
+
+logger = logging.getLogger("notedx_sdk")
+
+# Bytes read from the start of a file to recognize its container
+HEADER_SIZE = 64
+
+# Containers a file extension may legitimately hold. ID3 tags precede MP3
+# frames, but some encoders also put them in front of AAC and FLAC streams.
+# Raw PCM has no header, so any content that is not a known container is accepted.
+EXTENSION_CONTAINERS: Dict[str, FrozenSet[str]] = {
+    '.mp3': frozenset({'mpeg', 'id3'}),
+    '.mp2': frozenset({'mpeg', 'id3'}),
+    '.mp4': frozenset({'mp4'}),
+    '.m4a': frozenset({'mp4'}),
+    '.aac': frozenset({'aac', 'id3'}),
+    '.wav': frozenset({'wav'}),
+    '.flac': frozenset({'flac', 'id3'}),
+    '.pcm': frozenset(),
+    '.ogg': frozenset({'ogg'}),
+    '.opus': frozenset({'ogg'}),
+    '.webm': frozenset({'webm'}),
+}
+
+# Human readable names of the containers, for error messages
+CONTAINER_NAMES = {
+    'wav': 'WAV',
+    'mpeg': 'MPEG audio (MP3)',
+    'id3': 'ID3-tagged audio',
+    'aac': 'AAC (ADTS/ADIF)',
+    'flac': 'FLAC',
+    'ogg': 'Ogg',
+    'webm': 'WebM/Matroska',
+    'mp4': 'MP4/M4A',
+}
+
+# A path, an open file descriptor, a binary file object or in-memory audio
+AudioInput = Union[str, "os.PathLike[str]", int, BinaryIO, bytes, bytearray, memoryview]
+
+
+# Reads `count` bytes at an absolute offset
+ReadAt = Callable[[int, int], bytes]
+
+
+class AudioFileInfo(NamedTuple):
+    """Size and container of an audio file, from one stat and a header read."""
+
+    size: int
+    header: bytes
+    container: Optional[str]
+
+
+class AudioProbe(NamedTuple):
+    """Duration and layout of audio, read from its container headers.
+
+    Fields the headers do not provide are None.
+    """
+
+    container: Optional[str]
+    size: int
+    duration: Optional[float]  # seconds
+    sample_rate: Optional[int]
+    channels: Optional[int]
+
+
+def detect_container(header: bytes) -> Optional[str]:
+    """Recognize an audio container from the first bytes of a file.
+
+    Args:
+        header: Start of the file, at least 12 bytes for reliable detection
+
+    Returns:
+        One of the `CONTAINER_NAMES` keys, or None if no known signature matches
+    """
+    if header[:4] in (b'RIFF', b'RF64', b'BW64') and header[8:12] == b'WAVE':
+        return 'wav'
+    if header[:4] == b'fLaC':
+        return 'flac'
+    if header[:4] == b'OggS':
+        return 'ogg'
+    if header[:4] == b'\x1a\x45\xdf\xa3':
+        return 'webm'
+    if header[4:8] == b'ftyp':
+        return 'mp4'
+    if header[:3] == b'ID3':
+        return 'id3'
+    if header[:4] == b'ADIF':
+        return 'aac'
+    if len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0:
+        # Frame sync: layer bits 00 mean ADTS (AAC), anything else MPEG audio
+        if header[1] & 0xF6 == 0xF0:
+            return 'aac'
+        if header[1] & 0x06:
+            return 'mpeg'
+    return None
+
+
+def container_mismatch(extension: str, container: Optional[str]) -> Optional[str]:
+    """Explain why content does not fit its extension, if it does not.
+
+    Args:
+        extension: Lowercase file extension with its dot, e.g. `.wav`
+        container: Result of `detect_container()`
+
+    Returns:
+        An error message, or None when the content is plausible for the extension
+    """
+    allowed = EXTENSION_CONTAINERS.get(extension)
+    if allowed is None:
+        return None
+    if not allowed:
+        # Headerless formats: only a recognizable container is suspicious
+        if container is None:
+            return None
+        return f"{extension} audio is raw samples, but the data is {CONTAINER_NAMES[container]}"
+    if container in allowed:
+        return None
+    if container is None:
+        return f"Data is not recognizable {extension} audio"
+    return f"File extension is {extension}, but the data is {CONTAINER_NAMES[container]}"
+
+
+def inspect_audio(source: AudioInput, header_size: int = HEADER_SIZE) -> AudioFileInfo:
+    """Read the size and container of audio without reading more than its header.
+
+    Paths take a single `os.stat()` and a read of `header_size` bytes. File
+    descriptors and file objects are inspected without moving their position;
+    in-memory audio is inspected in place.
+
+    Args:
+        source: Path, file descriptor, seekable binary file object or bytes-like object
+        header_size: Number of leading bytes to read
+
+    Returns:
+        AudioFileInfo with the size, header and detected container
+
+    Raises:
+        FileNotFoundError: If the path does not exist or is not a regular file
+        OSError: If the file cannot be read
+        TypeError: If the source is of an unsupported type
+        ValueError: If a file object is not seekable
+
+    Example:
+        ```python
+        >>> inspect_audio("visit.wav").container
+        'wav'
+        ```
+    """
+    with _random_access(source) as (size, read_at):
+        header = read_at(0, header_size)
+        return AudioFileInfo(size, header, detect_container(header))
+
+
+def probe_audio(source: AudioInput) -> AudioProbe:
+    """Read the duration, sample rate and channel count of audio from its headers only.
+
+    Nothing is decoded; only a few small reads are made, wherever the container
+    keeps this information:
+
+    - WAV: the `fmt ` and `data` chunks (and `ds64` for RF64)
+    - MP3: the Xing/Info or VBRI header of the first frame, or the bitrate of a
+      constant bitrate stream
+    - FLAC: the STREAMINFO block
+    - Ogg (Opus, Vorbis, FLAC): the identification header and the granule
+      position of the last page
+    - MP4/M4A: the `mvhd` box and the sound track's sample description
+    - PCM: the size, for paths ending in `.pcm`, assuming 16kHz mono 16-bit
+
+    Args:
+        source: Path, file descriptor, seekable binary file object or bytes-like object
+
+    Returns:
+        AudioProbe; fields the headers do not provide (e.g. the duration of
+        ADTS or WebM audio) are None
+
+    Raises:
+        FileNotFoundError: If the path does not exist or is not a regular file
+        OSError: If the file cannot be read
+        TypeError: If the source is of an unsupported type
+        ValueError: If a file object is not seekable
+
+    Example:
+        ```python
+        >>> probe = probe_audio("visit.mp3")
+        >>> probe.duration, probe.sample_rate, probe.channels
+        (1834.2, 44100, 2)
+        ```
+    """
+    with _random_access(source) as (size, read_at):
+        container = detect_container(read_at(0, HEADER_SIZE))
+        if container is None and isinstance(source, (str, os.PathLike)) \
+                and os.path.splitext(os.fspath(source))[1].lower() == '.pcm':
+            rate, channels = PCM_FORMAT.sample_rate, PCM_FORMAT.channels
+            return AudioProbe('pcm', size, size / (rate * PCM_FORMAT.frame_size), rate, channels)
+
+        parser = _PROBES.get(container)
+        duration = sample_rate = channels = None
+        if parser is not None:
+            try:
+                duration, sample_rate, channels = parser(size, read_at)
+            except (struct.error, ValueError, IndexError, ZeroDivisionError) as e:
+                logger.debug("Cannot read %s headers: %s", container, str(e))
+        return AudioProbe(container, size, duration, sample_rate, channels)
+
+
+@contextmanager
+def _random_access(source: AudioInput) -> Iterator[Tuple[int, ReadAt]]:
+    """Size of the audio and a positional reader, leaving file positions unchanged."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast("B")
+        yield view.nbytes, lambda offset, count: bytes(view[offset:offset + count])
+
+    elif isinstance(source, int):
+        st = os.fstat(source)
+        if not stat.S_ISREG(st.st_mode):
+            raise ValueError("File descriptor does not refer to a regular file")
+        yield st.st_size, lambda offset, count: _pread(source, offset, count)
+
+    elif isinstance(source, (str, os.PathLike)):
+        st = os.stat(source)
+        if not stat.S_ISREG(st.st_mode):
+            raise FileNotFoundError(f"Not a regular file: {os.fspath(source)}")
+        with open(source, 'rb') as f:
+            def read_at(offset: int, count: int) -> bytes:
+                f.seek(offset)
+                return f.read(count)
+            yield st.st_size, read_at
+
+    elif hasattr(source, "read"):
+        seekable = getattr(source, "seekable", None)
+        if seekable is None or not seekable():
+            raise ValueError("Audio file object must be seekable to be inspected")
+        start = source.tell()
+        try:
+            size = source.seek(0, os.SEEK_END) - start
+
+            def read_at(offset: int, count: int) -> bytes:
+                source.seek(start + offset)
+                return source.read(count)
+            yield size, read_at
+        finally:
+            source.seek(start)
+
+    else:
+        raise TypeError(f"Cannot inspect audio from {type(source).__name__}")
+
+
+def _pread(fd: int, offset: int, count: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, count, offset)
+    position = os.lseek(fd, 0, os.SEEK_CUR)
+    try:
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, count)
+    finally:
+        os.lseek(fd, position, os.SEEK_SET)
+
+
+ProbeResult = Tuple[Optional[float], Optional[int], Optional[int]]
+
+
+def _probe_wav(size: int, read_at: ReadAt) -> ProbeResult:
+    offset = 12
+    fmt = None
+    ds64_data_size = None
+    while offset + 8 <= size:
+        chunk_id, chunk_size = struct.unpack('<4sI', read_at(offset, 8))
+        if chunk_id == b'ds64':
+            ds64_data_size = struct.unpack('<Q', read_at(offset + 16, 8))[0]
+        elif chunk_id == b'fmt ':
+            fmt = struct.unpack('<HHIIHH', read_at(offset + 8, 16))
+        elif chunk_id == b'data':
+            if fmt is None:
+                break
+            available = size - offset - 8
+            if chunk_size == 0xFFFFFFFF and ds64_data_size is not None:
+                chunk_size = ds64_data_size
+            elif chunk_size in (0, 0xFFFFFFFF):
+                # Written by a recorder that never went back to fill in the size
+                chunk_size = available
+            byte_rate = fmt[3]
+            return min(chunk_size, available) / byte_rate, fmt[2], fmt[1]
+        offset += 8 + chunk_size + (chunk_size & 1)
+    if fmt is None:
+        raise ValueError("No fmt chunk")
+    return None, fmt[2], fmt[1]
+
+
+# kbps by (MPEG-1, layer) and (MPEG-2/2.5, layer), for bitrate indexes 1-14
+_MPEG_BITRATES = {
+    (True, 1): (32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Sample rates by version bits: 3 is MPEG-1, 2 MPEG-2, 0 MPEG-2.5
+_MPEG_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+# How far frame headers are searched for after the ID3 tag, for padding
+_SYNC_SEARCH = 4096
+
+
+def _id3_size(read_at: ReadAt) -> int:
+    """Length of the ID3v2 tag at the start of a file, 0 if there is none."""
+    header = read_at(0, 10)
+    if header[:3] != b'ID3' or len(header) < 10:
+        return 0
+    size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
+    footer = 10 if header[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _probe_mpeg(size: int, read_at: ReadAt) -> ProbeResult:
+    start = _id3_size(read_at)
+    data = read_at(start, _SYNC_SEARCH)
+    for index in range(len(data) - 3):
+        if data[index] != 0xFF or data[index + 1] & 0xE0 != 0xE0:
+            continue
+        version = (data[index + 1] >> 3) & 3
+        layer = 4 - ((data[index + 1] >> 1) & 3)
+        bitrate_index = data[index + 2] >> 4
+        rate_index = (data[index + 2] >> 2) & 3
+        if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+            continue
+        break
+    else:
+        raise ValueError("No MPEG frame header")
+
+    frame = start + index
+    mpeg1 = version == 3
+    sample_rate = _MPEG_RATES[version][rate_index]
+    channels = 1 if data[index + 3] >> 6 == 3 else 2
+    samples_per_frame = 384 if layer == 1 else 1152 if mpeg1 or layer == 2 else 576
+
+    # Variable bitrate files announce their frame count in the first frame
+    side_info = (32 if channels == 2 else 17) if mpeg1 else (17 if channels == 2 else 9)
+    xing = read_at(frame + 4 + side_info, 12)
+    frames = None
+    if xing[:4] in (b'Xing', b'Info') and struct.unpack('>I', xing[4:8])[0] & 1:
+        frames = struct.unpack('>I', xing[8:12])[0]
+    else:
+        vbri = read_at(frame + 36, 18)
+        if vbri[:4] == b'VBRI':
+            frames = struct.unpack('>I', vbri[14:18])[0]
+    if frames:
+        return frames * samples_per_frame / sample_rate, sample_rate, channels
+
+    audio_bytes = size - frame
+    if size >= 128 and read_at(size - 128, 3) == b'TAG':
+        audio_bytes -= 128
+    bitrate = _MPEG_BITRATES[(mpeg1, layer)][bitrate_index - 1] * 1000
+    return audio_bytes * 8 / bitrate, sample_rate, channels
+
+
+def _streaminfo(block: bytes) -> ProbeResult:
+    """Duration, sample rate and channels of a FLAC STREAMINFO block."""
+    fields = int.from_bytes(block[10:18], 'big')
+    sample_rate = fields >> 44
+    channels = ((fields >> 41) & 7) + 1
+    total_samples = fields & ((1 << 36) - 1)
+    return (total_samples / sample_rate if total_samples else None), sample_rate, channels
+
+
+def _probe_flac(size: int, read_at: ReadAt) -> ProbeResult:
+    start = _id3_size(read_at)
+    header = read_at(start, 8 + 34)
+    if header[:4] != b'fLaC' or header[4] & 0x7F != 0:
+        raise ValueError("No STREAMINFO block")
+    return _streaminfo(header[8:])
+
+
+# Span of the end of an Ogg file searched for its last page; pages are at most 65307 bytes
+_OGG_TAIL = 2 * 65536
+
+
+def _probe_ogg(size: int, read_at: ReadAt) -> ProbeResult:
+    page = read_at(0, 27 + 255)
+    serial = page[14:18]
+    packet = read_at(27 + page[26], 64)
+    if packet[:8] == b'OpusHead':
+        channels = packet[9]
+        pre_skip = struct.unpack('<H', packet[10:12])[0]
+        input_rate = struct.unpack('<I', packet[12:16])[0]
+        # Opus granule positions always count 48kHz samples
+        granule_rate, offset, sample_rate = 48000, pre_skip, input_rate or 48000
+    elif packet[:7] == b'\x01vorbis':
+        channels = packet[11]
+        sample_rate = granule_rate = struct.unpack('<I', packet[12:16])[0]
+        offset = 0
+    elif packet[:5] == b'\x7fFLAC':
+        _, sample_rate, channels = _streaminfo(packet[17:17 + 34])
+        granule_rate, offset = sample_rate, 0
+    else:
+        return None, None, None
+
+    tail_start = max(0, size - _OGG_TAIL)
+    tail = read_at(tail_start, size - tail_start)
+    position = len(tail)
+    while True:
+        position = tail.rfind(b'OggS', 0, position)
+        if position < 0:
+            return None, sample_rate, channels
+        granule = struct.unpack('<q', tail[position + 6:position + 14])[0]
+        if tail[position + 14:position + 18] == serial and granule >= 0:
+            return max(0, granule - offset) / granule_rate, sample_rate, channels
+
+
+def _mp4_boxes(read_at: ReadAt, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Type, payload start and end of the boxes between two offsets."""
+    offset = start
+    while offset + 8 <= end:
+        header = read_at(offset, 16)
+        size, kind = struct.unpack('>I4s', header[:8])
+        header_size = 8
+        if size == 1:
+            size = struct.unpack('>Q', header[8:16])[0]
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size:
+            return
+        yield kind, offset + header_size, min(offset + size, end)
+        offset += size
+
+
+def _mp4_child(read_at: ReadAt, start: int, end: int, path: Tuple[bytes, ...]) -> Optional[Tuple[int, int]]:
+    for kind, payload, box_end in _mp4_boxes(read_at, start, end):
+        if kind == path[0]:
+            return (payload, box_end) if len(path) == 1 else _mp4_child(read_at, payload, box_end, path[1:])
+    return None
+
+
+def _probe_mp4(size: int, read_at: ReadAt) -> ProbeResult:
+    moov = _mp4_child(read_at, 0, size, (b'moov',))
+    if moov is None:
+        raise ValueError("No moov box")
+
+    duration = None
+    mvhd = _mp4_child(read_at, moov[0], moov[1], (b'mvhd',))
+    if mvhd is not None:
+        header = read_at(mvhd[0], 32)
+        if header[0] == 1:
+            timescale, length = struct.unpack('>IQ', header[20:32])
+        else:
+            timescale, length = struct.unpack('>II', header[12:20])
+        duration = length / timescale if timescale else None
+
+    sample_rate = channels = None
+    for kind, payload, end in _mp4_boxes(read_at, moov[0], moov[1]):
+        if kind != b'trak':
+            continue
+        hdlr = _mp4_child(read_at, payload, end, (b'mdia', b'hdlr'))
+        if hdlr is None or read_at(hdlr[0] + 8, 4) != b'soun':
+            continue
+        stsd = _mp4_child(read_at, payload, end, (b'mdia', b'minf', b'stbl', b'stsd'))
+        if stsd is not None:
+            # Audio sample entry after the entry count: reserved fields, then channels and 16.16 rate
+            entry = read_at(stsd[0] + 8, 8 + 28)
+            channels = struct.unpack('>H', entry[24:26])[0]
+            sample_rate = struct.unpack('>I', entry[32:36])[0] >> 16
+        break
+    return duration, sample_rate, channels
+
+
+# Sampling frequency indexes of ADTS headers
+_ADTS_RATES = (96000, 88200, 64000, 48000, 44100, 32000, 24000, 22050, 16000, 12000, 11025, 8000, 7350)
+
+
+def _probe_aac(size: int, read_at: ReadAt) -> ProbeResult:
+    header = read_at(0, 4)
+    if header[:4] == b'ADIF':
+        return None, None, None
+    # ADTS frames do not carry the stream length; only the layout is known
+    channels = ((header[2] & 1) << 2) | (header[3] >> 6)
+    return None, _ADTS_RATES[(header[2] >> 2) & 0xF], channels or None
+
+
+def _probe_id3(size: int, read_at: ReadAt) -> ProbeResult:
+    # An ID3 tag can precede MP3, AAC or FLAC audio
+    start = _id3_size(read_at)
+    container = detect_container(read_at(start, HEADER_SIZE))
+    if container == 'flac':
+        return _probe_flac(size, read_at)
+    if container == 'aac':
+        return None, None, None
+    return _probe_mpeg(size, read_at)
+
+
+_PROBES: Dict[Optional[str], Callable[[int, ReadAt], ProbeResult]] = {
+    'wav': _probe_wav,
+    'mpeg': _probe_mpeg,
+    'id3': _probe_id3,
+    'flac': _probe_flac,
+    'ogg': _probe_ogg,
+    'mp4': _probe_mp4,
+    'aac': _probe_aac,
+}
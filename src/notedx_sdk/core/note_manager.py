@@ -1,6 +1,13 @@
-from typing import Dict, Any, Literal, Optional, List, TYPE_CHECKING, Union
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterable, Iterator, Literal, Optional, List, Set, Tuple, TYPE_CHECKING, Union
 from logging import Handler
 import os
+import shutil
+import stat
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+import wave
 import requests
 import logging
 import time
@@ -16,13 +23,53 @@ from ..exceptions import (
     InvalidFieldError,
     BadRequestError,
     UploadError,
+    UploadCancelledError,
+    UploadUrlRejectedError,
     NotFoundError,
     JobNotFoundError,
     JobError,
     RateLimitError,
     InternalServerError,
+    RetryBudgetExhaustedError,
     ServiceUnavailableError
 )
+from .uploads import (
+    AdaptiveBody,
+    AdaptiveChunkSizer,
+    AudioSource,
+    BufferReader,
+    CombinedProgress,
+    IteratorReader,
+    MultipartUploader,
+    ProgressCallback,
+    ProgressReader,
+    ProgressTracker,
+    UploadProgress,
+    check_presigned_url,
+    log_progress,
+    open_file_body,
+    verify_checksum,
+    open_upload_body,
+    rejected_url_error,
+    ThroughputEstimator
+)
+from .checkpoints import UploadCheckpoint, default_checkpoint_dir, prune_expired
+from .formats import HEADER_SIZE, AudioFileInfo, container_mismatch, detect_container, inspect_audio, probe_audio
+from .dedup import UploadIndex, content_hash, default_index_path, params_key
+from .batch import BatchPipeline, BatchResult, Stage
+from .slots import JobSlotPool
+from .background import UploadControl, UploadHandle
+from .bandwidth import upload_limiter
+from .retry import (
+    STORAGE_RETRY_STATUSES,
+    RetryPolicy,
+    request_was_sent,
+    retry_after,
+    retry_budget,
+    select_policy,
+    upload_retry_delay
+)
+from .audio import PREPROCESS_EXTENSIONS, SPEECH_FORMAT, PreprocessResult, numpy_available, preprocess_audio, split_audio
 
 if TYPE_CHECKING:
     from ..client import NoteDxClient
@@ -42,6 +89,9 @@ VALID_TEMPLATES = [
     'letter', 'social', 'wfw','smartInsert', 'interventionalRadiology'
 ]
 
+# Maximum size of an uploaded recording
+MAX_AUDIO_SIZE = 500 * 1024 * 1024  # 500MB
+
 # Valid audio formats and their MIME types
 VALID_AUDIO_FORMATS = {
     '.mp3': 'audio/mpeg',
@@ -57,6 +107,21 @@ VALID_AUDIO_FORMATS = {
     '.webm': 'audio/webm'
 }
 
+# Job parameters a process_batch() item may set
+BATCH_JOB_PARAMS = (
+    'visit_type', 'recording_type', 'patient_consent', 'lang', 'output_language', 'template',
+    'documentation_style', 'custom', 'custom_metadata', 'webhook_env'
+)
+
+# Worker threads of each process_batch() stage; None follows max_inflight
+DEFAULT_BATCH_WORKERS: Dict[str, Optional[int]] = {
+    'validate': 2,
+    'create': 4,
+    'upload': 4,
+    'wait': None,
+    'fetch': 4
+}
+
 class NoteManager:
     """Manages medical note generation from audio files using the NoteDx API.
 
@@ -100,7 +165,20 @@ class NoteManager:
         'max_retries': 3,
         'retry_delay': 1,  # seconds
         'retry_max_delay': 30,  # seconds
-        'retry_on_status': [408, 429, 500, 502, 503, 504]
+        'retry_on_status': [408, 429, 500, 502, 503, 504],
+        'retry_policies': {},  # endpoint prefix -> RetryPolicy, e.g. {'fetch-note': RetryPolicy(max_retries=6)}
+        'checkpoint_dir': None,  # enables resume_upload(); defaults to NOTEDX_CHECKPOINT_DIR, off if unset
+        'progress_interval': 0.5,  # seconds between two on_progress reports
+        'silence_threshold_db': -40.0,  # level below which audio counts as silence (trim_silence)
+        'min_silence': 1.0,  # seconds; shorter silences are kept
+        'keep_silence': 0.25,  # seconds of silence kept around speech
+        'dedup_index': None,  # defaults to NOTEDX_DEDUP_INDEX or ~/.notedx/uploads.json
+        'dedup_max_age': 7 * 24 * 3600,  # seconds a recorded upload can be reused
+        'verify_checksum': True,  # compare the MD5 of uploads with the one storage reports
+        'split_workers': 4,  # segments of an oversized recording submitted concurrently
+        'background_workers': 4,  # uploads of process_audio(background=True) running at once
+        'url_refreshes': 1,  # new jobs requested when an upload URL expired or was rejected
+        'url_expiry_margin': 5  # seconds of validity an upload URL needs to be used
     }
     
     def __init__(self, client: "NoteDxClient") -> None:
@@ -113,6 +191,12 @@ class NoteManager:
         self._config = self.DEFAULT_CONFIG.copy()
         self._config['api_base_url'] = self._client.base_url
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._throughput = ThroughputEstimator()
+        self._upload_index: Optional[UploadIndex] = None
+        self._slot_pool: Optional[JobSlotPool] = None
+        self._background: Optional[ThreadPoolExecutor] = None
+        self._hashing: Optional[ThreadPoolExecutor] = None
+        self._uploads: Set[UploadHandle] = set()
         self.logger.debug("Initialized NoteManager")
 
     def set_logger(self, level: Union[int, str], handler: Optional[Handler] = None) -> None:
@@ -126,6 +210,73 @@ class NoteManager:
         if handler:
             self.logger.addHandler(handler)
 
+    @classmethod
+    def set_upload_bandwidth(cls, bytes_per_second: Optional[float], burst: Optional[int] = None) -> None:
+        """Cap the combined throughput of every upload of the process.
+
+        The cap is shared by all clients, managers and concurrent uploads, sync and
+        async, which take turns sending 64KB at a time. It can be changed while
+        uploads run; they follow the new cap from their next 64KB.
+
+        Args:
+            bytes_per_second: The cap, or None to lift it
+            burst: Bytes that can go out at once after an idle period (optional).
+                Defaults to 64KB.
+
+        Raises:
+            ValueError: If `bytes_per_second` is not positive
+
+        Example:
+            ```python
+            >>> # Leave room for the rest of the site on a 10Mbit/s uplink
+            >>> NoteManager.set_upload_bandwidth(600 * 1024)
+            >>> NoteManager.set_upload_bandwidth(None)
+            ```
+        """
+        upload_limiter().set_rate(bytes_per_second, burst)
+
+    @classmethod
+    def set_retry_budget(
+        cls,
+        ratio: Optional[float] = 0.2,
+        min_per_second: Optional[float] = None,
+        window: Optional[float] = None
+    ) -> None:
+        """Set the process-wide retry budget shared by every request and upload.
+
+        Retries are allowed up to `ratio` per successful request over the last
+        `window` seconds (10 by default), plus `min_per_second` (10 by default).
+        Once the budget is spent, failures that would have been retried raise
+        `RetryBudgetExhaustedError` right away.
+
+        Args:
+            ratio: Retries allowed per recent successful request, or None for no budget
+            min_per_second: Retries per second allowed regardless of successes (optional)
+            window: Seconds over which successes and retries are counted (optional)
+
+        Raises:
+            ValueError: If a value is negative or the window is not positive
+
+        Example:
+            ```python
+            >>> NoteManager.set_retry_budget(0.1, min_per_second=2)
+            >>> NoteManager.retry_budget_stats()["balance"]
+            20.0
+            ```
+        """
+        retry_budget().configure(ratio, min_per_second, window)
+
+    @classmethod
+    def retry_budget_stats(cls) -> Dict[str, Any]:
+        """Snapshot of the process-wide retry budget, for metrics.
+
+        Returns:
+            Dict with `successes` and `retries` counted in the window, the `balance`
+            of retries available, the totals of retries `spent` and `denied`, and
+            the configured `ratio`, `min_per_second` and `window`
+        """
+        return retry_budget().stats()
+
     @classmethod
     def configure_logging(cls, level: Union[int, str] = logging.INFO, handler: Optional[Handler] = None) -> None:
         """Configure logging for the SDK.
@@ -165,7 +316,10 @@ class NoteManager:
 
         This method handles:
         - API key authentication
-        - Request retries with exponential backoff
+        - Connection reuse through the client's pooled session
+        - Request retries per the endpoint's `RetryPolicy` (jittered backoff, `Retry-After`)
+        - The client's circuit breaker of the endpoint family
+        - The client's rate limiter, if any (waits for a turn before each attempt)
         - Error response parsing and conversion to exceptions
         - Request/response logging (at DEBUG level)
         - Timeout configuration
@@ -193,10 +347,14 @@ class NoteManager:
 
         url = f"{self._config['api_base_url']}/{endpoint}"
         timeout = timeout or self._config['request_timeout']
-        retries = 0
-        delay = self._config['retry_delay']
+        policy = self._retry_policy(endpoint)
+        circuit = self._client.circuit_breakers.get(endpoint)
+        attempt = 0
 
         while True:
+            circuit.allow()
+            if self._client.rate_limiter is not None:
+                self._client.rate_limiter.acquire(endpoint, self._client._api_key)
             try:
                 self.logger.debug(
                     "Making %s request to %s",
@@ -209,7 +367,7 @@ class NoteManager:
                     }
                 )
 
-                response = requests.request(
+                response = self._client.session.request(
                     method,
                     url,
                     json=data if data else None,
@@ -217,66 +375,124 @@ class NoteManager:
                     headers=headers,
                     timeout=timeout
                 )
-                
-                self.logger.debug(
-                    "Received response: %s %s",
-                    response.status_code,
-                    response.text[:1000] + '...' if len(response.text) > 1000 else response.text
-                )
-                
-                # Handle various error responses
-                if response.status_code == 401:
-                    raise AuthenticationError(f"Invalid API key: {response.text}")
-                elif response.status_code == 403:
-                    raise AuthorizationError(f"API key does not have required permissions: {response.text}")
-                elif response.status_code == 402:
-                    raise PaymentRequiredError(f"Payment required: {response.text}")
-                elif response.status_code == 429:
-                    raise RateLimitError(f"Rate limit exceeded: {response.text}")
-                elif response.status_code == 404:
-                    raise NotFoundError(f"Resource not found: {response.text}")
-                elif response.status_code == 400:
-                    raise BadRequestError(response.text)
-                elif response.status_code >= 500:
-                    # Only retry on server errors if we haven't exceeded max retries
-                    if (response.status_code in self._config['retry_on_status'] and 
-                        retries < self._config['max_retries']):
-                        self.logger.warning(
-                            "Request failed with %d, retrying in %d seconds (attempt %d/%d)",
-                            response.status_code, delay, retries + 1, self._config['max_retries']
-                        )
-                        time.sleep(delay)
-                        retries += 1
-                        delay = min(delay * 2, self._config['retry_max_delay'])
-                        continue
-                    
-                    # After retries are exhausted, raise InternalServerError
-                    self.logger.error("Server error after %d retries: %s", retries, response.text)
-                    raise InternalServerError(f"Server error: {response.text}")
-                
-                # If we get here, check for any other error status codes
-                try:
-                    response.raise_for_status()
-                except requests.exceptions.HTTPError as e:
-                    self.logger.error("HTTP error occurred: %s", str(e))
-                    raise NetworkError(f"HTTP error: {str(e)}")
-                
-                try:
-                    return response.json()
-                except ValueError as e:
-                    self.logger.error("Invalid JSON response: %s", str(e))
-                    raise BadRequestError("Invalid response format")
-                
-            except requests.exceptions.ConnectionError as e:
-                self.logger.error("Connection error: %s", str(e))
-                raise NetworkError(f"Connection error: {str(e)}")
-            except requests.exceptions.Timeout as e:
-                self.logger.error("Request timed out: %s", str(e))
-                raise NetworkError(f"Request timed out: {str(e)}")
             except requests.exceptions.RequestException as e:
+                attempt += 1
+                delay = None
+                if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                    circuit.record_failure()
+                    delay = policy.next_delay(attempt, method, sent=request_was_sent(e))
+                if delay is not None:
+                    self.logger.warning(
+                        "Request to %s failed (%s), retrying in %.1f seconds (attempt %d/%d)",
+                        endpoint, type(e).__name__, delay, attempt, policy.max_retries
+                    )
+                    time.sleep(delay)
+                    continue
+                if isinstance(e, requests.exceptions.ConnectionError):
+                    self.logger.error("Connection error: %s", str(e))
+                    raise NetworkError(f"Connection error: {str(e)}")
+                if isinstance(e, requests.exceptions.Timeout):
+                    self.logger.error("Request timed out: %s", str(e))
+                    raise NetworkError(f"Request timed out: {str(e)}")
                 self.logger.error("Request failed: %s", str(e))
                 raise NetworkError(f"Request failed: {str(e)}")
 
+            self.logger.debug(
+                "Received response: %s %s",
+                response.status_code,
+                response.text[:1000] + '...' if len(response.text) > 1000 else response.text
+            )
+            circuit.record_response(response.status_code)
+            if response.status_code == 429:
+                self._client._defer_rate_limit(endpoint, response.headers)
+
+            if response.status_code in policy.retry_on_status:
+                attempt += 1
+                delay = policy.next_delay(attempt, method, response.status_code, response.headers)
+                if delay is not None:
+                    self.logger.warning(
+                        "Request to %s failed with %d, retrying in %.1f seconds (attempt %d/%d)",
+                        endpoint, response.status_code, delay, attempt, policy.max_retries
+                    )
+                    time.sleep(delay)
+                    continue
+
+            # Handle various error responses
+            error = self._error_for_status(response.status_code, response.text)
+            if error is not None:
+                if isinstance(error, RateLimitError):
+                    wait = retry_after(response.headers)
+                    if wait is not None:
+                        error.details['retry_after'] = wait
+                elif isinstance(error, InternalServerError) and attempt:
+                    self.logger.error("Server error after %d retries: %s", attempt - 1, response.text)
+                raise error
+
+            # If we get here, check for any other error status codes
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as e:
+                self.logger.error("HTTP error occurred: %s", str(e))
+                raise NetworkError(f"HTTP error: {str(e)}")
+
+            policy.record_success()
+            try:
+                return response.json()
+            except ValueError as e:
+                self.logger.error("Invalid JSON response: %s", str(e))
+                raise BadRequestError("Invalid response format")
+
+    def _retry_policy(self, endpoint: str) -> RetryPolicy:
+        """Retry policy of requests to `endpoint`.
+
+        An entry of the `retry_policies` setting matching the endpoint wins; other
+        endpoints follow `max_retries`, `retry_delay`, `retry_max_delay` and
+        `retry_on_status`.
+        """
+        default = RetryPolicy(
+            max_retries=self._config['max_retries'],
+            backoff=self._config['retry_delay'],
+            max_backoff=self._config['retry_max_delay'],
+            retry_on_status=self._config['retry_on_status']
+        )
+        return select_policy(self._config.get('retry_policies'), endpoint, default)
+
+    def _upload_retry_policy(self) -> RetryPolicy:
+        """Retry policy of uploads to storage, where `max_retries` counts attempts."""
+        return RetryPolicy(
+            max_retries=max(0, self._config['max_retries'] - 1),
+            backoff=self._config['retry_delay'],
+            max_backoff=self._config['retry_max_delay'],
+            retry_on_status=STORAGE_RETRY_STATUSES
+        )
+
+    @staticmethod
+    def _error_for_status(status_code: int, text: str) -> Optional[NoteDxError]:
+        """Map an API error status code to the matching SDK exception.
+
+        Args:
+            status_code: HTTP status code of the response
+            text: Raw response body
+
+        Returns:
+            The exception to raise, or None if the status is not a handled error
+        """
+        if status_code == 401:
+            return AuthenticationError(f"Invalid API key: {text}")
+        elif status_code == 403:
+            return AuthorizationError(f"API key does not have required permissions: {text}")
+        elif status_code == 402:
+            return PaymentRequiredError(f"Payment required: {text}")
+        elif status_code == 429:
+            return RateLimitError(f"Rate limit exceeded: {text}")
+        elif status_code == 404:
+            return NotFoundError(f"Resource not found: {text}")
+        elif status_code == 400:
+            return BadRequestError(text)
+        elif status_code >= 500:
+            return InternalServerError(f"Server error: {text}")
+        return None
+
     def _validate_input(self, **kwargs) -> None:
         """Validate input parameters against API requirements.
 
@@ -389,6 +605,175 @@ class NoteManager:
                     details={"recording_type": "conversation"}
                 )
 
+    @staticmethod
+    def _build_job_data(
+        lang: str,
+        template: Optional[str],
+        visit_type: Optional[str] = None,
+        recording_type: Optional[str] = None,
+        patient_consent: Optional[bool] = None,
+        output_language: Optional[str] = None,
+        custom: Optional[Dict[str, Any]] = None,
+        documentation_style: Optional[str] = None,
+        custom_metadata: Optional[Dict[str, Any]] = None,
+        webhook_env: Optional[str] = None,
+        **extra: Any
+    ) -> Dict[str, Any]:
+        """Build the request body for a note generation job.
+
+        Args:
+            lang: Source language
+            template: Note template
+            visit_type: Type of medical visit (optional)
+            recording_type: Type of recording (optional)
+            patient_consent: Whether patient consent was obtained (optional)
+            output_language: Target language (optional)
+            custom: Custom context/template (optional)
+            documentation_style: Documentation style (optional)
+            custom_metadata: Metadata passed to webhooks and jobs (optional)
+            webhook_env: Webhook environment (optional)
+            **extra: Endpoint specific fields (e.g. `text`, `file_extension`)
+
+        Returns:
+            Request body with only the provided optional fields
+        """
+        data = {**extra, 'lang': lang, 'template': template}
+
+        # Add optional fields if provided
+        if visit_type:
+            data['visit_type'] = visit_type
+        if recording_type:
+            data['recording_type'] = recording_type
+        if patient_consent is not None:
+            data['patient_consent'] = patient_consent
+        if output_language:
+            data['output_language'] = output_language
+        if custom:
+            data['custom'] = custom
+        if documentation_style:
+            data['documentation_style'] = documentation_style
+        if custom_metadata:
+            data['custom_metadata'] = custom_metadata
+        if webhook_env:
+            data['webhook_env'] = webhook_env
+        return data
+
+    def _job_error(self, e: NoteDxError, map_field_errors: bool = True) -> NoteDxError:
+        """Translate a job creation error into the error raised to the caller.
+
+        Args:
+            e: Error raised by the job creation request
+            map_field_errors: Whether to map 400 field errors to validation errors
+
+        Returns:
+            The translated error, or `e` itself when no translation applies
+        """
+        if isinstance(e, AuthenticationError):
+            if "Invalid API key" in str(e):
+                self.logger.error("Invalid API key provided")
+                return AuthenticationError("Invalid API key provided")
+            elif "Missing user ID" in str(e):
+                self.logger.error("API key has no associated user")
+                return AuthenticationError("API key has no associated user")
+        elif isinstance(e, PaymentRequiredError):
+            if "Free trial jobs depleted" in str(e):
+                self.logger.error("Free trial jobs (100) depleted")
+                return PaymentRequiredError(
+                    "Free trial jobs (100) depleted. Please subscribe to continue.",
+                    details=e.details
+                )
+            elif "Payment required" in str(e):
+                self.logger.error("Payment required for subscription")
+                return PaymentRequiredError(
+                    "Payment required to activate subscription",
+                    details=e.details
+                )
+        elif isinstance(e, AuthorizationError):
+            if "Account is inactive" in str(e):
+                self.logger.error("Account is inactive")
+                return InactiveAccountError(
+                    "Account is inactive. Please complete subscription setup or contact support.",
+                    details=e.details
+                )
+        elif isinstance(e, BadRequestError) and map_field_errors:
+            if "Missing required field" in str(e):
+                self.logger.error("Missing required field: %s", str(e))
+                return MissingFieldError(str(e).split(": ")[1])
+            elif "Invalid field" in str(e):
+                self.logger.error("Invalid field value: %s", str(e))
+                field = str(e).split(": ")[1].split(" ")[0]
+                return InvalidFieldError(field, str(e))
+        return e
+
+    def _create_job(self, endpoint: str, data: Dict[str, Any], map_field_errors: bool = True) -> Dict[str, Any]:
+        """Create a note generation job.
+
+        Args:
+            endpoint: Job creation endpoint (`process-audio` or `process-text`)
+            data: Request body
+            map_field_errors: Whether to map 400 field errors to validation errors
+
+        Returns:
+            API response data as dictionary
+        """
+        try:
+            return self._request("POST", endpoint, data=data)
+        except NoteDxError as e:
+            error = self._job_error(e, map_field_errors)
+            if error is e:
+                self.logger.error("Error creating job: %s", str(e))
+                raise
+            raise error
+
+    def _create_audio_job(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create an audio job, taking a pre-created one from the active `job_slots()` pool if possible."""
+        pool = self._slot_pool
+        if pool is None or data.get('multipart'):
+            return self._create_job("process-audio", data)
+        return pool.acquire(data)
+
+    @contextmanager
+    def job_slots(self, size: int = 2, ttl: float = 600.0) -> Iterator[JobSlotPool]:
+        """Creates audio jobs ahead of demand while the block runs.
+
+        Inside the block, `process_audio()`, `process_audio_stream()` and
+        `process_batch()` take a job created in the background with the same
+        parameters when one is ready, and the pool creates the next ones while the
+        current file uploads. This hides the job creation round trip of every file
+        but the first in a loop over recordings sharing their parameters.
+
+        Args:
+            size: Jobs ready or being created per parameter set, counting one created on
+                demand when none is ready. At least 2; defaults to 2.
+            ttl: Seconds a pre-created job stays usable. Defaults to 600.  
+                Jobs are also discarded a minute before their presigned URL expires.
+
+        Yields:
+            JobSlotPool: The pool, with `hits`, `misses` and `expired` counters
+
+        Example:
+            ```python
+            >>> with note_manager.job_slots(size=2) as pool:
+            ...     for path in paths:
+            ...         note_manager.process_audio(path, template="wfw")
+            >>> pool.hits
+            41
+            ```
+
+        Note:
+            - Jobs left unused when the block exits (at most `size` per parameter
+              set) never receive a recording; their IDs are logged and returned by
+              `pool.close()` / `pool.unused_jobs()`
+            - Multipart uploads need the file size at job creation and are not pooled
+        """
+        pool = JobSlotPool(lambda data: self._create_job("process-audio", data), size=size, ttl=ttl)
+        previous, self._slot_pool = self._slot_pool, pool
+        try:
+            yield pool
+        finally:
+            self._slot_pool = previous
+            pool.close()
+
     def _calculate_optimal_chunk_size(self, file_size: int) -> int:
         """Calculate optimal chunk size based on file size.
         
@@ -411,6 +796,502 @@ class NoteManager:
         else:
             return 20 * MB
 
+    def _progress_callback(
+        self,
+        job_id: str,
+        log_interval: int,
+        on_progress: Optional[Callable[[UploadProgress], None]] = None,
+        control: Optional[UploadControl] = None
+    ) -> ProgressCallback:
+        """Progress callback for an upload body: debug logging, plus `on_progress` reports if given.
+
+        With a `control`, every read of the body also waits while the upload is
+        paused and stops it once cancelled.
+        """
+        callback = log_progress(job_id, log_interval)
+        if on_progress is not None:
+            callback = ProgressTracker(job_id, on_progress, self._config['progress_interval'], callback)
+        if control is None:
+            return callback
+
+        def controlled(sent: int, total: int) -> None:
+            callback(sent, total)
+            control.check()
+
+        return controlled
+
+    def _upload_file(
+        self,
+        presigned_url: str,
+        file_path: str,
+        job_id: str,
+        chunk_size: Optional[int] = None,
+        on_progress: Optional[Callable[[UploadProgress], None]] = None,
+        control: Optional[UploadControl] = None
+    ) -> None:
+        """Stream an audio file to its presigned URL in a single PUT.
+
+        The file is memory-mapped and handed to the session as the request body, so
+        the upload runs at line rate with one round trip and without per-chunk
+        buffers. A failed attempt resends from the mapping.
+
+        Args:
+            presigned_url: Upload URL returned by job creation
+            file_path: Path to the audio file
+            job_id: ID of the job being processed
+            chunk_size: Fixed read block size in bytes (optional). By default chunks
+                adapt to measured throughput, up to `_calculate_optimal_chunk_size()`.
+            on_progress: Function called with `UploadProgress` reports (optional)
+            control: Pause and cancellation state of a background upload (optional)
+
+        Raises:
+            NetworkError: For connection issues
+            UploadError: For upload failures
+        """
+        mime_type = VALID_AUDIO_FORMATS[os.path.splitext(file_path)[1].lower()]
+        file_size = os.path.getsize(file_path)
+        adaptive = chunk_size is None
+        if adaptive:
+            chunk_size = self._calculate_optimal_chunk_size(file_size)
+            self.logger.debug(
+                "Using adaptive chunk size of up to %d bytes for file size %d bytes",
+                chunk_size, file_size
+            )
+
+        with open(file_path, 'rb') as f:
+            body = open_file_body(
+                f, 0, file_size, self._progress_callback(job_id, chunk_size, on_progress, control), chunk_size
+            )
+            try:
+                self._upload_body(presigned_url, body, mime_type, job_id, chunk_size if adaptive else None)
+            finally:
+                body.close()
+
+    def _upload_body(
+        self,
+        presigned_url: str,
+        body: Union[ProgressReader, BufferReader, IteratorReader],
+        mime_type: str,
+        job_id: str,
+        max_chunk_size: Optional[int] = None
+    ) -> None:
+        """PUT an upload body to a presigned URL, rewinding and resending it on failure.
+
+        Bodies that cannot be rewound (iterators, non-seekable files) get a single attempt.
+        With `max_chunk_size`, rewindable bodies are sent in chunks sized from the
+        measured throughput (slow start), and each chunk gets a send timeout derived
+        from that throughput instead of the fixed request timeout.
+
+        The MD5 of the body is computed as it is sent and checked against the one
+        storage reports, so data corrupted in transit fails the attempt.
+
+        Args:
+            presigned_url: Upload URL returned by job creation
+            body: Upload body from `open_upload_body()`
+            mime_type: Content type of the audio
+            job_id: ID of the job being processed
+            max_chunk_size: Largest adaptive chunk in bytes (optional)
+
+        Raises:
+            NetworkError: For connection issues
+            UploadError: For upload failures
+        """
+        headers = {'Content-Type': mime_type}
+        if body.total is not None:
+            headers['Content-Length'] = str(body.total)
+        if self._config['verify_checksum']:
+            body.enable_checksum()
+        body.limiter = upload_limiter()
+
+        sizer = None
+        if max_chunk_size is not None and body.rewindable:
+            sizer = AdaptiveChunkSizer(
+                self._throughput,
+                max_chunk_size=max_chunk_size,
+                default_timeout=self._config['request_timeout']
+            )
+            body = AdaptiveBody(body, sizer)
+
+        policy = self._upload_retry_policy()
+        attempt = 0
+        while True:
+            # The connect timeout also bounds the send of each chunk of the body
+            timeout = (sizer.timeout(), self._config['request_timeout']) if sizer else self._config['request_timeout']
+            try:
+                upload_response = self._client.session.put(
+                    presigned_url,
+                    data=body,
+                    headers=headers,
+                    timeout=timeout
+                )
+                rejection = rejected_url_error(upload_response, job_id)
+                if rejection is not None:
+                    raise rejection
+                upload_response.raise_for_status()
+                verify_checksum(upload_response.headers, body.checksum, job_id)
+                policy.record_success()
+                return
+            except Exception as e:
+                attempt += 1
+                delay = None
+                if body.rewindable and not isinstance(e, (UploadCancelledError, UploadUrlRejectedError)):
+                    delay = upload_retry_delay(policy, attempt, e)
+                if delay is None:
+                    self._handle_upload_error(e, job_id)
+                self.logger.warning(
+                    "Upload failed for job %s, retrying in %.1f seconds (attempt %d/%d)",
+                    job_id, delay, attempt, policy.max_retries + 1
+                )
+                time.sleep(delay)
+                body.rewind()
+
+    def _dedup_index(self) -> UploadIndex:
+        """Index of uploaded recordings used by `process_audio(deduplicate=True)`."""
+        if self._upload_index is None:
+            self._upload_index = UploadIndex(
+                self._config.get('dedup_index') or default_index_path(),
+                max_age=self._config['dedup_max_age']
+            )
+        return self._upload_index
+
+    def _hash_in_background(self, file_path: str) -> "Future[str]":
+        """Start the content hash of a recording for the deduplication index.
+
+        Hashes run one at a time on an executor shared by the calls of this
+        manager, since they are bound by disk reads.
+        """
+        if self._hashing is None:
+            self._hashing = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notedx-hash")
+        return self._hashing.submit(content_hash, file_path)
+
+    def _find_duplicate(
+        self,
+        file_path: str,
+        source_params: Dict[str, Any],
+        note_params: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Reuse the job of an identical earlier submission, if there is one.
+
+        Returns the recorded response when the note parameters match too, and the
+        response of `regenerate_note()` on the earlier job when only they differ.
+
+        Returns:
+            The job response, or None if the recording must be uploaded
+        """
+        index = self._dedup_index()
+        entry = index.lookup(file_path, source_params)
+        if entry is None:
+            return None
+
+        response = entry['variants'].get(params_key(note_params))
+        if response is not None:
+            self.logger.info("Recording %s was already submitted as job %s", file_path, response.get('job_id'))
+            return {**response, 'deduplicated': True}
+
+        self.logger.info(
+            "Recording %s was already uploaded for job %s, regenerating the note", file_path, entry['job_id']
+        )
+        try:
+            response = self.regenerate_note(entry['job_id'], **note_params)
+        except JobNotFoundError:
+            index.forget(entry['key'])
+            return None
+        except (JobError, ValidationError) as e:
+            self.logger.info("Cannot regenerate from job %s, uploading again: %s", entry['job_id'], str(e))
+            return None
+        index.record(file_path, source_params, entry['sha256'], entry['job_id'], note_params, response)
+        return {**response, 'deduplicated': True}
+
+    def _checkpoint_dir(self) -> Optional[str]:
+        """Directory where upload checkpoints are kept, or None if checkpoints are disabled."""
+        return self._config.get('checkpoint_dir') or default_checkpoint_dir()
+
+    def _create_checkpoint(self, job_id: str, file_path: str, response: Dict[str, Any], multipart: bool) -> Optional[UploadCheckpoint]:
+        """Record an upload so it can be resumed, without failing the upload if that is not possible."""
+        directory = self._checkpoint_dir()
+        if directory is None:
+            return None
+        try:
+            # Checkpoints of failed uploads that were never resumed hold expired URLs
+            prune_expired(directory)
+            return UploadCheckpoint.create(directory, job_id, file_path, response, multipart)
+        except OSError as e:
+            self.logger.warning("Could not write upload checkpoint for job %s: %s", job_id, str(e))
+            return None
+
+    def _preprocess_audio(
+        self,
+        file_path: str,
+        trim_silence: bool = False,
+        speech_profile: bool = False
+    ) -> Tuple[str, Optional[PreprocessResult]]:
+        """Write a smaller copy of a WAV/PCM file to a temporary file before upload.
+
+        Preprocessing is an optimization: files it cannot handle (other formats,
+        non-PCM WAV) are uploaded unchanged.
+
+        Returns:
+            The path to upload, and the preprocessing result if a copy was written
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        if not (trim_silence or speech_profile):
+            return file_path, None
+        if ext not in PREPROCESS_EXTENSIONS:
+            self.logger.warning("Skipping audio preprocessing of %s: only WAV and PCM are supported", file_path)
+            return file_path, None
+
+        fd, output_path = tempfile.mkstemp(prefix="notedx-", suffix=ext)
+        os.close(fd)
+        try:
+            result = preprocess_audio(
+                file_path,
+                output_path,
+                trim_silence=trim_silence,
+                speech_format=SPEECH_FORMAT if speech_profile else None,
+                silence_threshold_db=self._config['silence_threshold_db'],
+                min_silence=self._config['min_silence'],
+                keep_silence=self._config['keep_silence']
+            )
+        except (ValueError, wave.Error, EOFError) as e:
+            os.remove(output_path)
+            self.logger.warning("Skipping audio preprocessing of %s: %s", file_path, str(e))
+            return file_path, None
+        except BaseException:
+            os.remove(output_path)
+            raise
+
+        self.logger.info(
+            "Preprocessing saved %d of %d bytes (%.1fs of silence removed) in %.2fs of CPU",
+            result.bytes_saved, result.input_bytes, result.removed_seconds, result.cpu_seconds
+        )
+        return output_path, result
+
+    def _process_split_audio(
+        self,
+        file_path: str,
+        process: Callable[[str, Optional[Callable[[UploadProgress], None]]], Dict[str, Any]],
+        on_progress: Optional[Callable[[UploadProgress], None]] = None
+    ) -> Dict[str, Any]:
+        """Submit a WAV/PCM recording over the size limit as one job per segment.
+
+        Args:
+            file_path: Path to the recording
+            process: Submits one segment file, reporting to the given progress callback,
+                and returns its job response
+            on_progress: Function called with progress reports on the whole recording (optional)
+
+        Returns:
+            The combined response described in `process_audio()`
+
+        Raises:
+            ValidationError: If the recording cannot be split
+            ImportError: If numpy is not installed
+            NoteDxError: The error of the first failed segment, with the jobs created
+                for the others under `details['job_ids']` (None for failed segments)
+        """
+        directory = tempfile.mkdtemp(prefix="notedx-split-")
+        try:
+            try:
+                segments = split_audio(
+                    file_path,
+                    directory,
+                    MAX_AUDIO_SIZE,
+                    silence_threshold_db=self._config['silence_threshold_db']
+                )
+            except (ValueError, wave.Error, EOFError) as e:
+                self.logger.error("Cannot split audio file %s: %s", file_path, str(e))
+                raise ValidationError(
+                    f"File size exceeds 500MB limit and the file cannot be split: {str(e)}",
+                    field="file_path",
+                    details={"path": file_path, "max_size": MAX_AUDIO_SIZE, "error": str(e)}
+                )
+            self.logger.info(
+                "Submitting %s as %d segments under the 500MB limit",
+                file_path, len(segments)
+            )
+
+            progress = None
+            if on_progress is not None:
+                progress = CombinedProgress([os.path.getsize(segment.path) for segment in segments], on_progress)
+            with ThreadPoolExecutor(max_workers=min(self._config['split_workers'], len(segments))) as executor:
+                futures = [
+                    executor.submit(process, segment.path, progress.for_part(index) if progress else None)
+                    for index, segment in enumerate(segments)
+                ]
+            responses: List[Optional[Dict[str, Any]]] = []
+            errors = []
+            for future in futures:
+                try:
+                    responses.append(future.result())
+                except Exception as e:
+                    responses.append(None)
+                    errors.append(e)
+            if errors:
+                # Jobs of the segments that went through are billed: let the caller find them
+                job_ids = [response['job_id'] if response else None for response in responses]
+                self.logger.error(
+                    "%d of %d segments of %s failed; jobs created for the others: %s",
+                    len(errors), len(segments), file_path, [job_id for job_id in job_ids if job_id]
+                )
+                error = errors[0]
+                if not isinstance(error, NoteDxError):
+                    raise UploadError(
+                        f"Segment of {file_path} failed: {str(error)}",
+                        details={'job_ids': job_ids}
+                    ) from error
+                error.details['job_ids'] = job_ids
+                raise error
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+        parts = [
+            {**response, 'start': round(segment.start, 3), 'duration': round(segment.duration, 3)}
+            for segment, response in zip(segments, responses)
+        ]
+        return {
+            'job_id': parts[0]['job_id'],
+            'job_ids': [part['job_id'] for part in parts],
+            'segments': parts
+        }
+
+    def _upload_with_checkpoint(
+        self,
+        checkpoint: Optional[UploadCheckpoint],
+        response: Dict[str, Any],
+        multipart: bool,
+        file_path: str,
+        job_id: str,
+        chunk_size: Optional[int],
+        max_workers: int,
+        on_progress: Optional[Callable[[UploadProgress], None]] = None,
+        control: Optional[UploadControl] = None,
+        data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Upload to the target of a job response, keeping its checkpoint until storage confirms.
+
+        An expired upload URL is detected before anything is sent, and one storage
+        rejects fails without retries. Given the job creation `data`, the upload
+        then moves to a new job (at most `url_refreshes` times), and `response` is
+        updated in place with that job.
+
+        Raises:
+            NetworkError: For connection issues
+            UploadUrlRejectedError: If the upload URL expired or was rejected, and no new job can be used
+            UploadError: For upload failures
+        """
+        refreshes = 0
+        while True:
+            try:
+                if control is not None:
+                    # A queued background upload can be paused or cancelled before it starts
+                    control.check()
+                if refreshes == 0:
+                    # URLs of new jobs are used as is, so a wrong local clock costs one job at most
+                    check_presigned_url(
+                        response['multipart']['part_urls'][0] if multipart else response['presigned_url'],
+                        job_id,
+                        self._config['url_expiry_margin']
+                    )
+                if multipart:
+                    self._upload_multipart(
+                        response['multipart'], file_path, job_id, max_workers, checkpoint, on_progress, control
+                    )
+                else:
+                    # Stream the file to the presigned URL in a single request
+                    self._upload_file(response['presigned_url'], file_path, job_id, chunk_size, on_progress, control)
+                break
+            except UploadUrlRejectedError as e:
+                if data is None or not self._can_refresh_url(e, job_id, refreshes):
+                    if checkpoint is not None:
+                        # Resuming with a URL storage refuses cannot succeed
+                        checkpoint.delete()
+                    raise
+            except (NetworkError, UploadError):
+                if checkpoint is not None:
+                    self.logger.info(
+                        "Upload for job %s can be continued with resume_upload(%r, %r)",
+                        job_id, job_id, file_path
+                    )
+                raise
+
+            refreshes += 1
+            fresh = self._create_job("process-audio", data)
+            if not fresh.get('presigned_url') or not fresh.get('job_id'):
+                raise ValidationError(
+                    "Invalid API response: missing presigned_url or job_id",
+                    details={"response": fresh}
+                )
+            response.clear()
+            response.update(fresh)
+            job_id = fresh['job_id']
+            multipart = multipart and MultipartUploader.is_multipart(fresh)
+            if checkpoint is not None:
+                checkpoint.delete()
+                checkpoint = self._create_checkpoint(job_id, file_path, response, multipart)
+        if checkpoint is not None:
+            checkpoint.delete()
+
+    def _can_refresh_url(self, e: UploadUrlRejectedError, job_id: str, refreshes: int) -> bool:
+        """Whether an upload whose URL expired or was rejected may move to a new job."""
+        if refreshes >= self._config['url_refreshes']:
+            return False
+        self.logger.warning("%s for job %s, moving the upload to a new job", str(e), job_id)
+        return True
+
+    def _upload_multipart(
+        self,
+        multipart: Dict[str, Any],
+        file_path: str,
+        job_id: str,
+        max_workers: int,
+        checkpoint: Optional[UploadCheckpoint] = None,
+        on_progress: Optional[Callable[[UploadProgress], None]] = None,
+        control: Optional[UploadControl] = None
+    ) -> None:
+        """Upload an audio file as concurrent parts.
+
+        Args:
+            multipart: The `multipart` object of the job creation response
+            file_path: Path to the audio file
+            job_id: ID of the job being processed
+            max_workers: Maximum number of parts in flight
+            checkpoint: Checkpoint recording stored parts; parts it lists are skipped (optional)
+            on_progress: Function called with `UploadProgress` reports across all parts (optional)
+            control: Pause and cancellation state of a background upload (optional)
+
+        Raises:
+            NetworkError: For connection issues
+            UploadError: For upload failures
+        """
+        mime_type = VALID_AUDIO_FORMATS[os.path.splitext(file_path)[1].lower()]
+        uploader = MultipartUploader(
+            self._client.session,
+            max_workers=max_workers,
+            retry_policy=self._upload_retry_policy(),
+            timeout=self._config['request_timeout'],
+            estimator=self._throughput,
+            verify_checksums=self._config['verify_checksum'],
+            limiter=upload_limiter()
+        )
+        self.logger.debug(
+            "Uploading %d parts for job %s with %d workers",
+            len(multipart['part_urls']), job_id, max_workers
+        )
+        try:
+            uploader.upload(
+                file_path,
+                multipart,
+                mime_type,
+                self._progress_callback(job_id, int(multipart['part_size']), on_progress, control),
+                completed=checkpoint.completed_parts if checkpoint else None,
+                on_part=checkpoint.mark_part if checkpoint else None
+            )
+        except Exception as e:
+            self._handle_upload_error(e, job_id)
+
     def process_audio(
         self,
         file_path: str,
@@ -426,8 +1307,16 @@ class NoteManager:
         custom: Optional[Dict[str, Any]] = None,
         chunk_size: Optional[int] = None,
         custom_metadata: Optional[Dict[str, Any]] = None,
-        webhook_env: Optional[Literal['prod', 'dev']] = None
-    ) -> Dict[str, Any]:
+        webhook_env: Optional[Literal['prod', 'dev']] = None,
+        multipart_upload: bool = False,
+        max_upload_workers: int = 4,
+        on_progress: Optional[Callable[[UploadProgress], None]] = None,
+        trim_silence: bool = False,
+        speech_profile: bool = False,
+        deduplicate: bool = False,
+        split_oversized: bool = False,
+        background: bool = False
+    ) -> Union[Dict[str, Any], UploadHandle]:
         """Converts an audio recording into a medical note using the specified template.
 
         ```bash
@@ -511,8 +1400,58 @@ class NoteManager:
                 * `context`: Additional patient context (history, demographics, medication, etc.)
                 * `template`: A complete custom template as a string (SOAP note, other etc...)
 
-            chunk_size: Size of upload chunks in bytes (optional).  
-                Defaults to 1MB. Adjust for large files or slow connections.
+            chunk_size: Fixed upload chunk size in bytes (optional).  
+                The file is always sent as a single streamed request. By default, chunks
+                start small and grow with the measured throughput (up to 5-20MB depending
+                on file size), and each chunk's timeout follows the throughput too.
+
+            multipart_upload: Request a parallel multipart upload (optional). Defaults to False.  
+                When the API offers one, the file is split into parts uploaded concurrently,
+                each retried on its own. Otherwise the file is sent as a single streamed request.
+
+            max_upload_workers: Maximum number of parts uploaded concurrently. Defaults to 4.
+
+            on_progress: Function called with an `UploadProgress` while the file uploads (optional).  
+                Reports bytes sent, total size, instantaneous and average throughput and
+                the estimated time remaining, at most every `progress_interval` seconds
+                (0.5 by default) and once when the upload completes. Exceptions it raises
+                are logged and do not interrupt the upload.
+
+            trim_silence: Remove long silences from WAV/PCM recordings before upload (optional). Defaults to False.  
+                Silences longer than `min_silence` (1s) below `silence_threshold_db` (-40 dBFS)
+                are shortened to `keep_silence` (0.25s) on each side. The file on disk is
+                left untouched; a trimmed copy is uploaded. Other formats are uploaded
+                as is. Requires numpy (`pip install notedx-sdk[audio]`).
+
+            speech_profile: Convert WAV/PCM recordings to mono 16kHz 16-bit before upload (optional). Defaults to False.  
+                Stereo 48kHz recordings shrink about 6x with no loss for speech recognition.
+                Combines with `trim_silence`; same requirements and fallbacks.
+
+            deduplicate: Reuse the job of an identical earlier submission (optional). Defaults to False.  
+                Submissions are recorded in a local index (`dedup_index` config, or the
+                NOTEDX_DEDUP_INDEX env var, default `~/.notedx/uploads.json`) by content
+                hash and parameters. Submitting the same recording with the same parameters
+                again returns the earlier job without uploading; if only the note parameters
+                (`template`, `output_language`, `documentation_style`, `custom`,
+                `custom_metadata`) differ, the note is regenerated from the earlier job with
+                `regenerate_note()`. The content hash is computed while the file uploads.
+
+            split_oversized: Split WAV/PCM recordings over 500MB instead of rejecting them (optional). Defaults to False.  
+                The recording is cut into balanced segments under the limit, each cut placed
+                in a silence so no word is split, and each segment is submitted as its own
+                job, `split_workers` (4) at a time, with the other parameters of this call.
+                Fetch the combined results with `fetch_merged_transcript()` and
+                `fetch_merged_note()`. `on_progress` reports cover the whole recording. If a
+                segment fails, its error lists the jobs created for the others under
+                `details['job_ids']`. Every segment is a billed job. Requires numpy
+                (`pip install notedx-sdk[audio]`); without it, and for other formats, recordings
+                over 500MB are rejected.
+
+            background: Return as soon as the job is created, and upload in the background (optional). Defaults to False.  
+                Returns an `UploadHandle` with the `job_id`, whose `progress()`, `pause()`,
+                `resume()`, `cancel()` and `wait()` follow and control the upload. Uploads
+                run `background_workers` (4) at a time; more wait in a queue. `close()`
+                cancels the unfinished ones. Not available for recordings that need splitting.
 
         Returns:
             dict: A dictionary containing:
@@ -520,6 +1459,18 @@ class NoteManager:
                 * `job_id`: Unique identifier for tracking the job
                 * `presigned_url`: URL for uploading the audio file
                 * `status`: Initial job status
+                * `preprocessing`: With `trim_silence` or `speech_profile`, the `input_bytes`,
+                  `output_bytes`, `bytes_saved`, `removed_seconds` and `cpu_seconds` of the uploaded copy
+                * `deduplicated`: With `deduplicate`, True when an earlier job was reused
+
+            For a recording split into segments:
+
+                * `job_id`: Job of the first segment
+                * `job_ids`: Jobs of all segments, in recording order
+                * `segments`: Response of each segment's job, with its `start` and
+                  `duration` in seconds
+
+            With `background`, an `UploadHandle` whose `wait()` returns the above.
 
         Raises:
             ValidationError: If parameters are invalid or missing
@@ -558,6 +1509,13 @@ class NoteManager:
             )
             ```
 
+            Background upload:
+            ```python
+            handle = note_manager.process_audio("visit.mp3", template="wfw", background=True)
+            save_job(handle.job_id)  # the job exists, the recording is still uploading
+            handle.wait()
+            ```
+
         Notes:
             The `custom` object provides powerful customization capabilities:
 
@@ -604,7 +1562,7 @@ class NoteManager:
         """
         # Validate input parameters
         self.logger.info("Starting audio processing for file: %s", file_path)
-        self._validate_audio_file(file_path)
+        audio = self._validate_audio_file(file_path, allow_split=split_oversized)
         self._validate_input(
             visit_type=visit_type,
             recording_type=recording_type,
@@ -615,78 +1573,92 @@ class NoteManager:
             custom=custom
         )
 
-        try:
-            # Prepare request data
-            data = {
+        if audio.size > MAX_AUDIO_SIZE:
+            if background:
+                raise ValidationError(
+                    "Recordings over 500MB are split into several jobs and cannot be uploaded in the background",
+                    field="background"
+                )
+            return self._process_split_audio(file_path, lambda segment_path, segment_progress: self.process_audio(
+                segment_path,
+                visit_type=visit_type,
+                recording_type=recording_type,
+                patient_consent=patient_consent,
+                lang=lang,
+                output_language=output_language,
+                template=template,
+                documentation_style=documentation_style,
+                custom=custom,
+                chunk_size=chunk_size,
+                custom_metadata=custom_metadata,
+                webhook_env=webhook_env,
+                multipart_upload=multipart_upload,
+                max_upload_workers=max_upload_workers,
+                on_progress=segment_progress,
+                trim_silence=trim_silence,
+                speech_profile=speech_profile,
+                deduplicate=deduplicate,
+                split_oversized=False
+            ), on_progress)
+
+        hashing: Optional["Future[str]"] = None
+        if deduplicate:
+            source_params = {
                 'lang': lang,
+                'visit_type': visit_type,
+                'recording_type': recording_type,
+                'patient_consent': patient_consent,
+                'webhook_env': webhook_env,
+                'trim_silence': trim_silence,
+                'speech_profile': speech_profile
+            }
+            note_params = {
                 'template': template,
-                'file_extension': os.path.splitext(file_path)[1].lower()
+                'output_language': output_language,
+                'documentation_style': documentation_style,
+                'custom': custom,
+                'custom_metadata': custom_metadata
             }
+            duplicate = self._find_duplicate(file_path, source_params, note_params)
+            if duplicate is not None:
+                if background:
+                    return self._upload_in_background(duplicate, lambda handle: duplicate)
+                return duplicate
+
+        upload_path, preprocessing = self._preprocess_audio(file_path, trim_silence, speech_profile)
+        if deduplicate:
+            # Hash the whole file alongside job creation and upload
+            hashing = self._hash_in_background(file_path)
+
+        def clean_up() -> None:
+            if hashing is not None and not hashing.done():
+                # The upload failed: nothing will be indexed
+                hashing.cancel()
+            if upload_path != file_path:
+                os.remove(upload_path)
 
-            # Add optional fields if provided
-            if visit_type:
-                data['visit_type'] = visit_type
-            if recording_type:
-                data['recording_type'] = recording_type
-            if patient_consent is not None:
-                data['patient_consent'] = patient_consent
-            if output_language:
-                data['output_language'] = output_language
-            if custom:
-                data['custom'] = custom
-            if documentation_style:
-                data['documentation_style'] = documentation_style
-            if custom_metadata:
-                data['custom_metadata'] = custom_metadata
-            if webhook_env:
-                data['webhook_env'] = webhook_env
+        try:
+            # Prepare request data
+            data = self._build_job_data(
+                lang=lang,
+                template=template,
+                visit_type=visit_type,
+                recording_type=recording_type,
+                patient_consent=patient_consent,
+                output_language=output_language,
+                custom=custom,
+                documentation_style=documentation_style,
+                custom_metadata=custom_metadata,
+                webhook_env=webhook_env,
+                file_extension=os.path.splitext(file_path)[1].lower()
+            )
+            if multipart_upload:
+                data['multipart'] = True
+                data['file_size'] = audio.size if upload_path == file_path else os.path.getsize(upload_path)
 
             # Create job and get upload URL
             self.logger.debug("Creating job with parameters: %s", data)
-            try:
-                response = self._request("POST", "process-audio", data=data)
-            except AuthenticationError as e:
-                if "Invalid API key" in str(e):
-                    self.logger.error("Invalid API key provided")
-                    raise AuthenticationError("Invalid API key provided")
-                elif "Missing user ID" in str(e):
-                    self.logger.error("API key has no associated user")
-                    raise AuthenticationError("API key has no associated user")
-                raise
-            except PaymentRequiredError as e:
-                if "Free trial jobs depleted" in str(e):
-                    self.logger.error("Free trial jobs (100) depleted")
-                    raise PaymentRequiredError(
-                        "Free trial jobs (100) depleted. Please subscribe to continue.",
-                        details=e.details
-                    )
-                elif "Payment required" in str(e):
-                    self.logger.error("Payment required for subscription")
-                    raise PaymentRequiredError(
-                        "Payment required to activate subscription",
-                        details=e.details
-                    )
-                raise
-            except AuthorizationError as e:
-                if "Account is inactive" in str(e):
-                    self.logger.error("Account is inactive")
-                    raise InactiveAccountError(
-                        "Account is inactive. Please complete subscription setup or contact support.",
-                        details=e.details
-                    )
-                raise
-            except BadRequestError as e:
-                if "Missing required field" in str(e):
-                    self.logger.error("Missing required field: %s", str(e))
-                    raise MissingFieldError(str(e).split(": ")[1])
-                elif "Invalid field" in str(e):
-                    self.logger.error("Invalid field value: %s", str(e))
-                    field = str(e).split(": ")[1].split(" ")[0]
-                    raise InvalidFieldError(field, str(e))
-                raise
-            except Exception as e:
-                self.logger.error("Error creating job: %s", str(e))
-                raise
+            response = self._create_audio_job(data)
 
             job_id = response.get('job_id')
             presigned_url = response.get('presigned_url')
@@ -696,76 +1668,545 @@ class NoteManager:
                     "Invalid API response: missing presigned_url or job_id",
                     details={"response": response}
                 )
+        except Exception as e:
+            self.logger.error("Error in process_audio: %s", str(e))
+            clean_up()
+            raise
 
-            # Upload file using presigned URL
-            self.logger.info("Uploading file for job %s", job_id)
+        def upload(handle: Optional[UploadHandle] = None) -> Dict[str, Any]:
             try:
-                file_ext = os.path.splitext(file_path)[1].lower()
-                mime_type = VALID_AUDIO_FORMATS[file_ext]
-                
-                # Get file size for progress tracking
-                file_size = os.path.getsize(file_path)
-                uploaded = 0
-                
-                # Calculate optimal chunk size if not provided
-                if chunk_size is None:
-                    chunk_size = self._calculate_optimal_chunk_size(file_size)
-                    self.logger.debug(
-                        "Using adaptive chunk size of %d bytes for file size %d bytes",
-                        chunk_size, file_size
-                    )
-                
-                with open(file_path, 'rb') as f:
-                    # Stream upload in chunks with progress tracking
-                    while True:
-                        chunk = f.read(chunk_size)
-                        if not chunk:
-                            break
-                            
-                        uploaded += len(chunk)
-                        progress = (uploaded / file_size) * 100
-                        
-                        self.logger.debug(
-                            "Upload progress for job %s: %.1f%% (%d/%d bytes)",
-                            job_id, progress, uploaded, file_size
+                self.logger.info("Uploading file for job %s", job_id)
+                multipart = multipart_upload and MultipartUploader.is_multipart(response)
+                # A preprocessed copy is temporary, so its upload cannot be resumed
+                checkpoint = None if preprocessing else self._create_checkpoint(job_id, file_path, response, multipart)
+                self._upload_with_checkpoint(
+                    checkpoint, response, multipart, upload_path, job_id, chunk_size, max_upload_workers,
+                    handle.report if handle else on_progress,
+                    handle.control if handle else None,
+                    data
+                )
+                # The upload moves to a new job if its URL expired
+                uploaded_job_id = response['job_id']
+                if handle is not None:
+                    handle.job_id = uploaded_job_id
+                self.logger.info("Successfully uploaded file for job %s", uploaded_job_id)
+                if preprocessing:
+                    response['preprocessing'] = preprocessing.to_dict()
+                if hashing is not None:
+                    try:
+                        self._dedup_index().record(
+                            file_path, source_params, hashing.result(), uploaded_job_id, note_params, response
                         )
-                        
-                        # Upload chunk with retries
-                        retries = 0
-                        while True:
-                            try:
-                                upload_response = requests.put(
-                                    presigned_url,
-                                    data=chunk,
-                                    headers={'Content-Type': mime_type},
-                                    timeout=self._config['request_timeout']
-                                )
-                                upload_response.raise_for_status()
-                                break
-                            except Exception as e:
-                                retries += 1
-                                if retries >= self._config['max_retries']:
-                                    self._handle_upload_error(e, job_id)
-                                delay = min(
-                                    self._config['retry_delay'] * (2 ** (retries - 1)),
-                                    self._config['retry_max_delay']
-                                )
-                                self.logger.warning(
-                                    "Upload chunk failed for job %s, retrying in %d seconds (attempt %d/%d)",
-                                    job_id, delay, retries, self._config['max_retries']
-                                )
-                                time.sleep(delay)
-                
-                self.logger.info("Successfully uploaded file for job %s", job_id)
-                
+                    except Exception as e:
+                        # The upload succeeded; only later deduplication is lost
+                        self.logger.warning("Could not index upload of %s: %s", file_path, str(e))
+                    response['deduplicated'] = False
+
+                return response
+
             except Exception as e:
-                self._handle_upload_error(e, job_id)
+                self.logger.error("Error in process_audio: %s", str(e))
+                raise
+            finally:
+                clean_up()
+
+        if background:
+            return self._upload_in_background(
+                response, upload, os.path.getsize(upload_path), on_progress
+            )
+        return upload()
+
+    def _upload_in_background(
+        self,
+        response: Dict[str, Any],
+        upload: Callable[[UploadHandle], Dict[str, Any]],
+        total_bytes: Optional[int] = None,
+        on_progress: Optional[Callable[[UploadProgress], None]] = None
+    ) -> UploadHandle:
+        """Run an upload on the background executor and return its handle.
+
+        Args:
+            response: Job creation response
+            upload: Runs the upload, following the handle's pause and cancellation state
+            total_bytes: Size of the upload (optional)
+            on_progress: Function called with `UploadProgress` reports (optional)
+
+        Returns:
+            UploadHandle: Handle on the running upload
+        """
+        if self._background is None:
+            self._background = ThreadPoolExecutor(
+                max_workers=self._config['background_workers'],
+                thread_name_prefix="notedx-upload"
+            )
+        handle = UploadHandle(response['job_id'], response, total_bytes, on_progress)
+        self._uploads.add(handle)
+        future = self._background.submit(upload, handle)
+        handle.start(future)
+        future.add_done_callback(lambda _: self._uploads.discard(handle))
+        self.logger.debug("Upload for job %s started in the background", handle.job_id)
+        return handle
+
+    def close(self, wait: bool = True) -> None:
+        """Cancel unfinished background uploads and stop the manager's worker threads.
+
+        Cancelled uploads stop at their next chunk and keep their checkpoints, so
+        they can be continued later with `resume_upload()`. The manager stays
+        usable: worker threads are started again when needed.
+
+        Args:
+            wait: Wait for the worker threads to finish. Defaults to True.
+
+        Example:
+            ```python
+            >>> handle = note_manager.process_audio("visit.mp3", template="wfw", background=True)
+            >>> note_manager.close()
+            >>> handle.state
+            'cancelled'
+            ```
+        """
+        for handle in list(self._uploads):
+            self.logger.info("Cancelling background upload for job %s", handle.job_id)
+            handle.cancel()
+        executors = (self._background, self._hashing)
+        self._background = None
+        self._hashing = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=wait)
+
+    def resume_upload(
+        self,
+        job_id: str,
+        file_path: str,
+        chunk_size: Optional[int] = None,
+        max_upload_workers: int = 4,
+        on_progress: Optional[Callable[[UploadProgress], None]] = None
+    ) -> Dict[str, Any]:
+        """Continues an interrupted `process_audio()` upload without creating a new job.
+
+        When checkpoints are enabled (the `checkpoint_dir` config or the NOTEDX_CHECKPOINT_DIR
+        env var), every upload started by `process_audio()` is recorded in a small checkpoint
+        file keyed by job ID and file hash, and removed once storage confirms the upload.
+        When an upload fails partway, call this method with the same job ID and file:
+
+        * Multipart uploads only send the parts that storage has not confirmed yet
+        * Single-request uploads are sent again to the job's presigned URL
+
+        Args:
+            job_id: ID of the job whose upload failed
+            file_path: Path to the same audio file that was being uploaded
+            chunk_size: Fixed upload chunk size in bytes (optional). By default chunks adapt to measured throughput.
+            max_upload_workers: Maximum number of parts uploaded concurrently. Defaults to 4.
+            on_progress: Function called with `UploadProgress` reports (optional), see `process_audio()`.
+
+        Returns:
+            dict: The job creation response of the original `process_audio()` call.
+
+        Raises:
+            ValidationError: If the audio file is invalid
+            UploadError: If checkpoints are disabled, no checkpoint exists for this job and file,
+                or the upload fails
+            NetworkError: If connection issues occur
+
+        Example:
+            ```python
+            try:
+                response = note_manager.process_audio(file_path="visit.wav", template="wfw")
+            except (UploadError, NetworkError) as e:
+                response = note_manager.resume_upload(e.details["job_id"], "visit.wav")
+            ```
+
+        Note:
+            - Checkpoints hold the job's presigned upload URLs, which grant write access until they
+              expire. They are written with mode 0600 in a 0700 directory, and deleted once the
+              upload completes or its URLs expire or are rejected.
+            - Presigned URLs expire; for a job whose URLs have expired, `UploadUrlRejectedError`
+              is raised before anything is sent, and the recording must be resubmitted
+        """
+        self._validate_audio_file(file_path)
+        directory = self._checkpoint_dir()
+        if directory is None:
+            raise UploadError(
+                "Upload checkpoints are disabled; set the checkpoint_dir config or NOTEDX_CHECKPOINT_DIR",
+                job_id=job_id
+            )
+        checkpoint = UploadCheckpoint.load(directory, job_id, file_path)
+        if checkpoint is None:
+            raise UploadError(
+                f"No upload checkpoint found for job {job_id} and file {file_path}",
+                job_id=job_id
+            )
+
+        completed = checkpoint.completed_parts
+        self.logger.info(
+            "Resuming upload for job %s (%d parts already stored)", job_id, len(completed)
+        )
+        self._upload_with_checkpoint(
+            checkpoint,
+            checkpoint.response,
+            checkpoint.multipart,
+            file_path,
+            job_id,
+            chunk_size,
+            max_upload_workers,
+            on_progress
+        )
+        self.logger.info("Successfully uploaded file for job %s", job_id)
+        return checkpoint.response
+
+    def process_audio_stream(
+        self,
+        source: AudioSource,
+        format: str,
+        visit_type: Optional[Literal['initialEncounter', 'followUp']] = None,
+        recording_type: Optional[Literal['dictation', 'conversation']] = None,
+        patient_consent: Optional[bool] = None,
+        lang: Literal['en', 'fr'] = 'en',
+        output_language: Optional[Literal['en', 'fr']] = None,
+        template: Optional[Literal['primaryCare', 'er', 'psychiatry', 'surgicalSpecialties',
+                                 'medicalSpecialties', 'nursing', 'radiology', 'procedures',
+                                 'letter', 'pharmacy', 'social', 'wfw', 'smartInsert', 'interventionalRadiology']] = None,
+        documentation_style: Optional[Literal['soap', 'problemBased']] = None,
+        custom: Optional[Dict[str, Any]] = None,
+        custom_metadata: Optional[Dict[str, Any]] = None,
+        webhook_env: Optional[Literal['prod', 'dev']] = None,
+        size: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        on_progress: Optional[Callable[[UploadProgress], None]] = None
+    ) -> Dict[str, Any]:
+        """Converts audio held in memory or produced as a stream into a medical note.
+
+        ```bash
+        POST /process-audio
+        ```
+
+        Same as `process_audio()`, but the audio comes from `source` instead of a file
+        on disk, so recordings already in memory don't need a temporary file:
+
+        * `bytes`, `bytearray` and `memoryview` are uploaded as zero-copy slices
+        * Seekable binary file objects (e.g. `io.BytesIO`, open files) are streamed
+          from their current position
+        * Non-seekable file objects and iterators of bytes (e.g. a live dictation
+          feed) are streamed as they are produced
+
+        Parameters:
+            source: The audio to upload.
+            format: Audio format, as a file extension (`mp3`, `.wav`, ...).  
+                Supported formats: `.mp3`, `.mp4`, `.m4a`, `.aac`, `.wav`, `.flac`, `.pcm`, `.ogg`, `.opus`, `.webm`
+            size: Number of bytes in `source` (optional).  
+                Needed for iterators and non-seekable streams to send a Content-Length;
+                without it they are sent with chunked transfer encoding.
+            chunk_size: Fixed read block size in bytes (optional). By default chunks adapt
+                to measured throughput.
+            on_progress: Function called with `UploadProgress` reports (optional).  
+                `total_bytes` and `eta` are None for streams of unknown size.
+
+            All other parameters are the same as in `process_audio()`.
+
+        Returns:
+            dict: A dictionary containing:
+
+                * `job_id`: Unique identifier for tracking the job
+                * `presigned_url`: URL for uploading the audio file
+                * `status`: Initial job status
+
+        Raises:
+            ValidationError: If parameters are invalid, the format is unsupported or the audio is empty or too large
+            UploadError: If the upload fails
+            AuthenticationError: If API key is invalid
+            PaymentRequiredError: If payment is required
+            InactiveAccountError: If account is inactive or pending setup
+            NetworkError: If connection issues occur
+            BadRequestError: If API rejects the request
+            InternalServerError: If server error occurs
+
+        Examples:
+            ```python
+            # Audio already in memory
+            response = note_manager.process_audio_stream(
+                recorder.get_wav_bytes(),
+                format="wav",
+                template="wfw"
+            )
+
+            # Live dictation feed
+            response = note_manager.process_audio_stream(
+                microphone.iter_chunks(),
+                format="webm",
+                template="wfw"
+            )
+            ```
+
+        Note:
+            - Buffers and seekable files are retried on upload failure; iterators and
+              non-seekable streams can only be sent once
+            - Stream uploads are not checkpointed, see `resume_upload()` for file uploads
+        """
+        self.logger.info("Starting audio stream processing (format: %s)", format)
+        file_ext = self._validate_stream_format(format)
+        self._validate_input(
+            visit_type=visit_type,
+            recording_type=recording_type,
+            lang=lang,
+            template=template,
+            patient_consent=patient_consent,
+            output_language=output_language,
+            custom=custom
+        )
+
+        self._validate_stream_content(source, file_ext)
+        try:
+            body = open_upload_body(source, size)
+        except (TypeError, OSError) as e:
+            raise ValidationError(str(e), field="source")
+        self._validate_stream_size(body.total)
+
+        data = self._build_job_data(
+            lang=lang,
+            template=template,
+            visit_type=visit_type,
+            recording_type=recording_type,
+            patient_consent=patient_consent,
+            output_language=output_language,
+            custom=custom,
+            documentation_style=documentation_style,
+            custom_metadata=custom_metadata,
+            webhook_env=webhook_env,
+            file_extension=file_ext
+        )
+        self.logger.debug("Creating job with parameters: %s", data)
+        response = self._create_audio_job(data)
+
+        job_id = response.get('job_id')
+        presigned_url = response.get('presigned_url')
+        if not presigned_url or not job_id:
+            raise ValidationError(
+                "Invalid API response: missing presigned_url or job_id",
+                details={"response": response}
+            )
+
+        adaptive = chunk_size is None
+        if adaptive:
+            chunk_size = self._calculate_optimal_chunk_size(body.total or 0)
+        body.callback = self._progress_callback(job_id, chunk_size, on_progress)
+
+        self.logger.info("Uploading audio stream for job %s", job_id)
+        self._upload_body(
+            presigned_url, body, VALID_AUDIO_FORMATS[file_ext], job_id, chunk_size if adaptive else None
+        )
+        self.logger.info("Successfully uploaded audio stream for job %s", job_id)
+        return response
+
+    def process_batch(
+        self,
+        items: Iterable[Union[str, Dict[str, Any]]],
+        max_inflight: int = 16,
+        workers: Optional[Dict[str, int]] = None,
+        wait: bool = True,
+        fetch_note: bool = True,
+        poll_interval: float = 5.0,
+        wait_timeout: Optional[float] = None,
+        **job_params: Any
+    ) -> Iterator[BatchResult]:
+        """Processes many recordings as a pipeline, yielding each result as it completes.
+
+        Instead of running validation, job creation, upload, waiting and note
+        retrieval one file after another, each step is a stage with its own
+        worker threads, connected to the next by a bounded queue:
+
+        1. `validate`: checks the file and parameters, as `process_audio()` does
+        2. `create`: creates the job (`POST /process-audio`)
+        3. `upload`: streams the file to its presigned URL
+        4. `wait`: polls the job status every `poll_interval` seconds until it completes
+        5. `fetch`: retrieves the note
+
+        At most `max_inflight` recordings are in the pipeline at once, so a slow
+        stage (typically the upload) holds back the earlier ones instead of
+        creating jobs far ahead of it. Items are read lazily, and a failure only
+        affects its own item.
+
+        Args:
+            items: Paths, or dicts with a `file_path` and any of the job parameters
+                of `process_audio()` (`template`, `visit_type`, `lang`, ...),
+                which override `job_params`
+            max_inflight: Maximum number of recordings between admission and their result. Defaults to 16.
+            workers: Worker count per stage name, overriding the defaults
+                (`validate` 2, `create` 4, `upload` 4, `wait` max_inflight, `fetch` 4)
+            wait: Wait for each job to complete. Defaults to True.  
+                When False, results are yielded once the upload is done.
+            fetch_note: Retrieve the note of each completed job. Defaults to True.
+            poll_interval: Seconds between two status checks of a job. Defaults to 5.
+            wait_timeout: Maximum seconds to wait for a job to complete (optional)
+            **job_params: Job parameters shared by every item, e.g. `template="wfw"`
+
+        Yields:
+            BatchResult: One per item, in completion order, with the `job_id`, the job
+            creation `response`, the last `status`, the `note` and, for failed items,
+            the `error` and the `stage` that failed
+
+        Raises:
+            ValidationError: If a stage name or a shared parameter is unknown, or
+                `max_inflight` is not positive
+
+        Example:
+            ```python
+            >>> paths = glob.glob("recordings/*.mp3")
+            >>> for result in note_manager.process_batch(paths, max_inflight=32, template="wfw"):
+            ...     if result.ok:
+            ...         save(result.index, result.note["note"])
+            ...     else:
+            ...         print(f"{result.item} failed in {result.stage}: {result.error}")
+            ```
+
+        Note:
+            - Results are yielded in completion order; use `result.index` to match them with items
+            - Closing the iterator early stops admitting recordings; jobs already created are not cancelled
+        """
+        unknown = set(job_params) - set(BATCH_JOB_PARAMS)
+        if unknown:
+            raise ValidationError(
+                f"Unsupported batch parameters: {', '.join(sorted(unknown))}",
+                details={"supported": list(BATCH_JOB_PARAMS)}
+            )
+        counts = {**DEFAULT_BATCH_WORKERS, **(workers or {})}
+        if set(counts) != set(DEFAULT_BATCH_WORKERS):
+            raise ValidationError(
+                f"Unknown batch stages: {', '.join(sorted(set(counts) - set(DEFAULT_BATCH_WORKERS)))}",
+                details={"stages": list(DEFAULT_BATCH_WORKERS)}
+            )
+        if max_inflight < 1:
+            raise ValidationError("max_inflight must be at least 1", field="max_inflight")
+
+        def validate(result: BatchResult, stop: threading.Event) -> None:
+            item = result.item
+            params = {'lang': 'en', **job_params, **({'file_path': item} if isinstance(item, (str, os.PathLike)) else item)}
+            file_path = os.fspath(params.pop('file_path', None) or "")
+            extra = set(params) - set(BATCH_JOB_PARAMS)
+            if extra:
+                raise ValidationError(
+                    f"Unsupported batch item parameters: {', '.join(sorted(extra))}",
+                    details={"supported": list(BATCH_JOB_PARAMS)}
+                )
+            self._validate_audio_file(file_path)
+            self._validate_input(**params)
+            result.context['file_path'] = file_path
+            result.context['data'] = self._build_job_data(
+                file_extension=os.path.splitext(file_path)[1].lower(), **params
+            )
+
+        def create(result: BatchResult, stop: threading.Event) -> None:
+            response = self._create_audio_job(result.context['data'])
+            if not response.get('presigned_url') or not response.get('job_id'):
+                raise ValidationError(
+                    "Invalid API response: missing presigned_url or job_id",
+                    details={"response": response}
+                )
+            result.response = response
+            result.job_id = response['job_id']
+
+        def upload(result: BatchResult, stop: threading.Event) -> None:
+            file_path = result.context['file_path']
+            checkpoint = self._create_checkpoint(result.job_id, file_path, result.response, False)
+            try:
+                self._upload_with_checkpoint(
+                    checkpoint, result.response, False, file_path, result.job_id, None, 1,
+                    data=result.context['data']
+                )
+            finally:
+                result.job_id = result.response['job_id']
+
+        def wait_for_job(result: BatchResult, stop: threading.Event) -> None:
+            deadline = None if wait_timeout is None else time.monotonic() + wait_timeout
+            while True:
+                result.status = self.fetch_status(result.job_id)
+                state = result.status['status']
+                if state == 'completed':
+                    return
+                if state == 'error':
+                    raise JobError(
+                        result.status.get('message') or "Job failed",
+                        job_id=result.job_id,
+                        status=state,
+                        details=dict(result.status)
+                    )
+                if deadline is not None and time.monotonic() + poll_interval > deadline:
+                    raise JobError(
+                        f"Job did not complete within {wait_timeout} seconds",
+                        job_id=result.job_id,
+                        status=state
+                    )
+                if stop.wait(poll_interval):
+                    return
+
+        def fetch(result: BatchResult, stop: threading.Event) -> None:
+            result.note = self.fetch_note(result.job_id)
+
+        stages = [
+            Stage('validate', validate, counts['validate']),
+            Stage('create', create, counts['create']),
+            Stage('upload', upload, counts['upload'])
+        ]
+        if wait:
+            stages.append(Stage('wait', wait_for_job, counts['wait'] or max_inflight))
+            if fetch_note:
+                stages.append(Stage('fetch', fetch, counts['fetch']))
+
+        self.logger.info("Starting batch with %d recordings in flight", max_inflight)
+        return BatchPipeline(stages, max_inflight).run(items)
+
+    def probe_audio(self, file_path: str) -> Dict[str, Any]:
+        """Reads the duration, sample rate and channel count of an audio file from its headers.
+
+        No request is made and nothing is decoded: only the container headers are
+        read (WAV `fmt `/`data` chunks, MP3 Xing/VBRI frames, FLAC STREAMINFO, Ogg
+        granule positions, MP4 `mvhd`), so probing takes milliseconds whatever the
+        file size. Useful to order work or pick polling intervals before calling
+        `process_audio()`.
+
+        Args:
+            file_path: Path to the audio file
 
-            return response
+        Returns:
+            dict: A dictionary containing:
 
-        except Exception as e:
-            self.logger.error("Error in process_audio: %s", str(e))
-            raise
+                - container (str): Detected container (`wav`, `mpeg`, `id3`, `flac`,
+                  `ogg`, `mp4`, `aac`, `webm`, `pcm`), or None
+                - size (int): File size in bytes
+                - duration (float): Duration in seconds, or None if the headers do not give it
+                - sample_rate (int): Sample rate in Hz, or None
+                - channels (int): Number of channels, or None
+
+        Raises:
+            MissingFieldError: If file_path is empty
+            ValidationError: If the file does not exist or cannot be read
+
+        Example:
+            ```python
+            >>> info = note_manager.probe_audio("visit.mp3")
+            >>> info["duration"], info["sample_rate"], info["channels"]
+            (1834.2, 44100, 2)
+            ```
+        """
+        if not file_path:
+            self.logger.error("Missing file_path parameter")
+            raise MissingFieldError("file_path")
+        try:
+            probe = probe_audio(file_path)
+        except FileNotFoundError:
+            raise ValidationError(
+                f"Audio file not found: {file_path}",
+                field="file_path",
+                details={"path": file_path}
+            )
+        except OSError as e:
+            raise ValidationError(
+                f"Cannot read audio file: {str(e)}",
+                field="file_path",
+                details={"path": file_path, "error": str(e)}
+            )
+        self.logger.debug("Probed %s: %r", file_path, probe)
+        return probe._asdict()
 
     def process_text(
         self,
@@ -959,29 +2400,19 @@ class NoteManager:
 
         try:
             # Prepare request data
-            data = {
-                'text': text,
-                'lang': lang,
-                'template': template
-            }
-
-            # Add optional fields if provided
-            if visit_type:
-                data['visit_type'] = visit_type
-            if recording_type:
-                data['recording_type'] = recording_type
-            if patient_consent is not None:
-                data['patient_consent'] = patient_consent
-            if output_language:
-                data['output_language'] = output_language
-            if custom:
-                data['custom'] = custom
-            if documentation_style:
-                data['documentation_style'] = documentation_style
-            if custom_metadata:
-                data['custom_metadata'] = custom_metadata
-            if webhook_env:
-                data['webhook_env'] = webhook_env
+            data = self._build_job_data(
+                lang=lang,
+                template=template,
+                visit_type=visit_type,
+                recording_type=recording_type,
+                patient_consent=patient_consent,
+                output_language=output_language,
+                custom=custom,
+                documentation_style=documentation_style,
+                custom_metadata=custom_metadata,
+                webhook_env=webhook_env,
+                text=text
+            )
 
             # Make request to process-text endpoint
             self.logger.debug("Creating text processing job with parameters: %s", {
@@ -989,38 +2420,7 @@ class NoteManager:
                 'text': f"{text[:100]}..." if len(text) > 100 else text  # Truncate text in logs
             })
             
-            try:
-                response = self._request("POST", "process-text", data=data)
-            except AuthenticationError as e:
-                if "Invalid API key" in str(e):
-                    self.logger.error("Invalid API key provided")
-                    raise AuthenticationError("Invalid API key provided")
-                elif "Missing user ID" in str(e):
-                    self.logger.error("API key has no associated user")
-                    raise AuthenticationError("API key has no associated user")
-                raise
-            except PaymentRequiredError as e:
-                if "Free trial jobs depleted" in str(e):
-                    self.logger.error("Free trial jobs (100) depleted")
-                    raise PaymentRequiredError(
-                        "Free trial jobs (100) depleted. Please subscribe to continue.",
-                        details=e.details
-                    )
-                elif "Payment required" in str(e):
-                    self.logger.error("Payment required for subscription")
-                    raise PaymentRequiredError(
-                        "Payment required to activate subscription",
-                        details=e.details
-                    )
-                raise
-            except AuthorizationError as e:
-                if "Account is inactive" in str(e):
-                    self.logger.error("Account is inactive")
-                    raise InactiveAccountError(
-                        "Account is inactive. Please complete subscription setup or contact support.",
-                        details=e.details
-                    )
-                raise
+            response = self._create_job("process-text", data, map_field_errors=False)
 
             job_id = response.get("job_id")
             if not job_id:
@@ -1114,73 +2514,14 @@ class NoteManager:
             - **IMPORTANT**: If both a custom template and documentation_style are provided, the documentation_style will override the custom template structure
         """
         # Validate all inputs first
-        if not job_id:
-            self.logger.error("Missing required field: job_id")
-            raise MissingFieldError("job_id")
-
-        if template and template not in VALID_TEMPLATES:
-            self.logger.error(
-                "Invalid template value: %s. Valid values: %s",
-                template, ', '.join(VALID_TEMPLATES)
-            )
-            raise InvalidFieldError(
-                'template',
-                f"Invalid value for template. Must be one of: {', '.join(VALID_TEMPLATES)}"
-            )
-
-        if output_language and output_language not in VALID_LANGUAGES:
-            self.logger.error(
-                "Invalid output_language: %s. Valid values: %s",
-                output_language, ', '.join(VALID_LANGUAGES)
-            )
-            raise InvalidFieldError(
-                'output_language',
-                f"Invalid value for output_language. Must be one of: {', '.join(VALID_LANGUAGES)}"
-            )
-
-        # Validate documentation_style
-        if documentation_style:
-            valid_styles = ['soap', 'problemBased']
-            if documentation_style not in valid_styles:
-                self.logger.error(
-                    "Invalid documentation_style: %s. Valid values: %s",
-                    documentation_style, ', '.join(valid_styles)
-                )
-                raise InvalidFieldError(
-                    'documentation_style',
-                    f"Invalid value for documentation_style. Must be one of: {', '.join(valid_styles)}"
-                )
+        self._validate_regenerate_input(job_id, template, output_language, documentation_style)
 
         # Check original job status first
         try:
             self.logger.debug("Checking status of original job %s", job_id)
             status = self.fetch_status(job_id)
             
-            # Check if the original job had errors
-            if status['status'] == 'error':
-                error_msg = status.get('message', 'Unknown error occurred')
-                self.logger.error(
-                    "Cannot regenerate note from job %s - original job had errors: %s",
-                    job_id, error_msg
-                )
-                raise JobError(
-                    f"Cannot regenerate note from a failed job. Original error: {error_msg}",
-                    job_id=job_id,
-                    status='error',
-                    details={'original_error': error_msg}
-                )
-            
-            # Check if the job was completed
-            if status['status'] != 'completed':
-                self.logger.error(
-                    "Cannot regenerate note from job %s - job status is %s",
-                    job_id, status['status']
-                )
-                raise JobError(
-                    f"Cannot regenerate note - job is in {status['status']} state",
-                    job_id=job_id,
-                    status=status['status']
-                )
+            self._ensure_job_completed(job_id, status)
 
         except JobNotFoundError:
             self.logger.error("Original job not found: %s", job_id)
@@ -1240,6 +2581,98 @@ class NoteManager:
             )
             raise
 
+    def _validate_regenerate_input(
+        self,
+        job_id: str,
+        template: Optional[str] = None,
+        output_language: Optional[str] = None,
+        documentation_style: Optional[str] = None
+    ) -> None:
+        """Validate the parameters of a note regeneration request.
+
+        Args:
+            job_id: ID of the original job
+            template: New template (optional)
+            output_language: New output language (optional)
+            documentation_style: New documentation style (optional)
+
+        Raises:
+            MissingFieldError: If job_id is missing
+            InvalidFieldError: If a field value is invalid
+        """
+        if not job_id:
+            self.logger.error("Missing required field: job_id")
+            raise MissingFieldError("job_id")
+
+        if template and template not in VALID_TEMPLATES:
+            self.logger.error(
+                "Invalid template value: %s. Valid values: %s",
+                template, ', '.join(VALID_TEMPLATES)
+            )
+            raise InvalidFieldError(
+                'template',
+                f"Invalid value for template. Must be one of: {', '.join(VALID_TEMPLATES)}"
+            )
+
+        if output_language and output_language not in VALID_LANGUAGES:
+            self.logger.error(
+                "Invalid output_language: %s. Valid values: %s",
+                output_language, ', '.join(VALID_LANGUAGES)
+            )
+            raise InvalidFieldError(
+                'output_language',
+                f"Invalid value for output_language. Must be one of: {', '.join(VALID_LANGUAGES)}"
+            )
+
+        # Validate documentation_style
+        if documentation_style:
+            valid_styles = ['soap', 'problemBased']
+            if documentation_style not in valid_styles:
+                self.logger.error(
+                    "Invalid documentation_style: %s. Valid values: %s",
+                    documentation_style, ', '.join(valid_styles)
+                )
+                raise InvalidFieldError(
+                    'documentation_style',
+                    f"Invalid value for documentation_style. Must be one of: {', '.join(valid_styles)}"
+                )
+
+    def _ensure_job_completed(self, job_id: str, status: Dict[str, Any]) -> None:
+        """Check that a job can be used as the source of a regenerated note.
+
+        Args:
+            job_id: ID of the original job
+            status: Status response from fetch_status()
+
+        Raises:
+            JobError: If the job had errors or is not completed
+        """
+        # Check if the original job had errors
+        if status['status'] == 'error':
+            error_msg = status.get('message', 'Unknown error occurred')
+            self.logger.error(
+                "Cannot regenerate note from job %s - original job had errors: %s",
+                job_id, error_msg
+            )
+            raise JobError(
+                f"Cannot regenerate note from a failed job. Original error: {error_msg}",
+                job_id=job_id,
+                status='error',
+                details={'original_error': error_msg}
+            )
+
+        # Check if the job was completed
+        if status['status'] != 'completed':
+            self.logger.error(
+                "Cannot regenerate note from job %s - job status is %s",
+                job_id, status['status']
+            )
+            raise JobError(
+                f"Cannot regenerate note - job is in {status['status']} state",
+                job_id=job_id,
+                status=status['status']
+            )
+
     def fetch_status(self, job_id: str) -> Dict[str, Any]:
         """Gets the current status and progress of a note generation job.
 
@@ -1520,6 +2953,78 @@ class NoteManager:
             )
             raise
 
+    def fetch_merged_transcript(self, job_ids: List[str]) -> Dict[str, Any]:
+        """Retrieves the transcripts of the segments of a split recording, joined in order.
+
+        Fetches each segment's transcript with `fetch_transcript()`, concurrently.
+
+        Args:
+            job_ids: Jobs of the segments, in recording order (the `job_ids` returned
+                by `process_audio()` for a split recording)
+
+        Returns:
+            dict: A dictionary containing:
+
+                - transcript (str): The segment transcripts separated by blank lines
+                - job_ids (list): The job IDs, in order
+                - segments (list): Each segment's `fetch_transcript()` response
+
+        Raises:
+            MissingFieldError: If job_ids is empty
+            JobNotFoundError: If a job is not found
+            JobError: If a segment is not transcribed yet
+
+        Example:
+            ```python
+            >>> response = note_manager.process_audio("procedure.wav", template="wfw")
+            >>> merged = note_manager.fetch_merged_transcript(response.get("job_ids", [response["job_id"]]))
+            >>> print(merged["transcript"])
+            ```
+        """
+        return self._merge_segments(job_ids, self._fetch_segments(self.fetch_transcript, job_ids), 'transcript')
+
+    def fetch_merged_note(self, job_ids: List[str]) -> Dict[str, Any]:
+        """Retrieves the notes of the segments of a split recording, joined in order.
+
+        Fetches each segment's note with `fetch_note()`, concurrently.
+
+        Args:
+            job_ids: Jobs of the segments, in recording order
+
+        Returns:
+            dict: A dictionary containing:
+
+                - note (str): The segment notes separated by blank lines
+                - note_title (str, optional): Title of the first segment's note
+                - job_ids (list): The job IDs, in order
+                - segments (list): Each segment's `fetch_note()` response
+
+        Raises:
+            MissingFieldError: If job_ids is empty
+            JobNotFoundError: If a job is not found
+            JobError: If a segment's note is not completed yet
+        """
+        return self._merge_segments(job_ids, self._fetch_segments(self.fetch_note, job_ids), 'note')
+
+    def _fetch_segments(self, fetch: Callable[[str], Dict[str, Any]], job_ids: List[str]) -> List[Dict[str, Any]]:
+        if not job_ids:
+            self.logger.error("Missing required field: job_ids")
+            raise MissingFieldError("job_ids")
+        with ThreadPoolExecutor(max_workers=min(self._config['split_workers'], len(job_ids))) as executor:
+            return list(executor.map(fetch, job_ids))
+
+    @staticmethod
+    def _merge_segments(job_ids: List[str], responses: List[Dict[str, Any]], field: str) -> Dict[str, Any]:
+        """Join the `field` text of segment responses in recording order."""
+        merged = {
+            field: "\n\n".join(response[field].strip() for response in responses),
+            'job_ids': list(job_ids),
+            'segments': responses
+        }
+        if field == 'note' and responses[0].get('note_title'):
+            merged['note_title'] = responses[0]['note_title']
+        return merged
+
     def get_system_status(self) -> Dict[str, Any]:
         """Retrieves system status and health information.
 
@@ -1606,18 +3111,24 @@ class NoteManager:
                 details={"error": str(e)}
             )
 
-    def _validate_audio_file(self, file_path: str) -> None:
+    def _validate_audio_file(self, file_path: str, allow_split: bool = False) -> AudioFileInfo:
         """Validate audio file existence, readability, and format.
         
-        Performs thorough validation of the audio file:
+        Performs thorough validation of the audio file with a single `os.stat()`
+        and a read of its first bytes:
 
         - Checks file existence
-        - Verifies file is readable
         - Validates file format
         - Checks file size limits
+        - Verifies the file is readable and its content matches its extension
+          (RIFF/WAVE, ID3/MPEG frames, ADTS, fLaC, OggS, EBML, MP4 `ftyp`)
         
         Args:
             file_path: Path to the audio file
+            allow_split: Accept WAV/PCM files over the size limit, to be split (needs numpy)
+
+        Returns:
+            AudioFileInfo with the file size and detected container
 
         Raises:
             MissingFieldError: If file_path is empty
@@ -1627,12 +3138,24 @@ class NoteManager:
                 - File isn't readable
                 - File format is not supported
                 - File size exceeds limits
+                - File content is not audio of its extension's format
         """
         if not file_path:
             self.logger.error("Missing file_path parameter")
             raise MissingFieldError("file_path")
-            
-        if not os.path.isfile(file_path):
+
+        try:
+            st = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
+            st = None
+        except OSError as e:
+            self.logger.error("Cannot access file: %s", str(e))
+            raise ValidationError(
+                f"Cannot read audio file: {str(e)}",
+                field="file_path",
+                details={"path": file_path, "error": str(e)}
+            )
+        if st is None or not stat.S_ISREG(st.st_mode):
             self.logger.error("Audio file not found: %s", file_path)
             raise ValidationError(
                 f"Audio file not found: {file_path}",
@@ -1658,55 +3181,143 @@ class NoteManager:
             )
 
         # Check file size (500MB limit)
-        try:
-            file_size = os.path.getsize(file_path)
-            if file_size == 0:
-                self.logger.error("Audio file is empty: %s", file_path)
-                raise ValidationError(
-                    "Cannot read audio file: file is empty",
-                    field="file_path",
-                    details={"path": file_path}
-                )
-            if file_size > 500 * 1024 * 1024:  # 500MB
-                self.logger.error(
-                    "File size exceeds 500MB limit: %s (%d bytes)",
-                    file_path, file_size
-                )
-                raise ValidationError(
-                    "File size exceeds 500MB limit",
-                    field="file_path",
-                    details={
-                        "path": file_path,
-                        "size": file_size,
-                        "max_size": 500 * 1024 * 1024
-                    }
-                )
-        except OSError as e:
-            self.logger.error("Cannot access file: %s", str(e))
+        if st.st_size == 0:
+            self.logger.error("Audio file is empty: %s", file_path)
             raise ValidationError(
-                f"Cannot read audio file: {str(e)}",
+                "Cannot read audio file: file is empty",
                 field="file_path",
-                details={"path": file_path, "error": str(e)}
+                details={"path": file_path}
+            )
+        if st.st_size > MAX_AUDIO_SIZE and not (
+            allow_split and file_ext in PREPROCESS_EXTENSIONS and numpy_available()
+        ):
+            self.logger.error(
+                "File size exceeds 500MB limit: %s (%d bytes)",
+                file_path, st.st_size
+            )
+            if allow_split and file_ext in PREPROCESS_EXTENSIONS:
+                self.logger.error("Splitting oversized recordings requires `pip install notedx-sdk[audio]`")
+            raise ValidationError(
+                "File size exceeds 500MB limit",
+                field="file_path",
+                details={
+                    "path": file_path,
+                    "size": st.st_size,
+                    "max_size": MAX_AUDIO_SIZE
+                }
             )
 
-        # Check if file is readable
+        # Check the file is readable and holds what its extension says
         try:
             with open(file_path, 'rb') as f:
-                data = f.read(1)
-                if not data:
-                    self.logger.error("Audio file is empty: %s", file_path)
-                    raise ValidationError(
-                        "Cannot read audio file: file is empty",
-                        field="file_path",
-                        details={"path": file_path}
-                    )
-        except Exception as e:
+                header = f.read(HEADER_SIZE)
+        except OSError as e:
             self.logger.error("Cannot read audio file: %s", str(e))
             raise ValidationError(
                 f"Cannot read audio file: {str(e)}",
                 field="file_path",
                 details={"path": file_path, "error": str(e)}
             )
+        info = AudioFileInfo(st.st_size, header, detect_container(header))
+        self._validate_container(file_ext, info.container, "file_path", {"path": file_path})
+        return info
+
+    def _validate_container(
+        self,
+        file_ext: str,
+        container: Optional[str],
+        field: str,
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Reject audio whose content does not match its declared format.
+
+        Raises:
+            ValidationError: If the detected container does not fit `file_ext`
+        """
+        mismatch = container_mismatch(file_ext, container)
+        if mismatch is None:
+            return
+        self.logger.error("Mislabelled audio: %s", mismatch)
+        raise ValidationError(
+            mismatch,
+            field=field,
+            details={**(details or {}), "extension": file_ext, "detected_format": container}
+        )
+
+    def _validate_stream_format(self, format: str) -> str:
+        """Validate the format of a stream source.
+
+        Args:
+            format: File extension of the audio, with or without the leading dot
+
+        Returns:
+            The normalized extension, e.g. `.mp3`
+
+        Raises:
+            MissingFieldError: If format is empty
+            ValidationError: If the format is not supported
+        """
+        if not format:
+            self.logger.error("Missing format parameter")
+            raise MissingFieldError("format")
+
+        file_ext = format.lower() if format.startswith('.') else f".{format.lower()}"
+        if file_ext not in VALID_AUDIO_FORMATS:
+            self.logger.error(
+                "Unsupported audio format: %s. Supported formats: %s",
+                file_ext, ', '.join(VALID_AUDIO_FORMATS.keys())
+            )
+            raise ValidationError(
+                f"Unsupported audio format: {file_ext}. Supported formats: {', '.join(VALID_AUDIO_FORMATS.keys())}",
+                field="format",
+                details={
+                    "extension": file_ext,
+                    "supported_formats": list(VALID_AUDIO_FORMATS.keys())
+                }
+            )
+        return file_ext
+
+    def _validate_stream_content(self, source: Any, file_ext: str) -> None:
+        """Check that in-memory audio or a seekable file holds audio of the declared format.
+
+        Iterators and non-seekable streams cannot be peeked at without consuming
+        them, so they are not checked.
+
+        Raises:
+            ValidationError: If the content does not match `file_ext`
+        """
+        seekable = getattr(source, "seekable", None)
+        if not isinstance(source, (bytes, bytearray, memoryview)) and not (seekable and seekable()):
+            return
+        try:
+            info = inspect_audio(source)
+        except (OSError, ValueError) as e:
+            self.logger.debug("Cannot inspect audio stream: %s", str(e))
+            return
+        if info.size:
+            self._validate_container(file_ext, info.container, "source")
+
+    def _validate_stream_size(self, size: Optional[int]) -> None:
+        """Validate the size of a stream source, when it is known.
+
+        Args:
+            size: Number of bytes to upload, or None if unknown
+
+        Raises:
+            ValidationError: If the audio is empty or exceeds the 500MB limit
+        """
+        if size is None:
+            return
+        if size == 0:
+            self.logger.error("Audio stream is empty")
+            raise ValidationError("Cannot read audio: source is empty", field="source")
+        if size > MAX_AUDIO_SIZE:
+            self.logger.error("Audio stream exceeds 500MB limit (%d bytes)", size)
+            raise ValidationError(
+                "File size exceeds 500MB limit",
+                field="source",
+                details={"size": size, "max_size": MAX_AUDIO_SIZE}
+            )
 
     def _handle_upload_error(self, e: Exception, job_id: str) -> None:
         """Handle file upload errors with appropriate exception types.
@@ -1719,6 +3330,15 @@ class NoteManager:
             NetworkError: For connection issues
             UploadError: For upload failures
         """
+        if isinstance(e, UploadCancelledError):
+            self.logger.info("Upload cancelled for job %s", job_id)
+            raise e
+        if isinstance(e, RetryBudgetExhaustedError):
+            self.logger.error("Upload failed for job %s and was not retried: %s", job_id, str(e))
+            raise e
+        if isinstance(e, UploadError):
+            self.logger.error("Upload failed for job %s: %s", job_id, str(e))
+            raise e
         error_msg = str(e)
         if isinstance(e, requests.RequestException):
             if isinstance(e, requests.ConnectionError):
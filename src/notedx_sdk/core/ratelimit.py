@@ -0,0 +1,237 @@
+from typing import Callable, Dict, NamedTuple, Optional
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger("notedx_sdk")
+
+# Endpoint classes limits are configured for
+JOB_CREATION = "job_creation"
+STATUS = "status"
+FETCH = "fetch"
+OTHER = "other"
+ENDPOINT_CLASSES = (JOB_CREATION, STATUS, FETCH, OTHER)
+
+_CLASS_BY_FAMILY = {
+    "process-audio": JOB_CREATION,
+    "process-text": JOB_CREATION,
+    "regenerate-note": JOB_CREATION,
+    "status": STATUS,
+    "fetch-note": FETCH,
+    "fetch-transcript": FETCH,
+}
+
+# Seconds after which an idle bucket is dropped from a shared state file
+_STALE_AFTER = 3600
+
+
+def endpoint_class(endpoint: str) -> str:
+    """Class of an endpoint for rate limiting: `job_creation`, `status`, `fetch` or `other`."""
+    return _CLASS_BY_FAMILY.get(endpoint.strip('/').split('/')[0], OTHER)
+
+
+class RateLimit(NamedTuple):
+    """`requests` per `per` seconds, with up to `burst` sent at once after an idle period.
+
+    Example:
+        ```python
+        >>> RateLimit(60, per=60)  # one a second on average
+        >>> RateLimit(10, burst=5)  # 10 a second, 5 at once
+        ```
+    """
+
+    requests: float
+    per: float = 1.0
+    burst: int = 1
+
+    @property
+    def interval(self) -> float:
+        """Seconds between two requests at the sustained rate."""
+        return self.per / self.requests
+
+
+class MemoryRateLimitBackend:
+    """Buckets shared by the threads of one process.
+
+    Each bucket is a theoretical arrival time (GCRA): the moment by which every
+    request granted so far is paid for at the sustained rate.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, float] = {}
+
+    def reserve(self, key: str, interval: float, burst: int) -> float:
+        """Grant one request of bucket `key` and return the seconds to wait before sending it."""
+        with self._lock:
+            now = time.time()
+            tat = max(self._buckets.get(key, now), now) + interval
+            self._buckets[key] = tat
+        return max(0.0, tat - now - burst * interval)
+
+    def defer(self, key: str, until: float, interval: float, burst: int) -> None:
+        """Grant nothing from bucket `key` before the epoch time `until`."""
+        # The burst allowance is spent too, so the first request waits until `until`
+        with self._lock:
+            self._buckets[key] = max(self._buckets.get(key, 0.0), until + (burst - 1) * interval)
+
+
+class FileRateLimitBackend:
+    """Buckets shared by every process of the host through a locked state file.
+
+    The state is a small JSON document updated under an exclusive `flock`, so
+    workers in separate processes (or containers sharing a volume) draw from the
+    same buckets and stay under the server quota together. Buckets idle for an
+    hour are dropped. Requires a POSIX system.
+
+    Args:
+        path: State file, created if missing
+
+    Raises:
+        RuntimeError: If file locking is not available on this platform
+    """
+
+    def __init__(self, path: str) -> None:
+        if fcntl is None:
+            raise RuntimeError("FileRateLimitBackend requires fcntl (POSIX)")
+        self.path = os.path.abspath(os.path.expanduser(path))
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Serializes the threads of this process; flock does the same across processes
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, interval: float, burst: int) -> float:
+        """Grant one request of bucket `key` and return the seconds to wait before sending it."""
+        result = {}
+
+        def update(buckets: Dict[str, float], now: float) -> None:
+            tat = max(buckets.get(key, now), now) + interval
+            buckets[key] = tat
+            result['wait'] = max(0.0, tat - now - burst * interval)
+
+        self._update(update)
+        return result['wait']
+
+    def defer(self, key: str, until: float, interval: float, burst: int) -> None:
+        """Grant nothing from bucket `key` before the epoch time `until`."""
+        def update(buckets: Dict[str, float], now: float) -> None:
+            buckets[key] = max(buckets.get(key, 0.0), until + (burst - 1) * interval)
+
+        self._update(update)
+
+    def _update(self, update: Callable[[Dict[str, float], float], None]) -> None:
+        with self._lock, open(self.path, 'a+') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    buckets = {key: float(tat) for key, tat in json.loads(f.read() or '{}').items()}
+                except (ValueError, AttributeError, TypeError):
+                    logger.warning("Ignoring unreadable rate limit state in %s", self.path)
+                    buckets = {}
+                now = time.time()
+                buckets = {key: tat for key, tat in buckets.items() if tat > now - _STALE_AFTER}
+                update(buckets, now)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(buckets))
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """Client-side token buckets that keep requests under the API quota.
+
+    Requests are paced per API key and per endpoint class: `job_creation`
+    (`process-audio`, `process-text`, `regenerate-note`), `status` polls,
+    `fetch` (`fetch-note`, `fetch-transcript`) and `other`. Classes without a
+    limit are not paced. A request over its limit waits for its turn instead of
+    getting a 429, and concurrent workers are served in order.
+
+    Buckets are named after a hash of the API key, so clients using the same key,
+    in any thread (or any process, with `FileRateLimitBackend`), share them. When
+    the API still answers 429 with a reset time, the whole bucket waits for it.
+
+    Args:
+        limits: `RateLimit` by endpoint class
+        backend: Where buckets are kept (optional). Defaults to this process's memory;
+            pass a `FileRateLimitBackend` to share them with other processes.
+
+    Raises:
+        ValueError: If a limit is given for an unknown endpoint class
+
+    Example:
+        ```python
+        >>> limiter = RateLimiter(
+        ...     {"job_creation": RateLimit(30, per=60), "status": RateLimit(5, burst=5)},
+        ...     backend=FileRateLimitBackend("/tmp/notedx-rate-limits.json")
+        ... )
+        >>> client = NoteDxClient(api_key="...", rate_limiter=limiter)
+        ```
+    """
+
+    def __init__(self, limits: Dict[str, RateLimit], backend: Optional[object] = None) -> None:
+        unknown = set(limits) - set(ENDPOINT_CLASSES)
+        if unknown:
+            raise ValueError(
+                f"Unknown endpoint classes: {', '.join(sorted(unknown))}. "
+                f"Use {', '.join(ENDPOINT_CLASSES)}"
+            )
+        for limit in limits.values():
+            if limit.requests <= 0 or limit.per <= 0 or limit.burst < 1:
+                raise ValueError(f"Invalid rate limit {limit!r}")
+        self.limits = dict(limits)
+        self.backend = backend or MemoryRateLimitBackend()
+
+    def reserve(self, endpoint: str, identity: Optional[str]) -> float:
+        """Take a turn for a request and return the seconds to wait before sending it.
+
+        Args:
+            endpoint: API endpoint path
+            identity: API key (or account) the request is made with
+        """
+        endpoint_cls = endpoint_class(endpoint)
+        limit = self.limits.get(endpoint_cls)
+        if limit is None:
+            return 0.0
+        return self.backend.reserve(self._key(identity, endpoint_cls), limit.interval, limit.burst)
+
+    def acquire(self, endpoint: str, identity: Optional[str]) -> None:
+        """Block until a request to `endpoint` may be sent."""
+        wait = self.reserve(endpoint, identity)
+        if wait > 0:
+            logger.debug("Rate limiting %s: waiting %.2f seconds", endpoint, wait)
+            time.sleep(wait)
+
+    async def acquire_async(self, endpoint: str, identity: Optional[str]) -> None:
+        """Awaitable version of `acquire()`."""
+        wait = self.reserve(endpoint, identity)
+        if wait > 0:
+            logger.debug("Rate limiting %s: waiting %.2f seconds", endpoint, wait)
+            await asyncio.sleep(wait)
+
+    def defer(self, endpoint: str, identity: Optional[str], seconds: float) -> None:
+        """Hold every request of the endpoint's class for `seconds`, after the API answered 429."""
+        endpoint_cls = endpoint_class(endpoint)
+        limit = self.limits.get(endpoint_cls)
+        if limit is not None:
+            self.backend.defer(
+                self._key(identity, endpoint_cls), time.time() + seconds, limit.interval, limit.burst
+            )
+
+    @staticmethod
+    def _key(identity: Optional[str], endpoint_cls: str) -> str:
+        # The key itself never ends up in a shared state file
+        digest = hashlib.sha256((identity or "").encode()).hexdigest()[:16]
+        return f"{digest}:{endpoint_cls}"
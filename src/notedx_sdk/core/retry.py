@@ -0,0 +1,401 @@
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+import logging
+import random
+import threading
+import time
+
+import requests
+
+from ..exceptions import RetryBudgetExhaustedError
+
+logger = logging.getLogger("notedx_sdk")
+
+# Methods that can be resent without risking a duplicate side effect
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses by which the server says it did not process the request, so even a
+# non-idempotent request can be resent
+UNPROCESSED_STATUSES = frozenset({408, 425, 429, 503})
+
+DEFAULT_RETRY_STATUSES = (408, 429, 502, 503, 504)
+
+# Object storage documents its 500s as transient
+STORAGE_RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+
+
+def retry_after(headers: Optional[Mapping[str, Any]], now: Optional[float] = None) -> Optional[float]:
+    """Seconds the server asks to wait before the next request.
+
+    Reads `Retry-After` (seconds or an HTTP date) and falls back to
+    `X-RateLimit-Reset`, which is accepted as epoch seconds, epoch milliseconds
+    or seconds from now.
+
+    Args:
+        headers: Response headers (optional)
+        now: Current epoch time (optional, defaults to `time.time()`)
+
+    Returns:
+        Seconds to wait (0 if the time is already past), or None if the response has no usable hint
+    """
+    if not headers:
+        return None
+    now = time.time() if now is None else now
+    try:
+        value = headers.get('Retry-After')
+        if value is not None:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+        value = headers.get('X-RateLimit-Reset')
+        if value is not None:
+            reset = float(value)
+            if reset > 1e12:
+                reset = reset / 1000 - now
+            elif reset > 1e9:
+                reset -= now
+            return max(0.0, reset)
+    except (TypeError, ValueError, IndexError):
+        pass
+    return None
+
+
+def request_was_sent(error: BaseException) -> bool:
+    """Whether a request that failed with `error` may have reached the server.
+
+    Connection failures (refused connection, DNS failure, connect timeout) happen
+    before anything is sent; other errors may happen after the server received
+    the request.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return False
+    if isinstance(error, requests.exceptions.ConnectionError):
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        name = type(reason).__name__
+        return name not in ("NewConnectionError", "NameResolutionError", "ConnectTimeoutError")
+    # httpx, which is an optional dependency
+    return not (
+        type(error).__module__.startswith("httpx")
+        and type(error).__name__ in ("ConnectError", "ConnectTimeout")
+    )
+
+
+class RetryBudget:
+    """Process-wide allowance of retries, capped as a fraction of recent successes.
+
+    Every request that succeeds adds `ratio` of a retry to the budget, and every
+    retry takes one; on top of that, `min_per_second` retries per second are
+    always allowed so that a quiet process can still retry. Both are counted over
+    a sliding `window` of seconds. During a brownout successes stop coming in,
+    the budget drains, and failed requests are raised instead of being retried
+    by every worker, which would multiply the load on the struggling service.
+
+    Args:
+        ratio: Retries allowed per recent successful request, or None for no budget
+        min_per_second: Retries per second allowed regardless of successes
+        window: Seconds over which successes and retries are counted
+
+    Example:
+        ```python
+        >>> budget = retry_budget()
+        >>> budget.configure(ratio=0.1)
+        >>> budget.stats()
+        {'ratio': 0.1, 'successes': 120, 'retries': 3, 'balance': 109.0, 'denied': 0, ...}
+        ```
+    """
+
+    _SLOTS = 10
+
+    def __init__(self, ratio: Optional[float] = 0.2, min_per_second: float = 10.0, window: float = 10.0) -> None:
+        self._lock = threading.Lock()
+        self.ratio: Optional[float] = None
+        self.min_per_second = min_per_second
+        self.window = window
+        self.configure(ratio, min_per_second, window)
+
+    def configure(
+        self,
+        ratio: Optional[float] = 0.2,
+        min_per_second: Optional[float] = None,
+        window: Optional[float] = None
+    ) -> None:
+        """Change the budget and clear its counts.
+
+        Args:
+            ratio: Retries allowed per recent successful request, or None for no budget
+            min_per_second: Retries per second allowed regardless of successes (optional)
+            window: Seconds over which successes and retries are counted (optional)
+
+        Raises:
+            ValueError: If a value is negative or the window is not positive
+        """
+        if ratio is not None and ratio < 0:
+            raise ValueError("ratio cannot be negative, use None for no budget")
+        if min_per_second is not None and min_per_second < 0:
+            raise ValueError("min_per_second cannot be negative")
+        if window is not None and window <= 0:
+            raise ValueError("window must be positive")
+        with self._lock:
+            self.ratio = ratio
+            if min_per_second is not None:
+                self.min_per_second = min_per_second
+            if window is not None:
+                self.window = window
+            # Counts per slot of window / _SLOTS seconds, tagged with the slot's number
+            self._slot_ids: List[int] = [-1] * self._SLOTS
+            self._successes: List[int] = [0] * self._SLOTS
+            self._retries: List[int] = [0] * self._SLOTS
+            self.spent = 0
+            self.denied = 0
+
+    @property
+    def limited(self) -> bool:
+        return self.ratio is not None
+
+    def record_success(self) -> None:
+        """Count a successful request."""
+        if self.ratio is None:
+            return
+        with self._lock:
+            self._successes[self._slot()] += 1
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False if it is spent."""
+        with self._lock:
+            if self.ratio is not None:
+                slot = self._slot()
+                if self._balance() < 1:
+                    self.denied += 1
+                    return False
+                self._retries[slot] += 1
+            self.spent += 1
+            return True
+
+    @property
+    def balance(self) -> float:
+        """Retries available now (infinite without a budget)."""
+        with self._lock:
+            if self.ratio is None:
+                return float('inf')
+            self._slot()
+            return self._balance()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the budget, for metrics.
+
+        Returns:
+            `ratio`, `min_per_second` and `window` as configured, `successes` and
+            `retries` counted in the window, the `balance` of retries available,
+            and the totals of retries `spent` and `denied` since configured
+        """
+        with self._lock:
+            if self.ratio is not None:
+                self._slot()
+            return {
+                'ratio': self.ratio,
+                'min_per_second': self.min_per_second,
+                'window': self.window,
+                'successes': sum(self._successes),
+                'retries': sum(self._retries),
+                'balance': self._balance() if self.ratio is not None else float('inf'),
+                'spent': self.spent,
+                'denied': self.denied
+            }
+
+    def _slot(self) -> int:
+        """Position of the current slot, clearing the slots that left the window."""
+        slot_id = int(time.monotonic() * self._SLOTS / self.window)
+        for offset in range(self._SLOTS):
+            position = (slot_id - offset) % self._SLOTS
+            expected = slot_id - offset
+            if self._slot_ids[position] != expected:
+                self._slot_ids[position] = expected
+                self._successes[position] = 0
+                self._retries[position] = 0
+        return slot_id % self._SLOTS
+
+    def _balance(self) -> float:
+        return self.min_per_second * self.window + self.ratio * sum(self._successes) - sum(self._retries)
+
+
+# Shared by every request and upload of the process
+_retry_budget = RetryBudget()
+
+
+def retry_budget() -> RetryBudget:
+    """The process-wide budget every retry draws from."""
+    return _retry_budget
+
+
+class RetryPolicy:
+    """When and after how long a failed request is retried.
+
+    Waits grow exponentially from `backoff` up to `max_backoff` with full jitter
+    (a random wait between 0 and the exponential delay), so clients that failed
+    together do not retry together. A `Retry-After` or `X-RateLimit-Reset` header
+    on the response is honoured instead; a wait longer than `max_wait` is not
+    worth holding the caller for, and the error is raised right away.
+
+    A failure is retried if its status is in `retry_on_status` (or it has no
+    response at all, e.g. a connection error) and resending is safe: idempotent
+    methods can always be resent, other requests (POST job creation) only if
+    they never reached the server or the server said it did not process them
+    (408, 425, 429, 503). `retry_non_idempotent` lifts that restriction for
+    endpoints known to be safe.
+
+    Every retry is drawn from a `RetryBudget`, the process-wide one by default;
+    once it is spent, the failure is raised as `RetryBudgetExhaustedError`
+    instead of being retried. Call sites report successes with `record_success()`.
+
+    Args:
+        max_retries: Retries after the first attempt
+        backoff: Delay before the first retry in seconds
+        max_backoff: Maximum exponential delay in seconds
+        retry_on_status: HTTP statuses worth retrying
+        jitter: Randomize delays (full jitter)
+        retry_non_idempotent: Retry non-idempotent requests like idempotent ones
+        max_wait: Longest server-requested wait honoured, in seconds. Defaults to `max_backoff`.
+        budget: Budget retries are drawn from (optional, defaults to `retry_budget()`)
+
+    Example:
+        ```python
+        >>> policy = RetryPolicy(max_retries=5, backoff=0.5)
+        >>> policy.next_delay(1, "GET", status=503)
+        0.31
+        >>> policy.next_delay(1, "POST", status=500) is None  # may have created the job
+        True
+        ```
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        retry_on_status: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        jitter: bool = True,
+        retry_non_idempotent: bool = False,
+        max_wait: Optional[float] = None,
+        budget: Optional[RetryBudget] = None
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_on_status = frozenset(retry_on_status)
+        self.jitter = jitter
+        self.retry_non_idempotent = retry_non_idempotent
+        self.max_wait = max_backoff if max_wait is None else max_wait
+        self._budget = budget
+
+    @property
+    def budget(self) -> RetryBudget:
+        return self._budget or _retry_budget
+
+    def record_success(self) -> None:
+        """Report a successful request, which adds to the retry budget."""
+        self.budget.record_success()
+
+    def retryable(self, method: str, status: Optional[int] = None, sent: bool = True) -> bool:
+        """Whether a failed attempt may be resent.
+
+        Args:
+            method: HTTP method of the request
+            status: Status of the response, or None if the attempt got no response
+            sent: Whether the request may have reached the server (see `request_was_sent()`)
+        """
+        if status is not None and status not in self.retry_on_status:
+            return False
+        if not sent or self.retry_non_idempotent or method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return status in UNPROCESSED_STATUSES
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Exponential delay before retry number `attempt` (1-based), jittered if enabled."""
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def next_delay(
+        self,
+        attempt: int,
+        method: str,
+        status: Optional[int] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+        sent: bool = True
+    ) -> Optional[float]:
+        """Seconds to wait before retrying a failed attempt, or None to give up.
+
+        Args:
+            attempt: Number of failed attempts so far, this one included
+            method: HTTP method of the request
+            status: Status of the response, or None if the attempt got no response
+            headers: Headers of the response (optional)
+            sent: Whether the request may have reached the server
+
+        Returns:
+            The delay in seconds, or None if the failure should be raised
+
+        Raises:
+            RetryBudgetExhaustedError: If the failure is worth retrying but the retry budget is spent
+        """
+        if attempt > self.max_retries or not self.retryable(method, status, sent):
+            return None
+        wait = retry_after(headers)
+        if wait is None:
+            wait = self.backoff_delay(attempt)
+        elif wait > self.max_wait:
+            return None
+        budget = self.budget
+        if not budget.try_spend():
+            failure = f"status {status}" if status is not None else "no response"
+            logger.warning("Retry budget exhausted, not retrying %s request (%s)", method, failure)
+            raise RetryBudgetExhaustedError(
+                f"Retry budget exhausted: {method} request failed with {failure} and was not retried",
+                details={'status': status, 'attempt': attempt, 'budget': budget.stats()}
+            )
+        return wait
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_retries={self.max_retries}, backoff={self.backoff}, "
+            f"max_backoff={self.max_backoff}, retry_on_status={sorted(self.retry_on_status)})"
+        )
+
+
+def upload_retry_delay(policy: RetryPolicy, attempt: int, error: BaseException) -> Optional[float]:
+    """Seconds to wait before resending an upload (a PUT) that failed with `error`, or None to give up.
+
+    Status errors are retried per `policy`; failures without a response, including
+    checksum mismatches, are retried until attempts run out.
+    """
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None)
+    if status is not None:
+        return policy.next_delay(attempt, "PUT", status, response.headers)
+    return policy.next_delay(attempt, "PUT", sent=request_was_sent(error))
+
+
+def select_policy(
+    policies: Optional[Mapping[str, RetryPolicy]],
+    endpoint: str,
+    default: RetryPolicy
+) -> RetryPolicy:
+    """Policy of the longest endpoint prefix in `policies` matching `endpoint`, or `default`.
+
+    Example:
+        ```python
+        >>> policies = {"process-audio": RetryPolicy(max_retries=1), "fetch-note": RetryPolicy(max_retries=6)}
+        >>> select_policy(policies, "fetch-note/job-123", RetryPolicy()).max_retries
+        6
+        ```
+    """
+    endpoint = endpoint.lstrip('/')
+    best = None
+    for prefix in policies or ():
+        key = prefix.strip('/')
+        if (endpoint == key or endpoint.startswith(key + '/')) and (best is None or len(key) > len(best)):
+            best = key
+            policy = policies[prefix]
+    return default if best is None else policy
@@ -0,0 +1,198 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional
+import logging
+import threading
+import time
+
+from .dedup import params_key
+from .uploads import presigned_url_expiry
+
+logger = logging.getLogger("notedx_sdk")
+
+
+class JobSlot:
+    """A job created ahead of demand, waiting for a recording to be uploaded to it."""
+
+    __slots__ = ("response", "created", "expires")
+
+    def __init__(self, response: Dict[str, Any], ttl: float, margin: float) -> None:
+        self.response = response
+        self.created = time.time()
+        expiry = self.created + ttl
+        url_expiry = presigned_url_expiry(response.get('presigned_url', ''))
+        if url_expiry is not None:
+            # The upload has to start, and get going, before the URL expires
+            expiry = min(expiry, url_expiry - margin)
+        self.expires = expiry
+
+    @property
+    def job_id(self) -> str:
+        return self.response['job_id']
+
+    def fresh(self, now: Optional[float] = None) -> bool:
+        return (time.time() if now is None else now) < self.expires
+
+
+class JobSlotPool:
+    """Creates audio jobs ahead of demand so uploads do not wait for job creation.
+
+    Each `acquire()` hands out a job created earlier with the same job parameters
+    (template, language, file extension, ...), or creates one if none is ready,
+    and tops the pool up in the background so that at most `size` jobs for those
+    parameters are ready or being created, a job created on demand for a miss
+    included. In a loop over recordings, the job of the next recording is then
+    created while the current one uploads, hiding one API round trip per file.
+    Every job is billed, so after a failed creation the pool stops creating jobs
+    ahead for `failure_backoff` seconds.
+
+    The API binds parameters when a job is created, so a slot is only handed out
+    for a request with exactly the parameters it was created with; parameters are
+    bound at the first request for them, and later recordings reuse them. Slots
+    expire after `ttl` seconds, or `margin` seconds before their presigned upload
+    URL does; expired and unused slots are jobs that never receive a recording,
+    and are left to expire on the server.
+
+    Args:
+        create: Creates a job from its request body and returns the API response
+        size: Jobs ready or being created per parameter set (at least 2)
+        ttl: Seconds a slot stays usable
+        margin: Seconds of validity a presigned URL must have left to be handed out
+        failure_backoff: Seconds without creating jobs ahead after a creation fails
+
+    Example:
+        ```python
+        >>> with note_manager.job_slots(size=2):
+        ...     for path in paths:
+        ...         note_manager.process_audio(path, template="wfw")
+        ```
+    """
+
+    def __init__(
+        self,
+        create: Callable[[Dict[str, Any]], Dict[str, Any]],
+        size: int = 2,
+        ttl: float = 600.0,
+        margin: float = 60.0,
+        failure_backoff: float = 30.0
+    ) -> None:
+        if size < 2:
+            # The job created on demand for a miss counts toward size
+            raise ValueError("size must be at least 2")
+        self.size = size
+        self.ttl = ttl
+        self.margin = margin
+        self.failure_backoff = failure_backoff
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self._create = create
+        self._slots: Dict[str, Deque[JobSlot]] = {}
+        # Jobs being created in the background / on demand for a miss, by parameters
+        self._pending: Dict[str, int] = {}
+        self._creating: Dict[str, int] = {}
+        self._paused_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="notedx-slots")
+
+    def acquire(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Get a job for a request body, from the pool if one is ready.
+
+        Args:
+            data: Job creation request body
+
+        Returns:
+            The job creation response (`job_id`, `presigned_url`, ...)
+
+        Raises:
+            NoteDxError: If no slot is ready and creating the job fails
+        """
+        key = params_key(data)
+        with self._lock:
+            if self._closed:
+                # Slots left over were reported unused by close()
+                slot = None
+            else:
+                slot = self._take(key)
+            if slot is None:
+                self.misses += 1
+                self._creating[key] = self._creating.get(key, 0) + 1
+            else:
+                self.hits += 1
+            self._refill(key, data)
+        if slot is not None:
+            logger.debug("Using pre-created job %s", slot.job_id)
+            return dict(slot.response)
+        try:
+            return self._create(data)
+        except Exception:
+            with self._lock:
+                self._pause(key)
+            raise
+        finally:
+            with self._lock:
+                self._creating[key] -= 1
+
+    def unused_jobs(self) -> List[str]:
+        """IDs of the jobs created ahead of demand and not handed out yet."""
+        with self._lock:
+            return [slot.job_id for slots in self._slots.values() for slot in slots]
+
+    def close(self) -> List[str]:
+        """Stop creating jobs, wait for creations in progress and return the unused job IDs.
+
+        Jobs requested after closing are created on demand.
+        """
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True)
+        unused = self.unused_jobs()
+        if unused:
+            logger.info("%d pre-created jobs were not used: %s", len(unused), ", ".join(unused))
+        return unused
+
+    def __enter__(self) -> "JobSlotPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _take(self, key: str) -> Optional[JobSlot]:
+        slots = self._slots.get(key)
+        now = time.time()
+        while slots:
+            slot = slots.popleft()
+            if slot.fresh(now):
+                return slot
+            self.expired += 1
+            logger.debug("Discarding expired pre-created job %s", slot.job_id)
+        return None
+
+    def _refill(self, key: str, data: Dict[str, Any]) -> None:
+        if self._closed or time.monotonic() < self._paused_until.get(key, 0.0):
+            return
+        ready = len(self._slots.get(key, ())) + self._pending.get(key, 0) + self._creating.get(key, 0)
+        for _ in range(self.size - ready):
+            self._pending[key] = self._pending.get(key, 0) + 1
+            self._executor.submit(self._fill, key, dict(data))
+
+    def _fill(self, key: str, data: Dict[str, Any]) -> None:
+        try:
+            slot: Optional[JobSlot] = JobSlot(self._create(data), self.ttl, self.margin)
+            if not (slot.response.get('presigned_url') and slot.response.get('job_id')):
+                raise ValueError("response has no presigned_url or job_id")
+        except Exception as e:
+            logger.warning("Could not pre-create a job: %s", str(e))
+            slot = None
+        with self._lock:
+            self._pending[key] -= 1
+            if slot is not None:
+                self._slots.setdefault(key, deque()).append(slot)
+            else:
+                self._pause(key)
+
+    def _pause(self, key: str) -> None:
+        if time.monotonic() >= self._paused_until.get(key, 0.0):
+            logger.info("Not creating jobs ahead for %.0f seconds after a failed creation", self.failure_backoff)
+        self._paused_until[key] = time.monotonic() + self.failure_backoff
@@ -0,0 +1,1102 @@
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+import base64
+import binascii
+import hashlib
+import logging
+import mmap
+import os
+import re
+import threading
+import time
+import requests
+
+from ..exceptions import UploadCancelledError, UploadError, UploadUrlRejectedError
+from .bandwidth import BandwidthLimiter
+from .retry import STORAGE_RETRY_STATUSES, RetryPolicy, upload_retry_delay
+
+logger = logging.getLogger("notedx_sdk")
+
+# Called with (bytes_sent, total_bytes) as the upload body is consumed; total is 0 when unknown
+ProgressCallback = Callable[[int, int], None]
+
+# In-memory audio, an open binary file, or an iterator of byte chunks
+AudioSource = Union[bytes, bytearray, memoryview, BinaryIO, Iterable[bytes]]
+
+_MD5_ETAG = re.compile(r'^(?:W/)?"?([0-9a-fA-F]{32})"?$')
+
+
+def _md5() -> "hashlib._Hash":
+    try:
+        return hashlib.md5(usedforsecurity=False)
+    except TypeError:  # Python < 3.9
+        return hashlib.md5()
+
+
+class _UploadBody:
+    """Progress accounting shared by upload bodies.
+
+    Every chunk handed to the transport goes through `_advance()`, which counts
+    it, reports progress and, once `enable_checksum()` was called, feeds it to an
+    MD5 digest. The checksum is thus computed in the same pass as the upload,
+    without reading the data a second time. With a `limiter`, `_advance()` first
+    waits until the limiter lets the chunk go out.
+    """
+
+    total: Optional[int]
+    sent: int
+    callback: Optional[ProgressCallback]
+    checksum: Optional["hashlib._Hash"] = None
+    limiter: Optional[BandwidthLimiter] = None
+
+    def enable_checksum(self) -> None:
+        """Compute the MD5 of the data as it is sent (available as `checksum`)."""
+        self.checksum = _md5()
+
+    def _advance(self, data: Union[bytes, memoryview]) -> None:
+        if self.limiter is not None:
+            self.limiter.acquire(len(data))
+        self.sent += len(data)
+        if self.checksum is not None:
+            self.checksum.update(data)
+        if self.callback is not None:
+            self.callback(self.sent, self.total or 0)
+
+    def _restart(self) -> None:
+        self.sent = 0
+        if self.checksum is not None:
+            self.checksum = _md5()
+
+
+def stored_md5(headers: Any) -> Optional[str]:
+    """MD5 of an uploaded object as reported by storage, if it reports one.
+
+    Reads an MD5-shaped `ETag` (S3 and compatible stores, single `PUT` or part)
+    or the `md5=` entry of `x-goog-hash` (Google Cloud Storage).
+
+    Returns:
+        Lowercase hex digest, or None when the response carries no usable MD5
+        (e.g. KMS-encrypted objects, whose ETag is not an MD5)
+    """
+    goog_hash = headers.get('x-goog-hash')
+    if isinstance(goog_hash, str):
+        for entry in goog_hash.split(','):
+            name, _, value = entry.strip().partition('=')
+            if name == 'md5':
+                try:
+                    return base64.b64decode(value).hex()
+                except (binascii.Error, ValueError):
+                    return None
+    etag = headers.get('ETag')
+    match = _MD5_ETAG.match(etag.strip()) if isinstance(etag, str) else None
+    return match.group(1).lower() if match else None
+
+
+def presigned_url_expiry(url: str) -> Optional[float]:
+    """When a presigned URL stops being accepted, from its signature parameters.
+
+    Understands AWS Signature V4 (`X-Amz-Date` + `X-Amz-Expires`), Google Cloud
+    Storage V4 (`X-Goog-Date` + `X-Goog-Expires`), the V2 `Expires` timestamp of
+    both, and Azure SAS tokens (`se`).
+
+    Returns:
+        Expiry as a Unix timestamp, or None if the URL does not say
+    """
+    params = {name.lower(): values[0] for name, values in parse_qs(urlsplit(url).query).items()}
+    try:
+        for prefix in ('x-amz-', 'x-goog-'):
+            if prefix + 'date' in params and prefix + 'expires' in params:
+                signed = datetime.strptime(params[prefix + 'date'], '%Y%m%dT%H%M%SZ').replace(tzinfo=timezone.utc)
+                return signed.timestamp() + int(params[prefix + 'expires'])
+        if 'expires' in params:
+            return float(params['expires'])
+        if 'se' in params and 'sig' in params:
+            expiry = datetime.fromisoformat(params['se'].replace('Z', '+00:00'))
+            return (expiry if expiry.tzinfo else expiry.replace(tzinfo=timezone.utc)).timestamp()
+    except ValueError:
+        logger.debug("Cannot read the expiry of presigned URL %s", urlsplit(url).path)
+    return None
+
+
+def check_presigned_url(url: str, job_id: Optional[str] = None, margin: float = 0.0) -> None:
+    """Fail before sending anything when a presigned URL has expired.
+
+    Args:
+        url: Presigned upload URL
+        job_id: ID of the job the URL belongs to (optional)
+        margin: Seconds of validity the URL must have left
+
+    Raises:
+        UploadUrlRejectedError: If the URL expires within `margin` seconds
+    """
+    expiry = presigned_url_expiry(url)
+    if expiry is not None and expiry - margin <= time.time():
+        raise UploadUrlRejectedError(
+            "Presigned upload URL expired",
+            job_id,
+            details={"expired_at": datetime.fromtimestamp(expiry, timezone.utc).isoformat()}
+        )
+
+
+def rejected_url_error(response: Any, job_id: Optional[str] = None) -> Optional[UploadUrlRejectedError]:
+    """Error for a storage response rejecting the presigned URL itself, if it is one.
+
+    Storage answers 403 to expired or invalid signatures (400 with an expiry
+    message on some providers). Such answers do not change on retry, unlike 5xx
+    and connection errors.
+
+    Args:
+        response: Upload response (`requests` or `httpx`)
+        job_id: ID of the job the URL belongs to (optional)
+
+    Returns:
+        The error to raise, or None if the response is not a URL rejection
+    """
+    if response.status_code not in (400, 403):
+        return None
+    text = response.text or ""
+    expired = "expire" in text.lower()
+    if response.status_code == 400 and not expired:
+        return None
+    return UploadUrlRejectedError(
+        f"Storage rejected the presigned upload URL ({response.status_code})",
+        job_id,
+        'URL_EXPIRED' if expired else 'URL_REJECTED',
+        details={"status_code": response.status_code, "response": text[:500]}
+    )
+
+
+def verify_checksum(headers: Any, checksum: Optional["hashlib._Hash"], job_id: Optional[str] = None) -> None:
+    """Compare the MD5 computed while uploading with the one storage reports.
+
+    Args:
+        headers: Headers of the storage response
+        checksum: MD5 digest of the data sent, or None to skip verification
+        job_id: ID of the job, for the error (optional)
+
+    Raises:
+        UploadError: If storage reports a different MD5, i.e. the data was corrupted in transit
+    """
+    if checksum is None:
+        return
+    stored = stored_md5(headers)
+    if stored is None:
+        logger.debug("Storage response carries no MD5, upload checksum not verified")
+        return
+    if stored != checksum.hexdigest():
+        raise UploadError(
+            "Upload checksum mismatch: storage received corrupted data",
+            job_id=job_id,
+            code='CHECKSUM_MISMATCH',
+            details={"sent_md5": checksum.hexdigest(), "stored_md5": stored}
+        )
+
+
+class ProgressReader(_UploadBody):
+    """File-like upload body that streams a file and reports progress.
+
+    `requests` sends objects exposing `read()` and `__len__()` as a streamed body
+    with a fixed `Content-Length`, so the whole file goes out in a single request
+    while only one read block is held in memory at a time.
+
+    Args:
+        fileobj: Binary file object positioned at the start of the upload
+        total: Number of bytes that will be sent
+        callback: Optional function called with `(bytes_sent, total)` after each read;
+            exposed as the `callback` attribute
+        chunk_size: Block size used when the body is iterated
+
+    Example:
+        ```python
+        >>> with open("visit.mp3", "rb") as f:
+        ...     body = ProgressReader(f, os.path.getsize("visit.mp3"), callback=print)
+        ...     session.put(presigned_url, data=body)
+        ```
+    """
+
+    rewindable = True
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        total: int,
+        callback: Optional[ProgressCallback] = None,
+        chunk_size: int = 1024 * 1024
+    ) -> None:
+        self._fileobj = fileobj
+        self._start = fileobj.tell() if hasattr(fileobj, "tell") else 0
+        self.total = total
+        self.sent = 0
+        self.callback = callback
+        self._chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return self.total - self.sent
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to `size` bytes, never past `total`."""
+        remaining = self.total - self.sent
+        if remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        data = self._fileobj.read(size)
+        if data:
+            self._advance(data)
+        return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            data = self.read(self._chunk_size)
+            if not data:
+                return
+            yield data
+
+    def rewind(self) -> None:
+        """Seek back to the start so the body can be resent on retry."""
+        self._fileobj.seek(self._start)
+        self._restart()
+
+    def close(self) -> None:
+        """Release resources held by the body (the file itself stays open)."""
+
+
+class BufferReader(_UploadBody):
+    """Upload body over an in-memory buffer that hands out zero-copy slices.
+
+    `read()` returns `memoryview` slices of the buffer, which the transport writes
+    to the socket directly, so the audio is never copied on its way out.
+
+    Args:
+        buffer: Bytes-like object holding the audio
+        callback: Optional function called with `(bytes_sent, total)` after each read;
+            exposed as the `callback` attribute
+        chunk_size: Block size used when the body is iterated
+    """
+
+    rewindable = True
+
+    def __init__(
+        self,
+        buffer: Union[bytes, bytearray, memoryview],
+        callback: Optional[ProgressCallback] = None,
+        chunk_size: int = 1024 * 1024
+    ) -> None:
+        self._view = memoryview(buffer).cast("B")
+        self.total = self._view.nbytes
+        self.sent = 0
+        self.callback = callback
+        self._chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return self.total - self.sent
+
+    def read(self, size: int = -1) -> memoryview:
+        """Return a view of up to `size` bytes of the buffer."""
+        if size is None or size < 0:
+            size = self.total - self.sent
+        data = self._view[self.sent:self.sent + size]
+        if len(data):
+            self._advance(data)
+        return data
+
+    def __iter__(self) -> Iterator[memoryview]:
+        while True:
+            data = self.read(self._chunk_size)
+            if not len(data):
+                return
+            yield data
+
+    def rewind(self) -> None:
+        """Start over from the beginning of the buffer."""
+        self._restart()
+
+    def close(self) -> None:
+        """Release resources held by the body."""
+
+
+class MappedFileReader(BufferReader):
+    """Upload body over a read-only memory map of a file range.
+
+    Reads are zero-copy `memoryview` slices of the mapping, so no per-chunk buffers
+    are allocated and the page cache backs the data: memory per upload stays near
+    constant however large the file is. A retry simply starts over from the mapping.
+
+    Args:
+        fileobj: Binary file object backed by a regular file
+        offset: First byte of the range to upload
+        length: Number of bytes to upload; defaults to the rest of the file
+        callback: Optional function called with `(bytes_sent, total)` after each read
+        chunk_size: Block size used when the body is iterated
+
+    Raises:
+        OSError: If the file cannot be mapped
+        ValueError: If the range is empty or outside the file
+    """
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        offset: int = 0,
+        length: Optional[int] = None,
+        callback: Optional[ProgressCallback] = None,
+        chunk_size: int = 1024 * 1024
+    ) -> None:
+        fileno = fileobj.fileno()
+        if length is None:
+            length = os.fstat(fileno).st_size - offset
+        # Mappings must start on an allocation boundary
+        start = offset - offset % mmap.ALLOCATIONGRANULARITY
+        self._mapping = mmap.mmap(fileno, length + offset - start, access=mmap.ACCESS_READ, offset=start)
+        if hasattr(self._mapping, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._mapping.madvise(mmap.MADV_SEQUENTIAL)
+        self._base = memoryview(self._mapping)[offset - start:]
+        super().__init__(self._base, callback, chunk_size)
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._view.release()
+        self._base.release()
+        try:
+            self._mapping.close()
+        except BufferError:
+            # A slice is still referenced (e.g. by the transport); the mapping
+            # is released together with it
+            pass
+
+
+def open_file_body(
+    fileobj: BinaryIO,
+    offset: int = 0,
+    length: Optional[int] = None,
+    callback: Optional[ProgressCallback] = None,
+    chunk_size: int = 1024 * 1024
+) -> Union[MappedFileReader, ProgressReader]:
+    """Open the upload body for a file range, memory-mapped when possible.
+
+    Falls back to a buffered `ProgressReader` for files that cannot be mapped
+    (empty files, pipes, objects without a real file descriptor).
+
+    Args:
+        fileobj: Open binary file
+        offset: First byte of the range to upload
+        length: Number of bytes to upload; defaults to the rest of the file
+        callback: Optional function called with `(bytes_sent, total)`
+        chunk_size: Block size used when the body is iterated
+
+    Returns:
+        An upload body; call `close()` on it once the upload is done
+    """
+    try:
+        return MappedFileReader(fileobj, offset, length, callback, chunk_size)
+    except (OSError, ValueError, TypeError) as e:
+        logger.debug("Falling back to buffered reads, file cannot be memory-mapped: %s", str(e))
+    fileobj.seek(offset)
+    if length is None:
+        length = os.fstat(fileobj.fileno()).st_size - offset
+    return ProgressReader(fileobj, length, callback, chunk_size)
+
+
+class IteratorReader(_UploadBody):
+    """Upload body over a one-shot stream of byte chunks.
+
+    Used for iterators and non-seekable file objects. The body is sent with
+    chunked transfer encoding unless `size` is given, and cannot be rewound,
+    so a failed upload is not retried.
+
+    Args:
+        chunks: Iterable of bytes-like chunks
+        size: Total number of bytes, if known
+        callback: Optional function called with `(bytes_sent, total)` after each chunk;
+            exposed as the `callback` attribute
+    """
+
+    rewindable = False
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        size: Optional[int] = None,
+        callback: Optional[ProgressCallback] = None
+    ) -> None:
+        self._chunks = chunks
+        self.total = size
+        self.sent = 0
+        self.callback = callback
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._chunks:
+            if not len(chunk):
+                continue
+            self._advance(chunk)
+            yield chunk
+
+    def rewind(self) -> None:
+        raise ValueError("Stream sources cannot be rewound for a retry")
+
+
+class SizedIteratorReader(IteratorReader):
+    """`IteratorReader` whose size is known, so it is sent with a Content-Length."""
+
+    def __len__(self) -> int:
+        return self.total - self.sent
+
+
+def _iter_reads(fileobj: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    while True:
+        data = fileobj.read(chunk_size)
+        if not data:
+            return
+        yield data
+
+
+def open_upload_body(
+    source: AudioSource,
+    size: Optional[int] = None,
+    callback: Optional[ProgressCallback] = None,
+    chunk_size: int = 1024 * 1024
+) -> Union[BufferReader, ProgressReader, IteratorReader]:
+    """Wrap an audio source in the upload body that streams it without copies.
+
+    * `bytes`, `bytearray` and `memoryview` are sent as zero-copy slices
+    * Seekable binary files are streamed from their current position and can be rewound
+    * Non-seekable files and iterators of bytes are streamed once
+
+    Args:
+        source: Audio to upload
+        size: Number of bytes to send (optional). Required to send a Content-Length
+            for iterators and non-seekable files.
+        callback: Optional function called with `(bytes_sent, total)`
+        chunk_size: Read block size in bytes
+
+    Returns:
+        An upload body with `total`, `sent` and `rewind()`
+
+    Raises:
+        TypeError: If `source` is not a supported type
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return BufferReader(source, callback, chunk_size)
+
+    if hasattr(source, "read"):
+        seekable = getattr(source, "seekable", None)
+        if seekable is not None and seekable():
+            if size is None:
+                start = source.tell()
+                size = source.seek(0, os.SEEK_END) - start
+                source.seek(start)
+            return ProgressReader(source, size, callback, chunk_size)
+        return _iterator_reader(_iter_reads(source, chunk_size), size, callback)
+
+    if isinstance(source, str) or not hasattr(source, "__iter__"):
+        raise TypeError(
+            f"Unsupported audio source type: {type(source).__name__}. "
+            "Expected bytes, memoryview, a binary file object or an iterator of bytes."
+        )
+    return _iterator_reader(source, size, callback)
+
+
+def _iterator_reader(
+    chunks: Iterable[bytes],
+    size: Optional[int],
+    callback: Optional[ProgressCallback]
+) -> IteratorReader:
+    if size is None:
+        return IteratorReader(chunks, None, callback)
+    return SizedIteratorReader(chunks, size, callback)
+
+
+class ThroughputEstimator:
+    """Exponentially weighted estimate of upload throughput.
+
+    Shared by the uploads of a client, so a new upload starts from the throughput
+    measured on the same link instead of from scratch.
+
+    Args:
+        alpha: Weight of the newest sample, between 0 and 1
+    """
+
+    def __init__(self, alpha: float = 0.3) -> None:
+        self.alpha = alpha
+        self._rate: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def bytes_per_second(self) -> Optional[float]:
+        """Current estimate, or None before the first sample."""
+        return self._rate
+
+    def record(self, nbytes: int, seconds: float) -> None:
+        """Add a sample of `nbytes` sent in `seconds`."""
+        if nbytes <= 0 or seconds <= 0:
+            return
+        sample = nbytes / seconds
+        with self._lock:
+            if self._rate is None:
+                self._rate = sample
+            else:
+                self._rate = self.alpha * sample + (1 - self.alpha) * self._rate
+
+
+class AdaptiveChunkSizer:
+    """Chooses upload chunk sizes and the per-chunk timeout from measured throughput.
+
+    Works like TCP slow start: chunks start small and double while each one is
+    sent in under `target_seconds`; once a chunk takes longer, the size follows the
+    measured throughput so that a chunk takes about `target_seconds` to send. Small
+    chunks on slow links keep every chunk well inside its timeout, large chunks on
+    fast links keep per-chunk overhead low.
+
+    Args:
+        estimator: Throughput estimate shared across uploads
+        max_chunk_size: Largest chunk in bytes
+        min_chunk_size: Smallest chunk in bytes
+        initial_chunk_size: First chunk size when no throughput is known yet
+        target_seconds: Desired send time of one chunk
+        default_timeout: Per-chunk timeout in seconds while no throughput is known
+        min_timeout: Lower bound of the per-chunk timeout in seconds
+    """
+
+    SAFETY_FACTOR = 4
+
+    def __init__(
+        self,
+        estimator: ThroughputEstimator,
+        max_chunk_size: int = 16 * 1024 * 1024,
+        min_chunk_size: int = 64 * 1024,
+        initial_chunk_size: int = 256 * 1024,
+        target_seconds: float = 1.0,
+        default_timeout: float = 60,
+        min_timeout: float = 10
+    ) -> None:
+        self.estimator = estimator
+        self.max_chunk_size = max(min_chunk_size, max_chunk_size)
+        self.min_chunk_size = min_chunk_size
+        self.target_seconds = target_seconds
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+
+        rate = estimator.bytes_per_second
+        self._slow_start = rate is None
+        self.chunk_size = self._clamp(initial_chunk_size if rate is None else rate * target_seconds)
+
+    def _clamp(self, size: float) -> int:
+        return int(min(self.max_chunk_size, max(self.min_chunk_size, size)))
+
+    def record(self, nbytes: int, seconds: float) -> None:
+        """Record that a chunk of `nbytes` took `seconds` to send and size the next one."""
+        self.estimator.record(nbytes, seconds)
+        if self._slow_start and seconds < self.target_seconds:
+            self.chunk_size = self._clamp(self.chunk_size * 2)
+            return
+        self._slow_start = False
+        rate = self.estimator.bytes_per_second
+        if rate is not None:
+            self.chunk_size = self._clamp(rate * self.target_seconds)
+
+    def timeout(self) -> float:
+        """Per-chunk send timeout in seconds.
+
+        Chunks are sized to take about `target_seconds` (at most twice that while
+        growing), so once throughput is known the timeout only needs to cover that
+        duration with a safety margin. Before that, the default timeout applies.
+        """
+        if self.estimator.bytes_per_second is None:
+            return self.default_timeout
+        return min(
+            self.default_timeout,
+            max(self.min_timeout, self.SAFETY_FACTOR * 2 * self.target_seconds)
+        )
+
+
+class AdaptiveBody:
+    """Upload body that sends a rewindable reader in throughput-sized chunks.
+
+    Only exposes iteration and length, so the transport writes the chunks it is
+    given one by one. The time between two chunks being requested is the time the
+    previous chunk took to send, which feeds the `AdaptiveChunkSizer`.
+
+    Args:
+        reader: Rewindable reader (`ProgressReader`, `BufferReader`, `MappedFileReader`)
+        sizer: Chunk sizer for this upload
+    """
+
+    def __init__(self, reader: Union[ProgressReader, BufferReader], sizer: AdaptiveChunkSizer) -> None:
+        self.reader = reader
+        self.sizer = sizer
+
+    @property
+    def total(self) -> int:
+        return self.reader.total
+
+    @property
+    def sent(self) -> int:
+        return self.reader.sent
+
+    @property
+    def rewindable(self) -> bool:
+        return self.reader.rewindable
+
+    @property
+    def checksum(self) -> Optional["hashlib._Hash"]:
+        return self.reader.checksum
+
+    def __len__(self) -> int:
+        return len(self.reader)
+
+    def __iter__(self) -> Iterator[Union[bytes, memoryview]]:
+        while True:
+            size = self.sizer.chunk_size
+            limiter = self.reader.limiter
+            if limiter is not None and limiter.limited:
+                # Small chunks keep a capped upload smooth on the wire
+                size = min(size, limiter.quantum)
+            chunk = self.reader.read(size)
+            if not len(chunk):
+                return
+            started = time.monotonic()
+            yield chunk
+            self.sizer.record(len(chunk), time.monotonic() - started)
+
+    def rewind(self) -> None:
+        self.reader.rewind()
+
+    def close(self) -> None:
+        self.reader.close()
+
+
+def log_progress(job_id: str, interval: int) -> ProgressCallback:
+    """Build a progress callback that logs at most once per `interval` bytes.
+
+    Args:
+        job_id: ID of the job being uploaded
+        interval: Minimum number of bytes between two log lines
+
+    Returns:
+        A callback suitable for `ProgressReader`
+    """
+    state = {"next": 0}
+
+    def callback(sent: int, total: int) -> None:
+        if sent >= state["next"] or sent == total:
+            state["next"] = sent + interval
+            if total:
+                logger.debug(
+                    "Upload progress for job %s: %.1f%% (%d/%d bytes)",
+                    job_id, (sent / total) * 100, sent, total
+                )
+            else:
+                logger.debug("Upload progress for job %s: %d bytes sent", job_id, sent)
+
+    return callback
+
+
+class UploadProgress:
+    """Snapshot of an upload passed to `on_progress` callbacks.
+
+    Attributes:
+        job_id: ID of the job being uploaded
+        bytes_sent: Bytes sent so far
+        total_bytes: Size of the upload, or None when streaming an unknown size
+        throughput: Instantaneous throughput in bytes per second, over the last interval
+        average_throughput: Average throughput in bytes per second since the upload started
+        eta: Estimated seconds until the upload completes, or None if unknown
+    """
+
+    __slots__ = ("job_id", "bytes_sent", "total_bytes", "throughput", "average_throughput", "eta")
+
+    def __init__(
+        self,
+        job_id: str,
+        bytes_sent: int,
+        total_bytes: Optional[int],
+        throughput: float,
+        average_throughput: float,
+        eta: Optional[float]
+    ) -> None:
+        self.job_id = job_id
+        self.bytes_sent = bytes_sent
+        self.total_bytes = total_bytes
+        self.throughput = throughput
+        self.average_throughput = average_throughput
+        self.eta = eta
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Completed fraction between 0 and 1, or None if the size is unknown."""
+        if not self.total_bytes:
+            return None
+        return min(1.0, self.bytes_sent / self.total_bytes)
+
+    def __repr__(self) -> str:
+        return (
+            f"UploadProgress(job_id={self.job_id!r}, bytes_sent={self.bytes_sent}, "
+            f"total_bytes={self.total_bytes}, throughput={self.throughput:.0f}, "
+            f"average_throughput={self.average_throughput:.0f}, eta={self.eta})"
+        )
+
+
+class ProgressTracker:
+    """Turns raw `(bytes_sent, total)` progress into rate-limited `UploadProgress` reports.
+
+    Called for every read of the upload body, but only invokes `on_progress` once
+    per `interval` seconds (and once on completion), so a UI or autoscaler gets
+    regular updates without per-chunk overhead. Exceptions raised by `on_progress`
+    are logged and never interrupt the upload.
+
+    Args:
+        job_id: ID of the job being uploaded
+        on_progress: Function called with an `UploadProgress`
+        interval: Minimum seconds between two reports
+        next_callback: Optional progress callback to forward raw updates to (e.g. logging)
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        on_progress: Callable[[UploadProgress], None],
+        interval: float = 0.5,
+        next_callback: Optional[ProgressCallback] = None
+    ) -> None:
+        self.job_id = job_id
+        self.on_progress = on_progress
+        self.interval = interval
+        self.next_callback = next_callback
+        self._started = time.monotonic()
+        self._last_time = self._started
+        self._last_sent = 0
+        self._rate: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def __call__(self, sent: int, total: int) -> None:
+        if self.next_callback is not None:
+            self.next_callback(sent, total)
+
+        now = time.monotonic()
+        with self._lock:
+            if sent < self._last_sent:
+                # The body was rewound for a retry
+                self._last_sent = sent
+                self._last_time = now
+                return
+            done = bool(total) and sent >= total
+            elapsed = now - self._last_time
+            if elapsed < self.interval and not done:
+                return
+
+            throughput = (sent - self._last_sent) / elapsed if elapsed > 0 else 0.0
+            self._rate = throughput if self._rate is None else 0.3 * throughput + 0.7 * self._rate
+            total_elapsed = now - self._started
+            average = sent / total_elapsed if total_elapsed > 0 else 0.0
+            eta = None
+            if total:
+                eta = 0.0 if done else ((total - sent) / self._rate if self._rate else None)
+            self._last_time = now
+            self._last_sent = sent
+            progress = UploadProgress(self.job_id, sent, total or None, throughput, average, eta)
+
+        try:
+            self.on_progress(progress)
+        except Exception as e:
+            logger.warning("on_progress callback failed for job %s: %s", self.job_id, str(e))
+
+
+class CombinedProgress:
+    """Merges the progress reports of uploads running side by side into reports on their total.
+
+    Used for the segments of a split recording: each segment reports to its own
+    `for_part()` callback, and `on_progress` receives `UploadProgress` reports on
+    the whole recording (bytes, size, throughput and ETA over all segments). The
+    `job_id` of a report is the one of the segment that triggered it.
+
+    Args:
+        sizes: Expected upload size of each part, updated from their reports
+        on_progress: Function called with the combined `UploadProgress`
+    """
+
+    def __init__(self, sizes: List[int], on_progress: Callable[[UploadProgress], None]) -> None:
+        self.on_progress = on_progress
+        self._sizes = list(sizes)
+        self._sent = [0] * len(sizes)
+        self._throughput = [0.0] * len(sizes)
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def for_part(self, index: int) -> Callable[[UploadProgress], None]:
+        """Progress callback of part `index`."""
+        def report(progress: UploadProgress) -> None:
+            # Reports are combined and delivered under the lock, so totals never go backwards
+            with self._lock:
+                self._sent[index] = progress.bytes_sent
+                self._throughput[index] = progress.throughput
+                if progress.total_bytes is not None:
+                    self._sizes[index] = progress.total_bytes
+                sent, total = sum(self._sent), sum(self._sizes)
+                elapsed = time.monotonic() - self._started
+                average = sent / elapsed if elapsed > 0 else 0.0
+                eta = max(0.0, total - sent) / average if average else None
+                self.on_progress(UploadProgress(
+                    progress.job_id, sent, total, sum(self._throughput), average, eta
+                ))
+
+        return report
+
+
+class MultipartUploader:
+    """Upload a file as concurrent parts to presigned part URLs.
+
+    The file is split into `part_size` ranges that are uploaded on a bounded thread
+    pool, each part streamed from its own file handle and retried on its own. Once
+    every part is stored, the collected ETags are posted to `complete_url` as an
+    S3-style `CompleteMultipartUpload` document.
+
+    Args:
+        session: Session used for part and completion requests
+        max_workers: Maximum number of parts in flight
+        max_retries: Attempts per part before giving up
+        retry_delay: Initial delay between part attempts in seconds
+        retry_max_delay: Maximum delay between part attempts in seconds
+        retry_policy: Policy deciding which part failures are retried and when (optional).
+            Replaces `max_retries`, `retry_delay` and `retry_max_delay`.
+        timeout: Timeout of each part request in seconds
+        estimator: Throughput estimate (optional). When given, parts are sent in
+            adaptive chunks with throughput-based per-chunk timeouts
+        verify_checksums: Check each part's MD5, computed while sending it, against
+            the one storage reports; a mismatching part is sent again
+        limiter: Bandwidth limiter the parts are sent through (optional)
+
+    Example:
+        ```python
+        >>> uploader = MultipartUploader(session, max_workers=8)
+        >>> uploader.upload("visit.wav", response["multipart"], "audio/wav")
+        ```
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        retry_delay: float = 1,
+        retry_max_delay: float = 30,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: float = 60,
+        estimator: Optional[ThroughputEstimator] = None,
+        verify_checksums: bool = True,
+        limiter: Optional[BandwidthLimiter] = None
+    ) -> None:
+        self.session = session
+        self.estimator = estimator
+        self.verify_checksums = verify_checksums
+        self.limiter = limiter
+        self.max_workers = max(1, max_workers)
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max(0, max_retries - 1),
+            backoff=retry_delay,
+            max_backoff=retry_max_delay,
+            retry_on_status=STORAGE_RETRY_STATUSES
+        )
+        self.timeout = timeout
+
+    @staticmethod
+    def is_multipart(response: Dict[str, Any]) -> bool:
+        """Whether a job creation response offers a multipart upload."""
+        multipart = response.get('multipart')
+        return bool(
+            isinstance(multipart, dict)
+            and multipart.get('part_urls')
+            and multipart.get('part_size')
+            and multipart.get('complete_url')
+        )
+
+    def upload(
+        self,
+        file_path: str,
+        multipart: Dict[str, Any],
+        content_type: str,
+        callback: Optional[ProgressCallback] = None,
+        completed: Optional[Dict[int, str]] = None,
+        on_part: Optional[Callable[[int, str], None]] = None
+    ) -> List[str]:
+        """Upload all parts concurrently and complete the multipart upload.
+
+        Args:
+            file_path: Path to the file to upload
+            multipart: The `multipart` object of the job creation response, with
+                `part_urls`, `part_size` and `complete_url`
+            content_type: MIME type sent with each part
+            callback: Optional function called with `(bytes_sent, total)`
+            completed: ETags of parts already stored, by part number; these are skipped
+            on_part: Optional function called with `(part_number, etag)` as each part is stored
+
+        Returns:
+            The ETags of the uploaded parts, in part order
+
+        Raises:
+            ValueError: If the part URLs do not cover the file
+            requests.RequestException: If a part or the completion fails after retries
+            UploadError: If a part keeps arriving corrupted
+        """
+        part_urls = multipart['part_urls']
+        part_size = int(multipart['part_size'])
+        file_size = os.path.getsize(file_path)
+        part_count = max(1, -(-file_size // part_size))
+        if len(part_urls) < part_count:
+            raise ValueError(
+                f"Multipart upload needs {part_count} part URLs, got {len(part_urls)}"
+            )
+
+        completed = completed or {}
+        progress = _SharedProgress(file_size, callback)
+        etags: List[Optional[str]] = [completed.get(index + 1) for index in range(part_count)]
+        remaining = [index for index in range(part_count) if etags[index] is None]
+        progress.add(sum(min(part_size, file_size - index * part_size)
+                         for index in range(part_count) if etags[index] is not None))
+
+        def upload_part(index: int) -> None:
+            etag = self._upload_part(
+                part_urls[index],
+                file_path,
+                index * part_size,
+                min(part_size, file_size - index * part_size),
+                content_type,
+                progress
+            )
+            etags[index] = etag
+            if on_part is not None:
+                on_part(index + 1, etag)
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, max(1, len(remaining))))
+        try:
+            futures = [executor.submit(upload_part, index) for index in remaining]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+        finally:
+            # Parts already in flight are allowed to finish and be recorded
+            executor.shutdown(wait=True)
+        for future in done:
+            future.result()
+
+        self._complete(multipart['complete_url'], etags)
+        return etags
+
+    def _upload_part(
+        self,
+        url: str,
+        file_path: str,
+        offset: int,
+        length: int,
+        content_type: str,
+        progress: "_SharedProgress"
+    ) -> str:
+        """Upload one part, retrying it independently of the others.
+
+        Returns:
+            The ETag returned by storage for the part
+        """
+        with open(file_path, 'rb') as f:
+            on_read = progress.part_callback()
+            body = open_file_body(f, offset, length, on_read)
+            body.limiter = self.limiter
+            if self.verify_checksums:
+                body.enable_checksum()
+            if self.estimator is not None:
+                body = AdaptiveBody(body, AdaptiveChunkSizer(
+                    self.estimator, max_chunk_size=length, default_timeout=self.timeout
+                ))
+            try:
+                return self._put_part(url, body, length, content_type, offset, on_read)
+            finally:
+                body.close()
+
+    def _put_part(
+        self,
+        url: str,
+        body: Union[MappedFileReader, ProgressReader, AdaptiveBody],
+        length: int,
+        content_type: str,
+        offset: int,
+        on_read: ProgressCallback
+    ) -> str:
+        """PUT a part body, resending it from the start on failure."""
+        attempt = 0
+        while True:
+            timeout = self.timeout
+            if isinstance(body, AdaptiveBody):
+                # The connect timeout also bounds the send of each chunk of the body
+                timeout = (body.sizer.timeout(), self.timeout)
+            try:
+                response = self.session.put(
+                    url,
+                    data=body,
+                    headers={'Content-Type': content_type, 'Content-Length': str(length)},
+                    timeout=timeout
+                )
+                rejection = rejected_url_error(response)
+                if rejection is not None:
+                    raise rejection
+                response.raise_for_status()
+                verify_checksum(response.headers, body.checksum)
+                self.retry_policy.record_success()
+                return response.headers.get('ETag', '')
+            except (UploadCancelledError, UploadUrlRejectedError):
+                raise
+            except (requests.RequestException, UploadError) as e:
+                attempt += 1
+                delay = upload_retry_delay(self.retry_policy, attempt, e)
+                if delay is None:
+                    raise
+                logger.warning(
+                    "Upload of part at offset %d failed, retrying in %.1f seconds (attempt %d/%d)",
+                    offset, delay, attempt, self.retry_policy.max_retries + 1
+                )
+                time.sleep(delay)
+                # Discount the bytes of the failed attempt
+                on_read(0, length)
+                body.rewind()
+
+    def _complete(self, complete_url: str, etags: List[Optional[str]]) -> None:
+        """Post the part list so storage assembles the final object."""
+        parts = "".join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>{escape(etag or '')}</ETag></Part>"
+            for number, etag in enumerate(etags, start=1)
+        )
+        response = self.session.post(
+            complete_url,
+            data=f"<CompleteMultipartUpload>{parts}</CompleteMultipartUpload>".encode(),
+            headers={'Content-Type': 'application/xml'},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+
+
+class _SharedProgress:
+    """Thread-safe byte counter shared by the parts of a multipart upload."""
+
+    def __init__(self, total: int, callback: Optional[ProgressCallback]) -> None:
+        self.total = total
+        self.sent = 0
+        self.callback = callback
+        self._lock = threading.Lock()
+
+    def add(self, delta: int) -> None:
+        """Record `delta` more (or, when negative, fewer) bytes as sent."""
+        with self._lock:
+            self.sent += delta
+            sent = self.sent
+        if self.callback is not None and delta > 0:
+            self.callback(sent, self.total)
+
+    def part_callback(self) -> ProgressCallback:
+        """Build a `ProgressReader` callback feeding this counter for one part."""
+        last = [0]
+
+        def callback(sent: int, total: int) -> None:
+            self.add(sent - last[0])
+            last[0] = sent
+
+        return callback
@@ -134,6 +134,34 @@ class UploadError(NoteDxError):
             details['job_id'] = job_id
         super().__init__(message, code, details)
 
+class UploadCancelledError(UploadError):
+    """Error raised when an upload is cancelled through its `UploadHandle`.
+
+    Parameters:
+        job_id: The ID of the job whose upload was cancelled (optional)
+        details: Additional error details (optional)
+    """
+    def __init__(self, job_id: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
+        super().__init__("Upload cancelled", job_id, 'UPLOAD_CANCELLED', details)
+
+class UploadUrlRejectedError(UploadError):
+    """Error raised when a presigned upload URL expired or storage rejected it.
+
+    Retrying the same URL cannot succeed; the upload needs a new job.
+
+    Common error codes:
+    * `URL_EXPIRED` - The URL expired before the upload started, or storage says it did
+    * `URL_REJECTED` - Storage refused the URL (403)
+
+    Parameters:
+        message: The error message
+        job_id: The ID of the job the URL belongs to (optional)
+        code: The error code (defaults to 'URL_EXPIRED')
+        details: Additional error details (optional)
+    """
+    def __init__(self, message: str, job_id: Optional[str] = None, code: str = 'URL_EXPIRED', details: Optional[Dict[str, Any]] = None):
+        super().__init__(message, job_id, code, details)
+
 class NotFoundError(NoteDxError):
     """Error raised when resource is not found (404).
 
@@ -211,6 +239,20 @@ class ServiceUnavailableError(NoteDxError):
     def __init__(self, message: str, code: str = 'SERVICE_UNAVAILABLE', details: Optional[Dict[str, Any]] = None):
         super().__init__(message, code, details)
 
+class RetryBudgetExhaustedError(ServiceUnavailableError):
+    """Error raised instead of retrying a failed request once the process-wide retry budget is spent.
+
+    The budget allows retries up to a fraction of recent successful requests, so
+    a struggling service is not hit with every worker's retries at once.
+
+    Parameters:
+        message: The error message
+        code: The error code (defaults to 'RETRY_BUDGET_EXHAUSTED')
+        details: Additional error details, including the budget's `stats()` (optional)
+    """
+    def __init__(self, message: str, code: str = 'RETRY_BUDGET_EXHAUSTED', details: Optional[Dict[str, Any]] = None):
+        super().__init__(message, code, details)
+
 class ConflictError(NoteDxError):
     """
     Raised when a resource conflict occurs (HTTP 409).
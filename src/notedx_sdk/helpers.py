@@ -1,7 +1,8 @@
 import os
 import logging
 import requests
-from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional
 from .exceptions import (
     NoteDxError,
     AuthenticationError,
@@ -92,4 +93,38 @@ def build_headers(token: str = None, api_key: str = None) -> Dict[str, str]:
     elif api_key:
         headers["X-Api-Key"] = api_key
         
-    return headers
\ No newline at end of file
+    return headers
+
+
+def create_session(
+    api_base_url: str,
+    api_pool_size: int = 10,
+    storage_pool_size: int = 10,
+    session: Optional[requests.Session] = None
+) -> requests.Session:
+    """Create a pooled, keep-alive HTTP session for API and storage traffic.
+
+    Requests to the NoteDx API and uploads to presigned storage URLs live on
+    different hosts, so each gets its own connection pool. Connections are kept
+    alive and reused across status polls, note fetches and uploads instead of
+    paying a TCP+TLS handshake for every call.
+
+    Parameters:
+        api_base_url: Base URL of the NoteDx API (e.g. https://api.notedx.io/v1)
+        api_pool_size: Maximum number of pooled connections to the API host
+        storage_pool_size: Maximum number of pooled connections per storage host
+        session: Existing session to mount the adapters on (optional)
+
+    Returns:
+        The configured requests.Session
+    """
+    session = session or requests.Session()
+    storage_adapter = HTTPAdapter(pool_connections=storage_pool_size, pool_maxsize=storage_pool_size)
+    api_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=api_pool_size)
+
+    # Presigned upload URLs can point to any storage host, so they share the
+    # generic adapters. The API prefix is longer and therefore takes precedence.
+    session.mount("https://", storage_adapter)
+    session.mount("http://", storage_adapter)
+    session.mount(api_base_url.rstrip("/") + "/", api_adapter)
+    return session
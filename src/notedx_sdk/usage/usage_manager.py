@@ -100,6 +100,59 @@ class UsageManager:
                 f"Invalid {param_name} format: {month}. Must be in YYYY-MM format (e.g., 2024-01)"
             )
 
+    def _build_usage_params(self, start_month: Optional[str] = None, end_month: Optional[str] = None) -> Dict[str, str]:
+        """
+        Validate the requested period and build the query parameters for a usage request.
+
+        Args:
+            start_month (str, optional): Start month in YYYY-MM format
+            end_month (str, optional): End month in YYYY-MM format
+
+        Returns:
+            Dict of query parameters. Defaults to the current month if no range is given.
+
+        Raises:
+            ValidationError: If the date format or range is invalid
+        """
+        # Set default time period to current month if not specified
+        if not start_month and not end_month:
+            current_month = datetime.now(timezone.utc).strftime('%Y-%m')
+            start_month = current_month
+            end_month = current_month
+            self.logger.debug("No date range specified, defaulting to current month", 
+                            extra={'month': current_month})
+        
+        # Validate date formats if provided
+        if start_month:
+            self._validate_month_format(start_month, "start_month")
+        if end_month:
+            self._validate_month_format(end_month, "end_month")
+            
+        # Validate date range if both dates provided
+        if start_month and end_month and start_month > end_month:
+            raise ValidationError(
+                f"Invalid date range: start_month ({start_month}) must be <= end_month ({end_month})"
+            )
+
+        self.logger.debug(
+            "Retrieving usage statistics",
+            extra={
+                'date_range': {
+                    'start_month': start_month,
+                    'end_month': end_month
+                }
+            }
+        )
+
+        # Prepare query parameters
+        params = {}
+        if start_month:
+            params['start_month'] = start_month
+        if end_month:
+            params['end_month'] = end_month
+
+        return params
+
     def get(self, start_month: Optional[str] = None, end_month: Optional[str] = None) -> Dict[str, Any]:
         """
         Retrieve detailed usage statistics for the authenticated account.
@@ -192,42 +245,7 @@ class UsageManager:
             print(f"Subscription status: {billing['subscription_status']}")
             ```
         """
-        # Set default time period to current month if not specified
-        if not start_month and not end_month:
-            current_month = datetime.now(timezone.utc).strftime('%Y-%m')
-            start_month = current_month
-            end_month = current_month
-            self.logger.debug("No date range specified, defaulting to current month", 
-                            extra={'month': current_month})
-        
-        # Validate date formats if provided
-        if start_month:
-            self._validate_month_format(start_month, "start_month")
-        if end_month:
-            self._validate_month_format(end_month, "end_month")
-            
-        # Validate date range if both dates provided
-        if start_month and end_month and start_month > end_month:
-            raise ValidationError(
-                f"Invalid date range: start_month ({start_month}) must be <= end_month ({end_month})"
-            )
-
-        self.logger.debug(
-            "Retrieving usage statistics",
-            extra={
-                'date_range': {
-                    'start_month': start_month,
-                    'end_month': end_month
-                }
-            }
-        )
-
-        # Prepare query parameters
-        params = {}
-        if start_month:
-            params['start_month'] = start_month
-        if end_month:
-            params['end_month'] = end_month
+        params = self._build_usage_params(start_month, end_month)
 
         try:
             response = self._client._request("GET", "user/usage", params=params)
@@ -113,6 +113,57 @@ class WebhookManager:
                 f"Production webhook URLs must use HTTPS: {url}"
             )
 
+    def _build_webhook_data(
+        self,
+        webhook_dev: Optional[str] = None,
+        webhook_prod: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate webhook URLs and build the request body for an update.
+
+        Args:
+            webhook_dev (str, optional): Development environment webhook URL
+            webhook_prod (str, optional): Production environment webhook URL
+
+        Returns:
+            Dict with only the webhook URLs that were provided
+
+        Raises:
+            ValidationError: If URLs are invalid or don't meet security requirements
+            InvalidFieldError: If no URLs provided to update
+        """
+        # Validate input
+        if webhook_dev is None and webhook_prod is None:
+            self.logger.error("No webhook URLs provided for update")
+            raise InvalidFieldError(
+                "webhook_urls",
+                "At least one webhook URL must be provided"
+            )
+
+        # Validate URLs if provided
+        try:
+            if webhook_dev is not None:
+                self._validate_webhook_url(webhook_dev)
+                
+            if webhook_prod is not None:
+                self._validate_webhook_url(webhook_prod, require_https=True)
+        except ValidationError as e:
+            self.logger.error(
+                "Invalid webhook URL format",
+                extra={'error': str(e)},
+                exc_info=True
+            )
+            raise
+
+        # Prepare update data
+        data = {}
+        if webhook_dev is not None:
+            data['webhook_dev'] = webhook_dev
+        if webhook_prod is not None:
+            data['webhook_prod'] = webhook_prod
+
+        return data
+
     def get_webhook_settings(self) -> Dict[str, Any]:
         """
         Retrieve current webhook configuration settings.
@@ -248,35 +299,7 @@ class WebhookManager:
         # Verify Firebase auth
         self._check_firebase_auth()
         
-        # Validate input
-        if webhook_dev is None and webhook_prod is None:
-            self.logger.error("No webhook URLs provided for update")
-            raise InvalidFieldError(
-                "webhook_urls",
-                "At least one webhook URL must be provided"
-            )
-
-        # Validate URLs if provided
-        try:
-            if webhook_dev is not None:
-                self._validate_webhook_url(webhook_dev)
-                
-            if webhook_prod is not None:
-                self._validate_webhook_url(webhook_prod, require_https=True)
-        except ValidationError as e:
-            self.logger.error(
-                "Invalid webhook URL format",
-                extra={'error': str(e)},
-                exc_info=True
-            )
-            raise
-
-        # Prepare update data
-        data = {}
-        if webhook_dev is not None:
-            data['webhook_dev'] = webhook_dev
-        if webhook_prod is not None:
-            data['webhook_prod'] = webhook_prod
+        data = self._build_webhook_data(webhook_dev, webhook_prod)
 
         try:
             response = self._client._request("POST", "user/webhook", data=data)
@@ -1,9 +1,28 @@
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pytest
 from unittest.mock import Mock, patch
 from src.notedx_sdk import NoteDxClient
+from src.notedx_sdk.core import retry
 
 TEST_BASE_URL = "https://api.notedx.io/v1"
 
+@pytest.fixture(autouse=True)
+def checkpoint_dir(tmp_path, monkeypatch):
+    """Keep upload checkpoints and the upload index written by tests out of the home directory."""
+    directory = tmp_path / "checkpoints"
+    monkeypatch.setenv("NOTEDX_CHECKPOINT_DIR", str(directory))
+    monkeypatch.setenv("NOTEDX_DEDUP_INDEX", str(tmp_path / "uploads.json"))
+    return directory
+
+@pytest.fixture(autouse=True)
+def fresh_retry_budget(monkeypatch):
+    """Give each test a default process-wide retry budget, untouched by earlier tests."""
+    budget = retry.RetryBudget()
+    monkeypatch.setattr(retry, "_retry_budget", budget)
+    return budget
+
 @pytest.fixture
 def api_key():
     return "test-api-key"
@@ -41,4 +60,110 @@ def mock_job_id():
 
 @pytest.fixture
 def mock_presigned_url():
-    return "https://storage.example.com/test-file.mp3?token=xyz" 
\ No newline at end of file
+    return "https://storage.example.com/test-file.mp3?token=xyz" 
+
+class StorageServer:
+    """Local stand-in for presigned-URL object storage.
+
+    `PUT` stores the body under the request path (without the query) and returns its MD5 as ETag,
+    `POST` records the body (e.g. a multipart completion). `fail[path] = n`
+    answers the next `n` requests for `path` with a 500, `reject[path] = n`
+    answers the next `n` `PUT`s with a 403 "Request has expired", and
+    `corrupt[path] = n` flips a byte of the next `n` bodies stored at `path`.
+    `puts[path]` counts the `PUT` requests received for `path`.
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self.posts = {}
+        self.headers = {}
+        self.fail = {}
+        self.reject = {}
+        self.corrupt = {}
+        self.puts = {}
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            @property
+            def key(self):
+                # Objects are stored by path; the query holds the URL signature
+                return self.path.split("?", 1)[0]
+
+            def _body(self):
+                if self.headers.get("Transfer-Encoding") == "chunked":
+                    body = b""
+                    while True:
+                        size = int(self.rfile.readline().strip(), 16)
+                        if size == 0:
+                            self.rfile.readline()
+                            return body
+                        body += self.rfile.read(size)
+                        self.rfile.readline()
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+            def _reply(self, status, headers=None, body=b""):
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _take(self, counters):
+                with server.lock:
+                    if counters.get(self.key, 0) > 0:
+                        counters[self.key] -= 1
+                        return True
+                return False
+
+            def _should_fail(self):
+                return self._take(server.fail)
+
+            def do_PUT(self):
+                body = self._body()
+                with server.lock:
+                    server.puts[self.key] = server.puts.get(self.key, 0) + 1
+                if self._take(server.reject):
+                    return self._reply(403, body=b"<Error><Code>AccessDenied</Code><Message>Request has expired</Message></Error>")
+                if self._should_fail():
+                    return self._reply(500)
+                if body and self._take(server.corrupt):
+                    body = bytes([body[0] ^ 0xFF]) + body[1:]
+                with server.lock:
+                    server.objects[self.key] = body
+                    server.headers[self.key] = dict(self.headers)
+                self._reply(200, {"ETag": f'"{hashlib.md5(body).hexdigest()}"'})
+
+            def do_POST(self):
+                body = self._body()
+                if self._should_fail():
+                    return self._reply(500)
+                with server.lock:
+                    server.posts[self.key] = body
+                self._reply(200)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def storage_server():
+    """Run a local stand-in storage server for upload tests."""
+    server = StorageServer().start()
+    yield server
+    server.stop()
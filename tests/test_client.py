@@ -2,6 +2,9 @@ import pytest
 import requests
 from unittest.mock import Mock, patch
 from src.notedx_sdk import NoteDxClient
+from src.notedx_sdk.core.note_manager import NoteManager
+from src.notedx_sdk.core.ratelimit import RateLimit, RateLimiter
+from src.notedx_sdk.core.retry import RetryPolicy
 from src.notedx_sdk.exceptions import (
     NoteDxError,
     AuthenticationError,
@@ -478,8 +481,83 @@ class TestRequestHandling:
             client._request("GET", "test/endpoint")
         assert "API rate limit exceeded" in str(exc_info.value)
 
+    @patch('time.sleep')
     @patch('requests.Session.request')
-    def test_request_network_error(self, mock_request):
+    def test_request_retry_after(self, mock_request, mock_sleep):
+        """Test 503 and 429 responses are retried after the server's delay"""
+        unavailable = Mock(spec=requests.Response)
+        unavailable.status_code = 503
+        unavailable.headers = {'Retry-After': '2'}
+        unavailable.json.return_value = {"message": "Unavailable"}
+
+        limited = Mock(spec=requests.Response)
+        limited.status_code = 429
+        limited.headers = {'X-RateLimit-Reset': '4'}
+        limited.json.return_value = {"message": "Rate limit exceeded"}
+
+        mock_success = Mock(spec=requests.Response)
+        mock_success.status_code = 200
+        mock_success.json.return_value = {"data": "success"}
+
+        mock_request.side_effect = [unavailable, limited, mock_success]
+
+        client = NoteDxClient(api_key="test-api-key", auto_login=False)
+        assert client._request("GET", "test/endpoint") == {"data": "success"}
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [2.0, 4.0]
+
+    @patch('time.sleep')
+    @patch('requests.Session.request')
+    def test_request_retry_policies(self, mock_request, mock_sleep):
+        """Test connection errors are retried per the endpoint's policy"""
+        mock_request.side_effect = requests.ConnectionError("Connection reset")
+        client = NoteDxClient(
+            api_key="test-api-key",
+            auto_login=False,
+            retry_policies={"user/account": RetryPolicy(max_retries=2, jitter=False)}
+        )
+        with pytest.raises(NetworkError):
+            client._request("GET", "user/account/info")
+        assert mock_request.call_count == 3
+        # POSTs that may have reached the server are not resent
+        mock_request.reset_mock()
+        with pytest.raises(NetworkError):
+            client._request("POST", "user/webhook")
+        assert mock_request.call_count == 1
+
+    @patch('time.sleep')
+    @patch('requests.Session.request')
+    def test_request_rate_limiter(self, mock_request, mock_sleep):
+        """Test requests wait for their turn, and a 429 holds the endpoint class until its reset"""
+        limited = Mock(spec=requests.Response)
+        limited.status_code = 429
+        limited.headers = {'Retry-After': '5'}
+        limited.json.return_value = {"message": "Rate limit exceeded"}
+
+        mock_success = Mock(spec=requests.Response)
+        mock_success.status_code = 200
+        mock_success.json.return_value = {"data": "success"}
+
+        mock_request.side_effect = [mock_success, limited, mock_success]
+
+        now = [1000.0]
+        mock_sleep.side_effect = lambda seconds: now.__setitem__(0, now[0] + seconds)
+        client = NoteDxClient(
+            api_key="test-api-key",
+            auto_login=False,
+            retry_policy=RetryPolicy(max_retries=0),
+            rate_limiter=RateLimiter({"other": RateLimit(2)})
+        )
+        with patch('time.time', side_effect=lambda: now[0]):
+            client._request("GET", "user/account/info")
+            with pytest.raises(RateLimitError):
+                client._request("GET", "user/account/info")
+            client._request("GET", "user/account/info")
+        # Half a second for its turn, then until the reset of the 429
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, pytest.approx(5.0)]
+
+    @patch('time.sleep')
+    @patch('requests.Session.request')
+    def test_request_network_error(self, mock_request, mock_sleep):
         """Test handling of network errors"""
         mock_request.side_effect = requests.ConnectionError("Connection failed")
 
@@ -488,8 +566,9 @@ class TestRequestHandling:
             client._request("GET", "test/endpoint")
         assert "Connection error" in str(exc_info.value)
 
+    @patch('time.sleep')
     @patch('requests.Session.request')
-    def test_request_timeout(self, mock_request):
+    def test_request_timeout(self, mock_request, mock_sleep):
         """Test handling of request timeouts"""
         mock_request.side_effect = requests.Timeout("Request timed out")
 
@@ -756,3 +835,16 @@ class TestUtilityMethods:
         client.set_api_key("new-api-key")
         assert client._api_key == "new-api-key"
 
+
+    def test_close(self):
+        """Test closing stops the note manager and only closes a session the client created"""
+        with NoteDxClient(api_key="test-api-key", auto_login=False) as client:
+            pass
+        custom = Mock(spec=requests.Session)
+        with patch.object(NoteManager, 'close') as close_notes:
+            with patch.object(client.session, 'close') as close_session:
+                client.close()
+            NoteDxClient(api_key="test-api-key", session=custom, auto_login=False).close()
+        assert close_notes.call_count == 2
+        close_session.assert_called_once()
+        custom.close.assert_not_called()
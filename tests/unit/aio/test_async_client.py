@@ -0,0 +1,345 @@
+import asyncio
+import json
+import threading
+import time
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from src.notedx_sdk.aio import AsyncNoteDxClient
+from src.notedx_sdk.core.note_manager import NoteManager
+from src.notedx_sdk.core.ratelimit import RateLimit, RateLimiter
+from src.notedx_sdk.core.retry import RetryPolicy
+from src.notedx_sdk.exceptions import (
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    NetworkError,
+)
+
+
+API = "https://api.notedx.io/v1"
+
+
+def make_client(handler, **kwargs):
+    """Create an AsyncNoteDxClient whose HTTP traffic is served by `handler`."""
+    kwargs.setdefault("api_key", "test-api-key")
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncNoteDxClient(http_client=http_client, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def clear_env(monkeypatch):
+    for var in ("NOTEDX_EMAIL", "NOTEDX_PASSWORD", "NOTEDX_API_KEY", "NOTEDX_API_URL"):
+        monkeypatch.delenv(var, raising=False)
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "visit.mp3"
+    path.write_bytes(b"ID3" + b"\x00" * 4096)
+    return str(path)
+
+
+class TestAsyncNoteDxClient:
+    def test_requires_credentials(self):
+        with pytest.raises(AuthenticationError):
+            AsyncNoteDxClient(http_client=httpx.AsyncClient())
+
+    def test_managers_exist(self):
+        client = make_client(lambda request: httpx.Response(200, json={}))
+        for name in ("notes", "usage", "keys", "webhooks", "account"):
+            assert getattr(client, name) is not None
+
+    def test_fetch_status(self):
+        def handler(request):
+            assert request.url == f"{API}/status/job-123"
+            assert request.headers["x-api-key"] == "test-api-key"
+            return httpx.Response(200, json={"job_id": "job-123", "status": "completed"})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.notes.fetch_status("job-123")
+
+        assert asyncio.run(run())["status"] == "completed"
+
+    def test_process_audio_streams_upload(self, audio_file):
+        uploaded = {}
+
+        def handler(request):
+            if request.url.host == "storage.example.com":
+                uploaded["body"] = request.read()
+                uploaded["headers"] = request.headers
+                return httpx.Response(200)
+            assert request.url == f"{API}/process-audio"
+            payload = json.loads(request.content)
+            assert payload["file_extension"] == ".mp3"
+            assert payload["template"] == "primaryCare"
+            return httpx.Response(200, json={
+                "job_id": "job-123",
+                "presigned_url": "https://storage.example.com/upload"
+            })
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.notes.process_audio(
+                    file_path=audio_file,
+                    visit_type="initialEncounter",
+                    recording_type="dictation",
+                    template="primaryCare",
+                    chunk_size=1024
+                )
+
+        result = asyncio.run(run())
+        assert result["job_id"] == "job-123"
+        with open(audio_file, "rb") as f:
+            assert uploaded["body"] == f.read()
+        assert uploaded["headers"]["Content-Type"] == "audio/mpeg"
+        assert uploaded["headers"]["Content-Length"] == "4099"
+
+    def test_rejected_upload_url(self, audio_file):
+        jobs = []
+        puts = []
+
+        def handler(request):
+            if request.url.host == "storage.example.com":
+                puts.append(request.url.path)
+                if request.url.path == "/job-0":
+                    return httpx.Response(403, text="<Error><Message>Request has expired</Message></Error>")
+                return httpx.Response(200)
+            jobs.append(f"job-{len(jobs)}")
+            return httpx.Response(200, json={
+                "job_id": jobs[-1],
+                "presigned_url": f"https://storage.example.com/{jobs[-1]}"
+            })
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.notes.process_audio(file_path=audio_file, template="wfw")
+
+        assert asyncio.run(run())["job_id"] == "job-1"
+        assert puts == ["/job-0", "/job-1"]
+
+    def test_upload_bandwidth(self, audio_file):
+        pieces = []
+
+        def handler(request):
+            if request.url.host == "storage.example.com":
+                pieces.extend(len(piece) for piece in request.stream)
+                return httpx.Response(200)
+            return httpx.Response(200, json={
+                "job_id": "job-123",
+                "presigned_url": "https://storage.example.com/upload"
+            })
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.notes.process_audio(file_path=audio_file, template="wfw")
+
+        NoteManager.set_upload_bandwidth(4096, burst=0)
+        started = time.monotonic()
+        try:
+            asyncio.run(run())
+        finally:
+            NoteManager.set_upload_bandwidth(None)
+        # 4099 bytes at 4KB/s, without a burst
+        assert time.monotonic() - started >= 0.9
+        assert sum(pieces) == 4099
+
+    def test_process_audio_keeps_file_work_off_loop(self, audio_file, monkeypatch):
+        threads = {}
+        validate = NoteManager._validate_audio_file
+
+        def validate_audio_file(manager, file_path, *args, **kwargs):
+            threads["validate"] = threading.get_ident()
+            return validate(manager, file_path, *args, **kwargs)
+
+        def handler(request):
+            if request.url.host == "storage.example.com":
+                request.read()
+                return httpx.Response(200)
+            return httpx.Response(200, json={
+                "job_id": "job-123",
+                "presigned_url": "https://storage.example.com/upload"
+            })
+
+        def on_progress(progress):
+            threads.setdefault("progress", set()).add(threading.get_ident())
+
+        async def run():
+            threads["loop"] = threading.get_ident()
+            async with make_client(handler) as client:
+                return await client.notes.process_audio(
+                    file_path=audio_file, template="wfw", chunk_size=1024, on_progress=on_progress
+                )
+
+        monkeypatch.setattr(NoteManager, "_validate_audio_file", validate_audio_file)
+        asyncio.run(run())
+        # Validation, reads and the checksum fed by them run on executor threads
+        assert threads["validate"] != threads["loop"]
+        assert threads["progress"] and threads["loop"] not in threads["progress"]
+
+    @pytest.mark.parametrize("as_async_iter", [False, True])
+    def test_process_audio_stream(self, as_async_iter):
+        data = b"ID3" + b"\x01" * 3000
+        uploaded = {}
+
+        def handler(request):
+            if request.url.host == "storage.example.com":
+                uploaded["body"] = request.read()
+                return httpx.Response(200)
+            return httpx.Response(200, json={
+                "job_id": "job-123",
+                "presigned_url": "https://storage.example.com/upload"
+            })
+
+        async def chunks():
+            for i in range(0, len(data), 1000):
+                yield data[i:i + 1000]
+
+        async def run():
+            async with make_client(handler) as client:
+                source = chunks() if as_async_iter else memoryview(data)
+                return await client.notes.process_audio_stream(source, format="mp3", template="wfw")
+
+        assert asyncio.run(run())["job_id"] == "job-123"
+        assert uploaded["body"] == data
+
+    def test_concurrent_jobs(self):
+        def handler(request):
+            job_id = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"job_id": job_id, "status": "processing"})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await asyncio.gather(*[
+                    client.notes.fetch_status(f"job-{i}") for i in range(50)
+                ])
+
+        results = asyncio.run(run())
+        assert [r["job_id"] for r in results] == [f"job-{i}" for i in range(50)]
+
+    def test_fetch_merged_transcript(self):
+        def handler(request):
+            job_id = request.url.path.rsplit("/", 1)[1]
+            return httpx.Response(200, json={"job_id": job_id, "transcript": f"{job_id} text"})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.notes.fetch_merged_transcript(["job-2", "job-1"])
+
+        merged = asyncio.run(run())
+        assert merged["transcript"] == "job-2 text\n\njob-1 text"
+        assert merged["job_ids"] == ["job-2", "job-1"]
+
+    def test_list_api_keys(self):
+        def handler(request):
+            assert request.url.path == "/v1/user/list-api-keys"
+            assert request.url.params["showFull"] == "true"
+            return httpx.Response(200, json=[{"key": "sk_test_****1234"}])
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.keys.list_api_keys(show_full=True)
+
+        assert asyncio.run(run()) == [{"key": "sk_test_****1234"}]
+
+    def test_lazy_login(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if request.url.path == "/v1/auth/login":
+                return httpx.Response(200, json={
+                    "user_id": "user-1", "id_token": "token", "refresh_token": "refresh"
+                })
+            assert request.headers["Authorization"] == "Bearer token"
+            return httpx.Response(200, json={"company_name": "Acme"})
+
+        async def run():
+            async with make_client(handler, api_key=None, email="a@b.c", password="pw") as client:
+                return await client.account.get_account()
+
+        assert asyncio.run(run())["company_name"] == "Acme"
+        assert calls == ["/v1/auth/login", "/v1/user/account/info"]
+
+    @pytest.mark.parametrize("status,body,headers,error", [
+        (404, {"message": "Not found"}, {}, NotFoundError),
+        (429, {"message": "Slow down"}, {"X-RateLimit-Reset": "60"}, RateLimitError),
+    ])
+    def test_error_mapping(self, status, body, headers, error):
+        def handler(request):
+            return httpx.Response(status, json=body, headers=headers)
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.usage.get()
+
+        with pytest.raises(error):
+            asyncio.run(run())
+
+    def test_retry_after(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                return httpx.Response(429, json={"message": "Slow down"}, headers={"Retry-After": "0.05"})
+            return httpx.Response(200, json={"status": "completed"})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.notes.fetch_status("job-123"), await client.usage.get()
+
+        started = time.monotonic()
+        assert asyncio.run(run())[0] == {"status": "completed"}
+        assert time.monotonic() - started >= 0.05
+        assert calls == ["/v1/status/job-123", "/v1/status/job-123", "/v1/user/usage"]
+
+    def test_rate_limiter(self):
+        sent = []
+
+        def handler(request):
+            sent.append((request.url.path, time.monotonic()))
+            return httpx.Response(200, json={"status": "completed"})
+
+        async def run():
+            limiter = RateLimiter({"status": RateLimit(20), "other": RateLimit(20)})
+            async with make_client(handler, rate_limiter=limiter) as client:
+                await asyncio.gather(*(client.notes.fetch_status(f"job-{i}") for i in range(3)))
+                await client.usage.get()
+
+        asyncio.run(run())
+        status_times = [at for path, at in sent if path.startswith("/v1/status/")]
+        # Concurrent status polls share a bucket and go out 50ms apart
+        assert status_times[-1] - status_times[0] >= 0.09
+        assert len(sent) == 4
+
+    def test_connection_error(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            raise httpx.ConnectError("refused", request=request)
+
+        async def run():
+            async with make_client(handler, retry_policy=RetryPolicy(backoff=0)) as client:
+                await client.usage.get()
+
+        with pytest.raises(NetworkError):
+            asyncio.run(run())
+        assert len(calls) == 4
+
+
+class TestSyncFacade:
+    def test_blocking_calls(self):
+        def handler(request):
+            return httpx.Response(200, json={"job_id": "job-123", "status": "completed"})
+
+        client = make_client(handler)
+        try:
+            assert client.sync.notes.fetch_status("job-123")["status"] == "completed"
+            assert client.sync.keys.list_api_keys() == {"job_id": "job-123", "status": "completed"}
+            assert client.sync.base_url == API
+        finally:
+            client.close()
@@ -0,0 +1,223 @@
+import os
+import wave
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.notedx_sdk.core.audio import (
+    AudioFormat,
+    SPEECH_FORMAT,
+    SilenceTrimmer,
+    SpeechConverter,
+    decode_samples,
+    encode_samples,
+    preprocess_audio,
+    quietest_point,
+    split_audio,
+)
+
+RATE = 16000
+
+
+def tone(seconds, rate=RATE, channels=1, amplitude=10000, frequency=440):
+    t = np.arange(int(seconds * rate)) / rate
+    samples = (np.sin(2 * np.pi * frequency * t) * amplitude).astype('<i2')
+    return np.repeat(samples[:, None], channels, axis=1)
+
+
+def silence(seconds, rate=RATE, channels=1):
+    return np.zeros((int(seconds * rate), channels), dtype='<i2')
+
+
+def write_wav(path, samples, rate=RATE):
+    with wave.open(str(path), 'wb') as w:
+        w.setnchannels(samples.shape[1])
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(samples.tobytes())
+
+
+def read_wav(path):
+    with wave.open(str(path), 'rb') as w:
+        return decode_samples(w.readframes(w.getnframes()), AudioFormat(w.getframerate(), w.getnchannels(), 2))
+
+
+@pytest.mark.parametrize("width", [1, 2, 3, 4])
+def test_sample_codec_round_trip(width):
+    audio_format = AudioFormat(RATE, 2, width)
+    data = os.urandom(audio_format.frame_size * 50)
+    assert encode_samples(decode_samples(data, audio_format), audio_format) == data
+
+
+class TestSilenceTrimmer:
+    def _trim(self, samples, block, **kwargs):
+        trimmer = SilenceTrimmer(AudioFormat(RATE, samples.shape[1], 2), **kwargs)
+        out = [trimmer.process(samples[i:i + block]) for i in range(0, len(samples), block)]
+        return np.concatenate(out + [trimmer.flush()]), trimmer
+
+    @pytest.mark.parametrize("block", [333, 4096, 10 * RATE])
+    def test_long_silence_is_shortened(self, block):
+        speech = tone(1)
+        samples = np.concatenate([speech, silence(3), speech])
+
+        out, trimmer = self._trim(samples, block, keep_silence=0.25)
+
+        assert len(out) == 2 * RATE + RATE // 2
+        assert trimmer.removed_frames == len(samples) - len(out)
+        assert np.array_equal(out[:RATE], speech)
+        assert np.array_equal(out[-RATE:], speech)
+
+    def test_short_silence_is_kept(self):
+        samples = np.concatenate([tone(1), silence(0.5), tone(1)])
+        out, trimmer = self._trim(samples, 4096, min_silence=1.0)
+        assert np.array_equal(out, samples)
+        assert trimmer.removed_frames == 0
+
+    def test_quiet_speech_above_threshold_is_kept(self):
+        samples = np.concatenate([tone(1), tone(2, amplitude=500), tone(1)])
+        out, _ = self._trim(samples, 4096, threshold_db=-40)
+        assert len(out) == len(samples)
+
+
+class TestSpeechConverter:
+    def _convert(self, samples, audio_format, block):
+        converter = SpeechConverter(audio_format)
+        out = [converter.process(samples[i:i + block]) for i in range(0, len(samples), block)]
+        return np.concatenate(out + [converter.flush()]), converter
+
+    @pytest.mark.parametrize("rate", [48000, 44100, 22050])
+    def test_downmix_and_resample(self, rate):
+        samples = tone(2, rate=rate, channels=2)
+
+        out, converter = self._convert(samples, AudioFormat(rate, 2, 2), 4096)
+
+        assert converter.format == SPEECH_FORMAT
+        assert out.shape == (int(round(len(samples) * RATE / rate)), 1)
+        expected = tone(2, rate=RATE)[:len(out), 0].astype(float)
+        assert np.abs(out[100:-100, 0] - expected[100:-100]).max() < 50
+
+    def test_output_does_not_depend_on_blocks(self):
+        samples = (np.random.default_rng(0).normal(size=(48000, 2)) * 3000).astype('<i2')
+        audio_format = AudioFormat(48000, 2, 2)
+        whole, _ = self._convert(samples, audio_format, len(samples))
+        blocks, _ = self._convert(samples, audio_format, 777)
+        assert np.array_equal(whole, blocks)
+
+    def test_removes_frequencies_above_output_nyquist(self):
+        samples = tone(1, rate=48000, frequency=12000)
+        out, _ = self._convert(samples, AudioFormat(48000, 1, 2), 4096)
+        assert np.abs(out[100:-100]).max() < 200
+
+    def test_never_upgrades_format(self):
+        converter = SpeechConverter(AudioFormat(8000, 1, 1))
+        samples = decode_samples(os.urandom(800), AudioFormat(8000, 1, 1))
+        assert converter.format == AudioFormat(8000, 1, 1)
+        assert np.array_equal(converter.process(samples), samples)
+
+    def test_reduces_sample_width(self):
+        converter = SpeechConverter(AudioFormat(16000, 1, 4))
+        samples = np.array([[1 << 30], [-(1 << 31)]], dtype='<i4')
+        assert converter.process(samples).tolist() == [[1 << 14], [-(1 << 15)]]
+
+
+def test_preprocess_to_speech_format(tmp_path):
+    source = tmp_path / "visit.wav"
+    target = tmp_path / "speech.wav"
+    write_wav(source, tone(3, rate=48000, channels=2), rate=48000)
+
+    result = preprocess_audio(str(source), str(target), speech_format=SPEECH_FORMAT)
+
+    with wave.open(str(target), 'rb') as w:
+        assert (w.getframerate(), w.getnchannels(), w.getsampwidth()) == (16000, 1, 2)
+        assert w.getnframes() == 3 * RATE
+    assert result.input_bytes / result.output_bytes == pytest.approx(6, rel=0.01)
+    assert result.cpu_seconds >= 0
+
+
+def test_preprocess_wav(tmp_path):
+    source = tmp_path / "visit.wav"
+    target = tmp_path / "trimmed.wav"
+    write_wav(source, np.concatenate([silence(2, channels=2), tone(1, channels=2), silence(5, channels=2)]))
+
+    result = preprocess_audio(str(source), str(target), trim_silence=True, block_seconds=0.5)
+
+    assert result.output_bytes == os.path.getsize(target)
+    assert result.bytes_saved == result.input_bytes - result.output_bytes
+    assert result.removed_seconds == pytest.approx(6.5)
+    assert len(read_wav(target)) == RATE * 3 // 2
+    assert result.to_dict()["bytes_saved"] == RATE * 13 // 2 * 4
+
+
+def test_preprocess_pcm_uses_default_layout(tmp_path):
+    source = tmp_path / "visit.pcm"
+    target = tmp_path / "trimmed.pcm"
+    source.write_bytes(np.concatenate([tone(1), silence(4)]).tobytes())
+
+    result = preprocess_audio(str(source), str(target), trim_silence=True)
+
+    assert result.bytes_saved == int(3.75 * RATE) * 2
+    assert target.read_bytes() == np.concatenate([tone(1), silence(0.25)]).tobytes()
+
+
+def test_preprocess_rejects_compressed_audio(tmp_path):
+    source = tmp_path / "visit.mp3"
+    source.write_bytes(b"ID3")
+    with pytest.raises(ValueError):
+        preprocess_audio(str(source), str(tmp_path / "out.mp3"), trim_silence=True)
+
+
+def test_quietest_point_prefers_longest_silence():
+    samples = np.concatenate([tone(1), silence(0.2), tone(1), silence(0.6), tone(1)])
+    cut = quietest_point(samples, AudioFormat(RATE, 1, 2))
+    assert abs(cut - int(2.5 * RATE)) <= 0.02 * RATE
+
+
+def test_quietest_point_without_silence():
+    samples = np.concatenate([tone(1), tone(0.2, amplitude=1000), tone(1)])
+    cut = quietest_point(samples, AudioFormat(RATE, 1, 2))
+    assert RATE <= cut < 1.2 * RATE
+
+
+class TestSplitAudio:
+    def test_cuts_balanced_segments_at_silences(self, tmp_path):
+        # 24s of speech with a pause every 2s, in segments of at most 10s
+        samples = np.concatenate([np.concatenate([tone(1.7), silence(0.3)]) for _ in range(12)])
+        source = tmp_path / "long.wav"
+        write_wav(source, samples)
+        max_bytes = 10 * RATE * 2 + 44
+        segments = split_audio(str(source), str(tmp_path), max_bytes, search_seconds=2.5)
+
+        assert [os.path.basename(segment.path) for segment in segments] == [
+            f"long.part{index}.wav" for index in range(1, 5)
+        ]
+        parts = [read_wav(segment.path) for segment in segments]
+        assert np.array_equal(np.concatenate(parts), samples)
+        for segment, part in zip(segments, parts):
+            assert os.path.getsize(segment.path) <= max_bytes
+            assert segment.duration == len(part) / RATE
+            assert 4.5 <= segment.duration <= 7.5
+        # Every cut falls inside a pause
+        for segment in segments[1:]:
+            assert 1.7 <= segment.start % 2 <= 2.0
+
+    def test_file_under_limit_is_one_segment(self, tmp_path):
+        source = tmp_path / "short.wav"
+        write_wav(source, tone(1))
+        segments = split_audio(str(source), str(tmp_path), 10 * 1024 * 1024)
+        assert len(segments) == 1
+        assert np.array_equal(read_wav(segments[0].path), tone(1))
+
+    def test_pcm(self, tmp_path):
+        samples = np.concatenate([tone(2), silence(0.5), tone(2)])
+        source = tmp_path / "raw.pcm"
+        source.write_bytes(samples.tobytes())
+        segments = split_audio(str(source), str(tmp_path), 3 * RATE * 2, search_seconds=1)
+        assert len(segments) == 2
+        assert abs(segments[1].start - 2.25) <= 0.02
+        assert b"".join(open(segment.path, 'rb').read() for segment in segments) == samples.tobytes()
+
+    def test_rejects_compressed_audio(self, tmp_path):
+        source = tmp_path / "visit.flac"
+        source.write_bytes(b"fLaC")
+        with pytest.raises(ValueError, match="only WAV and PCM"):
+            split_audio(str(source), str(tmp_path), 1024)
@@ -0,0 +1,70 @@
+import threading
+from concurrent.futures import Future
+import pytest
+from src.notedx_sdk.core.background import UploadControl, UploadHandle
+from src.notedx_sdk.core.uploads import UploadProgress
+from src.notedx_sdk.exceptions import UploadCancelledError, UploadError
+
+
+def test_pause_blocks_until_resumed():
+    control = UploadControl("job")
+    control.pause()
+    passed = threading.Event()
+    thread = threading.Thread(target=lambda: (control.check(), passed.set()))
+    thread.start()
+    assert not passed.wait(0.05)
+    control.resume()
+    assert passed.wait(1)
+    thread.join()
+
+
+def test_cancel_wakes_a_paused_upload():
+    control = UploadControl("job")
+    control.pause()
+    errors = []
+
+    def run():
+        try:
+            control.check()
+        except UploadCancelledError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    control.cancel()
+    thread.join(1)
+    assert not thread.is_alive()
+    assert errors[0].code == "UPLOAD_CANCELLED"
+    assert errors[0].details == {"job_id": "job"}
+    assert isinstance(errors[0], UploadError)
+
+
+def test_handle_state_and_progress():
+    reports = []
+    handle = UploadHandle("job", {"job_id": "job"}, total_bytes=100, on_progress=reports.append)
+    future = Future()
+    handle.start(future)
+    assert (handle.state, handle.done()) == ("uploading", False)
+    assert handle.progress().bytes_sent == 0 and handle.progress().total_bytes == 100
+
+    progress = UploadProgress("job", 40, 100, 10.0, 10.0, 6.0)
+    handle.report(progress)
+    assert handle.progress() is progress and reports == [progress]
+
+    handle.pause()
+    assert handle.state == "paused"
+    handle.resume()
+    future.set_result({"job_id": "job"})
+    assert (handle.state, handle.done()) == ("completed", True)
+    assert handle.wait() == {"job_id": "job"}
+
+
+@pytest.mark.parametrize("error,state", [(UploadCancelledError("job"), "cancelled"), (UploadError("boom"), "failed")])
+def test_handle_errors(error, state):
+    handle = UploadHandle("job", {"job_id": "job"})
+    future = Future()
+    handle.start(future)
+    future.set_exception(error)
+    assert handle.state == state
+    with pytest.raises(type(error)):
+        handle.wait()
@@ -0,0 +1,59 @@
+import threading
+import time
+import pytest
+from src.notedx_sdk.core.bandwidth import BandwidthLimiter, upload_limiter
+
+
+def test_unlimited_by_default():
+    limiter = BandwidthLimiter()
+    assert not limiter.limited
+    started = time.monotonic()
+    limiter.acquire(100 * 1024 * 1024)
+    assert limiter.reserve(1024) == 0.0
+    assert time.monotonic() - started < 0.05
+    assert not upload_limiter().limited
+
+
+def test_rate_after_burst():
+    limiter = BandwidthLimiter(rate=1024 * 1024, quantum=64 * 1024)
+    started = time.monotonic()
+    limiter.acquire(64 * 1024)  # the burst goes out at once
+    assert time.monotonic() - started < 0.05
+    limiter.acquire(256 * 1024)
+    assert 0.2 < time.monotonic() - started < 0.5
+
+
+def test_concurrent_uploads_share_the_cap():
+    limiter = BandwidthLimiter(rate=64 * 1024, quantum=1024)
+    order = []
+
+    def upload(name):
+        for _ in range(8):
+            limiter.acquire(1024)
+            order.append(name)
+
+    threads = [threading.Thread(target=upload, args=(name,)) for name in "ab"]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - started > 0.2  # 15 quanta after the burst, at 1/64s each
+    # Quanta are granted in turn: neither upload gets ahead by more than a quantum or two
+    assert all(abs(order[:n].count("a") - order[:n].count("b")) <= 2 for n in range(len(order)))
+
+
+def test_rate_changes_at_runtime():
+    limiter = BandwidthLimiter(rate=1024, quantum=1024)
+    limiter.reserve(1024)
+    assert limiter.reserve(1024) == pytest.approx(1.0, abs=0.05)
+    limiter.set_rate(2048)  # the second KB is now paid in half the time
+    assert limiter.reserve(1024) == pytest.approx(1.0, abs=0.05)
+    limiter.set_rate(None)
+    assert limiter.reserve(1024 * 1024) == 0.0
+    limiter.set_rate(1024, burst=0)
+    assert limiter.reserve(1024) == pytest.approx(1.0, abs=0.05)
+    with pytest.raises(ValueError):
+        limiter.set_rate(0)
+    with pytest.raises(ValueError):
+        limiter.set_rate(1024, burst=-1)
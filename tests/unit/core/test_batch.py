@@ -0,0 +1,89 @@
+import threading
+import time
+import pytest
+from src.notedx_sdk.core.batch import BatchPipeline, Stage
+
+
+def stage(name, run=None, workers=2):
+    def wrapped(result, stop):
+        result.context.setdefault("stages", []).append(name)
+        if run is not None:
+            run(result, stop)
+    return Stage(name, wrapped, workers)
+
+
+def test_items_go_through_every_stage():
+    results = list(BatchPipeline([stage("a"), stage("b"), stage("c")], max_inflight=4).run(range(20)))
+    assert sorted(result.index for result in results) == list(range(20))
+    assert all(result.ok and result.context["stages"] == ["a", "b", "c"] for result in results)
+    assert all(result.item == result.index for result in results)
+
+
+def test_failed_item_skips_later_stages():
+    def fail_odd(result, stop):
+        if result.item % 2:
+            raise ValueError("odd")
+
+    results = {r.index: r for r in BatchPipeline([stage("a", fail_odd), stage("b")]).run(range(6))}
+    assert [results[i].ok for i in range(6)] == [True, False] * 3
+    assert results[1].stage == "a" and results[1].context["stages"] == ["a"]
+    assert isinstance(results[1].error, ValueError)
+    assert results[0].stage == "b"
+
+
+def test_results_stream_in_completion_order():
+    def slow_first(result, stop):
+        time.sleep(0.2 if result.item == 0 else 0)
+
+    results = list(BatchPipeline([stage("a", slow_first, workers=4)], max_inflight=4).run(range(4)))
+    assert results[-1].index == 0
+
+
+def test_inflight_items_are_bounded():
+    inflight = []
+    lock = threading.Lock()
+    current = [0]
+
+    def enter(result, stop):
+        with lock:
+            current[0] += 1
+            inflight.append(current[0])
+        time.sleep(0.01)
+
+    pipeline = BatchPipeline([stage("a", enter, workers=8), stage("b", workers=8)], max_inflight=3)
+    for _ in pipeline.run(range(30)):
+        with lock:
+            current[0] -= 1
+    assert max(inflight) <= 3
+
+
+def test_items_are_read_lazily():
+    consumed = []
+
+    def items():
+        for n in range(1000):
+            consumed.append(n)
+            yield n
+
+    results = BatchPipeline([stage("a")], max_inflight=2).run(items())
+    next(results)
+    results.close()
+    assert len(consumed) <= 5
+
+
+def test_input_error_is_raised_after_admitted_items():
+    def items():
+        yield 1
+        raise RuntimeError("bad source")
+
+    results = BatchPipeline([stage("a")]).run(items())
+    assert next(results).item == 1
+    with pytest.raises(RuntimeError, match="bad source"):
+        next(results)
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        BatchPipeline([])
+    with pytest.raises(ValueError):
+        BatchPipeline([stage("a")], max_inflight=0)
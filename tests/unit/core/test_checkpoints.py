@@ -0,0 +1,88 @@
+import os
+import stat
+import time
+from src.notedx_sdk.core.checkpoints import (
+    UploadCheckpoint,
+    default_checkpoint_dir,
+    file_fingerprint,
+    prune_expired,
+    FINGERPRINT_SAMPLE_SIZE,
+)
+
+
+def test_default_checkpoint_dir_from_env(checkpoint_dir, monkeypatch):
+    assert default_checkpoint_dir() == str(checkpoint_dir)
+    # Checkpoints hold upload URLs: they are only written when asked for
+    monkeypatch.delenv("NOTEDX_CHECKPOINT_DIR")
+    assert default_checkpoint_dir() is None
+
+
+def test_file_fingerprint(tmp_path):
+    a = tmp_path / "a.wav"
+    b = tmp_path / "b.wav"
+    a.write_bytes(b"x" * (3 * FINGERPRINT_SAMPLE_SIZE))
+    b.write_bytes(b"x" * (3 * FINGERPRINT_SAMPLE_SIZE - 1) + b"y")
+
+    assert file_fingerprint(str(a)) == file_fingerprint(str(a))
+    assert file_fingerprint(str(a)) != file_fingerprint(str(b))
+
+
+class TestUploadCheckpoint:
+    def test_roundtrip(self, tmp_path):
+        audio = tmp_path / "visit.wav"
+        audio.write_bytes(b"audio")
+        response = {"job_id": "job-1", "presigned_url": "https://example.com"}
+
+        checkpoint = UploadCheckpoint.create(str(tmp_path / "cp"), "job-1", str(audio), response, multipart=True)
+        checkpoint.mark_part(2, '"etag-2"')
+
+        loaded = UploadCheckpoint.load(str(tmp_path / "cp"), "job-1", str(audio))
+        assert loaded.response == response
+        assert loaded.multipart is True
+        assert loaded.completed_parts == {2: '"etag-2"'}
+
+        loaded.delete()
+        assert UploadCheckpoint.load(str(tmp_path / "cp"), "job-1", str(audio)) is None
+
+    def test_keyed_by_file_content(self, tmp_path):
+        audio = tmp_path / "visit.wav"
+        audio.write_bytes(b"audio")
+        UploadCheckpoint.create(str(tmp_path), "job-1", str(audio), {})
+
+        audio.write_bytes(b"other")
+        assert UploadCheckpoint.load(str(tmp_path), "job-1", str(audio)) is None
+
+    def test_private_to_owner(self, tmp_path):
+        audio = tmp_path / "visit.wav"
+        audio.write_bytes(b"audio")
+        checkpoint = UploadCheckpoint.create(str(tmp_path / "cp"), "job-1", str(audio), {})
+
+        assert stat.S_IMODE(os.stat(checkpoint.path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(tmp_path / "cp").st_mode) & 0o077 == 0
+
+    def test_expired_checkpoints_are_pruned(self, tmp_path):
+        audio = tmp_path / "visit.wav"
+        audio.write_bytes(b"audio")
+        now = int(time.time())
+        expired = UploadCheckpoint.create(
+            str(tmp_path), "job-1", str(audio), {"presigned_url": f"https://storage/job-1?Expires={now - 10}"}
+        )
+        live = UploadCheckpoint.create(
+            str(tmp_path), "job-2", str(audio), {"multipart": {"part_urls": [f"https://storage/job-2?Expires={now + 3600}"]}}
+        )
+        unknown = UploadCheckpoint.create(str(tmp_path), "job-3", str(audio), {"presigned_url": "https://storage/job-3"})
+
+        assert expired.expired and not live.expired and not unknown.expired
+        assert prune_expired(str(tmp_path)) == 1
+        assert not os.path.exists(expired.path)
+        assert os.path.exists(live.path) and os.path.exists(unknown.path)
+
+    def test_corrupt_checkpoint_is_ignored(self, tmp_path):
+        audio = tmp_path / "visit.wav"
+        audio.write_bytes(b"audio")
+        checkpoint = UploadCheckpoint.create(str(tmp_path), "job-1", str(audio), {})
+        with open(checkpoint.path, "w") as f:
+            f.write("{not json")
+
+        assert UploadCheckpoint.load(str(tmp_path), "job-1", str(audio)) is None
+        assert not os.path.exists(checkpoint.path + ".tmp")
@@ -0,0 +1,97 @@
+from unittest.mock import patch
+import pytest
+from src.notedx_sdk.core.circuit import CircuitBreaker, CircuitBreakers, endpoint_family
+from src.notedx_sdk.exceptions import ServiceUnavailableError
+
+
+@pytest.mark.parametrize("endpoint,family", [
+    ("process-audio", "process-audio"),
+    ("fetch-note/job-123", "fetch-note"),
+    ("/status/job-123", "status"),
+    ("user/account/info", "user/account"),
+    ("user/api-keys/sk_123/status", "user/api-keys"),
+    ("auth/login", "auth/login"),
+])
+def test_endpoint_family(endpoint, family):
+    assert endpoint_family(endpoint) == family
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with patch("time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+def test_opens_after_consecutive_failures(clock):
+    changes = []
+    circuit = CircuitBreaker("fetch-note", failure_threshold=3, recovery_timeout=30,
+                             on_state_change=lambda *change: changes.append(change))
+    circuit.record_failure()
+    circuit.record_failure()
+    circuit.record_response(404)  # the service answered: the streak is broken
+    circuit.record_failure()
+    circuit.record_failure()
+    circuit.allow()
+    assert circuit.state == "closed"
+    circuit.record_response(503)
+    assert circuit.state == "open"
+    clock[0] += 10
+    with pytest.raises(ServiceUnavailableError) as exc_info:
+        circuit.allow()
+    assert exc_info.value.code == "CIRCUIT_OPEN"
+    assert exc_info.value.details == {"endpoint_family": "fetch-note", "retry_after": 20.0}
+    assert changes == [("fetch-note", "closed", "open")]
+
+
+def test_half_open_trials(clock):
+    changes = []
+    circuit = CircuitBreaker("process-audio", failure_threshold=1, recovery_timeout=30, half_open_calls=2,
+                             on_state_change=lambda name, old, new: changes.append(new))
+    circuit.record_failure()
+    clock[0] += 30
+    assert circuit.state == "half_open"
+    circuit.allow()
+    circuit.allow()
+    with pytest.raises(ServiceUnavailableError):
+        circuit.allow()  # both trials are under way
+    circuit.record_success()
+    circuit.record_failure()
+    assert circuit.state == "open"
+
+    clock[0] += 30
+    circuit.allow()
+    circuit.allow()
+    circuit.record_success()
+    circuit.record_success()
+    assert circuit.state == "closed"
+    assert changes == ["open", "half_open", "open", "half_open", "closed"]
+
+
+def test_lost_trial_does_not_hold_circuit(clock):
+    circuit = CircuitBreaker("status", failure_threshold=1, recovery_timeout=5)
+    circuit.record_failure()
+    clock[0] += 5
+    circuit.allow()  # never reports back
+    with pytest.raises(ServiceUnavailableError):
+        circuit.allow()
+    clock[0] += 5
+    circuit.allow()
+
+
+def test_breakers_by_family(clock):
+    changes = []
+    breakers = CircuitBreakers(failure_threshold=1)
+    breakers.on_state_change(lambda *change: changes.append(change))
+    breakers.get("fetch-note/job-1").record_failure()
+    assert breakers.get("fetch-note/job-2").state == "open"
+    breakers.get("status/job-1").allow()
+    assert breakers.states() == {"fetch-note": "open", "status": "closed"}
+    breakers.reset()
+    assert breakers.states() == {"fetch-note": "closed", "status": "closed"}
+    assert changes == [("fetch-note", "closed", "open"), ("fetch-note", "open", "closed")]
+
+    disabled = CircuitBreakers(failure_threshold=1, enabled=False)
+    disabled.get("fetch-note/job-1").record_failure()
+    disabled.get("fetch-note/job-1").allow()
+    assert disabled.states() == {}
@@ -0,0 +1,85 @@
+import hashlib
+import os
+from src.notedx_sdk.core.checkpoints import FINGERPRINT_SAMPLE_SIZE
+from src.notedx_sdk.core.dedup import (
+    UploadIndex,
+    content_hash,
+    default_index_path,
+    params_key,
+)
+
+
+def test_default_index_path_from_env(tmp_path):
+    assert default_index_path() == str(tmp_path / "uploads.json")
+
+
+def test_content_hash(tmp_path):
+    audio = tmp_path / "visit.wav"
+    data = os.urandom(3 * 1024 * 1024 + 7)
+    audio.write_bytes(data)
+    assert content_hash(str(audio)) == hashlib.sha256(data).hexdigest()
+
+
+def test_params_key_ignores_unset_and_order():
+    assert params_key({"lang": "en", "visit_type": None, "a": 1}) == params_key({"a": 1, "lang": "en"})
+    assert params_key({"lang": "en"}) != params_key({"lang": "fr"})
+
+
+class TestUploadIndex:
+    def _record(self, index, audio, params, note_params, job_id="job-1"):
+        index.record(str(audio), params, content_hash(str(audio)), job_id, note_params, {
+            "job_id": job_id, "presigned_url": "https://storage.example.com/put", "status": "pending"
+        })
+
+    def test_lookup_after_record(self, tmp_path):
+        audio = tmp_path / "visit.wav"
+        audio.write_bytes(b"audio")
+        index = UploadIndex(str(tmp_path / "uploads.json"))
+        self._record(index, audio, {"lang": "en"}, {"template": "er"})
+
+        entry = UploadIndex(str(tmp_path / "uploads.json")).lookup(str(audio), {"lang": "en"})
+
+        assert entry["job_id"] == "job-1"
+        assert entry["variants"][params_key({"template": "er"})] == {"job_id": "job-1", "status": "pending"}
+        assert index.lookup(str(audio), {"lang": "fr"}) is None
+
+    def test_changed_content_is_not_matched(self, tmp_path):
+        audio = tmp_path / "visit.wav"
+        data = bytearray(os.urandom(3 * FINGERPRINT_SAMPLE_SIZE))
+        audio.write_bytes(bytes(data))
+        index = UploadIndex(str(tmp_path / "uploads.json"))
+        self._record(index, audio, {}, {})
+
+        # Same size, first and last megabyte: the fingerprint matches, the content hash does not
+        data[FINGERPRINT_SAMPLE_SIZE + 10] ^= 0xFF
+        audio.write_bytes(bytes(data))
+
+        assert index.lookup(str(audio), {}) is None
+
+    def test_expired_and_evicted_entries(self, tmp_path):
+        index = UploadIndex(str(tmp_path / "uploads.json"), max_entries=2)
+        files = []
+        for n in range(3):
+            audio = tmp_path / f"visit{n}.wav"
+            audio.write_bytes(b"audio %d" % n)
+            self._record(index, audio, {}, {}, job_id=f"job-{n}")
+            files.append(audio)
+
+        assert index.lookup(str(files[0]), {}) is None
+        assert index.lookup(str(files[2]), {})["job_id"] == "job-2"
+
+        index.max_age = -1
+        assert index.lookup(str(files[2]), {}) is None
+
+    def test_forget_and_corrupt_index(self, tmp_path):
+        audio = tmp_path / "visit.wav"
+        audio.write_bytes(b"audio")
+        path = tmp_path / "uploads.json"
+        index = UploadIndex(str(path))
+        self._record(index, audio, {}, {})
+
+        index.forget(index.key_for(str(audio), {}))
+        assert index.lookup(str(audio), {}) is None
+
+        path.write_text("{not json")
+        assert index.lookup(str(audio), {}) is None
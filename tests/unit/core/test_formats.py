@@ -0,0 +1,195 @@
+import os
+import struct
+import wave
+from io import BytesIO
+import pytest
+from src.notedx_sdk.core.formats import (
+    HEADER_SIZE,
+    container_mismatch,
+    detect_container,
+    inspect_audio,
+    probe_audio,
+)
+
+
+@pytest.mark.parametrize("header,expected", [
+    (b"RIFF\x24\x00\x00\x00WAVEfmt ", "wav"),
+    (b"RF64\xff\xff\xff\xffWAVEds64", "wav"),
+    (b"RIFF\x24\x00\x00\x00AVI LIST", None),
+    (b"fLaC\x00\x00\x00\x22", "flac"),
+    (b"OggS\x00\x02\x00\x00", "ogg"),
+    (b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81", "webm"),
+    (b"\x00\x00\x00\x20ftypM4A \x00\x00", "mp4"),
+    (b"ID3\x04\x00\x00\x00\x00", "id3"),
+    (b"\xff\xfb\x90\x64\x00\x00", "mpeg"),
+    (b"\xff\xf1\x50\x80\x02\x1f", "aac"),
+    (b"ADIF\x00\x00\x00\x00", "aac"),
+    (b"<html>", None),
+    (b"", None),
+])
+def test_detect_container(header, expected):
+    assert detect_container(header) == expected
+
+
+@pytest.mark.parametrize("extension,container,ok", [
+    (".wav", "wav", True),
+    (".mp3", "id3", True),
+    (".mp3", "mpeg", True),
+    (".flac", "id3", True),
+    (".opus", "ogg", True),
+    (".wav", "mpeg", False),
+    (".m4a", None, False),
+    (".pcm", None, True),
+    (".pcm", "wav", False),
+    (".unknown", None, True),
+])
+def test_container_mismatch(extension, container, ok):
+    assert (container_mismatch(extension, container) is None) == ok
+
+
+def test_container_mismatch_names_detected_format():
+    assert container_mismatch(".wav", "ogg") == "File extension is .wav, but the data is Ogg"
+
+
+class TestInspectAudio:
+    data = b"fLaC" + bytes(range(256)) * 4
+
+    def test_path(self, tmp_path):
+        audio = tmp_path / "visit.flac"
+        audio.write_bytes(self.data)
+        info = inspect_audio(str(audio))
+        assert (info.size, info.header, info.container) == (len(self.data), self.data[:HEADER_SIZE], "flac")
+
+    def test_directory_is_not_found(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            inspect_audio(tmp_path)
+
+    def test_fd_keeps_position(self, tmp_path):
+        audio = tmp_path / "visit.flac"
+        audio.write_bytes(self.data)
+        fd = os.open(audio, os.O_RDONLY)
+        try:
+            os.lseek(fd, 10, os.SEEK_SET)
+            assert inspect_audio(fd).container == "flac"
+            assert os.lseek(fd, 0, os.SEEK_CUR) == 10
+        finally:
+            os.close(fd)
+
+    def test_file_object_from_current_position(self):
+        source = BytesIO(b"junk" + self.data)
+        source.seek(4)
+        info = inspect_audio(source)
+        assert (info.size, info.container) == (len(self.data), "flac")
+        assert source.tell() == 4
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_in_memory(self, wrap):
+        info = inspect_audio(wrap(self.data), header_size=8)
+        assert (info.size, info.header, info.container) == (len(self.data), self.data[:8], "flac")
+
+    def test_unsupported_source(self):
+        with pytest.raises(TypeError):
+            inspect_audio(3.5)
+
+
+def box(kind, payload=b""):
+    return struct.pack(">I", 8 + len(payload)) + kind + payload
+
+
+def ogg_page(serial, granule, packet=b"", header_type=0):
+    return (b"OggS" + bytes([0, header_type]) + struct.pack("<q", granule) + serial
+            + b"\x00" * 8 + bytes([1, len(packet)]) + packet)
+
+
+MPEG_FRAME = b"\xff\xfb\x90\x00"  # MPEG-1 layer III, 128kbps, 44.1kHz, stereo
+
+
+class TestProbeAudio:
+    def test_wav(self, tmp_path):
+        audio = tmp_path / "visit.wav"
+        with wave.open(str(audio), "wb") as w:
+            w.setnchannels(2)
+            w.setsampwidth(2)
+            w.setframerate(16000)
+            w.writeframes(b"\x00" * 4 * 24000)
+        probe = probe_audio(str(audio))
+        assert probe == ("wav", 96044, 1.5, 16000, 2)
+
+    def test_wav_without_data_size(self, tmp_path):
+        audio = tmp_path / "visit.wav"
+        with wave.open(str(audio), "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(8000)
+            w.writeframes(b"\x00" * 16000)
+        data = bytearray(audio.read_bytes())
+        data[40:44] = b"\x00" * 4  # as left by a recorder that was interrupted
+        assert probe_audio(bytes(data)).duration == 1.0
+
+    def test_mp3_constant_bitrate(self):
+        data = b"ID3\x04\x00\x00\x00\x00\x00\x20" + b"\x00" * 0x20 + MPEG_FRAME + b"\x00" * 15996
+        assert probe_audio(data) == ("id3", len(data), 1.0, 44100, 2)
+
+    @pytest.mark.parametrize("header", [
+        b"\x00" * 32 + b"Xing" + struct.pack(">II", 1, 100),
+        b"\x00" * 32 + b"VBRI" + b"\x00" * 10 + struct.pack(">I", 100),
+    ])
+    def test_mp3_variable_bitrate(self, header):
+        data = MPEG_FRAME + header + b"\x00" * 1000
+        probe = probe_audio(data)
+        assert probe.duration == pytest.approx(100 * 1152 / 44100)
+        assert (probe.container, probe.sample_rate, probe.channels) == ("mpeg", 44100, 2)
+
+    def test_flac(self):
+        fields = (44100 << 44) | (1 << 41) | (15 << 36) | 88200
+        streaminfo = b"\x10\x00\x10\x00" + b"\x00" * 6 + fields.to_bytes(8, "big") + b"\x00" * 16
+        data = b"fLaC\x80\x00\x00\x22" + streaminfo + b"\x00" * 100
+        assert probe_audio(data) == ("flac", len(data), 2.0, 44100, 2)
+
+    def test_ogg_opus(self):
+        serial = b"\x01\x02\x03\x04"
+        head = b"OpusHead\x01\x02" + struct.pack("<HI", 312, 16000) + b"\x00\x00\x00"
+        data = (ogg_page(serial, 0, head, header_type=2) + ogg_page(serial, 96312, b"\x00" * 50)
+                + ogg_page(b"\x09\x09\x09\x09", 10 ** 9) + ogg_page(serial, 144312, header_type=4))
+        assert probe_audio(data) == ("ogg", len(data), 3.0, 16000, 2)
+
+    def test_ogg_vorbis(self):
+        serial = b"\x05\x06\x07\x08"
+        head = b"\x01vorbis" + struct.pack("<IBI", 0, 1, 44100) + b"\x00" * 16
+        data = ogg_page(serial, 0, head, header_type=2) + ogg_page(serial, 88200, header_type=4)
+        assert probe_audio(data) == ("ogg", len(data), 2.0, 44100, 1)
+
+    def test_mp4_with_moov_at_end(self):
+        mvhd = box(b"mvhd", b"\x00" * 12 + struct.pack(">II", 1000, 2500) + b"\x00" * 80)
+        hdlr = box(b"hdlr", b"\x00" * 8 + b"soun" + b"\x00" * 12)
+        mp4a = box(b"mp4a", b"\x00" * 16 + struct.pack(">HHHHI", 2, 16, 0, 0, 44100 << 16))
+        stsd = box(b"stsd", struct.pack(">II", 0, 1) + mp4a)
+        trak = box(b"trak", box(b"mdia", hdlr + box(b"minf", box(b"stbl", stsd))))
+        data = box(b"ftyp", b"M4A \x00\x00\x00\x00") + box(b"mdat", b"\x00" * 5000) + box(b"moov", mvhd + trak)
+        assert probe_audio(BytesIO(data)) == ("mp4", len(data), 2.5, 44100, 2)
+
+    def test_adts_has_no_duration(self):
+        data = b"\xff\xf1\x50\x80\x02\x1f\xfc" + b"\x00" * 100
+        assert probe_audio(data) == ("aac", len(data), None, 44100, 2)
+
+    def test_pcm_path(self, tmp_path):
+        audio = tmp_path / "visit.pcm"
+        audio.write_bytes(b"\x01\x00" * 16000)
+        assert probe_audio(str(audio)) == ("pcm", 32000, 1.0, 16000, 1)
+
+    @pytest.mark.parametrize("data,container", [
+        (b"RIFF\x00\x00\x00\x00WAVE", "wav"),
+        (b"<html></html>", None),
+    ])
+    def test_unreadable_headers(self, data, container):
+        assert probe_audio(data) == (container, len(data), None, None, None)
+
+    def test_reads_only_headers(self, tmp_path):
+        audio = tmp_path / "visit.mp3"
+        audio.write_bytes(MPEG_FRAME + b"\x00" * (4 * 1024 * 1024))
+        reads = []
+        real_read = BytesIO.read
+        source = BytesIO(audio.read_bytes())
+        source.read = lambda count=-1: reads.append(count) or real_read(source, count)
+        assert probe_audio(source).duration == pytest.approx(4 * 1024 * 1024 * 8 / 128000, rel=1e-3)
+        assert sum(reads) < 16 * 1024
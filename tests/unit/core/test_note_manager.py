@@ -1,13 +1,26 @@
+import itertools
 import os
+import tempfile
+import threading
+import time
+import wave
 import pytest
 import logging
 import requests
-from unittest.mock import patch, mock_open, Mock, MagicMock
+from unittest.mock import patch, Mock, MagicMock
 from io import BytesIO
+from concurrent.futures import Future
+from src.notedx_sdk.core import audio as audio_module
+from src.notedx_sdk.core import note_manager as note_manager_module
 from src.notedx_sdk.core.note_manager import NoteManager
+from src.notedx_sdk.core.circuit import CircuitBreakers
+from src.notedx_sdk.core.ratelimit import RateLimit, RateLimiter
+from src.notedx_sdk.core.retry import RetryPolicy
 from src.notedx_sdk.exceptions import (
     ValidationError,
     UploadError,
+    UploadCancelledError,
+    UploadUrlRejectedError,
     JobNotFoundError,
     JobError,
     NotFoundError,
@@ -17,18 +30,48 @@ from src.notedx_sdk.exceptions import (
     PaymentRequiredError,
     RateLimitError,
     InternalServerError,
+    NoteDxError,
     NetworkError,
     MissingFieldError,
     InvalidFieldError,
+    RetryBudgetExhaustedError,
     ServiceUnavailableError
 )
 
+# Leading bytes of each container, so test files pass the content check
+AUDIO_HEADERS = {
+    ".wav": b"RIFF\x00\x00\x00\x00WAVE",
+    ".mp3": b"ID3\x04\x00",
+    ".m4a": b"\x00\x00\x00\x20ftypM4A ",
+    ".aac": b"\xff\xf1\x50\x80",
+    ".ogg": b"OggS\x00",
+    ".opus": b"OggS\x00",
+    ".webm": b"\x1a\x45\xdf\xa3",
+    ".flac": b"fLaC",
+}
+
+def audio_bytes(size, ext=".wav"):
+    """Random audio data of `size` bytes behind a valid `ext` header."""
+    header = AUDIO_HEADERS[ext]
+    return header + os.urandom(size - len(header))
+
+@pytest.fixture
+def audio_file(tmp_path):
+    """Write a test audio file and return its path."""
+    def write(name="test.wav", size=1024):
+        path = tmp_path / name
+        ext = os.path.splitext(name)[1]
+        path.write_bytes(audio_bytes(size, ext) if ext in AUDIO_HEADERS else b"x" * size)
+        return str(path)
+    return write
+
 @pytest.fixture
 def mock_client():
     """Create a mock client with test API key and base URL."""
     mock_client = Mock()
     mock_client._api_key = "test_api_key"
     mock_client.base_url = "https://api.notedx.com/v1"
+    mock_client.session = requests.Session()
     return mock_client
 
 @pytest.fixture
@@ -49,20 +92,39 @@ def test_request_retry_on_server_error(note_manager):
     success_response.json.return_value = {"status": "success"}
 
     # Mock requests.request to return error twice then success
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request, patch('time.sleep'):
         mock_request.side_effect = [error_response, error_response, success_response]
 
         result = note_manager._request("GET", "test/endpoint")
         assert result == {"status": "success"}
         assert mock_request.call_count == 3
 
+def test_request_uses_client_session(note_manager):
+    """Test that requests go through the client's pooled session."""
+    success_response = Mock()
+    success_response.status_code = 200
+    success_response.text = '{"status": "success"}'
+    success_response.json.return_value = {"status": "success"}
+
+    note_manager._client.session = Mock()
+    note_manager._client.session.request.return_value = success_response
+
+    with patch('requests.request') as module_request:
+        result = note_manager._request("GET", "status/test-job")
+        assert result == {"status": "success"}
+        module_request.assert_not_called()
+
+    args, kwargs = note_manager._client.session.request.call_args
+    assert args == ("GET", "https://api.notedx.com/v1/status/test-job")
+    assert kwargs["headers"]["x-api-key"] == "test_api_key"
+
 def test_request_max_retries_exceeded(note_manager):
     """Test behavior when max retries are exceeded."""
     error_response = Mock()
     error_response.status_code = 500
     error_response.text = "Server Error"
 
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request, patch('time.sleep'):
         mock_request.return_value = error_response
 
         with pytest.raises(InternalServerError) as exc_info:
@@ -77,11 +139,104 @@ def test_request_max_retries_exceeded(note_manager):
 ])
 def test_request_network_errors(note_manager, error, expected_exception, error_msg):
     """Test handling of various network errors."""
-    with patch('requests.request', side_effect=error):
+    with patch('requests.Session.request', side_effect=error), patch('time.sleep'):
         with pytest.raises(expected_exception) as exc_info:
             note_manager._request("GET", "test/endpoint")
         assert error_msg in str(exc_info.value)
 
+def api_response(status_code, headers=None, body=None):
+    """Mock API response with a status, headers and JSON body."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = str(body)
+    response.json.return_value = body
+    return response
+
+def test_request_honours_retry_after(note_manager):
+    """Test a 429 is retried after the delay the server asks for."""
+    responses = [api_response(429, {"Retry-After": "7"}), api_response(200, body={"status": "ok"})]
+    with patch('requests.Session.request', side_effect=responses), patch('time.sleep') as sleep:
+        assert note_manager._request("GET", "status/job-1") == {"status": "ok"}
+    sleep.assert_called_once_with(7.0)
+
+def test_request_rate_limit_wait_too_long(note_manager):
+    """Test a 429 asking for a longer wait than retry_max_delay is raised right away."""
+    response = api_response(429, {"Retry-After": "3600"}, "Slow down")
+    with patch('requests.Session.request', return_value=response) as mock_request:
+        with pytest.raises(RateLimitError) as exc_info:
+            note_manager._request("GET", "status/job-1")
+    assert mock_request.call_count == 1
+    assert exc_info.value.details["retry_after"] == 3600
+
+def test_job_creation_not_resent_after_server_error(note_manager):
+    """Test a POST that may have created a job is not resent, unlike one the server refused."""
+    with patch('requests.Session.request', return_value=api_response(500, body="boom")) as mock_request:
+        with pytest.raises(InternalServerError):
+            note_manager._request("POST", "process-audio", data={"template": "wfw"})
+    assert mock_request.call_count == 1
+
+    responses = [api_response(503), api_response(200, body={"job_id": "job-1"})]
+    with patch('requests.Session.request', side_effect=responses), patch('time.sleep'):
+        assert note_manager._request("POST", "process-audio", data={"template": "wfw"}) == {"job_id": "job-1"}
+
+def test_request_retries_connection_errors(note_manager):
+    """Test connection errors are retried with jittered backoff."""
+    responses = [requests.ConnectionError("reset"), requests.Timeout("slow"), api_response(200, body={"status": "ok"})]
+    with patch('requests.Session.request', side_effect=responses), patch('time.sleep') as sleep:
+        assert note_manager._request("GET", "status/job-1") == {"status": "ok"}
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert len(delays) == 2 and 0 <= delays[0] <= 1 and 0 <= delays[1] <= 2
+
+def test_retry_budget_fails_fast(note_manager):
+    """Test requests fail fast once the process-wide retry budget is spent."""
+    NoteManager.set_retry_budget(0.5, min_per_second=0)
+    ok = api_response(200, body={"status": "ok"})
+    with patch('requests.Session.request', side_effect=[ok, ok, api_response(503), ok, api_response(502)]) as mock_request, \
+            patch('time.sleep'):
+        note_manager._request("GET", "status/job-1")
+        note_manager._request("GET", "status/job-2")
+        # Two successes pay for one retry
+        assert note_manager._request("GET", "status/job-3") == {"status": "ok"}
+        with pytest.raises(RetryBudgetExhaustedError):
+            note_manager._request("GET", "status/job-4")
+    assert mock_request.call_count == 5
+    stats = NoteManager.retry_budget_stats()
+    assert (stats["successes"], stats["spent"], stats["denied"]) == (3, 1, 1)
+
+def test_circuit_breaker_refuses_failing_endpoint(note_manager):
+    """Test an endpoint family that keeps failing is refused without sending requests."""
+    note_manager._client.circuit_breakers = CircuitBreakers(failure_threshold=3)
+    with patch('requests.Session.request', side_effect=requests.Timeout("slow")) as mock_request, \
+            patch('time.sleep'):
+        with pytest.raises(ServiceUnavailableError) as exc_info:
+            note_manager._request("GET", "fetch-note/job-1")
+        assert exc_info.value.code == "CIRCUIT_OPEN"
+        assert mock_request.call_count == 3
+        with pytest.raises(ServiceUnavailableError):
+            note_manager._request("GET", "fetch-note/job-2")
+        assert mock_request.call_count == 3
+    with patch('requests.Session.request', return_value=api_response(200, body={"status": "ok"})):
+        assert note_manager._request("GET", "status/job-1") == {"status": "ok"}
+
+def test_rate_limiter_paces_status_polls(note_manager):
+    """Test requests wait for the client's rate limiter before being sent."""
+    note_manager._client.rate_limiter = RateLimiter({"status": RateLimit(1, per=5)})
+    with patch('requests.Session.request', return_value=api_response(200, body={"status": "ok"})), \
+            patch('time.time', return_value=1000.0), patch('time.sleep') as sleep:
+        for _ in range(3):
+            note_manager._request("GET", "status/job-1")
+        note_manager._request("GET", "fetch-note/job-1")
+    assert [call.args[0] for call in sleep.call_args_list] == [5.0, 10.0]
+
+def test_retry_policies_by_endpoint(note_manager):
+    """Test a policy configured for an endpoint prefix replaces the default one."""
+    note_manager._config['retry_policies'] = {'fetch-note': RetryPolicy(max_retries=0)}
+    with patch('requests.Session.request', return_value=api_response(503, body="down")) as mock_request:
+        with pytest.raises(InternalServerError):
+            note_manager._request("GET", "fetch-note/job-1")
+    assert mock_request.call_count == 1
+
 @pytest.mark.parametrize("status_code,expected_exception,response_text,expected_msg", [
     (400, BadRequestError, "Bad request", "Bad request"),
     (401, AuthenticationError, "Invalid API key", "Invalid API key: Invalid API key"),
@@ -97,12 +252,12 @@ def test_request_error_responses(note_manager, status_code, expected_exception,
     mock_response.text = response_text
     mock_response.json.return_value = {"error": response_text}
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response), patch('time.sleep'):
         with pytest.raises(expected_exception) as exc_info:
             note_manager._request("GET", "test/endpoint")
         assert expected_msg in str(exc_info.value)
 
-def test_process_audio_success(note_manager):
+def test_process_audio_success(note_manager, audio_file):
     """Test successful audio processing."""
     # Mock initial request response
     mock_response = Mock()
@@ -114,14 +269,10 @@ def test_process_audio_success(note_manager):
     mock_upload_response = Mock()
     mock_upload_response.status_code = 200
 
-    mock_file = mock_open(read_data=b'test audio data')
-    with patch('os.path.isfile', return_value=True), \
-         patch('os.path.getsize', return_value=1024 * 1024), \
-         patch('builtins.open', mock_file), \
-         patch('requests.request', return_value=mock_response), \
-         patch('requests.put', return_value=mock_upload_response):
+    with patch('requests.Session.request', return_value=mock_response), \
+         patch('requests.Session.put', return_value=mock_upload_response):
         result = note_manager.process_audio(
-            "test.wav",
+            audio_file("test.wav"),
             visit_type="initialEncounter",
             recording_type="dictation",
             template="primaryCare",
@@ -129,16 +280,704 @@ def test_process_audio_success(note_manager):
         )
         assert result == {"job_id": "test-job", "presigned_url": "https://example.com/upload"}
 
-def test_process_audio_upload_network_error(note_manager):
+def test_process_audio_streams_single_put(note_manager, tmp_path):
+    """Test the whole file is sent as one streamed request body."""
+    audio = tmp_path / "visit.mp3"
+    data = audio_bytes(3000, ".mp3")
+    audio.write_bytes(data)
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.text = '{"job_id": "test-job", "presigned_url": "https://example.com/upload"}'
+    mock_response.json.return_value = {"job_id": "test-job", "presigned_url": "https://example.com/upload"}
+
+    bodies = []
+    def fake_put(url, data=None, headers=None, timeout=None):
+        bodies.append(b"".join(data))
+        assert headers["Content-Length"] == "3000"
+        assert timeout == (note_manager._config['request_timeout'], note_manager._config['request_timeout'])
+        return Mock(status_code=200)
+
+    with patch('requests.Session.request', return_value=mock_response), \
+         patch('requests.Session.put', side_effect=fake_put) as mock_put:
+        note_manager.process_audio(
+            str(audio),
+            visit_type="initialEncounter",
+            recording_type="dictation",
+            template="primaryCare"
+        )
+    assert mock_put.call_count == 1
+    assert bodies == [data]
+
+def test_upload_retry_resends_whole_file(note_manager, tmp_path):
+    """Test a failed upload attempt rewinds the body before retrying."""
+    audio = tmp_path / "visit.wav"
+    audio.write_bytes(b"RIFF" + b"\x00" * 100)
+    note_manager._config['retry_delay'] = 0
+
+    bodies = []
+    def fake_put(url, data=None, headers=None, timeout=None):
+        bodies.append(b"".join(bytes(chunk) for chunk in data))
+        if len(bodies) == 1:
+            raise requests.ConnectionError("reset")
+        return Mock(status_code=200)
+
+    with patch('requests.Session.put', side_effect=fake_put):
+        note_manager._upload_file("https://example.com/upload", str(audio), "test-job")
+    assert bodies == [b"RIFF" + b"\x00" * 100] * 2
+
+def test_process_batch(note_manager, storage_server, audio_file, tmp_path):
+    """Test a batch runs through validation, creation, upload, wait and fetch, per item."""
+    paths = [audio_file(f"visit{n}.mp3") for n in range(5)]
+    items = paths + [{"file_path": str(tmp_path / "missing.mp3")}, {"file_path": paths[0], "template": "letter"}]
+    polls = {}
+    lock = threading.Lock()
+
+    def api(method, endpoint, data=None, **kwargs):
+        if endpoint == "process-audio":
+            with lock:
+                job_id = f"job-{len(polls)}"
+                polls[job_id] = 0
+            return {"job_id": job_id, "presigned_url": f"{storage_server.url}/{job_id}"}
+        job_id = endpoint.rsplit("/", 1)[1]
+        if endpoint.startswith("status/"):
+            with lock:
+                polls[job_id] += 1
+                return {"status": "completed" if polls[job_id] >= 2 else "transcribing"}
+        return {"note": f"note of {job_id}", "job_id": job_id}
+
+    with patch.object(note_manager, '_request', side_effect=api):
+        results = list(note_manager.process_batch(
+            items, max_inflight=3, poll_interval=0.01, template="wfw"
+        ))
+
+    assert sorted(result.index for result in results) == list(range(7))
+    failed = [result for result in results if not result.ok]
+    assert [(result.index, result.stage) for result in failed] == [(5, "validate"), (6, "validate")]
+    assert isinstance(failed[0].error, ValidationError)
+    assert isinstance(failed[1].error, MissingFieldError)  # letter needs a visit type
+    for result in results:
+        if result.ok:
+            assert result.stage == "fetch"
+            assert result.note == {"note": f"note of {result.job_id}", "job_id": result.job_id}
+            assert storage_server.objects[f"/{result.job_id}"] == open(paths[result.index], 'rb').read()
+            assert polls[result.job_id] == 2
+
+def test_process_batch_without_waiting(note_manager, audio_file):
+    """Test batch results can be yielded as soon as uploads finish."""
+    with patch.object(note_manager, '_request', return_value={"job_id": "job", "presigned_url": "https://example.com/upload"}) as mock_request, \
+         patch('requests.Session.put', return_value=Mock(status_code=200, headers={})):
+        results = list(note_manager.process_batch([audio_file("a.mp3")], wait=False, template="wfw"))
+    assert [(result.ok, result.stage) for result in results] == [(True, "upload")]
+    assert mock_request.call_count == 1
+
+@pytest.mark.parametrize("kwargs", [{"workers": {"transcode": 2}}, {"speed": "fast"}, {"max_inflight": 0}])
+def test_process_batch_rejects_invalid_options(note_manager, kwargs):
+    with pytest.raises(ValidationError):
+        note_manager.process_batch([], **kwargs)
+
+def test_job_slots(note_manager, storage_server, audio_file):
+    """Test jobs for following recordings are created while the current one uploads."""
+    created = []
+    lock = threading.Lock()
+
+    def api(method, endpoint, data=None, **kwargs):
+        with lock:
+            job_id = f"job-{len(created)}"
+            created.append(job_id)
+        return {"job_id": job_id, "presigned_url": f"{storage_server.url}/{job_id}"}
+
+    paths = [audio_file(f"visit{n}.mp3", size=1024 + n) for n in range(3)]
+    with patch.object(note_manager, '_request', side_effect=api):
+        with note_manager.job_slots(size=2) as pool:
+            job_ids = []
+            for path in paths:
+                job_ids.append(note_manager.process_audio(path, template="wfw")['job_id'])
+                # Let the background creation finish, as a long upload would
+                deadline = time.monotonic() + 2
+                while not pool.unused_jobs() and time.monotonic() < deadline:
+                    time.sleep(0.005)
+        assert note_manager._slot_pool is None
+        assert (pool.hits, pool.misses) == (2, 1)
+        note_manager.process_audio(audio_file("after.mp3", size=2048), template="wfw")
+
+    for job_id, path in zip(job_ids, paths):
+        assert storage_server.objects[f"/{job_id}"] == open(path, 'rb').read()
+    assert len(created) == 6  # three used, two left unused, one created on demand after the block
+
+def job_factory(storage_server, urls=None):
+    """`_request` stand-in creating numbered jobs, with upload URLs from `urls` when given."""
+    created = []
+
+    def api(method, endpoint, data=None, **kwargs):
+        job_id = f"job-{len(created)}"
+        created.append(data)
+        url = urls[len(created) - 1] if urls else f"{storage_server.url}/{job_id}"
+        return {"job_id": job_id, "presigned_url": url}
+
+    return api, created
+
+def test_rejected_upload_url_moves_to_new_job(note_manager, storage_server, audio_file, checkpoint_dir):
+    """Test a URL storage rejects is not retried, and the upload moves to a fresh job."""
+    path = audio_file("visit.mp3")
+    storage_server.reject["/job-0"] = 1
+    api, created = job_factory(storage_server)
+    with patch.object(note_manager, '_request', side_effect=api):
+        response = note_manager.process_audio(path, template="wfw")
+    assert response["job_id"] == "job-1"
+    assert storage_server.puts == {"/job-0": 1, "/job-1": 1}
+    assert storage_server.objects["/job-1"] == open(path, 'rb').read()
+    assert created[0] == created[1]
+    assert not os.listdir(checkpoint_dir)
+
+def test_expired_upload_url_is_not_used(note_manager, storage_server, audio_file):
+    """Test an upload URL that expired while queued gets a new job before any byte is sent."""
+    api, created = job_factory(storage_server, urls=[
+        f"{storage_server.url}/job-0?Expires={int(time.time()) - 60}",
+        f"{storage_server.url}/job-1?Expires={int(time.time()) + 900}"
+    ])
+    with patch.object(note_manager, '_request', side_effect=api):
+        response = note_manager.process_audio(audio_file("visit.mp3"), template="wfw")
+    assert response["job_id"] == "job-1"
+    assert storage_server.puts == {"/job-1": 1}
+
+def test_upload_url_refreshes_are_bounded(note_manager, storage_server, audio_file):
+    storage_server.reject.update({"/job-0": 1, "/job-1": 1})
+    api, created = job_factory(storage_server)
+    with patch.object(note_manager, '_request', side_effect=api):
+        with pytest.raises(UploadUrlRejectedError):
+            note_manager.process_audio(audio_file("visit.mp3"), template="wfw")
+    assert len(created) == 2
+    assert storage_server.puts == {"/job-0": 1, "/job-1": 1}
+
+def test_resume_upload_with_expired_url(note_manager, storage_server, audio_file, checkpoint_dir):
+    """Test resuming an upload whose URL has expired fails without sending anything, and drops its checkpoint."""
+    path = audio_file("visit.mp3")
+    storage_server.fail["/job-0"] = 3
+    api, _ = job_factory(storage_server, urls=[f"{storage_server.url}/job-0?Expires={int(time.time()) + 3600}"])
+    note_manager._config['retry_delay'] = 0
+    with patch.object(note_manager, '_request', side_effect=api):
+        with pytest.raises(UploadError):
+            note_manager.process_audio(path, template="wfw")
+    with patch('time.time', return_value=time.time() + 7200):
+        with pytest.raises(UploadUrlRejectedError):
+            note_manager.resume_upload("job-0", path)
+    assert sum(storage_server.puts.values()) == 3
+    assert not os.listdir(checkpoint_dir)
+
+@pytest.fixture
+def upload_bandwidth():
+    """Set the process-wide upload cap for a test, and lift it afterwards."""
+    yield NoteManager.set_upload_bandwidth
+    NoteManager.set_upload_bandwidth(None)
+
+@pytest.mark.parametrize("multipart", [False, True])
+def test_upload_bandwidth(note_manager, storage_server, audio_file, upload_bandwidth, multipart):
+    """Test uploads, single and multipart, are held to the process-wide cap."""
+    path = audio_file("visit.mp3", size=320 * 1024)
+    response = {"job_id": "job", "presigned_url": f"{storage_server.url}/job"}
+    if multipart:
+        response["multipart"] = {
+            "part_size": 160 * 1024,
+            "part_urls": [f"{storage_server.url}/part1", f"{storage_server.url}/part2"],
+            "complete_url": f"{storage_server.url}/complete"
+        }
+    upload_bandwidth(1024 * 1024)
+    started = time.monotonic()
+    with patch.object(note_manager, '_request', return_value=response):
+        note_manager.process_audio(path, template="wfw", multipart_upload=multipart)
+    # 256KB past the 64KB burst, at 1MB/s
+    assert time.monotonic() - started >= 0.24
+    if multipart:
+        assert storage_server.objects["/part1"] + storage_server.objects["/part2"] == open(path, 'rb').read()
+    else:
+        assert storage_server.objects["/job"] == open(path, 'rb').read()
+
+@pytest.fixture
+def paused_upload(note_manager, storage_server, audio_file):
+    """Start a background upload of 64KB and pause it at its first progress report."""
+    note_manager._config['progress_interval'] = 0
+    started = threading.Event()
+    handles = []
+    reports = []
+
+    def on_progress(progress):
+        reports.append(progress)
+        if len(reports) == 1:
+            started.wait(1)
+            handles[0].pause()
+
+    path = audio_file("visit.mp3", size=64 * 1024)
+    with patch.object(note_manager, '_request', return_value={
+        "job_id": "job", "presigned_url": f"{storage_server.url}/job"
+    }):
+        handle = note_manager.process_audio(
+            path, template="wfw", chunk_size=1024, on_progress=on_progress, background=True
+        )
+    handles.append(handle)
+    started.set()
+    deadline = time.monotonic() + 2
+    while handle.state != "paused" and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return handle, path
+
+def test_process_audio_in_background(paused_upload, storage_server, checkpoint_dir):
+    """Test a background upload returns its job right away and can be paused and resumed."""
+    handle, path = paused_upload
+    assert handle.job_id == "job"
+    assert handle.state == "paused"
+    sent = handle.progress().bytes_sent
+    time.sleep(0.05)
+    assert 0 < handle.progress().bytes_sent == sent < 64 * 1024
+
+    handle.resume()
+    assert handle.wait(timeout=5)["job_id"] == "job"
+    assert handle.state == "completed"
+    assert handle.progress().fraction == 1.0
+    assert storage_server.objects["/job"] == open(path, 'rb').read()
+    assert not os.listdir(checkpoint_dir)
+
+def test_cancel_background_upload(paused_upload, checkpoint_dir):
+    """Test a cancelled background upload stops, and keeps its checkpoint for resume_upload()."""
+    handle, _ = paused_upload
+    handle.cancel()
+    with pytest.raises(UploadCancelledError):
+        handle.wait(timeout=5)
+    assert handle.state == "cancelled"
+    assert len(os.listdir(checkpoint_dir)) == 1
+
+def test_close_cancels_background_uploads(note_manager, paused_upload, checkpoint_dir):
+    """Test closing the manager cancels unfinished uploads and stops its workers."""
+    handle, _ = paused_upload
+    executor = note_manager._background
+    note_manager.close()
+    assert handle.state == "cancelled"
+    assert executor._shutdown
+    assert note_manager._background is None and not note_manager._uploads
+    assert len(os.listdir(checkpoint_dir)) == 1
+
+def test_background_rejects_split_recordings(note_manager, audio_file, monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(note_manager_module, "MAX_AUDIO_SIZE", 512)
+    with patch.object(note_manager, '_request') as mock_request:
+        with pytest.raises(ValidationError, match="background"):
+            note_manager.process_audio(audio_file("long.wav"), template="wfw", background=True, split_oversized=True)
+    mock_request.assert_not_called()
+
+def test_probe_audio(note_manager, tmp_path):
+    """Test audio files are probed from their headers, without a request."""
+    audio = tmp_path / "visit.wav"
+    write_pauses_wav(audio, cycles=1)
+    with patch.object(note_manager, '_request') as mock_request:
+        assert note_manager.probe_audio(str(audio)) == {
+            "container": "wav", "size": 144044, "duration": 4.5, "sample_rate": 16000, "channels": 1
+        }
+        with pytest.raises(ValidationError, match="Audio file not found"):
+            note_manager.probe_audio(str(tmp_path / "missing.wav"))
+    mock_request.assert_not_called()
+
+def write_pauses_wav(path, cycles, speech_frames=64000, pause_frames=8000):
+    """16kHz mono WAV alternating loud audio and silence; returns its frames."""
+    frames = (b"\x00\x40" * speech_frames + b"\x00\x00" * pause_frames) * cycles
+    with wave.open(str(path), 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(16000)
+        w.writeframes(frames)
+    return frames
+
+def test_process_audio_splits_oversized_wav(note_manager, storage_server, tmp_path, monkeypatch):
+    """Test WAV recordings over the size limit are submitted as one job per segment, cut in pauses."""
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(note_manager_module, "MAX_AUDIO_SIZE", 100000 * 2 + 44)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    audio = tmp_path / "procedure.wav"
+    frames = write_pauses_wav(audio, cycles=4)
+    counter = itertools.count(1)
+
+    def create_job(method, endpoint, data=None, **kwargs):
+        n = next(counter)
+        return {"job_id": f"job-{n}", "presigned_url": f"{storage_server.url}/object/{n}"}
+
+    with patch.object(note_manager, '_request', side_effect=create_job) as mock_request:
+        result = note_manager.process_audio(str(audio), template="wfw", split_oversized=True)
+
+    segments = result["segments"]
+    assert len(segments) == mock_request.call_count == 4
+    assert result["job_ids"] == [segment["job_id"] for segment in segments]
+    assert result["job_id"] == segments[0]["job_id"]
+    uploads = [storage_server.objects[segment["presigned_url"][len(storage_server.url):]] for segment in segments]
+    assert all(len(upload) <= note_manager_module.MAX_AUDIO_SIZE for upload in uploads)
+    assert b"".join(upload[44:] for upload in uploads) == frames
+    # Each cut falls in a pause: 4s of audio then 0.5s of silence
+    assert [segment["start"] for segment in segments][0] == 0
+    assert all(4.0 <= segment["start"] % 4.5 <= 4.5 for segment in segments[1:])
+    assert sum(segment["duration"] for segment in segments) == pytest.approx(18)
+    assert not list(tmp_path.glob("notedx-split-*"))
+
+def test_split_recording_progress_and_failures(note_manager, storage_server, tmp_path, monkeypatch):
+    """Test segments report progress on the whole recording, and a failure lists the jobs already created."""
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(note_manager_module, "MAX_AUDIO_SIZE", 100000 * 2 + 44)
+    audio = tmp_path / "procedure.wav"
+    write_pauses_wav(audio, cycles=4)
+    counter = itertools.count(1)
+    reports = []
+
+    def create_job(method, endpoint, data=None, **kwargs):
+        n = next(counter)
+        return {"job_id": f"job-{n}", "presigned_url": f"{storage_server.url}/object/{n}"}
+
+    with patch.object(note_manager, '_request', side_effect=create_job):
+        note_manager.process_audio(str(audio), template="wfw", split_oversized=True, on_progress=reports.append)
+    uploaded = sum(len(body) for body in storage_server.objects.values())
+    assert {report.total_bytes for report in reports} == {uploaded}
+    assert [report.bytes_sent for report in reports] == sorted(report.bytes_sent for report in reports)
+    assert reports[-1].bytes_sent == uploaded
+
+    def create_job_failing(method, endpoint, data=None, **kwargs):
+        n = next(counter)
+        if n == 7:
+            raise InternalServerError("Server error")
+        return {"job_id": f"job-{n}", "presigned_url": f"{storage_server.url}/object/{n}"}
+
+    with patch.object(note_manager, '_request', side_effect=create_job_failing):
+        with pytest.raises(NoteDxError) as exc_info:
+            note_manager.process_audio(str(audio), template="wfw", split_oversized=True)
+    job_ids = exc_info.value.details["job_ids"]
+    assert len(job_ids) == 4 and job_ids.count(None) == 1
+    assert {job_id for job_id in job_ids if job_id} == {"job-5", "job-6", "job-8"}
+
+def test_process_audio_split_disabled(note_manager, tmp_path, monkeypatch):
+    """Test oversized recordings are rejected unless splitting is asked for and numpy is installed."""
+    monkeypatch.setattr(note_manager_module, "MAX_AUDIO_SIZE", 1000)
+    audio = tmp_path / "procedure.wav"
+    write_pauses_wav(audio, cycles=1)
+    with patch.object(note_manager, '_request') as mock_request:
+        with pytest.raises(ValidationError, match="File size exceeds 500MB limit"):
+            note_manager.process_audio(str(audio), template="wfw")
+        monkeypatch.setattr(audio_module, "np", None)
+        with pytest.raises(ValidationError, match="File size exceeds 500MB limit"):
+            note_manager.process_audio(str(audio), template="wfw", split_oversized=True)
+    mock_request.assert_not_called()
+
+@pytest.mark.parametrize("method,field", [
+    ("fetch_merged_transcript", "transcript"),
+    ("fetch_merged_note", "note"),
+])
+def test_fetch_merged_results_in_order(note_manager, method, field):
+    """Test the results of split jobs are joined in recording order."""
+    def fetch(method_name, endpoint, **kwargs):
+        job_id = endpoint.rsplit("/", 1)[1]
+        return {field: f"{job_id} text\n", "job_id": job_id, "note_title": f"{job_id} title"}
+
+    with patch.object(note_manager, '_request', side_effect=fetch):
+        merged = getattr(note_manager, method)(["job-2", "job-1", "job-3"])
+
+    assert merged[field] == "job-2 text\n\njob-1 text\n\njob-3 text"
+    assert merged["job_ids"] == ["job-2", "job-1", "job-3"]
+    assert [segment["job_id"] for segment in merged["segments"]] == ["job-2", "job-1", "job-3"]
+    assert ("note_title" in merged) == (field == "note")
+    with pytest.raises(MissingFieldError):
+        getattr(note_manager, method)([])
+
+@pytest.mark.parametrize("offer_multipart", [True, False])
+def test_process_audio_multipart_upload(note_manager, storage_server, tmp_path, offer_multipart):
+    """Test multipart upload is used when offered, with streaming PUT as fallback."""
+    audio = tmp_path / "visit.wav"
+    data = audio_bytes(5000)
+    audio.write_bytes(data)
+
+    response = {"job_id": "test-job", "presigned_url": f"{storage_server.url}/object"}
+    if offer_multipart:
+        response["multipart"] = {
+            "part_urls": [f"{storage_server.url}/part/{n}" for n in (1, 2, 3)],
+            "part_size": 2000,
+            "complete_url": f"{storage_server.url}/complete"
+        }
+
+    with patch.object(note_manager, '_request', return_value=response) as mock_request:
+        note_manager.process_audio(
+            str(audio),
+            visit_type="initialEncounter",
+            recording_type="dictation",
+            template="primaryCare",
+            multipart_upload=True
+        )
+
+    job_data = mock_request.call_args.kwargs["data"]
+    assert job_data["multipart"] is True
+    assert job_data["file_size"] == 5000
+    if offer_multipart:
+        assert b"".join(storage_server.objects[f"/part/{n}"] for n in (1, 2, 3)) == data
+        assert "/complete" in storage_server.posts
+    else:
+        assert storage_server.objects["/object"] == data
+
+@pytest.mark.parametrize("offer_multipart", [True, False])
+def test_process_audio_reports_progress(note_manager, storage_server, tmp_path, offer_multipart):
+    """Test on_progress receives a final report covering the whole file."""
+    audio = tmp_path / "visit.wav"
+    audio.write_bytes(audio_bytes(5000))
+    response = {"job_id": "test-job", "presigned_url": f"{storage_server.url}/object"}
+    if offer_multipart:
+        response["multipart"] = {
+            "part_urls": [f"{storage_server.url}/part/{n}" for n in (1, 2, 3)],
+            "part_size": 2000,
+            "complete_url": f"{storage_server.url}/complete"
+        }
+    reports = []
+
+    with patch.object(note_manager, '_request', return_value=response):
+        note_manager.process_audio(
+            str(audio),
+            template="wfw",
+            multipart_upload=offer_multipart,
+            on_progress=reports.append
+        )
+
+    assert reports
+    assert reports[-1].job_id == "test-job"
+    assert reports[-1].bytes_sent == reports[-1].total_bytes == 5000
+    assert reports[-1].eta == 0
+
+def test_process_audio_trim_silence(note_manager, storage_server, tmp_path):
+    """Test a silence-trimmed copy is uploaded and the savings reported."""
+    np = pytest.importorskip("numpy")
+    import wave
+    audio = tmp_path / "visit.wav"
+    speech = (np.sin(np.arange(16000) / 3) * 8000).astype('<i2')
+    with wave.open(str(audio), 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(16000)
+        w.writeframes(np.concatenate([speech, np.zeros(64000, '<i2'), speech]).tobytes())
+    original = audio.read_bytes()
+    response = {"job_id": "test-job", "presigned_url": f"{storage_server.url}/object"}
+
+    with patch.object(note_manager, '_request', return_value=response), \
+            patch('src.notedx_sdk.core.note_manager.os.remove', wraps=os.remove) as remove:
+        result = note_manager.process_audio(str(audio), template="wfw", trim_silence=True)
+
+    uploaded = storage_server.objects["/object"]
+    assert result["preprocessing"]["bytes_saved"] == len(original) - len(uploaded) == 3.5 * 16000 * 2
+    assert audio.read_bytes() == original
+    temp_path = remove.call_args.args[0]
+    assert temp_path != str(audio) and not os.path.exists(temp_path)
+
+def test_process_audio_speech_profile(note_manager, storage_server, tmp_path):
+    """Test stereo 48kHz audio is uploaded as mono 16kHz."""
+    np = pytest.importorskip("numpy")
+    import io
+    import wave
+    audio = tmp_path / "visit.wav"
+    with wave.open(str(audio), 'wb') as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(48000)
+        w.writeframes((np.sin(np.arange(96000) / 5) * 8000).astype('<i2').repeat(2).tobytes())
+    response = {"job_id": "test-job", "presigned_url": f"{storage_server.url}/object"}
+
+    with patch.object(note_manager, '_request', return_value=response):
+        result = note_manager.process_audio(str(audio), template="wfw", speech_profile=True)
+
+    with wave.open(io.BytesIO(storage_server.objects["/object"]), 'rb') as w:
+        assert (w.getframerate(), w.getnchannels(), w.getnframes()) == (16000, 1, 32000)
+    assert result["preprocessing"]["output_bytes"] == len(storage_server.objects["/object"])
+
+def test_process_audio_trim_silence_skips_compressed_audio(note_manager, storage_server, tmp_path, caplog):
+    """Test formats that cannot be trimmed are uploaded unchanged."""
+    audio = tmp_path / "visit.mp3"
+    audio.write_bytes(b"ID3" + b"\x00" * 100)
+    response = {"job_id": "test-job", "presigned_url": f"{storage_server.url}/object"}
+
+    with patch.object(note_manager, '_request', return_value=response):
+        result = note_manager.process_audio(str(audio), template="wfw", trim_silence=True)
+
+    assert storage_server.objects["/object"] == audio.read_bytes()
+    assert "preprocessing" not in result
+    assert "Skipping audio preprocessing" in caplog.text
+
+def test_process_audio_deduplicates_submissions(note_manager, storage_server, tmp_path):
+    """Test identical submissions reuse the job and template changes regenerate the note."""
+    audio = tmp_path / "visit.wav"
+    audio.write_bytes(audio_bytes(5000))
+    response = {"job_id": "job-1", "presigned_url": f"{storage_server.url}/object"}
+    params = dict(visit_type="initialEncounter", recording_type="dictation", template="primaryCare")
+
+    with patch.object(note_manager, '_request', return_value=dict(response)) as mock_request:
+        first = note_manager.process_audio(str(audio), deduplicate=True, **params)
+        second = note_manager.process_audio(str(audio), deduplicate=True, **params)
+    assert first["deduplicated"] is False
+    assert second == {"job_id": "job-1", "deduplicated": True}
+    assert mock_request.call_count == 1
+
+    with patch.object(note_manager, 'regenerate_note', return_value={"job_id": "job-2"}) as regenerate:
+        third = note_manager.process_audio(str(audio), deduplicate=True, **{**params, "template": "er"})
+        fourth = note_manager.process_audio(str(audio), deduplicate=True, **{**params, "template": "er"})
+    regenerate.assert_called_once_with(
+        "job-1", template="er", output_language=None, documentation_style=None, custom=None, custom_metadata=None
+    )
+    assert third == fourth == {"job_id": "job-2", "deduplicated": True}
+
+    # Different transcript parameters need a new upload
+    with patch.object(note_manager, '_request', return_value=dict(response, job_id="job-3")):
+        fifth = note_manager.process_audio(str(audio), deduplicate=True, **{**params, "lang": "fr"})
+    assert fifth["job_id"] == "job-3"
+
+def test_process_audio_deduplicate_uploads_when_regeneration_fails(note_manager, storage_server, tmp_path):
+    """Test a recording is uploaded again when its earlier job cannot be regenerated."""
+    audio = tmp_path / "visit.wav"
+    audio.write_bytes(audio_bytes(5000))
+    response = {"job_id": "job-1", "presigned_url": f"{storage_server.url}/object"}
+
+    with patch.object(note_manager, '_request', return_value=dict(response)):
+        note_manager.process_audio(str(audio), template="wfw", deduplicate=True)
+    with patch.object(note_manager, 'regenerate_note', side_effect=JobError("still processing", job_id="job-1")), \
+            patch.object(note_manager, '_request', return_value=dict(response, job_id="job-2")) as mock_request:
+        result = note_manager.process_audio(str(audio), template="smartInsert", deduplicate=True)
+
+    assert result["job_id"] == "job-2"
+    assert mock_request.call_count == 1
+
+def test_process_audio_deduplicate_hashing(note_manager, storage_server, tmp_path):
+    """Test content hashes share one executor, are cancelled on failure and never fail an upload."""
+    audio = tmp_path / "visit.wav"
+    audio.write_bytes(audio_bytes(5000))
+    response = {"job_id": "job-1", "presigned_url": f"{storage_server.url}/object"}
+
+    pending = Future()
+    with patch.object(note_manager, '_hash_in_background', return_value=pending), \
+            patch.object(note_manager, '_request', side_effect=InternalServerError("down")):
+        with pytest.raises(InternalServerError):
+            note_manager.process_audio(str(audio), template="wfw", deduplicate=True)
+    assert pending.cancelled()
+
+    with patch.object(note_manager_module, "content_hash", side_effect=ValueError("bad read")), \
+            patch.object(note_manager, '_request', return_value=dict(response)):
+        result = note_manager.process_audio(str(audio), template="wfw", deduplicate=True)
+        executor = note_manager._hashing
+        note_manager.process_audio(str(audio), template="smartInsert", deduplicate=True)
+    assert result["deduplicated"] is False
+    assert note_manager._hashing is executor
+
+def test_process_audio_resends_corrupted_upload(note_manager, storage_server, tmp_path):
+    """Test an upload whose stored MD5 differs from the one sent is retried."""
+    note_manager._config['retry_delay'] = 0
+    audio = tmp_path / "visit.wav"
+    data = audio_bytes(5000)
+    audio.write_bytes(data)
+    storage_server.corrupt["/object"] = 1
+    response = {"job_id": "test-job", "presigned_url": f"{storage_server.url}/object"}
+
+    with patch.object(note_manager, '_request', return_value=response):
+        note_manager.process_audio(str(audio), template="wfw")
+
+    assert storage_server.objects["/object"] == data
+
+def test_process_audio_stream_checksum_mismatch(note_manager, storage_server):
+    """Test a corrupted stream upload, which cannot be resent, fails."""
+    storage_server.corrupt["/object"] = 1
+    response = {"job_id": "test-job", "presigned_url": f"{storage_server.url}/object"}
+
+    with patch.object(note_manager, '_request', return_value=response):
+        with pytest.raises(UploadError) as exc:
+            note_manager.process_audio_stream(iter([b"RIFF", b"data"]), format="wav", template="wfw")
+    assert exc.value.code == "CHECKSUM_MISMATCH"
+
+def test_resume_upload_sends_missing_parts(note_manager, storage_server, tmp_path):
+    """Test a failed multipart upload resumes from the parts storage confirmed."""
+    audio = tmp_path / "visit.wav"
+    data = audio_bytes(6000)
+    audio.write_bytes(data)
+    note_manager._config['retry_delay'] = 0
+    note_manager._config['max_retries'] = 1
+
+    response = {
+        "job_id": "test-job",
+        "presigned_url": f"{storage_server.url}/object",
+        "multipart": {
+            "part_urls": [f"{storage_server.url}/part/{n}" for n in (1, 2, 3)],
+            "part_size": 2000,
+            "complete_url": f"{storage_server.url}/complete"
+        }
+    }
+    storage_server.fail["/part/3"] = 1
+
+    with patch.object(note_manager, '_request', return_value=response):
+        with pytest.raises(UploadError):
+            note_manager.process_audio(str(audio), template="wfw", multipart_upload=True, max_upload_workers=1)
+    assert "/complete" not in storage_server.posts
+
+    storage_server.objects.clear()
+    assert note_manager.resume_upload("test-job", str(audio)) == response
+
+    assert list(storage_server.objects) == ["/part/3"]
+    assert storage_server.objects["/part/3"] == data[4000:]
+    assert storage_server.posts["/complete"].decode().count("<Part>") == 3
+    with pytest.raises(UploadError):
+        note_manager.resume_upload("test-job", str(audio))
+
+def test_checkpoints_disabled_by_default(note_manager, storage_server, audio_file, monkeypatch):
+    """Test uploads write no checkpoint unless a checkpoint directory is configured."""
+    monkeypatch.delenv("NOTEDX_CHECKPOINT_DIR")
+    path = audio_file("visit.mp3")
+    api, _ = job_factory(storage_server)
+    with patch.object(note_manager, '_request', side_effect=api), \
+            patch.object(note_manager_module.UploadCheckpoint, 'create') as create:
+        note_manager.process_audio(path, template="wfw")
+    create.assert_not_called()
+    with pytest.raises(UploadError, match="disabled"):
+        note_manager.resume_upload("job-0", path)
+
+def test_resume_upload_without_checkpoint(note_manager, tmp_path):
+    """Test resuming an unknown upload raises UploadError."""
+    audio = tmp_path / "visit.wav"
+    audio.write_bytes(audio_bytes(100))
+    with pytest.raises(UploadError) as exc_info:
+        note_manager.resume_upload("unknown-job", str(audio))
+    assert "No upload checkpoint found" in str(exc_info.value)
+
+@pytest.mark.parametrize("source_factory,chunked", [
+    (lambda data: data, False),
+    (lambda data: memoryview(data), False),
+    (lambda data: BytesIO(data), False),
+    (lambda data: (data[i:i + 1000] for i in range(0, len(data), 1000)), True),
+])
+def test_process_audio_stream(note_manager, storage_server, source_factory, chunked):
+    """Test in-memory and streamed sources are uploaded without a temp file."""
+    data = audio_bytes(4500, ".mp3")
+    response = {"job_id": "test-job", "presigned_url": f"{storage_server.url}/object"}
+
+    with patch.object(note_manager, '_request', return_value=response) as mock_request:
+        result = note_manager.process_audio_stream(source_factory(data), format="mp3", template="wfw")
+
+    assert result == response
+    assert mock_request.call_args.kwargs["data"]["file_extension"] == ".mp3"
+    assert storage_server.objects["/object"] == data
+    headers = storage_server.headers["/object"]
+    assert headers["Content-Type"] == "audio/mpeg"
+    assert ("Transfer-Encoding" in headers) == chunked
+
+@pytest.mark.parametrize("kwargs,message", [
+    ({"source": b"data", "format": "txt"}, "Unsupported audio format"),
+    ({"source": b"", "format": "wav"}, "source is empty"),
+    ({"source": "visit.wav", "format": "wav"}, "Unsupported audio source type"),
+])
+def test_process_audio_stream_validation(note_manager, kwargs, message):
+    """Test stream sources are validated before a job is created."""
+    with patch.object(note_manager, '_request') as mock_request:
+        with pytest.raises(ValidationError) as exc_info:
+            note_manager.process_audio_stream(template="wfw", **kwargs)
+    assert message in str(exc_info.value)
+    mock_request.assert_not_called()
+
+def test_process_audio_upload_network_error(note_manager, audio_file):
     """Test handling of network error during audio upload."""
-    mock_file = mock_open(read_data=b'test audio data')
-    with patch('os.path.isfile', return_value=True), \
-         patch('os.path.getsize', return_value=1024 * 1024), \
-         patch('builtins.open', mock_file), \
-         patch('requests.request', side_effect=requests.ConnectionError("Upload failed")):
+    with patch('requests.Session.request', side_effect=requests.ConnectionError("Upload failed")):
         with pytest.raises(NetworkError) as exc_info:
             note_manager.process_audio(
-                "test.wav",
+                audio_file("test.wav"),
                 visit_type="initialEncounter",
                 recording_type="dictation",
                 template="primaryCare",
@@ -157,7 +996,7 @@ def test_fetch_status_success(note_manager):
         "job_id": "test-job"
     }
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         result = note_manager.fetch_status("test-job")
         assert result == mock_response.json.return_value
 
@@ -167,7 +1006,7 @@ def test_fetch_status_not_found(note_manager):
     mock_response.status_code = 404
     mock_response.text = "Job not found"
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         with pytest.raises(JobNotFoundError):
             note_manager.fetch_status("non-existent-job")
 
@@ -182,7 +1021,7 @@ def test_fetch_note_success(note_manager):
         "job_id": "test-job"
     }
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         result = note_manager.fetch_note("test-job")
         assert result == mock_response.json.return_value
 
@@ -192,7 +1031,7 @@ def test_fetch_note_incomplete_job(note_manager):
     mock_response.status_code = 400
     mock_response.text = "Note generation not completed"
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         with pytest.raises(JobError):
             note_manager.fetch_note("incomplete-job")
 
@@ -206,7 +1045,7 @@ def test_fetch_transcript_success(note_manager):
         "job_id": "test-job"
     }
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         result = note_manager.fetch_transcript("test-job")
         assert result == mock_response.json.return_value
 
@@ -216,7 +1055,7 @@ def test_fetch_transcript_not_ready(note_manager):
     mock_response.status_code = 400
     mock_response.text = "Transcription not completed"
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         with pytest.raises(BadRequestError):
             note_manager.fetch_transcript("incomplete-job")
 
@@ -231,7 +1070,7 @@ def test_get_system_status_success(note_manager):
         "latency": {"avg": 150}
     }
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         result = note_manager.get_system_status()
         assert result == mock_response.json.return_value
 
@@ -281,16 +1120,14 @@ def test_calculate_optimal_chunk_size(note_manager):
     assert large_chunk > small_chunk
     assert large_chunk <= 50 * 1024 * 1024  # Should not exceed max chunk size
 
-def test_validate_audio_file_valid_formats(note_manager):
+def test_validate_audio_file_valid_formats(note_manager, audio_file):
     """Test audio file validation with valid formats."""
-    valid_formats = ['.mp3', '.wav', '.m4a', '.aac', '.ogg', '.opus', '.webm']
+    valid_formats = ['.mp3', '.wav', '.m4a', '.aac', '.ogg', '.opus', '.webm', '.flac']
     
     for fmt in valid_formats:
-        with patch('os.path.isfile', return_value=True), \
-             patch('os.path.getsize', return_value=1024), \
-             patch('builtins.open', mock_open(read_data=b'test')):
-            # Should not raise any exceptions
-            note_manager._validate_audio_file(f"test{fmt}")
+        info = note_manager._validate_audio_file(audio_file(f"test{fmt}"))
+        assert info.size == 1024
+        assert info.container is not None
 
 def test_validate_audio_file_missing_file(note_manager):
     """Test validation when file doesn't exist."""
@@ -313,7 +1150,7 @@ def test_regenerate_note_success(note_manager):
     regenerate_response.text = '{"job_id": "new-job", "status": "processing"}'
     regenerate_response.json.return_value = {"job_id": "new-job", "status": "processing"}
 
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_request.side_effect = [status_response, regenerate_response]
         result = note_manager.regenerate_note(
             "test-job",
@@ -330,7 +1167,7 @@ def test_regenerate_note_job_not_found(note_manager):
     mock_response.status_code = 404
     mock_response.text = "Job not found"
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         with pytest.raises(JobNotFoundError) as exc_info:
             note_manager.regenerate_note("non-existent-job")
         assert "Job not found" in str(exc_info.value)
@@ -343,7 +1180,7 @@ def test_regenerate_note_invalid_template(note_manager):
     mock_response.text = '{"status": "completed", "job_id": "test-job"}'
     mock_response.json.return_value = {"status": "completed", "job_id": "test-job"}
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         with pytest.raises(InvalidFieldError) as exc_info:
             note_manager.regenerate_note(
                 "test-job",
@@ -359,7 +1196,7 @@ def test_regenerate_note_invalid_documentation_style(note_manager):
     status_response.text = '{"status": "completed", "job_id": "test-job"}'
     status_response.json.return_value = {"status": "completed", "job_id": "test-job"}
 
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_request.side_effect = [status_response]
         with pytest.raises(InvalidFieldError) as exc_info:
             note_manager.regenerate_note(
@@ -377,7 +1214,7 @@ def test_regenerate_note_invalid_output_language(note_manager):
     mock_response.text = '{"status": "completed", "job_id": "test-job"}'
     mock_response.json.return_value = {"status": "completed", "job_id": "test-job"}
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         with pytest.raises(InvalidFieldError) as exc_info:
             note_manager.regenerate_note(
                 "test-job",
@@ -405,7 +1242,7 @@ def test_regenerate_note_with_custom_template(note_manager):
         "template": "Custom SOAP template"
     }
 
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_request.side_effect = [status_response, regenerate_response]
         result = note_manager.regenerate_note(
             "test-job",
@@ -414,79 +1251,99 @@ def test_regenerate_note_with_custom_template(note_manager):
         )
         assert result == {"job_id": "new-job", "status": "processing"}
 
-def test_process_audio_invalid_file_type(note_manager):
+def test_process_audio_invalid_file_type(note_manager, audio_file):
     """Test handling of invalid audio file type."""
-    with patch('os.path.isfile', return_value=True), \
-         patch('os.path.getsize', return_value=1024 * 1024):
+    with patch.object(note_manager, '_request') as mock_request:
         with pytest.raises(ValidationError) as exc_info:
             note_manager.process_audio(
-                "test.txt",
+                audio_file("test.txt"),
                 visit_type="initialEncounter",
                 recording_type="dictation",
                 template="primaryCare"
             )
         assert "Unsupported audio format" in str(exc_info.value)
+        mock_request.assert_not_called()
 
-def test_process_audio_file_too_large(note_manager):
+def test_process_audio_file_too_large(note_manager, tmp_path):
     """Test handling of file exceeding size limit."""
-    with patch('os.path.isfile', return_value=True), \
-         patch('os.path.getsize', return_value=600 * 1024 * 1024):  # 600MB
+    audio = tmp_path / "test.mp3"
+    with open(audio, 'wb') as f:
+        f.truncate(600 * 1024 * 1024)  # 600MB, sparse
+    with patch.object(note_manager, '_request') as mock_request:
         with pytest.raises(ValidationError) as exc_info:
             note_manager.process_audio(
-                "test.mp3",
+                str(audio),
                 visit_type="initialEncounter",
                 recording_type="dictation",
                 template="primaryCare"
             )
         assert "File size exceeds 500MB limit" in str(exc_info.value)
+        mock_request.assert_not_called()
 
-def test_process_audio_missing_required_fields(note_manager):
+def test_process_audio_missing_required_fields(note_manager, audio_file):
     """Test handling of missing required fields."""
-    mock_file = mock_open(read_data=b'test audio data')
-    with patch('os.path.isfile', return_value=True), \
-         patch('os.path.getsize', return_value=1024 * 1024), \
-         patch('builtins.open', mock_file):
+    with patch.object(note_manager, '_request') as mock_request:
         with pytest.raises(MissingFieldError) as exc_info:
             note_manager.process_audio(
-                "test.mp3",
+                audio_file("test.mp3"),
                 visit_type="initialEncounter",
                 recording_type="dictation"
                 # Missing required template field
             )
         assert "Missing required field: template" in str(exc_info.value)
+        mock_request.assert_not_called()
 
-def test_process_audio_invalid_field_values(note_manager):
+def test_process_audio_invalid_field_values(note_manager, audio_file):
     """Test handling of invalid field values."""
-    mock_file = mock_open(read_data=b'test audio data')
-    with patch('os.path.isfile', return_value=True), \
-         patch('os.path.getsize', return_value=1024 * 1024), \
-         patch('builtins.open', mock_file):
+    with patch.object(note_manager, '_request') as mock_request:
         with pytest.raises(InvalidFieldError) as exc_info:
             note_manager.process_audio(
-                "test.mp3",
+                audio_file("test.mp3"),
                 visit_type="invalid",
                 recording_type="dictation",
                 template="primaryCare"
             )
         assert "Invalid value for visit_type" in str(exc_info.value)
+        mock_request.assert_not_called()
 
-def test_validate_audio_file_zero_size(note_manager):
+def test_validate_audio_file_zero_size(note_manager, tmp_path):
     """Test validation of zero-size audio file."""
-    mock_file = mock_open()
-    mock_file.return_value.read.side_effect = [b'']  # Empty file
-    with patch('os.path.isfile', return_value=True), \
-         patch('os.path.getsize', return_value=0), \
-         patch('builtins.open', mock_file):
-        with pytest.raises(ValidationError, match="Cannot read audio file"):
-            note_manager._validate_audio_file("test.mp3")
-
-def test_validate_audio_file_directory(note_manager):
+    audio = tmp_path / "test.mp3"
+    audio.write_bytes(b"")
+    with pytest.raises(ValidationError, match="Cannot read audio file"):
+        note_manager._validate_audio_file(str(audio))
+
+def test_validate_audio_file_directory(note_manager, tmp_path):
     """Test validation when path points to a directory."""
-    with patch('os.path.isfile', return_value=False), \
-         patch('os.path.isdir', return_value=True):
+    directory = tmp_path / "test_dir.mp3"
+    directory.mkdir()
+    with pytest.raises(ValidationError) as exc_info:
+        note_manager._validate_audio_file(str(directory))
+    assert "Audio file not found" in str(exc_info.value)
+
+@pytest.mark.parametrize("name,content,detected", [
+    ("visit.wav", AUDIO_HEADERS[".mp3"] + b"\x00" * 100, "id3"),
+    ("visit.mp3", AUDIO_HEADERS[".wav"] + b"\x00" * 100, "wav"),
+    ("visit.m4a", b"<html><body>Not found</body></html>", None),
+])
+def test_process_audio_rejects_mislabelled_file(note_manager, tmp_path, name, content, detected):
+    """Test content that does not match the extension is rejected before a job is created."""
+    audio = tmp_path / name
+    audio.write_bytes(content)
+    with patch.object(note_manager, '_request') as mock_request:
         with pytest.raises(ValidationError) as exc_info:
-            note_manager._validate_audio_file("test_dir")
-        assert "Audio file not found" in str(exc_info.value)
+            note_manager.process_audio(str(audio), template="wfw")
+    assert exc_info.value.details["detected_format"] == detected
+    mock_request.assert_not_called()
+
+def test_process_audio_stream_rejects_mislabelled_content(note_manager):
+    """Test in-memory audio is checked against its declared format."""
+    source = BytesIO(AUDIO_HEADERS[".ogg"] + b"\x00" * 100)
+    with patch.object(note_manager, '_request') as mock_request:
+        with pytest.raises(ValidationError, match="the data is Ogg"):
+            note_manager.process_audio_stream(source, format="wav", template="wfw")
+    assert source.tell() == 0
+    mock_request.assert_not_called()
 
 def test_regenerate_note_server_error(note_manager):
     """Test handling of server error during note regeneration."""
@@ -497,7 +1354,7 @@ def test_regenerate_note_server_error(note_manager):
         "error": "Internal server error"
     }
 
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request, patch('time.sleep'):
         mock_request.return_value = mock_response
         with pytest.raises(InternalServerError, match="Server error"):
             note_manager.regenerate_note("test-job", template="primaryCare")
@@ -509,7 +1366,7 @@ def test_fetch_status_invalid_response(note_manager):
     mock_response.text = 'Invalid JSON'
     mock_response.json.side_effect = ValueError("Invalid JSON")
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         with pytest.raises(BadRequestError, match="Invalid response format"):
             note_manager.fetch_status("test-job")
 
@@ -520,13 +1377,12 @@ def test_fetch_transcript_invalid_response(note_manager):
     mock_response.text = 'Invalid JSON'
     mock_response.json.side_effect = ValueError("Invalid JSON")
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         with pytest.raises(BadRequestError, match="Invalid response format"):
             note_manager.fetch_transcript("test-job")
 
-def test_process_audio_job_error(note_manager):
+def test_process_audio_job_error(note_manager, audio_file):
     """Test handling of job error after successful upload."""
-    mock_file = mock_open(read_data=b'test audio data')
 
     # Mock job error response
     mock_response = Mock()
@@ -537,23 +1393,18 @@ def test_process_audio_job_error(note_manager):
         "job_id": "test-job"
     }
 
-    with patch('os.path.isfile', return_value=True), \
-         patch('os.path.exists', return_value=True), \
-         patch('os.path.getsize', return_value=1024 * 1024), \
-         patch('builtins.open', mock_file), \
-         patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_request.return_value = mock_response
         with pytest.raises(BadRequestError, match="Job processing failed"):
             note_manager.process_audio(
-                "test.mp3",
+                audio_file("test.mp3"),
                 visit_type="initialEncounter",
                 recording_type="dictation",
                 template="primaryCare"
             )
 
-def test_process_audio_service_unavailable(note_manager):
+def test_process_audio_service_unavailable(note_manager, audio_file):
     """Test handling of service unavailable error."""
-    mock_file = mock_open(read_data=b'test audio data')
     
     mock_response = Mock()
     mock_response.status_code = 503
@@ -562,15 +1413,11 @@ def test_process_audio_service_unavailable(note_manager):
         "error": "Service temporarily unavailable"
     }
 
-    with patch('os.path.isfile', return_value=True), \
-         patch('os.path.exists', return_value=True), \
-         patch('os.path.getsize', return_value=1024 * 1024), \
-         patch('builtins.open', mock_file), \
-         patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request, patch('time.sleep'):
         mock_request.return_value = mock_response
         with pytest.raises(InternalServerError) as exc_info:
             note_manager.process_audio(
-                "test.mp3",
+                audio_file("test.mp3"),
                 visit_type="initialEncounter",
                 recording_type="dictation",
                 template="primaryCare"
@@ -0,0 +1,120 @@
+import multiprocessing
+import time
+from unittest.mock import patch
+import pytest
+from src.notedx_sdk.core.ratelimit import (
+    FileRateLimitBackend,
+    MemoryRateLimitBackend,
+    RateLimit,
+    RateLimiter,
+    endpoint_class,
+)
+
+
+@pytest.mark.parametrize("endpoint,expected", [
+    ("process-audio", "job_creation"),
+    ("process-text", "job_creation"),
+    ("regenerate-note", "job_creation"),
+    ("/status/job-123", "status"),
+    ("fetch-note/job-123", "fetch"),
+    ("fetch-transcript/job-123", "fetch"),
+    ("user/account/info", "other"),
+])
+def test_endpoint_class(endpoint, expected):
+    assert endpoint_class(endpoint) == expected
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with patch("time.time", side_effect=lambda: now[0]):
+        yield now
+
+
+def test_paces_requests_after_burst(clock):
+    limiter = RateLimiter({"status": RateLimit(2, burst=3)})
+    waits = [limiter.reserve("status/job-1", "key") for _ in range(5)]
+    assert waits == pytest.approx([0, 0, 0, 0.5, 1.0])
+    # Classes without a limit are not paced
+    assert limiter.reserve("fetch-note/job-1", "key") == 0
+    clock[0] += 10
+    assert limiter.reserve("status/job-1", "key") == 0
+
+
+def test_buckets_per_key_and_class(clock):
+    limiter = RateLimiter({"job_creation": RateLimit(1, per=60), "status": RateLimit(1)})
+    assert limiter.reserve("process-audio", "key-1") == 0
+    assert limiter.reserve("process-audio", "key-1") == pytest.approx(60)
+    assert limiter.reserve("process-text", "key-2") == 0
+    assert limiter.reserve("status/job-1", "key-1") == 0
+
+
+def test_clients_with_the_same_key_share_buckets(clock):
+    backend = MemoryRateLimitBackend()
+    first = RateLimiter({"fetch": RateLimit(1)}, backend=backend)
+    second = RateLimiter({"fetch": RateLimit(1)}, backend=backend)
+    assert first.reserve("fetch-note/job-1", "key") == 0
+    assert second.reserve("fetch-note/job-2", "key") == pytest.approx(1)
+
+
+@pytest.mark.parametrize("make_backend", [
+    lambda tmp_path: MemoryRateLimitBackend(),
+    lambda tmp_path: FileRateLimitBackend(str(tmp_path / "state.json")),
+])
+def test_defer_holds_bucket(clock, tmp_path, make_backend):
+    limiter = RateLimiter({"status": RateLimit(5, burst=5)}, backend=make_backend(tmp_path))
+    limiter.defer("status/job-1", "key", 10)
+    # The burst does not let requests out before the reset
+    waits = [limiter.reserve("status/job-1", "key") for _ in range(3)]
+    assert waits == pytest.approx([10.0, 10.2, 10.4])
+    # Nothing to hold for a class without a limit
+    limiter.defer("fetch-note/job-1", "key", 30)
+    assert limiter.reserve("fetch-note/job-1", "key") == 0
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        RateLimiter({"uploads": RateLimit(1)})
+    with pytest.raises(ValueError):
+        RateLimiter({"status": RateLimit(0)})
+
+
+def test_acquire_sleeps_for_turn(clock):
+    limiter = RateLimiter({"status": RateLimit(4)})
+    with patch("time.sleep") as sleep:
+        limiter.acquire("status/job-1", "key")
+        limiter.acquire("status/job-1", "key")
+    sleep.assert_called_once_with(pytest.approx(0.25))
+
+
+def test_file_backend_state(tmp_path, clock):
+    path = tmp_path / "limits" / "state.json"
+    limiter = RateLimiter({"fetch": RateLimit(1)}, backend=FileRateLimitBackend(str(path)))
+    assert limiter.reserve("fetch-note/job-1", "secret-key") == 0
+    # A second process opening the same file sees the reservation
+    other = RateLimiter({"fetch": RateLimit(1)}, backend=FileRateLimitBackend(str(path)))
+    assert other.reserve("fetch-note/job-2", "secret-key") == pytest.approx(1)
+    assert "secret-key" not in path.read_text()
+
+    path.write_text("not json")
+    assert limiter.reserve("fetch-note/job-3", "secret-key") == 0
+
+
+def _reserve_send_times(path, count, queue):
+    limiter = RateLimiter({"job_creation": RateLimit(1, per=10)}, backend=FileRateLimitBackend(path))
+    for _ in range(count):
+        queue.put(time.time() + limiter.reserve("process-audio", "key"))
+
+
+def test_file_backend_across_processes(tmp_path):
+    path = str(tmp_path / "state.json")
+    queue = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=_reserve_send_times, args=(path, 4, queue)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    send_times = sorted(queue.get(timeout=30) for _ in range(12))
+    for worker in workers:
+        worker.join()
+    # Every process draws from the same bucket: one request every 10 seconds
+    gaps = [later - earlier for earlier, later in zip(send_times, send_times[1:])]
+    assert gaps == pytest.approx([10] * 11, abs=0.05)
@@ -0,0 +1,117 @@
+from email.utils import formatdate
+from unittest.mock import Mock, patch
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+from src.notedx_sdk.core.retry import RetryBudget, RetryPolicy, request_was_sent, retry_after, select_policy
+from src.notedx_sdk.exceptions import RetryBudgetExhaustedError, ServiceUnavailableError
+
+
+@pytest.mark.parametrize("headers,expected", [
+    ({"Retry-After": "7"}, 7.0),
+    ({"Retry-After": formatdate(2000000030, usegmt=True)}, 30.0),
+    ({"X-RateLimit-Reset": "12"}, 12.0),
+    ({"X-RateLimit-Reset": "86400"}, 86400.0),
+    ({"X-RateLimit-Reset": "2000000005"}, 5.0),
+    ({"X-RateLimit-Reset": "2000000005000"}, 5.0),
+    ({"X-RateLimit-Reset": "1999999000"}, 0.0),
+    ({"Retry-After": "3", "X-RateLimit-Reset": "60"}, 3.0),
+    ({"Retry-After": "soon"}, None),
+    ({}, None),
+    (None, None),
+])
+def test_retry_after(headers, expected):
+    wait = retry_after(headers, now=2000000000)
+    assert wait is None if expected is None else wait == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("method,status,sent,expected", [
+    ("GET", 502, True, True),
+    ("GET", None, True, True),
+    ("GET", 404, True, False),
+    ("POST", 502, True, False),  # the job may have been created
+    ("POST", None, True, False),
+    ("POST", None, False, True),  # never reached the server
+    ("POST", 429, True, True),
+    ("POST", 503, True, True),
+])
+def test_retryable(method, status, sent, expected):
+    assert RetryPolicy().retryable(method, status, sent) is expected
+
+
+def test_next_delay():
+    policy = RetryPolicy(max_retries=3, backoff=1, max_backoff=3, jitter=False)
+    assert [policy.next_delay(attempt, "GET", 503) for attempt in (1, 2, 3, 4)] == [1, 2, 3, None]
+    assert policy.next_delay(1, "GET", 503, {"Retry-After": "2.5"}) == 2.5
+    # Waiting longer than max_wait is not worth it
+    assert policy.next_delay(1, "GET", 429, {"Retry-After": "60"}) is None
+    assert RetryPolicy(max_wait=120).next_delay(1, "GET", 429, {"Retry-After": "60"}) == 60
+    assert RetryPolicy(retry_non_idempotent=True).next_delay(1, "POST", 502, {"Retry-After": "1"}) == 1
+
+    jittered = RetryPolicy(backoff=2)
+    assert all(0 <= jittered.next_delay(2, "GET") <= 4 for _ in range(50))
+
+
+def test_request_was_sent():
+    refused = requests.ConnectionError(MaxRetryError(None, "/", NewConnectionError(None, "refused")))
+    assert not request_was_sent(refused)
+    assert not request_was_sent(requests.ConnectTimeout())
+    assert request_was_sent(requests.ConnectionError("Connection reset by peer"))
+    assert request_was_sent(requests.ReadTimeout())
+
+
+def test_select_policy():
+    default, audio, note = RetryPolicy(), RetryPolicy(max_retries=0), RetryPolicy(max_retries=6)
+    policies = {"process-audio": audio, "fetch-note": note, "fetch-note/special": default}
+    assert select_policy(policies, "process-audio", Mock()) is audio
+    assert select_policy(policies, "/fetch-note/job-1", Mock()) is note
+    assert select_policy(policies, "fetch-note/special/x", Mock()) is default
+    assert select_policy(policies, "fetch-notes", default) is default
+    assert select_policy(None, "status/job-1", default) is default
+
+
+def test_retry_budget_follows_successes():
+    budget = RetryBudget(ratio=0.5, min_per_second=0, window=10)
+    assert not budget.try_spend()
+    for _ in range(4):
+        budget.record_success()
+    assert budget.balance == 2
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+    stats = budget.stats()
+    assert (stats["successes"], stats["retries"], stats["spent"], stats["denied"]) == (4, 2, 2, 2)
+
+
+def test_retry_budget_window_slides():
+    budget = RetryBudget(ratio=1, min_per_second=0.1, window=10)
+    with patch("time.monotonic", return_value=1000.0):
+        budget.record_success()
+        assert budget.balance == 2
+        assert budget.try_spend() and budget.try_spend()
+        assert budget.balance == 0
+    with patch("time.monotonic", return_value=1005.0):
+        assert budget.balance == 0
+    with patch("time.monotonic", return_value=1010.5):
+        # The success and the retries have left the window
+        assert budget.balance == 1
+
+
+def test_unlimited_retry_budget():
+    budget = RetryBudget(ratio=None)
+    assert all(budget.try_spend() for _ in range(1000))
+    assert budget.balance == float("inf")
+    assert budget.stats()["spent"] == 1000
+
+
+def test_policy_draws_from_budget():
+    budget = RetryBudget(ratio=1, min_per_second=0)
+    policy = RetryPolicy(backoff=0, budget=budget)
+    policy.record_success()
+    assert policy.next_delay(1, "GET", 503) == 0
+    with pytest.raises(RetryBudgetExhaustedError) as exc_info:
+        policy.next_delay(2, "GET", 503)
+    assert isinstance(exc_info.value, ServiceUnavailableError)
+    assert exc_info.value.details["budget"]["denied"] == 1
+    # Failures that are not retried anyway do not touch the budget
+    assert policy.next_delay(1, "GET", 404) is None
+    assert budget.stats()["denied"] == 1
@@ -0,0 +1,133 @@
+import threading
+import time
+from datetime import datetime, timezone
+import pytest
+from src.notedx_sdk.core.slots import JobSlotPool
+from src.notedx_sdk.exceptions import PaymentRequiredError
+
+
+class FakeApi:
+    def __init__(self, expires_in=None, fail=False):
+        self.created = []
+        self.attempts = 0
+        self.expires_in = expires_in
+        self.fail = fail
+        self.lock = threading.Lock()
+
+    def create(self, data):
+        with self.lock:
+            self.attempts += 1
+        if self.fail:
+            raise PaymentRequiredError("Free trial jobs depleted")
+        with self.lock:
+            job_id = f"job-{len(self.created)}"
+            self.created.append((job_id, data))
+        url = f"https://storage.example.com/{job_id}"
+        if self.expires_in is not None:
+            signed = datetime.fromtimestamp(time.time(), timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            url += f"?X-Amz-Date={signed}&X-Amz-Expires={self.expires_in}"
+        return {"job_id": job_id, "presigned_url": url}
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_next_jobs_are_created_ahead():
+    api = FakeApi()
+    data = {"template": "wfw", "lang": "en", "file_extension": ".mp3"}
+    with JobSlotPool(api.create, size=2) as pool:
+        first = pool.acquire(data)
+        # The job created on demand counts toward the size
+        wait_for(lambda: len(pool.unused_jobs()) == 1)
+        assert len(api.created) == 2
+        second = pool.acquire(dict(data))
+        assert (pool.hits, pool.misses) == (1, 1)
+        assert first["job_id"] != second["job_id"]
+        assert second["job_id"] in {job_id for job_id, _ in api.created[:2]}
+        wait_for(lambda: len(pool.unused_jobs()) == 2)
+    assert len(api.created) == 4
+    assert all(created == data for _, created in api.created)
+
+
+@pytest.mark.parametrize("calls", [1, 2, 5])
+def test_jobs_created_for_sequential_requests(calls):
+    api = FakeApi()
+    with JobSlotPool(api.create, size=2) as pool:
+        for n in range(calls):
+            pool.acquire({"template": "wfw"})
+            wait_for(lambda: len(pool.unused_jobs()) == (1 if n == 0 else 2))
+    # One job per request, plus at most `size` left unused
+    assert len(api.created) == calls + (1 if calls == 1 else 2)
+    assert (pool.hits, pool.misses) == (calls - 1, 1)
+
+
+def test_concurrent_misses_count_toward_size():
+    api = FakeApi()
+    release = threading.Event()
+
+    def slow_create(data):
+        release.wait(2)
+        return api.create(data)
+
+    with JobSlotPool(slow_create, size=2) as pool:
+        threads = [threading.Thread(target=pool.acquire, args=({"template": "wfw"},)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: pool.misses == 4)
+        release.set()
+        for thread in threads:
+            thread.join()
+    # The first miss pre-creates one job; later misses find the pool full
+    assert len(api.created) == 5
+
+
+def test_slots_are_only_used_for_the_same_parameters():
+    api = FakeApi()
+    with JobSlotPool(api.create, size=2) as pool:
+        pool.acquire({"template": "wfw"})
+        wait_for(lambda: len(pool.unused_jobs()) == 1)
+        response = pool.acquire({"template": "er"})
+        assert (pool.hits, pool.misses) == (0, 2)
+        assert (response["job_id"], {"template": "er"}) in api.created
+
+
+def test_expiring_slots_are_discarded():
+    api = FakeApi(expires_in=30)  # less than the 60s margin
+    with JobSlotPool(api.create, size=2) as pool:
+        pool.acquire({"template": "wfw"})
+        wait_for(lambda: len(pool.unused_jobs()) == 1)
+        pool.acquire({"template": "wfw"})
+        assert (pool.hits, pool.misses, pool.expired) == (0, 2, 1)
+
+
+def test_close_returns_unused_jobs():
+    api = FakeApi()
+    pool = JobSlotPool(api.create, size=2)
+    used = pool.acquire({"template": "wfw"})["job_id"]
+    unused = pool.close()
+    assert len(unused) == 1 and used not in unused
+    assert pool.acquire({"template": "wfw"})["job_id"] == "job-2"
+    assert len(api.created) == 3  # no refill once closed
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        JobSlotPool(FakeApi().create, size=1)
+
+
+def test_creation_errors_pause_refills():
+    api = FakeApi(fail=True)
+    pool = JobSlotPool(api.create, size=2, failure_backoff=60)
+    with pytest.raises(PaymentRequiredError):
+        pool.acquire({"template": "wfw"})
+    wait_for(lambda: api.attempts == 2)
+    for _ in range(3):
+        with pytest.raises(PaymentRequiredError):
+            pool.acquire({"template": "wfw"})
+    assert pool.close() == []
+    # Only the requests themselves, no job created ahead while paused
+    assert api.attempts == 5
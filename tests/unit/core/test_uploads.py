@@ -0,0 +1,481 @@
+import hashlib
+import logging
+import mmap
+import os
+import time
+import tracemalloc
+from io import BytesIO
+from unittest.mock import Mock
+import pytest
+import requests
+from src.notedx_sdk.core import uploads
+from src.notedx_sdk.core.uploads import (
+    AdaptiveBody,
+    AdaptiveChunkSizer,
+    BufferReader,
+    IteratorReader,
+    MappedFileReader,
+    MultipartUploader,
+    ProgressReader,
+    ProgressTracker,
+    log_progress,
+    open_file_body,
+    open_upload_body,
+    presigned_url_expiry,
+    check_presigned_url,
+    rejected_url_error,
+    stored_md5,
+    ThroughputEstimator,
+    verify_checksum,
+)
+from src.notedx_sdk.exceptions import UploadError, UploadUrlRejectedError
+
+
+class TestProgressReader:
+    def test_read_reports_progress(self):
+        calls = []
+        reader = ProgressReader(BytesIO(b"x" * 10), 10, callback=lambda sent, total: calls.append((sent, total)))
+
+        assert len(reader) == 10
+        assert reader.read(4) == b"xxxx"
+        assert len(reader) == 6
+        assert reader.read() == b"xxxxxx"
+        assert reader.read() == b""
+        assert calls == [(4, 10), (10, 10)]
+
+    def test_read_stops_at_total(self):
+        reader = ProgressReader(BytesIO(b"abcdef"), 4)
+        assert reader.read(100) == b"abcd"
+        assert reader.read(100) == b""
+
+    def test_iter_uses_chunk_size(self):
+        reader = ProgressReader(BytesIO(b"abcdefg"), 7, chunk_size=3)
+        assert list(reader) == [b"abc", b"def", b"g"]
+
+    def test_rewind(self):
+        f = BytesIO(b"headerbody")
+        f.seek(6)
+        reader = ProgressReader(f, 4)
+        assert reader.read() == b"body"
+        reader.rewind()
+        assert reader.sent == 0
+        assert reader.read() == b"body"
+
+
+def test_log_progress_is_rate_limited(caplog):
+    callback = log_progress("job-1", interval=50)
+    with caplog.at_level(logging.DEBUG, logger="notedx_sdk"):
+        for sent in range(10, 101, 10):
+            callback(sent, 100)
+    messages = [r.getMessage() for r in caplog.records if "job-1" in r.getMessage()]
+    assert len(messages) == 3
+    assert messages[-1].endswith("(100/100 bytes)")
+
+
+class TestProgressTracker:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(uploads.time, "monotonic", lambda: now[0])
+        return now
+
+    def test_reports_are_rate_limited(self, clock):
+        reports = []
+        tracker = ProgressTracker("job-1", reports.append, interval=1.0)
+        for sent in range(100, 1000, 100):
+            clock[0] += 0.25
+            tracker(sent, 1000)
+
+        assert [r.bytes_sent for r in reports] == [400, 800]
+        assert reports[0].throughput == pytest.approx(400)
+        assert reports[0].average_throughput == pytest.approx(400)
+        assert reports[0].eta == pytest.approx(600 / 400)
+        assert reports[0].fraction == pytest.approx(0.4)
+
+    def test_completion_is_always_reported(self, clock):
+        reports = []
+        tracker = ProgressTracker("job-1", reports.append, interval=10)
+        clock[0] += 1
+        tracker(1000, 1000)
+
+        assert len(reports) == 1
+        assert reports[0].eta == 0
+        assert reports[0].fraction == 1
+
+    def test_unknown_total(self, clock):
+        reports = []
+        tracker = ProgressTracker("job-1", reports.append, interval=1)
+        clock[0] += 2
+        tracker(500, 0)
+
+        assert reports[0].total_bytes is None
+        assert reports[0].eta is None
+        assert reports[0].fraction is None
+
+    def test_rewind_restarts_window(self, clock):
+        reports = []
+        tracker = ProgressTracker("job-1", reports.append, interval=1)
+        clock[0] += 1
+        tracker(800, 1000)
+        clock[0] += 1
+        tracker(0, 1000)
+        clock[0] += 1
+        tracker(300, 1000)
+
+        assert [r.bytes_sent for r in reports] == [800, 300]
+        assert reports[1].throughput == pytest.approx(300)
+
+    def test_forwards_and_survives_callback_errors(self, clock, caplog):
+        raw = []
+
+        def fail(progress):
+            raise RuntimeError("ui gone")
+
+        tracker = ProgressTracker("job-1", fail, interval=0, next_callback=lambda s, t: raw.append(s))
+        clock[0] += 1
+        with caplog.at_level(logging.WARNING, logger="notedx_sdk"):
+            tracker(10, 20)
+
+        assert raw == [10]
+        assert "ui gone" in caplog.text
+
+
+class TestChecksums:
+    @pytest.mark.parametrize("make_body", [
+        lambda data: BufferReader(data, chunk_size=7),
+        lambda data: ProgressReader(BytesIO(data), len(data), chunk_size=7),
+        lambda data: IteratorReader(iter([data[:10], data[10:]])),
+    ])
+    def test_checksum_is_computed_while_sending(self, make_body):
+        data = os.urandom(100)
+        body = make_body(data)
+        body.enable_checksum()
+
+        assert b"".join(bytes(chunk) for chunk in body) == data
+        assert body.checksum.hexdigest() == hashlib.md5(data).hexdigest()
+
+    def test_rewind_restarts_checksum(self):
+        data = os.urandom(100)
+        body = BufferReader(data)
+        body.enable_checksum()
+        body.read(30)
+        body.rewind()
+        body.read()
+        assert body.checksum.hexdigest() == hashlib.md5(data).hexdigest()
+
+    def test_checksum_is_off_by_default(self):
+        body = BufferReader(b"audio")
+        body.read()
+        assert body.checksum is None
+
+    @pytest.mark.parametrize("headers,expected", [
+        ({"ETag": '"0CC175B9C0F1B6A831C399E269772661"'}, "0cc175b9c0f1b6a831c399e269772661"),
+        ({"ETag": 'W/"0cc175b9c0f1b6a831c399e269772661"'}, "0cc175b9c0f1b6a831c399e269772661"),
+        ({"x-goog-hash": "crc32c=n03x6A==,md5=DMF1ucDxtqgxw5niaXcmYQ=="}, "0cc175b9c0f1b6a831c399e269772661"),
+        ({"ETag": '"0cc175b9c0f1b6a831c399e269772661-3"'}, None),
+        ({}, None),
+    ])
+    def test_stored_md5(self, headers, expected):
+        assert stored_md5(requests.structures.CaseInsensitiveDict(headers)) == expected
+
+    def test_verify_checksum(self):
+        checksum = hashlib.md5(b"a")
+        verify_checksum({"ETag": '"0cc175b9c0f1b6a831c399e269772661"'}, checksum)
+        verify_checksum({"ETag": '"opaque"'}, checksum)
+        verify_checksum({"ETag": '"00000000000000000000000000000000"'}, None)
+        with pytest.raises(UploadError) as exc:
+            verify_checksum({"ETag": '"00000000000000000000000000000000"'}, checksum, "job-1")
+        assert exc.value.code == "CHECKSUM_MISMATCH"
+        assert exc.value.details["job_id"] == "job-1"
+
+
+@pytest.mark.parametrize("query,expiry", [
+    ("X-Amz-Algorithm=AWS4-HMAC-SHA256&X-Amz-Date=20250101T000000Z&X-Amz-Expires=900&X-Amz-Signature=ab", 1735690500),
+    ("X-Goog-Date=20250101T000000Z&X-Goog-Expires=3600&X-Goog-Signature=ab", 1735693200),
+    ("AWSAccessKeyId=key&Expires=1735690000&Signature=ab", 1735690000),
+    ("sv=2021-08-06&se=2025-01-01T01%3A00%3A00Z&sig=ab", 1735693200),
+    ("token=xyz", None),
+    ("X-Amz-Date=yesterday&X-Amz-Expires=900", None),
+])
+def test_presigned_url_expiry(query, expiry):
+    assert presigned_url_expiry(f"https://storage.example.com/object?{query}") == expiry
+
+
+def test_check_presigned_url():
+    check_presigned_url("https://storage.example.com/object?token=xyz")
+    check_presigned_url("https://storage.example.com/object?Expires=4102444800")
+    with pytest.raises(UploadUrlRejectedError) as exc_info:
+        check_presigned_url("https://storage.example.com/object?Expires=1735690000", "job")
+    assert exc_info.value.code == "URL_EXPIRED"
+    assert exc_info.value.details == {"job_id": "job", "expired_at": "2025-01-01T00:06:40+00:00"}
+    with pytest.raises(UploadUrlRejectedError):
+        check_presigned_url(f"https://storage.example.com/object?Expires={int(time.time()) + 30}", margin=60)
+
+
+@pytest.mark.parametrize("status,text,code", [
+    (403, "<Error><Code>AccessDenied</Code><Message>Request has expired</Message></Error>", "URL_EXPIRED"),
+    (403, "<Error><Code>SignatureDoesNotMatch</Code></Error>", "URL_REJECTED"),
+    (400, "ExpiredToken: The provided token has expired", "URL_EXPIRED"),
+    (400, "<Error><Code>BadDigest</Code></Error>", None),
+    (500, "Request has expired", None),
+    (200, "", None),
+])
+def test_rejected_url_error(status, text, code):
+    error = rejected_url_error(Mock(status_code=status, text=text), "job")
+    assert (error.code if error else None) == code
+
+
+class TestMultipartUploader:
+    def _plan(self, server, parts, part_size):
+        return {
+            "part_urls": [f"{server.url}/part/{n}" for n in range(1, parts + 1)],
+            "part_size": part_size,
+            "complete_url": f"{server.url}/complete"
+        }
+
+    def test_is_multipart(self):
+        assert not MultipartUploader.is_multipart({"presigned_url": "https://example.com"})
+        assert MultipartUploader.is_multipart({"multipart": {
+            "part_urls": ["u"], "part_size": 10, "complete_url": "c"
+        }})
+
+    def test_uploads_parts_concurrently(self, storage_server, tmp_path):
+        data = os.urandom(10_000)
+        path = tmp_path / "visit.wav"
+        path.write_bytes(data)
+        progress = []
+
+        uploader = MultipartUploader(requests.Session(), max_workers=3)
+        etags = uploader.upload(
+            str(path), self._plan(storage_server, 4, 3000), "audio/wav",
+            callback=lambda sent, total: progress.append((sent, total))
+        )
+
+        parts = [storage_server.objects[f"/part/{n}"] for n in range(1, 5)]
+        assert b"".join(parts) == data
+        assert [len(p) for p in parts] == [3000, 3000, 3000, 1000]
+        assert etags == [f'"{hashlib.md5(p).hexdigest()}"' for p in parts]
+        completion = storage_server.posts["/complete"].decode()
+        assert completion.count("<Part>") == 4
+        assert "<PartNumber>4</PartNumber>" in completion
+        assert max(progress) == (10_000, 10_000)
+
+    def test_failed_part_is_retried_alone(self, storage_server, tmp_path):
+        path = tmp_path / "visit.wav"
+        path.write_bytes(b"abcdef")
+        storage_server.fail["/part/2"] = 1
+
+        uploader = MultipartUploader(requests.Session(), retry_delay=0)
+        uploader.upload(str(path), self._plan(storage_server, 2, 3), "audio/wav")
+
+        assert storage_server.objects["/part/1"] == b"abc"
+        assert storage_server.objects["/part/2"] == b"def"
+
+    def test_rejected_part_url_is_not_retried(self, storage_server, tmp_path):
+        path = tmp_path / "visit.wav"
+        path.write_bytes(b"abcdef")
+        storage_server.reject["/part/2"] = 1
+
+        uploader = MultipartUploader(requests.Session(), retry_delay=0)
+        with pytest.raises(UploadUrlRejectedError) as exc_info:
+            uploader.upload(str(path), self._plan(storage_server, 2, 3), "audio/wav")
+        assert exc_info.value.code == "URL_EXPIRED"
+        assert storage_server.puts["/part/2"] == 1
+        assert "/complete" not in storage_server.posts
+
+    @pytest.mark.parametrize("corruptions,stored", [(1, True), (3, False)])
+    def test_corrupted_part_is_resent(self, storage_server, tmp_path, corruptions, stored):
+        path = tmp_path / "visit.wav"
+        path.write_bytes(b"abcdef")
+        storage_server.corrupt["/part/2"] = corruptions
+
+        uploader = MultipartUploader(requests.Session(), retry_delay=0)
+        if stored:
+            uploader.upload(str(path), self._plan(storage_server, 2, 3), "audio/wav")
+            assert storage_server.objects["/part/2"] == b"def"
+        else:
+            with pytest.raises(UploadError):
+                uploader.upload(str(path), self._plan(storage_server, 2, 3), "audio/wav")
+            assert "/complete" not in storage_server.posts
+
+    def test_part_failure_after_retries(self, storage_server, tmp_path):
+        path = tmp_path / "visit.wav"
+        path.write_bytes(b"abcdef")
+        storage_server.fail["/part/1"] = 5
+
+        uploader = MultipartUploader(requests.Session(), max_retries=2, retry_delay=0)
+        with pytest.raises(requests.HTTPError):
+            uploader.upload(str(path), self._plan(storage_server, 2, 3), "audio/wav")
+        assert "/complete" not in storage_server.posts
+
+    def test_missing_part_urls(self, tmp_path):
+        path = tmp_path / "visit.wav"
+        path.write_bytes(b"abcdef")
+        with pytest.raises(ValueError):
+            MultipartUploader(requests.Session()).upload(
+                str(path), {"part_urls": ["u"], "part_size": 3, "complete_url": "c"}, "audio/wav"
+            )
+
+
+class TestOpenUploadBody:
+    def test_bytes_are_zero_copy(self):
+        data = bytearray(b"abcdef")
+        body = open_upload_body(data, chunk_size=4)
+        assert isinstance(body, BufferReader)
+        assert body.total == 6 and body.rewindable
+        chunks = list(body)
+        assert all(isinstance(c, memoryview) for c in chunks)
+        assert chunks[0].obj is data
+        assert b"".join(chunks) == b"abcdef"
+
+    def test_memoryview_of_wide_items(self):
+        import array
+        samples = array.array("h", [1, 2, 3])
+        body = open_upload_body(memoryview(samples))
+        assert body.total == 6
+        assert bytes(body.read()) == samples.tobytes()
+
+    def test_seekable_file_from_current_position(self):
+        f = BytesIO(b"skipdata")
+        f.seek(4)
+        body = open_upload_body(f)
+        assert isinstance(body, ProgressReader)
+        assert body.total == 4
+        assert body.read() == b"data"
+
+    def test_non_seekable_file(self):
+        class Pipe:
+            def __init__(self):
+                self._f = BytesIO(b"abcdef")
+            def read(self, size=-1):
+                return self._f.read(size)
+            def seekable(self):
+                return False
+
+        body = open_upload_body(Pipe(), chunk_size=4)
+        assert isinstance(body, IteratorReader) and not body.rewindable
+        assert body.total is None
+        assert list(body) == [b"abcd", b"ef"]
+        with pytest.raises(ValueError):
+            body.rewind()
+
+    def test_iterator_with_size(self):
+        body = open_upload_body(iter([b"ab", b"", b"cd"]), size=4)
+        assert len(body) == 4
+        assert list(body) == [b"ab", b"cd"]
+        assert body.sent == 4
+
+    def test_unsupported_source(self):
+        with pytest.raises(TypeError):
+            open_upload_body("visit.mp3")
+        with pytest.raises(TypeError):
+            open_upload_body(42)
+
+
+class TestMappedFileReader:
+    def test_reads_are_views_of_the_mapping(self, tmp_path):
+        path = tmp_path / "visit.wav"
+        path.write_bytes(b"0123456789")
+        with open(path, "rb") as f:
+            body = MappedFileReader(f)
+            chunk = body.read(4)
+            assert isinstance(chunk, memoryview)
+            assert isinstance(chunk.obj, mmap.mmap)
+            assert bytes(chunk) == b"0123"
+            del chunk
+            body.close()
+
+    def test_unaligned_range_and_rewind(self, tmp_path):
+        data = os.urandom(mmap.ALLOCATIONGRANULARITY * 2 + 100)
+        path = tmp_path / "visit.wav"
+        path.write_bytes(data)
+        offset = mmap.ALLOCATIONGRANULARITY + 7
+        with open(path, "rb") as f:
+            body = MappedFileReader(f, offset, 500, chunk_size=128)
+            assert body.total == 500
+            assert b"".join(bytes(c) for c in body) == data[offset:offset + 500]
+            body.rewind()
+            assert bytes(body.read()) == data[offset:offset + 500]
+            body.close()
+
+    def test_iteration_does_not_allocate_chunks(self, tmp_path):
+        path = tmp_path / "visit.wav"
+        path.write_bytes(b"\x00" * (16 * 1024 * 1024))
+        with open(path, "rb") as f:
+            body = MappedFileReader(f, chunk_size=4 * 1024 * 1024)
+            tracemalloc.start()
+            try:
+                total = sum(len(chunk) for chunk in body)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            body.close()
+        assert total == 16 * 1024 * 1024
+        assert peak < 64 * 1024
+
+    def test_open_file_body_falls_back_without_file_descriptor(self):
+        body = open_file_body(BytesIO(b"headerbody"), offset=6, length=4)
+        assert isinstance(body, ProgressReader)
+        assert body.read() == b"body"
+
+
+class TestAdaptiveChunking:
+    def test_estimator_ewma(self):
+        estimator = ThroughputEstimator(alpha=0.5)
+        assert estimator.bytes_per_second is None
+        estimator.record(1000, 1.0)
+        estimator.record(3000, 1.0)
+        estimator.record(0, 1.0)
+        assert estimator.bytes_per_second == 2000
+
+    def test_slow_start_doubles_then_tracks_throughput(self):
+        sizer = AdaptiveChunkSizer(
+            ThroughputEstimator(alpha=1.0),
+            max_chunk_size=10 * 1024 * 1024,
+            initial_chunk_size=256 * 1024
+        )
+        assert sizer.chunk_size == 256 * 1024
+        sizer.record(256 * 1024, 0.1)
+        assert sizer.chunk_size == 512 * 1024
+        sizer.record(512 * 1024, 0.2)
+        assert sizer.chunk_size == 1024 * 1024
+
+        # Chunk slower than the target: follow the measured throughput
+        sizer.record(1024 * 1024, 4.0)
+        assert sizer.chunk_size == 256 * 1024
+        # No more doubling once out of slow start
+        sizer.record(256 * 1024, 0.5)
+        assert sizer.chunk_size == 512 * 1024
+
+    def test_chunk_size_bounds(self):
+        sizer = AdaptiveChunkSizer(ThroughputEstimator(alpha=1.0), max_chunk_size=1024 * 1024, min_chunk_size=64 * 1024)
+        for _ in range(10):
+            sizer.record(sizer.chunk_size, 0.01)
+        assert sizer.chunk_size == 1024 * 1024
+        sizer.record(1024, 10.0)
+        assert sizer.chunk_size == 64 * 1024
+
+    def test_known_throughput_seeds_new_uploads(self):
+        estimator = ThroughputEstimator()
+        estimator.record(2 * 1024 * 1024, 1.0)
+        sizer = AdaptiveChunkSizer(estimator, target_seconds=1.0)
+        assert sizer.chunk_size == 2 * 1024 * 1024
+
+    def test_timeout_follows_throughput(self):
+        estimator = ThroughputEstimator()
+        sizer = AdaptiveChunkSizer(estimator, default_timeout=60, min_timeout=10, target_seconds=1.0)
+        assert sizer.timeout() == 60
+        estimator.record(1024, 1.0)
+        assert sizer.timeout() == 10
+
+    def test_adaptive_body_iterates_in_sized_chunks(self):
+        sizer = AdaptiveChunkSizer(
+            ThroughputEstimator(), max_chunk_size=64, min_chunk_size=4, initial_chunk_size=4
+        )
+        body = AdaptiveBody(BufferReader(b"x" * 100), sizer)
+        assert len(body) == 100 and body.rewindable
+        sizes = [len(chunk) for chunk in body]
+        assert sum(sizes) == 100
+        assert sizes[:4] == [4, 8, 16, 32]
+        body.rewind()
+        assert body.sent == 0
@@ -1,7 +1,7 @@
 import os
 import pytest
 import requests
-from src.notedx_sdk.helpers import get_env, parse_response, build_headers
+from src.notedx_sdk.helpers import get_env, parse_response, build_headers, create_session
 from src.notedx_sdk.exceptions import (
     NoteDxError,
     AuthenticationError,
@@ -105,4 +105,21 @@ class TestBuildHeaders:
     def test_headers_without_credentials(self):
         """Test building headers without any credentials"""
         headers = build_headers()
-        assert headers == {"Content-Type": "application/json"} 
\ No newline at end of file
+        assert headers == {"Content-Type": "application/json"}
+
+class TestCreateSession:
+    def test_separate_pools_for_api_and_storage(self):
+        """Test that API and storage hosts get their own pooled adapters"""
+        session = create_session("https://api.notedx.io/v1", api_pool_size=4, storage_pool_size=16)
+        api_adapter = session.get_adapter("https://api.notedx.io/v1/status/job")
+        storage_adapter = session.get_adapter("https://storage.example.com/upload?sig=x")
+        assert api_adapter is not storage_adapter
+        assert api_adapter._pool_maxsize == 4
+        assert storage_adapter._pool_maxsize == 16
+
+    def test_mounts_on_existing_session(self):
+        """Test that adapters are mounted on a provided session"""
+        existing = requests.Session()
+        session = create_session("https://api.notedx.io/v1", session=existing)
+        assert session is existing
+        assert session.get_adapter("https://api.notedx.io/v1/x")._pool_maxsize == 10